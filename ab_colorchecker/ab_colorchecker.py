@@ -1,10 +1,10 @@
 """
 Script Name: AB ColorChecker
-Script Version: 3.9.2
+Script Version: 3.12.0
 Flame Version: 2026
 Written by: AB
 Creation Date: 06.01.26
-Update Date: 06.17.26
+Update Date: 10.19.26
 
 Description:
     Camera matching via Macbeth ColorChecker chart in ACEScg scene-linear.
@@ -21,15 +21,27 @@ Description:
 
     Sessions store both A and B patch data and can be recalled to apply
     the same correction to new footage without re-clicking patches.
+    Saved .cube LUTs can be loaded back to compare against a session, apply
+    to new footage, or combine with the solved correction.
 
     Uses OpenImageIO if available, falls back to OpenCV automatically.
     Create ab_colorchecker_paths.py for custom library paths (IT/studio use).
+    ab_colorchecker_lut.py (the .cube LUT toolkit) must sit alongside this script.
 
 Menus:
     Right-click in Batch -> AB ColorChecker -> Match Cameras...
     Right-click in Media Panel -> AB ColorChecker -> Match Cameras...
 
 Updates:
+    3.12.0 10.19.26
+    - Added ab_colorchecker_lut.py: .cube writer (red-fastest rows, chunked formatting streamed to disk), .cube reader, LUT apply/compare/combine.
+    - Added Load LUT... to compare a .cube with the session and apply it (or correction + LUT) to new footage.
+    3.11.0 10.19.26
+    - HDR/360: optional bake of the TPS spline to a 65^3 3D LUT (tetrahedral) for fast apply, with max-error report against direct evaluation on the patches.
+    - HDR/360: export choice dialog now offered in HDR mode; baked LUT can be exported as .cube.
+    3.10.0 10.19.26
+    - Sequence processing reads, corrects and writes frames in parallel stages.
+    - Standard mode matrix correction stays in float32.
     3.9.2 06.17.26
     - Fixed sequence import into Flame Batch as full clip not single frame.
     3.9.1 06.17.26
@@ -48,7 +60,17 @@ Updates:
 """
 
 SCRIPT_NAME    = 'AB ColorChecker'
-SCRIPT_VERSION = '3.9.2'
+SCRIPT_VERSION = '3.12.0'
+
+# Sequence processing: threads per stage (read / correct / write) and frames
+# allowed to wait between stages. Each 4K float frame is ~100MB, so frames in
+# flight = 3 x workers + 2 x queue size.
+SEQUENCE_WORKERS    = 4
+SEQUENCE_QUEUE_SIZE = 4
+
+# HDR/360 bake-to-LUT: grid size and interpolation ('tetrahedral' or 'trilinear')
+HDR_LUT_SIZE          = 65
+HDR_LUT_INTERPOLATION = 'tetrahedral'
 
 PATCH_NAMES = [
     'Dark Skin','Light Skin','Blue Sky','Foliage','Blue Flower','Bluish Green',
@@ -126,6 +148,16 @@ def _setup_imaging():
     return None, None, None
 
 
+def _load_lut_module():
+    """Load the .cube LUT toolkit (ab_colorchecker_lut.py) from alongside this script."""
+    import importlib.util, os
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ab_colorchecker_lut.py')
+    spec = importlib.util.spec_from_file_location('ab_colorchecker_lut', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def launch_ui(selection):
     import os
     import sys
@@ -162,6 +194,8 @@ def launch_ui(selection):
     import flame
     from PySide6 import QtWidgets, QtCore, QtGui
 
+    lutlib = _load_lut_module()
+
     # Session directory
     SESSION_DIR = os.path.expanduser('~/AB_ColorChecker_Sessions')
     os.makedirs(SESSION_DIR, exist_ok=True)
@@ -398,22 +432,91 @@ def launch_ui(selection):
             M, _, _, _ = np.linalg.lstsq(src_patches, ref_patches, rcond=None)
             return ('matrix', M)
 
+    def eval_rbf(flat, correction):
+        """Evaluate the TPS RBF directly, in 200k-pixel chunks."""
+        _, rbf, src_max, ref_max = correction
+        flat_norm = np.asarray(flat, dtype=np.float64) / src_max
+        chunk = 200000
+        results = [np.empty((0, 3))]
+        for i in range(0, len(flat_norm), chunk):
+            results.append(rbf(flat_norm[i:i+chunk]))
+        return np.vstack(results) * ref_max
+
+    def bake_rbf_lut(correction, domain_min, domain_max, lut_size=HDR_LUT_SIZE):
+        """
+        Bake the fitted RBF into a dense 3D LUT over [domain_min, domain_max]
+        (per channel, image units). Returns ('lut', CubeLUT, rbf_correction).
+        The RBF correction is kept to evaluate pixels outside the domain exactly.
+        """
+        lut = lutlib.lut_from_function(lambda pts: eval_rbf(pts, correction),
+                                       lut_size, domain_min, domain_max)
+        return ('lut', lut, correction)
+
+    def apply_baked(flat, correction):
+        """
+        Apply a baked or loaded LUT. For a baked RBF, pixels outside the baked
+        domain (or non-finite) use the RBF directly; a loaded .cube clamps them.
+        """
+        _, lut, rbf_correction = correction
+        flat = np.asarray(flat, dtype=np.float32)
+        out = np.empty_like(flat)
+        chunk = 1000000
+        for i in range(0, len(flat), chunk):
+            block = flat[i:i+chunk]
+            if rbf_correction is None:
+                out[i:i+chunk] = lutlib.apply_lut(block, lut, HDR_LUT_INTERPOLATION)
+                continue
+            # Comparisons with NaN are False, so non-finite rows are never inside
+            inside = ((block >= lut.domain_min) & (block <= lut.domain_max)).all(axis=1)
+            out_block = out[i:i+chunk]
+            if inside.any():
+                out_block[inside] = lutlib.apply_lut(block[inside], lut, HDR_LUT_INTERPOLATION)
+            if not inside.all():
+                out_block[~inside] = eval_rbf(block[~inside], rbf_correction)
+        return out
+
+    def bake_correction(correction, img, src_patches, lut_size=HDR_LUT_SIZE):
+        """
+        Bake an RBF correction over the observed source range (image and
+        patches) and report the max error against direct evaluation on the
+        patch set. Returns (baked_correction, max_abs_err, max_rel_err_pct).
+        """
+        samples = [np.asarray(src_patches, dtype=np.float32).reshape(-1, 3)]
+        if img is not None:
+            flat = img.reshape(-1, 3)
+            finite = np.isfinite(flat).all(axis=1)
+            samples.append(flat[finite])
+        samples = np.vstack(samples)
+        domain_min = samples.min(axis=0).astype(np.float64)
+        domain_max = samples.max(axis=0).astype(np.float64)
+        # Keep every channel range non-empty
+        domain_max = np.maximum(domain_max, domain_min + 1e-4)
+        baked = bake_rbf_lut(correction, domain_min, domain_max, lut_size)
+
+        direct = eval_rbf(src_patches, correction)
+        from_lut = apply_baked(src_patches, baked)
+        abs_err = np.abs(from_lut - direct)
+        max_abs = float(abs_err.max())
+        max_rel = float((abs_err.mean(axis=1) / (np.abs(direct).mean(axis=1) + 1e-6)).max() * 100)
+        print(f'[AB ColorChecker] Baked {lut_size}^3 LUT ({HDR_LUT_INTERPOLATION}) '
+              f'domain R {domain_min[0]:.4f}-{domain_max[0]:.4f} '
+              f'G {domain_min[1]:.4f}-{domain_max[1]:.4f} B {domain_min[2]:.4f}-{domain_max[2]:.4f}')
+        print(f'[AB ColorChecker] Baked LUT vs direct RBF on patches: max error {max_abs:.6f} ({max_rel:.3f}%)')
+        return baked, max_abs, max_rel
+
     def apply_to_image(img, correction):
         h, w = img.shape[:2]
-        flat = img.reshape(-1, 3).astype(np.float64)
         if correction[0] == 'matrix':
+            # Matrix stays in float32 — no float64 copy of the frame
             _, M = correction
-            corrected = flat @ M
+            flat = img.reshape(-1, 3).astype(np.float32, copy=False)
+            corrected = flat @ M.astype(np.float32)
+        elif correction[0] == 'lut':
+            corrected = apply_baked(img.reshape(-1, 3), correction)
         else:
-            _, rbf, src_max, ref_max = correction
-            flat_norm = flat / src_max
-            chunk = 200000
-            results = []
-            for i in range(0, len(flat_norm), chunk):
-                results.append(rbf(flat_norm[i:i+chunk]))
-            corrected = np.vstack(results) * ref_max
+            corrected = eval_rbf(img.reshape(-1, 3), correction)
         # No clipping — preserves full dynamic range
-        return corrected.reshape(h, w, 3).astype(np.float32)
+        return corrected.reshape(h, w, 3).astype(np.float32, copy=False)
 
 
     def get_sequence_frames(path):
@@ -439,73 +542,175 @@ def launch_ui(selection):
             pass
         return frames if frames else [path]
 
-    def process_sequence(frames, correction, out_dir, progress_cb=None):
+    def sequence_output_path(frame_path, out_dir):
+        """clip.0001.exr -> <out_dir>/clip_matched.0001.exr"""
+        import re
+        basename = os.path.basename(frame_path)
+        m = re.match(r'^(.*?)\.?(\d+)(\.[^.]+)$', basename)
+        if m:
+            base, frame_num, ext = m.groups()
+            out_name = f'{base}_matched.{frame_num}{ext}'
+        else:
+            name, ext = os.path.splitext(basename)
+            out_name = f'{name}_matched{ext}'
+        return os.path.join(out_dir, out_name)
+
+    def process_sequence(frames, correction, out_dir, progress_cb=None,
+                         workers=SEQUENCE_WORKERS, queue_size=SEQUENCE_QUEUE_SIZE):
         """Apply correction to a list of frames, saving to out_dir.
         Output naming: <name>_matched.####.exr
         Returns list of output paths.
+
+        Frames go through three stages — read, correct, write — each with
+        `workers` threads, joined by bounded queues of `queue_size` frames so
+        I/O and maths overlap without loading the whole sequence. progress_cb
+        is only ever called from the calling (Qt) thread.
         """
-        import re
+        import queue, threading
         total = len(frames)
-        out_paths = []
-        for i, frame_path in enumerate(frames):
-            if progress_cb:
-                progress_cb(i, total)
-            img = load_image(frame_path)
-            corrected = apply_to_image(img, correction)
-            basename = os.path.basename(frame_path)
-            # Extract base name and frame number: clip.0001.exr -> clip_matched.0001.exr
-            m = re.match(r'^(.*?)\.?(\d+)(\.[^.]+)$', basename)
-            if m:
-                base, frame_num, ext = m.groups()
-                out_name = f'{base}_matched.{frame_num}{ext}'
-            else:
-                name, ext = os.path.splitext(basename)
-                out_name = f'{name}_matched{ext}'
-            out_path = os.path.join(out_dir, out_name)
-            save_exr(corrected, out_path)
-            out_paths.append(out_path)
+        out_paths = [sequence_output_path(f, out_dir) for f in frames]
         if progress_cb:
-            progress_cb(total, total)
+            progress_cb(0, total)
+        if not total:
+            return out_paths
+
+        stop = threading.Event()
+        events = queue.Queue()  # ('written', i) / ('error', exc) -> calling thread
+
+        def get(q):
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            return None
+
+        def put(q, item):
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def write(i, img):
+            save_exr(img, out_paths[i])
+            events.put(('written', i))
+
+        # (work, next queue) per stage. Read stage pulls from the frame list.
+        frame_q = queue.Queue()
+        for item in enumerate(frames):
+            frame_q.put(item)
+        read_q  = queue.Queue(maxsize=queue_size)
+        write_q = queue.Queue(maxsize=queue_size)
+        stages = [
+            (frame_q, lambda i, path: load_image(path), read_q),
+            (read_q,  lambda i, img: apply_to_image(img, correction), write_q),
+            (write_q, write, None),
+        ]
+
+        threads = []
+        for in_q, work, out_q in stages:
+            remaining = [workers]
+            lock = threading.Lock()
+
+            def loop(in_q=in_q, work=work, out_q=out_q, remaining=remaining, lock=lock):
+                try:
+                    while not stop.is_set():
+                        item = in_q.get_nowait() if in_q is frame_q else get(in_q)
+                        if item is None:
+                            break
+                        i, data = item
+                        result = work(i, data)
+                        if out_q is not None:
+                            put(out_q, (i, result))
+                except queue.Empty:
+                    pass  # frame list exhausted
+                except Exception as e:
+                    events.put(('error', e))
+                    stop.set()
+                finally:
+                    # Last thread of a stage tells the next stage it is done
+                    with lock:
+                        remaining[0] -= 1
+                        last = remaining[0] == 0
+                    if last and out_q is not None:
+                        for _ in range(workers):
+                            put(out_q, None)
+
+            for _ in range(workers):
+                t = threading.Thread(target=loop, daemon=True)
+                t.start()
+                threads.append(t)
+
+        written = 0
+        error = None
+        try:
+            while written < total and error is None:
+                try:
+                    kind, value = events.get(timeout=0.1)
+                except queue.Empty:
+                    if not any(t.is_alive() for t in threads):
+                        break
+                    continue
+                if kind == 'error':
+                    error = value
+                else:
+                    written += 1
+                    if progress_cb:
+                        progress_cb(written, total)
+        finally:
+            stop.set()
+            for t in threads:
+                t.join()
+
+        if error is not None:
+            raise error
+        if written < total:
+            raise RuntimeError(f'Only {written} of {total} frames were written')
         return out_paths
 
-    def build_lut_from_matrix(M, lut_size=33, domain_max=1.0):
+    def export_cube(correction, lut_path, img=None, src_patches=None):
         """
-        Build a .cube 3D LUT from a 3x3 colour matrix.
-        Since the matrix is linear, the LUT exactly matches the EXR output.
-        Domain is set from the source white patch value * 2 for headroom.
+        Write the correction as a .cube. The matrix LUT exactly matches the EXR
+        output; RBF corrections are baked first over the observed source range.
         """
-        coords = np.linspace(0, domain_max, lut_size)
-        r_g, g_g, b_g = np.meshgrid(coords, coords, coords, indexing='ij')
-        grid_pts = np.stack([r_g.ravel(), g_g.ravel(), b_g.ravel()], axis=1)
-        lut_vals = grid_pts @ M  # pure matrix — exact match to EXR
-
-        lines = [
-            '# AB ColorChecker — 3x3 Matrix LUT',
-            f'# Version: {SCRIPT_VERSION}',
-            '# Input:  Camera B ACEScg scene-linear',
-            '# Output: Matched to Camera A ACEScg scene-linear',
-            '# Apply:  Flame Colour Management > 3D LUT > 32-bit > ACEScg',
-            f'TITLE "AB Camera Match"',
-            f'LUT_3D_SIZE {lut_size}',
-            f'DOMAIN_MIN 0.000000 0.000000 0.000000',
-            f'DOMAIN_MAX {domain_max:.6f} {domain_max:.6f} {domain_max:.6f}',
-            '',
+        if correction[0] == 'matrix':
+            # Domain must cover full image range including highlights
+            # Matrix is linear so any domain size gives exact interpolation
+            _, M = correction
+            lut = lutlib.lut_from_matrix(M, lut_size=33, domain_max=100.0)
+            comments = ['AB ColorChecker — 3x3 Matrix LUT']
+        else:
+            if correction[0] == 'rbf':
+                correction, _, _ = bake_correction(correction, img, src_patches)
+            lut = correction[1]
+            comments = ['AB ColorChecker — HDR/360 TPS RBF baked LUT']
+        comments += [
+            f'Version: {SCRIPT_VERSION}',
+            'Input:  Camera B ACEScg scene-linear',
+            'Output: Matched to Camera A ACEScg scene-linear',
         ]
-        for bi in range(lut_size):
-            for gi in range(lut_size):
-                for ri in range(lut_size):
-                    idx = ri*lut_size*lut_size + gi*lut_size + bi
-                    rv, gv, bv = lut_vals[idx]
-                    lines.append(f'{rv:.6f} {gv:.6f} {bv:.6f}')
-        return '\n'.join(lines)
+        if correction[0] == 'lut':
+            comments.append('Domain: observed source range — values outside are clamped')
+        comments.append('Apply:  Flame Colour Management > 3D LUT > 32-bit > ACEScg')
+        lutlib.write_cube(lut_path, lut, comments)
+
+    def load_cube_correction(lut_path):
+        """Load a .cube as a correction that can be applied without re-solving."""
+        lut = lutlib.read_cube(lut_path)
+        n = lut.table.shape[0]
+        print(f'[AB ColorChecker] Loaded {n}^3 LUT "{lut.title}" from {lut_path}')
+        return ('lut', lut, None)
 
     def verify_patches(src_patches, ref_patches, correction):
         if correction[0] == 'matrix':
             _, M = correction
             pred = src_patches @ M
+        elif correction[0] == 'lut':
+            pred = apply_baked(src_patches, correction)
         else:
-            _, rbf, src_max, ref_max = correction
-            pred = rbf(src_patches / src_max) * ref_max
+            pred = eval_rbf(src_patches, correction)
         print('[AB ColorChecker] Patch verification:')
         for i in range(24):
             p = pred[i]; r = ref_patches[i]
@@ -787,7 +992,7 @@ def launch_ui(selection):
         'ref_path':None,'src_path':None,
         'ref_points':None,'src_points':None,
         'ref_patches':None,'src_patches':None,
-        'correction_built':False,
+        'correction_built':False,'correction':None,
         'session_loaded':False,
         'rbf':None,'src_max':None,'ref_max':None,
         'linear_scale':None,'linear_offset':None,
@@ -898,6 +1103,11 @@ def launch_ui(selection):
     session_row.addWidget(browse_session_btn)
     session_row.addWidget(load_session_btn)
 
+    load_lut_btn = QtWidgets.QPushButton('Load LUT...')
+    load_lut_btn.setFixedHeight(28)
+    load_lut_btn.setToolTip('Load a .cube to compare with this session or apply without re-solving.')
+    session_row.addWidget(load_lut_btn)
+
     session_row.addStretch()
     root.addLayout(session_row)
 
@@ -913,6 +1123,12 @@ def launch_ui(selection):
     match_status.setStyleSheet('font-size:10px;color:#888888;')
     bar.addWidget(match_status,1)
 
+    bake_check=QtWidgets.QCheckBox('Bake to 3D LUT (faster)')
+    bake_check.setToolTip('Bake the HDR/360 spline into a 3D LUT once and interpolate it '
+                          'instead of evaluating the spline for every pixel.')
+    bake_check.setVisible(hdr_mode)
+    bar.addWidget(bake_check)
+
     apply_btn=QtWidgets.QPushButton('Apply Correction')
     apply_btn.setObjectName('blue'); apply_btn.setEnabled(False)
     bar.addWidget(apply_btn)
@@ -992,6 +1208,102 @@ def launch_ui(selection):
         match_status.setText(f'✓  Session "{name}" saved to {os.path.basename(save_path)}')
         match_status.setStyleSheet('font-size:11px;color:#66cc66;')
 
+    def apply_to_new_image(get_correction):
+        """
+        Load a new Camera B image, apply get_correction(img) to it and save an
+        EXR without re-clicking patches. Returns True if an EXR was saved.
+        """
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            win, 'Load New Camera B Image', '',
+            'Images (*.exr *.tif *.tiff *.dpx *.png *.jpg);;All Files (*)')
+        if not path:
+            return False
+        try:
+            img = load_image(path)
+            state['src_img']   = img
+            state['src_path']  = path
+            state['src_points'] = None  # no re-clicking needed
+            correction = get_correction(img)
+            # Ask where to save
+            src_dir  = os.path.dirname(path)
+            src_base = os.path.splitext(os.path.basename(path))[0]
+            out_path, _ = QtWidgets.QFileDialog.getSaveFileName(
+                win, 'Save Corrected EXR',
+                os.path.join(src_dir, f'{src_base}_matched.exr'),
+                'OpenEXR (*.exr);;All Files (*)')
+            if not out_path:
+                return False
+            if not out_path.lower().endswith('.exr'):
+                out_path += '.exr'
+            progress.setVisible(True); progress.setValue(30)
+            QtWidgets.QApplication.processEvents()
+            corrected = apply_to_image(img, correction)
+            progress.setValue(80)
+            save_exr(corrected, out_path)
+            try:
+                flame.batch.import_clip(out_path, 'Schematic Reel 1')
+            except: pass
+            progress.setValue(100)
+            match_status.setText(f'✓  Saved: {os.path.basename(out_path)}')
+            match_status.setStyleSheet('font-size:11px;color:#66cc66;')
+            return True
+        except Exception as e:
+            match_status.setText(f'Error: {e}')
+            match_status.setStyleSheet('font-size:11px;color:#cc5555;')
+            progress.setVisible(False)
+            return True
+
+    def on_load_lut():
+        """
+        Load a .cube and compare it against the session patches and the last
+        solved correction, then apply it (or the correction combined with it)
+        to a new image without re-solving.
+        """
+        lut_path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            win, 'Load 3D LUT', SESSION_DIR, 'LUT Cube (*.cube);;All Files (*)')
+        if not lut_path: return
+        try:
+            loaded = load_cube_correction(lut_path)
+        except Exception as e:
+            match_status.setText(f'Error: {e}')
+            match_status.setStyleSheet('font-size:11px;color:#cc5555;')
+            return
+        lut = loaded[1]
+
+        # Compare against stored patches and the last solved correction
+        if state['ref_patches'] is not None and state['src_patches'] is not None:
+            verify_patches(np.asarray(state['src_patches']), np.asarray(state['ref_patches']), loaded)
+        solved = state.get('correction')
+        if solved is not None:
+            solved_lut = solved[1] if solved[0] == 'lut' else lutlib.lut_from_function(
+                lambda pts: apply_to_image(pts.reshape(-1, 1, 3).astype(np.float32), solved).reshape(-1, 3),
+                lut.table.shape[0], lut.domain_min, lut.domain_max)
+            max_abs, mean_abs = lutlib.compare_luts(lut, solved_lut)
+            print(f'[AB ColorChecker] Loaded LUT vs solved correction: max error {max_abs:.6f}, mean {mean_abs:.6f}')
+
+        box = QtWidgets.QMessageBox(win)
+        box.setWindowTitle('LUT Loaded')
+        box.setText(f'Loaded {os.path.basename(lut_path)} ({lut.table.shape[0]}³).\n\n'
+                    'Apply it to a new Camera B image?')
+        apply_lut_btn = box.addButton('Apply LUT', QtWidgets.QMessageBox.ButtonRole.AcceptRole)
+        combine_btn = None
+        if solved is not None:
+            combine_btn = box.addButton('Apply Correction + LUT', QtWidgets.QMessageBox.ButtonRole.AcceptRole)
+        box.addButton(QtWidgets.QMessageBox.StandardButton.Cancel)
+        box.exec()
+
+        if box.clickedButton() is apply_lut_btn:
+            apply_to_new_image(lambda img: loaded)
+        elif combine_btn is not None and box.clickedButton() is combine_btn:
+            if solved[0] == 'lut':
+                first = solved[1]
+            elif solved[0] == 'matrix':
+                first = lutlib.lut_from_matrix(solved[1], lut_size=33, domain_max=100.0)
+            else:
+                # Unbaked RBF: bake over the loaded LUT's domain first
+                first = bake_rbf_lut(solved, lut.domain_min, lut.domain_max)[1]
+            apply_to_new_image(lambda img: ('lut', lutlib.combine_luts(first, lut), None))
+
     def on_load_session():
         session = session_combo.currentData()
         if session is None:
@@ -1015,46 +1327,11 @@ def launch_ui(selection):
                 QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
             )
             if reply == QtWidgets.QMessageBox.StandardButton.Yes:
-                path, _ = QtWidgets.QFileDialog.getOpenFileName(
-                    win, 'Load New Camera B Image', '',
-                    'Images (*.exr *.tif *.tiff *.dpx *.png *.jpg);;All Files (*)')
-                if path:
-                    try:
-                        img = load_image(path)
-                        state['src_img']   = img
-                        state['src_path']  = path
-                        state['src_points'] = None  # no re-clicking needed
-                        # Build correction from stored patches directly
-                        ref_p = np.array(session['ref_patches'])
-                        src_p = np.array(session['src_patches'])
-                        correction = build_correction(src_p, ref_p, hdr=hdr_mode)
-                        # Ask where to save
-                        src_dir  = os.path.dirname(path)
-                        src_base = os.path.splitext(os.path.basename(path))[0]
-                        out_path, _ = QtWidgets.QFileDialog.getSaveFileName(
-                            win, 'Save Corrected EXR',
-                            os.path.join(src_dir, f'{src_base}_matched.exr'),
-                            'OpenEXR (*.exr);;All Files (*)')
-                        if out_path:
-                            if not out_path.lower().endswith('.exr'):
-                                out_path += '.exr'
-                            progress.setVisible(True); progress.setValue(30)
-                            QtWidgets.QApplication.processEvents()
-                            corrected = apply_to_image(img, correction)
-                            progress.setValue(80)
-                            save_exr(corrected, out_path)
-                            try:
-                                flame.batch.import_clip(out_path, 'Schematic Reel 1')
-                            except: pass
-                            progress.setValue(100)
-                            match_status.setText(f'✓  Saved: {os.path.basename(out_path)}')
-                            match_status.setStyleSheet('font-size:11px;color:#66cc66;')
-                            return
-                    except Exception as e:
-                        match_status.setText(f'Error: {e}')
-                        match_status.setStyleSheet('font-size:11px;color:#cc5555;')
-                        progress.setVisible(False)
-                        return
+                # Build correction from stored patches directly
+                ref_p = np.array(session['ref_patches'])
+                src_p = np.array(session['src_patches'])
+                if apply_to_new_image(lambda img: build_correction(src_p, ref_p, hdr=hdr_mode)):
+                    return
 
         match_status.setText(
             f'✓  Session "{session["name"]}" loaded — A side ready. '
@@ -1100,7 +1377,15 @@ def launch_ui(selection):
                 print(f'  G: {M[0,1]:.6f}  {M[1,1]:.6f}  {M[2,1]:.6f}')
                 print(f'  B: {M[0,2]:.6f}  {M[1,2]:.6f}  {M[2,2]:.6f}')
 
+            bake_note = ''
+            if correction[0] == 'rbf' and bake_check.isChecked():
+                match_status.setText('Baking correction to 3D LUT...')
+                QtWidgets.QApplication.processEvents()
+                correction, max_abs, max_rel = bake_correction(correction, state['src_img'], src_p)
+                bake_note = f'  (LUT max error {max_rel:.2f}%)'
+
             verify_patches(src_p, ref_p, correction)
+            state['correction'] = correction
 
             progress.setValue(40)
             match_status.setText('Applying correction to image...')
@@ -1113,16 +1398,13 @@ def launch_ui(selection):
             src_dir = os.path.dirname(state['src_path'])
             src_base = os.path.splitext(os.path.basename(state['src_path']))[0]
 
-            # For standard mode offer EXR / LUT / Both choice
-            if not hdr_mode:
-                exp_dlg = ExportChoiceDialog()
-                if exp_dlg.exec() != QtWidgets.QDialog.DialogCode.Accepted or exp_dlg.choice is None:
-                    match_status.setText('Cancelled.')
-                    match_status.setStyleSheet('font-size:10px;color:#888888;')
-                    progress.setVisible(False); return
-                export_choice = exp_dlg.choice
-            else:
-                export_choice = 'exr'  # HDR always exports EXR
+            # Offer EXR / LUT / Both / Sequence choice
+            exp_dlg = ExportChoiceDialog()
+            if exp_dlg.exec() != QtWidgets.QDialog.DialogCode.Accepted or exp_dlg.choice is None:
+                match_status.setText('Cancelled.')
+                match_status.setStyleSheet('font-size:10px;color:#888888;')
+                progress.setVisible(False); return
+            export_choice = exp_dlg.choice
 
             saved_files = []
 
@@ -1144,7 +1426,7 @@ def launch_ui(selection):
                     except Exception as e:
                         print(f'[AB ColorChecker] Auto-import skipped: {e}')
 
-            # Export LUT (standard mode only — matrix is linear so LUT == EXR exactly)
+            # Export LUT (standard: matrix is linear so LUT == EXR exactly; HDR: baked RBF)
             if export_choice in ('lut', 'both'):
                 lut_path, _ = QtWidgets.QFileDialog.getSaveFileName(
                     win, 'Save 3D LUT',
@@ -1153,13 +1435,7 @@ def launch_ui(selection):
                 if lut_path:
                     if not lut_path.lower().endswith('.cube'):
                         lut_path += '.cube'
-                    # Domain = source white patch value * 2 for headroom
-                    # Domain must cover full image range including highlights
-                    # Matrix is linear so any domain size gives exact interpolation
-                    _, M = correction
-                    cube_str = build_lut_from_matrix(M, lut_size=33, domain_max=100.0)
-                    with open(lut_path, 'w') as f:
-                        f.write(cube_str)
+                    export_cube(correction, lut_path, state['src_img'], src_p)
                     print(f'[AB ColorChecker] LUT saved: {lut_path}')
                     saved_files.append(os.path.basename(lut_path))
 
@@ -1247,15 +1523,12 @@ def launch_ui(selection):
                     if lut_path:
                         if not lut_path.lower().endswith('.cube'):
                             lut_path += '.cube'
-                        _, M = correction
-                        cube_str = build_lut_from_matrix(M, lut_size=33, domain_max=100.0)
-                        with open(lut_path, 'w') as f:
-                            f.write(cube_str)
+                        export_cube(correction, lut_path, state['src_img'], src_p)
                         saved_files.append(os.path.basename(lut_path))
 
             progress.setValue(100)
             if saved_files:
-                match_status.setText(f'✓  Saved: {", ".join(saved_files)}  —  Session can now be saved for reuse.')
+                match_status.setText(f'✓  Saved: {", ".join(saved_files)}{bake_note}  —  Session can now be saved for reuse.')
                 match_status.setStyleSheet('font-size:11px;color:#66cc66;')
                 save_session_btn.setEnabled(True)
             else:
@@ -1296,6 +1569,7 @@ def launch_ui(selection):
 
     apply_btn.clicked.connect(on_apply)
     save_session_btn.clicked.connect(on_save_session)
+    load_lut_btn.clicked.connect(on_load_lut)
     load_session_btn.clicked.connect(on_load_session)
     browse_session_btn.clicked.connect(on_browse_session)
 
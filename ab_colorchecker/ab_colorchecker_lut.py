@@ -0,0 +1,189 @@
+"""
+AB ColorChecker — 3D LUT (.cube) toolkit.
+
+Loaded by ab_colorchecker.py. Reads and writes .cube files and applies,
+compares and combines 3D LUTs held as NumPy arrays, so a saved LUT can be
+reused without re-solving the correction.
+
+LUT tables are float32 arrays indexed [r, g, b, rgb]. .cube files store
+rows red-fastest, which is the same memory order as a [b, g, r, rgb]
+array, so reading and writing is a transpose plus a flat copy.
+
+NumPy is imported inside each function so this file can sit in the Flame
+python hooks folder before ab_colorchecker has set up its library paths.
+"""
+
+from collections import namedtuple
+
+# Rows formatted and written per chunk when saving a .cube
+CUBE_WRITE_CHUNK = 65536
+
+CubeLUT = namedtuple('CubeLUT', ['table', 'domain_min', 'domain_max', 'title'])
+CubeLUT.__doc__ = """3D LUT: table [r, g, b, rgb] float32, per-channel domain_min/domain_max, title."""
+
+
+def make_lut(table, domain_min=0.0, domain_max=1.0, title='AB Camera Match'):
+    """Wrap a [r, g, b, rgb] table in a CubeLUT. Scalar domains apply to all channels."""
+    import numpy as np
+    table = np.asarray(table, dtype=np.float32)
+    if table.ndim != 4 or table.shape[3] != 3 or not (table.shape[0] == table.shape[1] == table.shape[2]):
+        raise ValueError(f'LUT table must be [n, n, n, 3], got {table.shape}')
+    domain_min = np.broadcast_to(np.asarray(domain_min, dtype=np.float32), (3,)).copy()
+    domain_max = np.broadcast_to(np.asarray(domain_max, dtype=np.float32), (3,)).copy()
+    if (domain_max <= domain_min).any():
+        raise ValueError(f'LUT domain max {domain_max} must be above domain min {domain_min}')
+    return CubeLUT(table, domain_min, domain_max, title)
+
+
+def lut_grid(lut_size, domain_min, domain_max):
+    """Return the (lut_size^3, 3) grid points of a LUT in [r, g, b] index order."""
+    import numpy as np
+    domain_min = np.broadcast_to(np.asarray(domain_min, dtype=np.float64), (3,))
+    domain_max = np.broadcast_to(np.asarray(domain_max, dtype=np.float64), (3,))
+    axes = [np.linspace(domain_min[c], domain_max[c], lut_size) for c in range(3)]
+    r_g, g_g, b_g = np.meshgrid(*axes, indexing='ij')
+    return np.stack([r_g.ravel(), g_g.ravel(), b_g.ravel()], axis=1)
+
+
+def lut_from_function(fn, lut_size, domain_min, domain_max, title='AB Camera Match'):
+    """Bake fn((N, 3) -> (N, 3)) into a LUT over [domain_min, domain_max]."""
+    grid_pts = lut_grid(lut_size, domain_min, domain_max)
+    table = fn(grid_pts).reshape(lut_size, lut_size, lut_size, 3)
+    return make_lut(table, domain_min, domain_max, title)
+
+
+def lut_from_matrix(M, lut_size=33, domain_min=0.0, domain_max=1.0, title='AB Camera Match'):
+    """LUT of a 3x3 colour matrix (row vectors: out = rgb @ M). Exact, since the matrix is linear."""
+    return lut_from_function(lambda pts: pts @ M, lut_size, domain_min, domain_max, title)
+
+
+def write_cube(path, lut, comments=()):
+    """
+    Write a LUT as a .cube file. Rows are written red-fastest straight from
+    a transposed copy of the table, formatted a chunk at a time.
+    """
+    import numpy as np
+    n = lut.table.shape[0]
+    rows = np.ascontiguousarray(lut.table.transpose(2, 1, 0, 3), dtype=np.float64).reshape(-1, 3)
+    dmin, dmax = lut.domain_min, lut.domain_max
+    with open(path, 'w') as f:
+        for line in comments:
+            f.write(f'# {line}\n')
+        f.write(f'TITLE "{lut.title}"\n')
+        f.write(f'LUT_3D_SIZE {n}\n')
+        f.write(f'DOMAIN_MIN {dmin[0]:.6f} {dmin[1]:.6f} {dmin[2]:.6f}\n')
+        f.write(f'DOMAIN_MAX {dmax[0]:.6f} {dmax[1]:.6f} {dmax[2]:.6f}\n')
+        f.write('\n')
+        for i in range(0, len(rows), CUBE_WRITE_CHUNK):
+            block = rows[i:i+CUBE_WRITE_CHUNK]
+            f.write(('%.6f %.6f %.6f\n' * len(block)) % tuple(block.ravel().tolist()))
+
+
+def read_cube(path):
+    """
+    Read a 3D .cube file into a CubeLUT. Supports TITLE, LUT_3D_SIZE,
+    DOMAIN_MIN/DOMAIN_MAX and LUT_3D_INPUT_RANGE. 1D LUTs are not supported.
+    """
+    import numpy as np
+    title = ''
+    lut_size = None
+    domain_min = [0.0, 0.0, 0.0]
+    domain_max = [1.0, 1.0, 1.0]
+    data = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if data or line[0] in '0123456789-+.':
+                data.append(line)
+                continue
+            key, _, value = line.partition(' ')
+            value = value.strip()
+            if key == 'TITLE':
+                title = value.strip('"')
+            elif key == 'LUT_3D_SIZE':
+                lut_size = int(value)
+            elif key == 'DOMAIN_MIN':
+                domain_min = [float(v) for v in value.split()]
+            elif key == 'DOMAIN_MAX':
+                domain_max = [float(v) for v in value.split()]
+            elif key == 'LUT_3D_INPUT_RANGE':
+                lo, hi = (float(v) for v in value.split())
+                domain_min, domain_max = [lo] * 3, [hi] * 3
+            elif key == 'LUT_1D_SIZE':
+                raise ValueError(f'{path}: 1D LUTs are not supported')
+
+    if lut_size is None:
+        raise ValueError(f'{path}: missing LUT_3D_SIZE')
+    values = np.array(' '.join(data).split(), dtype=np.float32)
+    if values.size != lut_size ** 3 * 3:
+        raise ValueError(f'{path}: expected {lut_size ** 3} rows, found {values.size / 3:g}')
+    table = values.reshape(lut_size, lut_size, lut_size, 3).transpose(2, 1, 0, 3)
+    return make_lut(np.ascontiguousarray(table), domain_min, domain_max, title)
+
+
+def apply_lut(flat, lut, method='tetrahedral'):
+    """
+    Look up (N, 3) pixels in a LUT with vectorized tetrahedral or trilinear
+    interpolation. Values outside the domain are clamped to its edges,
+    +inf to the upper edge and -inf and NaN to the lower edge.
+    """
+    import numpy as np
+    flat = np.asarray(flat, dtype=np.float32)
+    n = lut.table.shape[0]
+    table = lut.table.reshape(-1, 3)
+    pos = (flat - lut.domain_min) * ((n - 1) / (lut.domain_max - lut.domain_min))
+    # Non-finite positions would cast to out of range indices
+    np.nan_to_num(pos, copy=False, nan=0.0, posinf=n - 1, neginf=0.0)
+    np.clip(pos, 0, n - 1, out=pos)
+    idx = np.minimum(pos.astype(np.int32), n - 2)
+    f = (pos - idx).astype(np.float32)
+    strides = np.array([n * n, n, 1], dtype=np.int32)
+    base = idx @ strides
+
+    if method == 'trilinear':
+        out = np.zeros_like(f)
+        for dr in (0, 1):
+            wr = f[:, 0:1] if dr else 1 - f[:, 0:1]
+            for dg in (0, 1):
+                wg = f[:, 1:2] if dg else 1 - f[:, 1:2]
+                for db in (0, 1):
+                    wb = f[:, 2:3] if db else 1 - f[:, 2:3]
+                    out += (wr * wg * wb) * table[base + dr * n * n + dg * n + db]
+        return out
+
+    # Tetrahedral: walk from the base corner along axes in order of
+    # largest fraction, weights are the differences of sorted fractions
+    order = np.argsort(-f, axis=1)
+    fs = np.take_along_axis(f, order, axis=1)
+    steps = strides[order]
+    i1 = base + steps[:, 0]
+    i2 = i1 + steps[:, 1]
+    i3 = i2 + steps[:, 2]
+    return ((1 - fs[:, 0:1]) * table[base] + (fs[:, 0:1] - fs[:, 1:2]) * table[i1]
+            + (fs[:, 1:2] - fs[:, 2:3]) * table[i2] + fs[:, 2:3] * table[i3])
+
+
+def compare_luts(lut_a, lut_b, samples=None, method='tetrahedral'):
+    """
+    Compare two LUTs on the grid points of lut_a (or on (N, 3) samples).
+    Returns (max_abs_err, mean_abs_err).
+    """
+    import numpy as np
+    if samples is None:
+        samples = lut_grid(lut_a.table.shape[0], lut_a.domain_min, lut_a.domain_max)
+    err = np.abs(apply_lut(samples, lut_a, method) - apply_lut(samples, lut_b, method))
+    return float(err.max()), float(err.mean())
+
+
+def combine_luts(first, second, lut_size=None, method='tetrahedral'):
+    """
+    LUT that applies first then second, on the grid and domain of first
+    (optionally resampled to lut_size).
+    """
+    lut_size = lut_size or first.table.shape[0]
+    return lut_from_function(
+        lambda pts: apply_lut(apply_lut(pts, first, method), second, method),
+        lut_size, first.domain_min, first.domain_max,
+        f'{first.title} + {second.title}'.strip(' +'))
@@ -1,10 +1,10 @@
 """
 Script Name: Batch Group to Shot Folders
-Script Version: 1.0.0
+Script Version: 1.0.1
 Flame Version: 2025.1
 Written by: Michael Vaglienty
 Creation Date: 06.02.26
-Update Date: 06.11.26
+Update Date: 10.19.26
 
 Custom Action Type: Media Panel
 
@@ -65,6 +65,10 @@ To install:
 
 Updates:
 
+    v1.0.1 10.19.26
+        - Destination path is split into tokens once for all selected batch groups.
+        - Updated to PyFlameLib v5.4.1.
+
     v1.0.0 06.11.26
         - Initial release.
 """
@@ -84,7 +88,7 @@ from lib.pyflame_lib_batch_group_to_shot_folders import *
 # ==============================================================================
 
 SCRIPT_NAME = 'Batch Group to Shot Folders'
-SCRIPT_VERSION = 'v1.0.0'
+SCRIPT_VERSION = 'v1.0.1'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
 # ==============================================================================
@@ -440,7 +444,7 @@ class ToShotFolders:
                 return dest_folder
 
             # Resolve any remaining tokens in the destination path (e.g. project/date tokens)
-            dest_path = pyflame.resolve_tokens(tokenized_string=self.settings.tokenized_path, flame_pyobject=batch)
+            dest_path = dest_path_template.resolve(batch)
             print('Dest Path:', dest_path, '\n')
 
             print('Getting Shot Name...')
@@ -498,6 +502,9 @@ class ToShotFolders:
         if check_for_errors():
             return
 
+        # Split destination path into tokens once, project/user/date values are shared by all batch groups
+        dest_path_template = PyFlameTokenTemplate(self.settings.tokenized_path)
+
         # Move/Copy batch groups to destination folder
         replace_all = False  # Set True when user selects Replace All to skip further prompts
         cancelled = False    # Set True when user selects Cancel to abort the operation
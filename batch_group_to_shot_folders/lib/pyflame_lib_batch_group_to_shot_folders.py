@@ -19,10 +19,10 @@
 
 """
 PyFlame Library
-Version: 5.4.0
+Version: 5.4.1
 Written By: Michael Vaglienty
 Creation Date: 10.31.20
-Update Date: 06.03.26
+Update Date: 10.19.26
 
 Minimum Flame 2025.1
 
@@ -2428,6 +2428,10 @@ class _PyFlame:
 
         Resolves strings containing tokens.
 
+        The string is resolved with `PyFlameTokenTemplate`. To resolve the same string for many
+        Flame PyObjects use `pyflame.resolve_tokens_bulk` or a `PyFlameTokenTemplate` so project,
+        user, and date values are only looked up once.
+
         Args
         ----
             `tokenized_string` (str):
@@ -2441,6 +2445,10 @@ class _PyFlame:
                 Date/time to use for token translation. If None is passed datetime value will be gotten each time function is run.
                 (Default: `None`)
 
+            `shot_name_tag` (str, optional):
+                Batch group tag used to get the shot name of a PyBatch (<shot_name_tag>: <shot_name>).
+                (Default: `ShotName`)
+
         Supported tokens:
         ----------------
             <ProjectName>, <ProjectNickName>, <UserName>, <UserNickName>, <YYYY>, <YY>, <MM>, <DD>, <Hour>, <Minute>, <AMPM>, <ampm>
@@ -2465,7 +2473,7 @@ class _PyFlame:
         -------
             To resolve path tokens:
             ```
-            export_path = pyflame.translate_path_tokens(
+            export_path = pyflame.resolve_tokens(
                 tokenized_string=custom_export_path,
                 flame_pyobject=clip,
                 date=date
@@ -2477,253 +2485,64 @@ class _PyFlame:
         if not isinstance(tokenized_string, str):
             pyflame.raise_type_error('pyflame.resolve_tokens', 'tokenized_string', 'str', tokenized_string)
 
-        def get_seq_name(name):
-            """
-            Get sequence name abreviation from shot name
-            """
+        return PyFlameTokenTemplate(tokenized_string, date=date, shot_name_tag=shot_name_tag).resolve(flame_pyobject)
 
-            seq_name = re.split('[^a-zA-Z]', name)[0]
-            return seq_name
-
-        pyflame.print('Resolving Tokens', new_line=False)
-        print('----------------')
-
-        print('Checking for tokens in string:', tokenized_string)
+    @staticmethod
+    def resolve_tokens_bulk(tokenized_string: str, flame_pyobjects: list, date=None, shot_name_tag: str = 'ShotName') -> list[str]:
+        """
+        Resolve Tokens Bulk
+        ===================
 
-        # Check if string has tokens
-        if not re.search(r'<.*?>', tokenized_string):
-            pyflame.print(f'No tokens found in string: {tokenized_string}')
-            return tokenized_string
-        else:
-            pyflame.print(f'Tokens found in string, resolving...')
-        # Get time values for token conversion
-        if not date:
-            date = datetime.datetime.now()
-
-        yyyy = date.strftime('%Y')
-        yy = date.strftime('%y')
-        mm = date.strftime('%m')
-        dd = date.strftime('%d')
-        hour = date.strftime('%I')
-        if hour.startswith('0'):
-            hour = hour[1:]
-        minute = date.strftime('%M')
-        ampm_caps = date.strftime('%p')
-        ampm = str(date.strftime('%p')).lower()
-
-        # Replace tokens in path
-        resolved_path = re.sub('<ProjectName>', flame.projects.current_project.name, tokenized_string)
-        resolved_path = re.sub('<ProjectNickName>', flame.projects.current_project.nickname, resolved_path)
-        resolved_path = re.sub('<UserName>', flame.users.current_user.name, resolved_path)
-        resolved_path = re.sub('<UserNickName>', flame.users.current_user.nickname, resolved_path)
-        resolved_path = re.sub('<YYYY>', yyyy, resolved_path)
-        resolved_path = re.sub('<YY>', yy, resolved_path)
-        resolved_path = re.sub('<MM>', mm, resolved_path)
-        resolved_path = re.sub('<DD>', dd, resolved_path)
-        resolved_path = re.sub('<Hour>', hour, resolved_path)
-        resolved_path = re.sub('<Minute>', minute, resolved_path)
-        resolved_path = re.sub('<AMPM>', ampm_caps, resolved_path)
-        resolved_path = re.sub('<ampm>', ampm, resolved_path)
-
-        # Get Batch Group Name - Only works when a PyBatch object is passed as the flame_pyobject argument.
-        if flame_pyobject:
-            if '<BatchGroupName>' in tokenized_string and isinstance(flame_pyobject, flame.PyBatch):
-                resolved_path = re.sub('<BatchGroupName>', str(flame_pyobject.name)[1:-1], resolved_path)
-
-        # Resolve tokens for flame pyobjects
-        if flame_pyobject:
-            if isinstance(flame_pyobject, flame.PyClip):
-
-                def resolve_clip_tokens(clip, resolved_path: str) -> str:
-                    """
-                    Resolve Clip Tokens
-                    ===================
-                    """
-
-                    clip_name = str(clip.name)[1:-1] # Get clip name
-
-                    # Get shot name from clip
-                    try:
-                        if clip.versions[0].tracks[0].segments[0].shot_name != '':
-                            shot_name = str(clip.versions[0].tracks[0].segments[0].shot_name)[1:-1]
-                        else:
-                            shot_name = pyflame.resolve_shot_name(clip_name)
-                    except:
-                        shot_name = ''
-
-                    # Get tape name from clip
-                    try:
-                        tape_name = str(clip.versions[0].tracks[0].segments[0].tape_name) # Get tape name
-                    except:
-                        tape_name = ''
-
-                    seq_name = get_seq_name(shot_name) # Get Seq Name from shot name
-
-                    # Replace clip tokens in path
-                    resolved_path = re.sub('<ShotName>', shot_name, resolved_path)
-                    resolved_path = re.sub('<SeqName>', seq_name, resolved_path)
-                    resolved_path = re.sub('<SEQNAME>', seq_name.upper(), resolved_path)
-                    resolved_path = re.sub('<ClipName>', str(clip.name)[1:-1], resolved_path)
-                    resolved_path = re.sub('<Resolution>', str(clip.width) + 'x' + str(clip.height), resolved_path)
-                    resolved_path = re.sub('<ClipHeight>', str(clip.height), resolved_path)
-                    resolved_path = re.sub('<ClipWidth>', str(clip.width), resolved_path)
-                    resolved_path = re.sub('<TapeName>', tape_name, resolved_path)
-
-                    return resolved_path
-
-                resolved_path = resolve_clip_tokens(flame_pyobject, resolved_path)
-
-            elif isinstance(flame_pyobject, flame.PySegment):
-
-                def resolve_segment_tokens(segment, resolved_path: str) -> str:
-                    """
-                    Resolve Segment Tokens
-                    ======================
-
-                    Args
-                    ----
-                        `segment` (flame.PySegment):
-                            Flame PySegment object.
-
-                        `resolved_path` (str):
-                            Resolved path with tokens.
-
-                    Returns
-                    -------
-                        `resolved_path` (str):
-                            Resolved path with tokens.
-                    """
-
-                    segment_name = str(segment.name)[1:-1]
-
-                    # Get shot name from clip
-                    try:
-                        if segment.shot_name != '':
-                            shot_name = str(segment.shot_name)[1:-1]
-                        else:
-                            shot_name = pyflame.resolve_shot_name(segment_name)
-                    except:
-                        shot_name = ''
-
-                    # Get tape name from segment
-                    try:
-                        tape_name = str(segment.tape_name)
-                    except:
-                        tape_name = ''
-
-                    seq_name = get_seq_name(shot_name) # Get Seq Name from shot name
-
-                    # Replace segment tokens in path
-                    resolved_path = re.sub('<ShotName>', shot_name, resolved_path)
-                    resolved_path = re.sub('<SeqName>', seq_name, resolved_path)
-                    resolved_path = re.sub('<SEQNAME>', seq_name.upper(), resolved_path)
-                    resolved_path = re.sub('<ClipName>', segment_name, resolved_path)
-                    resolved_path = re.sub('<Resolution>', 'Unable to Resolve', resolved_path)
-                    resolved_path = re.sub('<ClipHeight>', 'Unable to Resolve', resolved_path)
-                    resolved_path = re.sub('<ClipWidth>', 'Unable to Resolve', resolved_path)
-                    resolved_path = re.sub('<TapeName>', tape_name, resolved_path)
-
-                    return resolved_path
-
-                resolved_path = resolve_segment_tokens(flame_pyobject, resolved_path)
-
-            elif isinstance(flame_pyobject, flame.PyBatch):
-
-                def resolve_batch_tokens(batch, resolved_path: str) -> str:
-                    """
-                    Resolve Batch Tokens
-                    ====================
-
-                    Batch is checked for a ShotName tag(ShotName:<shot_name>). If found, it is used to resolve the shot name token.
-                    Otherwise, any Render nodes in the batch are checked for a shot name. If a shot name is found, it is used to resolve the shot name token.
-                    If no shot name is found, the batch name is used to resolve the shot name token.
-
-                    Args
-                    ----
-                        `batch` (flame.PyBatch):
-                            Flame PyBatch object.
-
-                        `resolved_path` (str):
-                            Resolved path with tokens.
-
-                    Returns
-                    -------
-                        `resolved_path` (str):
-                            Resolved path with tokens.
-                    """
-
-                    def get_shot_name_tag(batch) -> str | None:
-                        """
-                        Get Shot Name Tag
-                        """
-
-                        # Check for ShotName tag
-                        if batch.tags.get_value() != []:
-                            print('Batch Tags:', batch.tags.get_value())
-                            for tag in batch.tags.get_value():
-                                if tag.startswith(f'{shot_name_tag}:'):
-                                    shot_name = tag.split(': ')[1]
-                                    print(f'Batch Shot Name Tag Found: {shot_name}')
-                                    return shot_name
-                        else:
-                            print('No Batch Shot Name Tags Found')
-                            return None
-
-                    def get_shot_name_from_render_nodes(batch) -> str | None:
-                        """
-                        Get Shot Name from Render Nodes
-                        """
-
-                        render_node_types = ['Render', 'Write File']
-                        render_nodes = [node for node in batch.nodes if node.type in render_node_types]
-
-                        if render_nodes:
-                            shot_name = str(render_nodes[0].shot_name)[1:-1]
-                            if shot_name:
-                                print(f'Render Node Shot Name Found: {shot_name}')
-                                return shot_name
-                            else:
-                                print('Render Node Shot Name Not Found')
-                                return None
-                        else:
-                            print('No Render Nodes Found')
-                            return None
-
-                    shot_name = None
-                    print('Checking for Shot Name Tag...')
-                    if batch.tags:
-                        shot_name = get_shot_name_tag(batch)
-                        print(f'Shot Name from Batch Tag: {shot_name}')
-                    else:
-                        print('No Batch Shot Name Tags Found')
+        Resolves a string containing tokens for each Flame PyObject in a list.
 
-                    if not shot_name:
-                        shot_name = get_shot_name_from_render_nodes(batch)
-                        print(f'Shot Name from Render Nodes: {shot_name}')
+        The string is only split into tokens once and project, user, and date values are only looked up
+        once for the whole list. See `pyflame.resolve_tokens` for supported tokens.
 
-                    if not shot_name:
-                        shot_name = pyflame.resolve_shot_name(str(batch.name)[1:-1])
-                        print(f'Shot Name from Batch Name: {shot_name}')
+        Args
+        ----
+            `tokenized_string` (str):
+                String with tokens to be translated.
 
-                    print('\n', end='')
+            `flame_pyobjects` (list):
+                List of Flame PyClip/PySegment/PyBatch objects.
 
-                    seq_name = get_seq_name(shot_name) # Get Seq Name from shot name
+            `date` (datetime, optional):
+                Date/time to use for token translation. If None is passed the current time is used for the whole list.
+                (Default: `None`)
 
-                    # Replace tokens in path
-                    resolved_path = re.sub('<ShotName>', shot_name, resolved_path)
-                    resolved_path = re.sub('<SeqName>', seq_name, resolved_path)
-                    resolved_path = re.sub('<SEQNAME>', seq_name.upper(), resolved_path)
+            `shot_name_tag` (str, optional):
+                Batch group tag used to get the shot name of a PyBatch (<shot_name_tag>: <shot_name>).
+                (Default: `ShotName`)
 
-                    print(f'Resolved Path: {resolved_path}')
+        Returns
+        -------
+            `resolved_strings` (list[str]):
+                Resolved strings in the same order as `flame_pyobjects`.
 
-                    return resolved_path
+        Raises
+        ------
+            TypeError:
+                If `tokenized_string` is not a string.
+                If `flame_pyobjects` is not a list.
 
-                resolved_path = resolve_batch_tokens(flame_pyobject, resolved_path)
+        Example
+        -------
+            To resolve export paths for all selected clips:
+            ```
+            export_paths = pyflame.resolve_tokens_bulk(
+                tokenized_string=custom_export_path,
+                flame_pyobjects=selection,
+                )
+            ```
+        """
 
-        pyflame.print(f'Resolved Tokenized String: {resolved_path}', text_color=TextColor.GREEN, new_line=False)
-        print('----------------\n')
+        # Validate Argument types
+        if not isinstance(tokenized_string, str):
+            pyflame.raise_type_error('pyflame.resolve_tokens_bulk', 'tokenized_string', 'str', tokenized_string)
+        elif not isinstance(flame_pyobjects, (list, tuple)):
+            pyflame.raise_type_error('pyflame.resolve_tokens_bulk', 'flame_pyobjects', 'list', flame_pyobjects)
 
-        return resolved_path
+        return PyFlameTokenTemplate(tokenized_string, date=date, shot_name_tag=shot_name_tag).resolve_many(flame_pyobjects)
 
     @staticmethod
     def resolve_shot_name(name: str) -> str:
@@ -4503,6 +4322,390 @@ class PyFlameConfig:
 
         return data
 
+class PyFlameTokenTemplate:
+    """
+    PyFlame Token Template
+    ======================
+
+    Tokenized string that is split into text and tokens once and can then be resolved any number of times.
+
+    Project, user, and date token values are looked up the first time the template is resolved and are
+    reused for every resolve after that. Clip, segment, and batch group values are only looked up for
+    tokens that are in the string. Resolving a template is one dictionary lookup per token, so one
+    template can resolve paths for hundreds of clips, segments, or batch groups.
+
+    Tokens that can't be resolved are left in the string unchanged.
+
+    `pyflame.resolve_tokens` and `pyflame.resolve_tokens_bulk` use this class.
+
+    Args
+    ----
+        `tokenized_string` (str):
+            String with tokens to be resolved.
+
+        `date` (datetime, optional):
+            Date/time to use for date tokens. If None is passed, the time the template is first resolved is used.
+            (Default: `None`)
+
+        `shot_name_tag` (str, optional):
+            Batch group tag used to get the shot name of a PyBatch (<shot_name_tag>: <shot_name>).
+            (Default: `ShotName`)
+
+    Properties
+    ----------
+        `tokenized_string` (str):
+            Get the tokenized string.
+
+        `tokens` (frozenset[str]):
+            Get the tokens found in the tokenized string.
+
+    Methods
+    -------
+        `resolve(flame_pyobject=None)` -> str:
+            Resolve the template.
+
+        `resolve_many(flame_pyobjects)` -> list[str]:
+            Resolve the template for each Flame PyObject in a list.
+
+        `clear_cache()`:
+            Clear split template cache. (Class method)
+
+    Supported tokens:
+    ----------------
+        <ProjectName>, <ProjectNickName>, <UserName>, <UserNickName>, <YYYY>, <YY>, <MM>, <DD>, <Hour>, <Minute>, <AMPM>, <ampm>
+
+        Additional tokens available when Flame PyObjects are resolved:
+            PyClip and PySegment:
+                <ShotName>, <SeqName>, <SEQNAME>, <ClipName>, <Resolution>, <ClipHeight>, <ClipWidth>, <TapeName>
+            PyBatch:
+                <BatchGroupName>, <ShotName>, <SeqName>, <SEQNAME>
+
+    Examples
+    --------
+        To resolve an export path for each selected clip:
+        ```
+        export_path_template = PyFlameTokenTemplate('/jobs/<ProjectName>/<ShotName>/<YYYY>-<MM>-<DD>')
+
+        for clip in selection:
+            export_path = export_path_template.resolve(clip)
+        ```
+
+        To resolve all paths in one call:
+        ```
+        export_paths = export_path_template.resolve_many(selection)
+        ```
+    """
+
+    PROJECT_TOKENS = frozenset({'<ProjectName>', '<ProjectNickName>'})
+    USER_TOKENS = frozenset({'<UserName>', '<UserNickName>'})
+    DATE_TOKENS = frozenset({'<YYYY>', '<YY>', '<MM>', '<DD>', '<Hour>', '<Minute>', '<AMPM>', '<ampm>'})
+    SHOT_TOKENS = frozenset({'<ShotName>', '<SeqName>', '<SEQNAME>'})
+    CLIP_TOKENS = SHOT_TOKENS | frozenset({'<ClipName>', '<Resolution>', '<ClipHeight>', '<ClipWidth>', '<TapeName>'})
+    BATCH_TOKENS = SHOT_TOKENS | frozenset({'<BatchGroupName>'})
+
+    # Split templates by tokenized string. Shared by all templates.
+    _parts_cache: dict[str, tuple[str, ...]] = {}
+
+    def __init__(self: 'PyFlameTokenTemplate',
+                 tokenized_string: str,
+                 date=None,
+                 shot_name_tag: str='ShotName',
+                 ) -> None:
+
+        # Validate Arguments
+        if not isinstance(tokenized_string, str):
+            pyflame.raise_type_error('PyFlameTokenTemplate', 'tokenized_string', 'str', tokenized_string)
+        elif date is not None and not isinstance(date, datetime.datetime):
+            pyflame.raise_type_error('PyFlameTokenTemplate', 'date', 'datetime | None', date)
+        elif not isinstance(shot_name_tag, str):
+            pyflame.raise_type_error('PyFlameTokenTemplate', 'shot_name_tag', 'str', shot_name_tag)
+
+        self._tokenized_string = tokenized_string
+        self._date = date
+        self._shot_name_tag = shot_name_tag
+
+        # Text is at even indexes, tokens are at odd indexes
+        self._parts = self._split(tokenized_string)
+        self._tokens = frozenset(self._parts[1::2])
+
+        self._global_values = None
+
+    #-------------------------------------
+    # [Properties]
+    #-------------------------------------
+
+    @property
+    def tokenized_string(self) -> str:
+        """
+        Tokenized String
+        ================
+
+        Get the tokenized string.
+        """
+
+        return self._tokenized_string
+
+    @property
+    def tokens(self) -> frozenset:
+        """
+        Tokens
+        ======
+
+        Get the tokens found in the tokenized string.
+        """
+
+        return self._tokens
+
+    #-------------------------------------
+    # [Methods]
+    #-------------------------------------
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Clear Cache
+        ===========
+
+        Clear split template cache.
+        """
+
+        cls._parts_cache.clear()
+
+    def resolve(self, flame_pyobject=None) -> str:
+        """
+        Resolve
+        =======
+
+        Resolve the template.
+
+        Args
+        ----
+            `flame_pyobject` (flame.PyClip | flame.PySegment | flame.PyBatch, optional):
+                Flame PyObject used to resolve clip, segment, or batch group tokens.
+                (Default: `None`)
+
+        Returns
+        -------
+            `resolved_string` (str):
+                String with resolved tokens.
+        """
+
+        if not self._tokens:
+            return self._tokenized_string
+
+        values = self._get_global_values()
+        if flame_pyobject is not None:
+            values = {**values, **self._get_pyobject_values(flame_pyobject)}
+
+        parts = list(self._parts)
+        for index in range(1, len(parts), 2):
+            parts[index] = values.get(parts[index], parts[index])
+
+        return ''.join(parts)
+
+    def resolve_many(self, flame_pyobjects: list) -> list[str]:
+        """
+        Resolve Many
+        ============
+
+        Resolve the template for each Flame PyObject in a list.
+
+        Args
+        ----
+            `flame_pyobjects` (list):
+                List of Flame PyClip/PySegment/PyBatch objects.
+
+        Returns
+        -------
+            `resolved_strings` (list[str]):
+                Resolved strings in the same order as `flame_pyobjects`.
+
+        Raises
+        ------
+            TypeError:
+                If `flame_pyobjects` is not a list or tuple.
+        """
+
+        if not isinstance(flame_pyobjects, (list, tuple)):
+            pyflame.raise_type_error('PyFlameTokenTemplate.resolve_many', 'flame_pyobjects', 'list', flame_pyobjects)
+
+        return [self.resolve(flame_pyobject) for flame_pyobject in flame_pyobjects]
+
+    #-------------------------------------
+    # [Internal Methods]
+    #-------------------------------------
+
+    @classmethod
+    def _split(cls, tokenized_string: str) -> tuple[str, ...]:
+        """
+        Split
+        =====
+
+        Split string into text and tokens. Results are cached by string.
+        """
+
+        parts = cls._parts_cache.get(tokenized_string)
+        if parts is None:
+            parts = tuple(re.split(r'(<[^<>]+>)', tokenized_string))
+            cls._parts_cache[tokenized_string] = parts
+
+        return parts
+
+    def _get_global_values(self) -> dict[str, str]:
+        """
+        Get Global Values
+        =================
+
+        Get project, user, and date token values. Values are only looked up once per template.
+        """
+
+        if self._global_values is not None:
+            return self._global_values
+
+        values = {}
+
+        if self._tokens & self.PROJECT_TOKENS:
+            project = flame.projects.current_project
+            values['<ProjectName>'] = project.name
+            values['<ProjectNickName>'] = project.nickname
+
+        if self._tokens & self.USER_TOKENS:
+            user = flame.users.current_user
+            values['<UserName>'] = user.name
+            values['<UserNickName>'] = user.nickname
+
+        if self._tokens & self.DATE_TOKENS:
+            date = self._date or datetime.datetime.now()
+            values['<YYYY>'] = date.strftime('%Y')
+            values['<YY>'] = date.strftime('%y')
+            values['<MM>'] = date.strftime('%m')
+            values['<DD>'] = date.strftime('%d')
+            values['<Hour>'] = date.strftime('%I').lstrip('0')
+            values['<Minute>'] = date.strftime('%M')
+            values['<AMPM>'] = date.strftime('%p')
+            values['<ampm>'] = date.strftime('%p').lower()
+
+        self._global_values = values
+
+        return values
+
+    def _get_pyobject_values(self, flame_pyobject) -> dict[str, str]:
+        """
+        Get PyObject Values
+        ===================
+
+        Get clip, segment, or batch group token values for tokens in the template.
+        """
+
+        if isinstance(flame_pyobject, flame.PyClip):
+            if not self._tokens & self.CLIP_TOKENS:
+                return {}
+
+            try:
+                segment = flame_pyobject.versions[0].tracks[0].segments[0]
+            except:
+                segment = None
+
+            values = self._get_shot_values(segment, str(flame_pyobject.name)[1:-1])
+            values['<ClipName>'] = str(flame_pyobject.name)[1:-1]
+            values['<Resolution>'] = f'{flame_pyobject.width}x{flame_pyobject.height}'
+            values['<ClipHeight>'] = str(flame_pyobject.height)
+            values['<ClipWidth>'] = str(flame_pyobject.width)
+
+        elif isinstance(flame_pyobject, flame.PySegment):
+            if not self._tokens & self.CLIP_TOKENS:
+                return {}
+
+            values = self._get_shot_values(flame_pyobject, str(flame_pyobject.name)[1:-1])
+            values['<ClipName>'] = str(flame_pyobject.name)[1:-1]
+            values['<Resolution>'] = 'Unable to Resolve'
+            values['<ClipHeight>'] = 'Unable to Resolve'
+            values['<ClipWidth>'] = 'Unable to Resolve'
+
+        elif isinstance(flame_pyobject, flame.PyBatch):
+            if not self._tokens & self.BATCH_TOKENS:
+                return {}
+
+            values = {'<BatchGroupName>': str(flame_pyobject.name)[1:-1]}
+            if self._tokens & self.SHOT_TOKENS:
+                values.update(self._get_seq_values(self._get_batch_shot_name(flame_pyobject)))
+
+        else:
+            values = {}
+
+        return values
+
+    def _get_shot_values(self, segment, name: str) -> dict[str, str]:
+        """
+        Get Shot Values
+        ===============
+
+        Get shot, sequence, and tape name token values from a segment. If the segment has no
+        shot name, the shot name is resolved from `name`.
+        """
+
+        values = {}
+
+        if self._tokens & self.SHOT_TOKENS:
+            try:
+                if segment.shot_name != '':
+                    shot_name = str(segment.shot_name)[1:-1]
+                else:
+                    shot_name = pyflame.resolve_shot_name(name)
+            except:
+                shot_name = ''
+            values.update(self._get_seq_values(shot_name))
+
+        if '<TapeName>' in self._tokens:
+            try:
+                values['<TapeName>'] = str(segment.tape_name)
+            except:
+                values['<TapeName>'] = ''
+
+        return values
+
+    @staticmethod
+    def _get_seq_values(shot_name: str) -> dict[str, str]:
+        """
+        Get Seq Values
+        ==============
+
+        Get shot name and sequence name token values. Sequence name is the leading letters of the shot name.
+        """
+
+        seq_name = re.split('[^a-zA-Z]', shot_name)[0]
+
+        return {
+            '<ShotName>': shot_name,
+            '<SeqName>': seq_name,
+            '<SEQNAME>': seq_name.upper(),
+            }
+
+    def _get_batch_shot_name(self, batch) -> str:
+        """
+        Get Batch Shot Name
+        ===================
+
+        Batch is checked for a ShotName tag(ShotName: <shot_name>). If not found, the first Render or
+        Write File node is checked for a shot name. If no shot name is found, the shot name is resolved
+        from the batch group name.
+        """
+
+        # Check for ShotName tag
+        for tag in batch.tags.get_value():
+            if tag.startswith(f'{self._shot_name_tag}:'):
+                return tag.split(':', 1)[1].strip()
+
+        # Check first render node for shot name
+        for node in batch.nodes:
+            if node.type in ('Render', 'Write File'):
+                shot_name = str(node.shot_name)[1:-1]
+                if shot_name:
+                    return shot_name
+                break
+
+        return pyflame.resolve_shot_name(str(batch.name)[1:-1])
+
 # ==============================================================================
 # [PyFlame QT Widgets]
 # ==============================================================================
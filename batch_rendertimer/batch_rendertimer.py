@@ -1,10 +1,10 @@
 """
 Script Name: Batch Rendertimer
-Script Version: 1.0.0
+Script Version: 1.1.0
 Flame Version: 2023
 Written by: Bob Maple
 Creation Date: 08.04.23
-Update Date: 08.04.23
+Update Date: 10.19.26
 
 Script Type: Batch Rendering
 
@@ -12,22 +12,224 @@ Description:
 
     Prints render start and end times to the console and to the Flame message area.
 
+    Every batch render is also recorded in a SQLite render stats database: wall time, frame count,
+    resolution, node count and node types, per project, batch group and shot. The Render Stats
+    window shows per-shot render time trends (flagging shots that got slower) and the node types
+    found in the slowest renders.
+
+    The database is stored in ~/.batch_rendertimer/render_stats.db. Set BATCH_RENDERTIMER_DB to use
+    a different file.
+
+Menus:
+
+    Flame Main Menu -> Batch Rendertimer -> Render Stats...
+
 To install:
 
     Copy script folder into /opt/Autodesk/shared/python
+
+Updates:
+
+    v1.1.0 10.19.26
+        - Renders are recorded in a SQLite render stats database.
+        - Added Render Stats window with per-shot trends and slowest node types.
 """
 
+import os
+import re
 import time
+import socket
+import getpass
+import sqlite3
 
 import flame
 
 
+DB_PATH = os.environ.get("BATCH_RENDERTIMER_DB", os.path.expanduser("~/.batch_rendertimer/render_stats.db"))
+
+# A shot is flagged when its last render is this much slower (per frame) than its previous render
+REGRESSION_THRESHOLD = 0.2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS renders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project TEXT,
+    batch_group TEXT,
+    shot_name TEXT,
+    node_name TEXT,
+    started REAL,
+    wall_time REAL,
+    frame_count INTEGER,
+    width INTEGER,
+    height INTEGER,
+    node_count INTEGER,
+    aborted INTEGER,
+    host TEXT,
+    user TEXT
+);
+CREATE TABLE IF NOT EXISTS render_node_types (
+    render_id INTEGER REFERENCES renders(id) ON DELETE CASCADE,
+    node_type TEXT,
+    node_count INTEGER
+);
+CREATE INDEX IF NOT EXISTS renders_shot ON renders (project, shot_name, started);
+CREATE INDEX IF NOT EXISTS render_node_types_render ON render_node_types (render_id);
+"""
+
+
 def print_message(message):
     flame.messages.show_in_console(message, 'info', 5)
     print(message)
 
+# ----------------------------------------------------------------
+# Render stats database
+# ----------------------------------------------------------------
+
+def open_db():
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, timeout=10)
+    conn.executescript(SCHEMA)
+    return conn
+
+def record_render(stats, node_types):
+    """Insert one render and its node type counts in a single transaction."""
+    conn = open_db()
+    try:
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO renders (project, batch_group, shot_name, node_name, started, wall_time, frame_count,"
+                " width, height, node_count, aborted, host, user) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (stats["project"], stats["batch_group"], stats["shot_name"], stats["node_name"], stats["started"],
+                 stats["wall_time"], stats["frame_count"], stats["width"], stats["height"], stats["node_count"],
+                 int(stats["aborted"]), socket.gethostname(), getpass.getuser()))
+            conn.executemany(
+                "INSERT INTO render_node_types (render_id, node_type, node_count) VALUES (?, ?, ?)",
+                [(cursor.lastrowid, node_type, count) for node_type, count in node_types.items()])
+    finally:
+        conn.close()
+
+def query_shot_trends(project):
+    """
+    Per shot: render count, last and previous wall time, seconds per frame for both,
+    change in seconds per frame and best wall time. Aborted renders are ignored.
+    """
+    conn = open_db()
+    try:
+        rows = conn.execute(
+            "SELECT shot_name, wall_time, frame_count, width, height FROM renders"
+            " WHERE project = ? AND aborted = 0 ORDER BY shot_name, started DESC", (project,)).fetchall()
+    finally:
+        conn.close()
+
+    trends = {}
+    for shot_name, wall_time, frame_count, width, height in rows:
+        per_frame = wall_time / frame_count if frame_count else wall_time
+        trend = trends.setdefault(shot_name, {
+            "shot_name": shot_name, "renders": 0, "last": wall_time, "last_per_frame": per_frame,
+            "previous_per_frame": None, "best": wall_time, "resolution": f"{width}x{height}" if width else ""})
+        trend["renders"] += 1
+        trend["best"] = min(trend["best"], wall_time)
+        if trend["renders"] == 2:
+            trend["previous_per_frame"] = per_frame
+
+    for trend in trends.values():
+        previous = trend["previous_per_frame"]
+        trend["change"] = (trend["last_per_frame"] - previous) / previous if previous else None
+
+    # Biggest slow downs first, then slowest renders
+    return sorted(trends.values(), key=lambda t: (-(t["change"] or 0), -t["last_per_frame"]))
+
+def query_node_types(project, limit=25):
+    """
+    Node types ranked by the average seconds per frame of the renders they appear in.
+    Renders are timed as a whole, so this points at the node types common to slow renders.
+    """
+    conn = open_db()
+    try:
+        return conn.execute(
+            "SELECT t.node_type, COUNT(*) AS renders, SUM(t.node_count) AS nodes,"
+            " AVG(CASE WHEN r.frame_count > 0 THEN r.wall_time / r.frame_count ELSE r.wall_time END) AS per_frame,"
+            " MAX(r.wall_time) AS slowest"
+            " FROM render_node_types t JOIN renders r ON r.id = t.render_id"
+            " WHERE r.project = ? AND r.aborted = 0"
+            " GROUP BY t.node_type ORDER BY per_frame DESC LIMIT ?", (project, limit)).fetchall()
+    finally:
+        conn.close()
+
+# ----------------------------------------------------------------
+# Batch info
+# ----------------------------------------------------------------
+
+def _value(attr):
+    try:
+        return attr.get_value()
+    except AttributeError:
+        return attr
+
+def _int(value):
+    try:
+        return int(_value(value))
+    except (TypeError, ValueError):
+        return None
+
+def _render_node(node_name):
+    for node in flame.batch.nodes:
+        if node.type in ("Render", "Write File") and (node_name is None or str(node.name)[1:-1] == node_name):
+            return node
+    return None
+
+def _shot_name(batch_group_name, render_node):
+    for tag in flame.batch.tags.get_value():
+        if tag.startswith("ShotName:"):
+            return tag.split(":", 1)[1].strip()
+    try:
+        shot_name = str(render_node.shot_name)[1:-1]
+        if shot_name:
+            return shot_name
+    except AttributeError:
+        pass
+    # Fall back to batch group name without version suffix (ie. abc_0010_comp_v003 -> abc_0010_comp)
+    return re.sub(r"[_.]v\d+$", "", batch_group_name)
+
+def collect_render_stats(info):
+    """Snapshot the batch group being rendered. Best effort: anything not available is left empty."""
+    stats = {"project": "", "batch_group": "", "shot_name": "", "node_name": info.get("nodeName"),
+             "frame_count": None, "width": _int(info.get("width")), "height": _int(info.get("height")),
+             "node_count": 0}
+    node_types = {}
+    try:
+        stats["project"] = flame.projects.current_project.name
+        stats["batch_group"] = str(flame.batch.name)[1:-1]
+
+        nodes = flame.batch.nodes
+        stats["node_count"] = len(nodes)
+        for node in nodes:
+            node_type = str(_value(node.type))
+            node_types[node_type] = node_types.get(node_type, 0) + 1
+
+        render_node = _render_node(stats["node_name"])
+        stats["shot_name"] = _shot_name(stats["batch_group"], render_node)
+
+        if render_node is not None:
+            start, end = _int(getattr(render_node, "range_start", None)), _int(getattr(render_node, "range_end", None))
+            if start is not None and end is not None:
+                stats["frame_count"] = end - start + 1
+            if stats["width"] is None:
+                stats["width"] = _int(getattr(render_node, "width", None))
+                stats["height"] = _int(getattr(render_node, "height", None))
+        if stats["frame_count"] is None:
+            stats["frame_count"] = _int(getattr(flame.batch, "duration", None))
+    except Exception as e:
+        print("Render stats: could not read batch info: " + str(e))
+    return stats, node_types
+
+# ----------------------------------------------------------------
+# Hooks
+# ----------------------------------------------------------------
+
 def batch_render_begin(info, userData, *args, **kwargs):
     userData["render_started"] = time.time()
+    userData["render_stats"] = collect_render_stats(info)
     print("Render started: " + str(userData.get("render_started")))
 
 def batch_render_end(info, userData, *args, **kwargs):
@@ -36,5 +238,97 @@ def batch_render_end(info, userData, *args, **kwargs):
     render_secs  = render_ended - userData.get("render_started")
     print_message("Render time total: " + str(round(render_secs, 2)) + " seconds\n")
 
+    if "render_stats" in userData:
+        stats, node_types = userData.pop("render_stats")
+        stats["started"] = userData.get("render_started")
+        stats["wall_time"] = render_secs
+        stats["aborted"] = bool(info.get("aborted", False))
+        try:
+            record_render(stats, node_types)
+        except (sqlite3.Error, OSError) as e:
+            print("Render stats: could not record render: " + str(e))
+
 def render_ended(module_name, sequence_name, elapsed_time_in_seconds):
     print_message("Timeline render ended: " + str(round(elapsed_time_in_seconds, 2)) + " seconds\n" )
+
+# ----------------------------------------------------------------
+# Render stats window
+# ----------------------------------------------------------------
+
+def show_render_stats(selection=None):
+    from PySide6 import QtWidgets, QtGui
+
+    project = flame.projects.current_project.name
+    try:
+        trends = query_shot_trends(project)
+        node_types = query_node_types(project)
+    except (sqlite3.Error, OSError) as e:
+        print_message("Render stats: could not read " + DB_PATH + ": " + str(e))
+        return
+
+    def make_table(headers, rows, highlight_rows=()):
+        table = QtWidgets.QTableWidget(len(rows), len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        for r, row in enumerate(rows):
+            for c, value in enumerate(row):
+                item = QtWidgets.QTableWidgetItem(value)
+                if r in highlight_rows:
+                    item.setForeground(QtGui.QColor("#e05555"))
+                table.setItem(r, c, item)
+        table.resizeColumnsToContents()
+        return table
+
+    shot_rows = []
+    regressions = []
+    for t in trends:
+        change = t["change"]
+        if change is not None and change > REGRESSION_THRESHOLD:
+            regressions.append(len(shot_rows))
+        shot_rows.append([
+            t["shot_name"], str(t["renders"]), t["resolution"],
+            "%.1f" % t["last"], "%.2f" % t["last_per_frame"],
+            "" if t["previous_per_frame"] is None else "%.2f" % t["previous_per_frame"],
+            "" if change is None else "%+.0f%%" % (change * 100),
+            "%.1f" % t["best"]])
+
+    node_rows = [[node_type, str(renders), str(nodes), "%.2f" % per_frame, "%.1f" % slowest]
+                 for node_type, renders, nodes, per_frame, slowest in node_types]
+
+    window = QtWidgets.QDialog()
+    window.setWindowTitle("Render Stats - " + project)
+    window.resize(900, 600)
+    layout = QtWidgets.QVBoxLayout(window)
+
+    summary = QtWidgets.QLabel(
+        "%d shots, %d slower than last render by more than %d%% per frame.   Database: %s"
+        % (len(trends), len(regressions), REGRESSION_THRESHOLD * 100, DB_PATH))
+    layout.addWidget(summary)
+
+    tabs = QtWidgets.QTabWidget()
+    tabs.addTab(make_table(
+        ["Shot", "Renders", "Resolution", "Last (s)", "Last s/frame", "Previous s/frame", "Change", "Best (s)"],
+        shot_rows, regressions), "Shot Trends")
+    tabs.addTab(make_table(
+        ["Node Type", "Renders", "Nodes", "Avg s/frame", "Slowest Render (s)"], node_rows), "Slowest Node Types")
+    layout.addWidget(tabs)
+
+    close_button = QtWidgets.QPushButton("Close")
+    close_button.clicked.connect(window.close)
+    layout.addWidget(close_button)
+
+    window.exec()
+
+def get_main_menu_custom_ui_actions():
+    return [
+        {
+            "name": "Batch Rendertimer",
+            "actions": [
+                {
+                    "name": "Render Stats...",
+                    "execute": show_render_stats,
+                }
+            ]
+        }
+    ]
@@ -19,11 +19,11 @@
 
 """
 Script Name:    Collect Media
-Script Version: 1.0.2
+Script Version: 1.1.0
 Flame Version:  2023
 Written by:     Kyle Obley
 Creation Date:  08.10.21
-Update Date:    12.08.26
+Update Date:    10.19.26
 
 License:        GNU General Public License v3.0 (GPL-3.0) - see LICENSE file for details
 
@@ -54,6 +54,13 @@ To install:
 
 Updates:
 
+    v1.1.0 10.19.26
+        - Each source directory is now scanned once with os.scandir instead of running a glob for every clip and segment.
+          Frames are grouped into sequences in memory.
+
+        - Source directories are scanned concurrently and the list is written as each directory finishes.
+          The list is no longer sorted, duplicates are still removed.
+
     v1.0.2 08.12.21
         - Adjusted formating to adhear to Logik-Portal requirements.
 
@@ -121,12 +128,25 @@ Updates:
         - Initial Release
 """
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import flame
 
 clips = []
 sequences = []
 uncached_only = True
 
+# Number of source directories scanned at the same time
+scan_workers = 8
+
+# Containers that are collected as a single file instead of a frame sequence
+exclude_list = ["mp4", "mov", "mxf", "braw", "r3d"]
+
+# <prefix><frame number>.<extension>
+frame_pattern = re.compile(r'^(.*?)(\d+)\.([^.]+)$')
+
 #
 # Scaning/Builing Functions
 #
@@ -319,38 +339,106 @@ def extract_segment_info(segment):
                 if path and path != '':
                     return path
 
-def get_file_sequence(filepath):
-    import os
-    import re
-    import glob
+class DirectoryCache(object):
+    """
+    Scans each source directory once with os.scandir and groups its files into frame
+    sequences in memory. Every clip and segment that points at the same directory is
+    then answered from the cache instead of another glob on the SAN.
+    """
+
+    def __init__(self):
+        self.listings = {}
+
+    def scan(self, directory):
+        """
+        List a directory. Returns the directory and a tuple of the set of file names
+        and a dict of sorted frame names keyed by (prefix, padding, extension).
+        """
+
+        files = set()
+        frame_sequences = {}
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+
+                    files.add(entry.name)
+
+                    match = frame_pattern.match(entry.name)
+                    if match:
+                        key = (match.group(1), len(match.group(2)), match.group(3))
+                        frame_sequences.setdefault(key, []).append(entry.name)
+        except OSError:
+            pass
+
+        # Frame numbers in a sequence share the same padding so a plain sort is in frame order
+        for frames in frame_sequences.values():
+            frames.sort()
+
+        return directory, (files, frame_sequences)
+
+    def scan_directories(self, directories):
+        """
+        Scan directories concurrently. Yields each directory as soon as its listing is cached.
+        """
+
+        to_scan = [directory for directory in directories if directory not in self.listings]
+
+        for directory in directories:
+            if directory in self.listings:
+                yield directory
+
+        if not to_scan:
+            return
+
+        with ThreadPoolExecutor(max_workers=scan_workers) as pool:
+            futures = [pool.submit(self.scan, directory) for directory in to_scan]
+            for future in as_completed(futures):
+                directory, listing = future.result()
+                self.listings[directory] = listing
+                yield directory
+
+    def get_file_sequence(self, filepath):
+        """
+        Return every frame on disk in the sequence filepath belongs to, sorted.
+        """
+
+        directory, name = os.path.split(filepath)
 
-    exlude_list = ["mp4", "mov", "mxf", "braw", "r3d"]
-    sequence = []
-    ext = filepath.split(".")[-1].lower()
-    if ext in exlude_list:
-        if os.path.isfile(filepath):
+        if directory not in self.listings:
+            self.listings[directory] = self.scan(directory)[1]
+
+        files, frame_sequences = self.listings[directory]
+
+        if name not in files:
+            return None
+
+        ext = filepath.split(".")[-1].lower()
+        if ext in exclude_list:
 
             # Make an exception for Red. Send path instead with trailing slash
             if ext == "r3d":
-                filepath = os.path.dirname(filepath) + "/"
+                return [directory + "/"]
 
-            sequence.append(filepath)
-    else:
-        try:
-            first_frame_number = re.findall(r'\d+', filepath)[-1]
-            padding = len(first_frame_number)
-            question_marks = ''.join([char*padding for char in "?"])
-            # sanitises filepath incase someone put brackets in the name
-            sanatised_filepath = glob.escape(filepath)
-            glob_to_search = sanatised_filepath.replace(str(first_frame_number) + "." + ext, question_marks + "." + ext)
-            if os.path.isfile(filepath):
-                sequence = glob.glob(glob_to_search)
-        except:
-            if os.path.isfile(filepath):
-                sequence.append(filepath)
-
-    if sequence:
-        return sorted(sequence)
+            return [filepath]
+
+        match = frame_pattern.match(name)
+        if not match:
+            return [filepath]
+
+        key = (match.group(1), len(match.group(2)), match.group(3))
+
+        return [os.path.join(directory, frame) for frame in frame_sequences[key]]
+
+directory_cache = DirectoryCache()
+
+def get_file_sequence(filepath):
+    return directory_cache.get_file_sequence(filepath)
 
 #
 # Scrape Workspace
@@ -404,16 +492,20 @@ def scrape_workspace():
 
 # def collect_media(selection):
 def collect_media():
-    import os
     import time
     import shutil
 
     debug = False
 
     global uncached_only
+    global directory_cache
 
     current_project = flame.project.current_project.name
     file_list = []
+    video_paths = []
+
+    # Start each run with an empty directory cache so new frames on disk are seen
+    directory_cache = DirectoryCache()
 
     # Custom dumpfile location in case you want a shared location.
     # This will still create a sub-folder for the current_project.
@@ -496,10 +588,7 @@ def collect_media():
                 extracted = extract_clip_info(clips)
                 if extracted:
                     num_clips += 1
-                    frames = get_file_sequence(extracted)
-                    if frames:
-                        for frame in frames:
-                            file_list.append(frame)
+                    video_paths.append(extracted)
                 
                 # Lose Audio clips
                 if clips.audio_tracks:
@@ -560,10 +649,7 @@ def collect_media():
                             extracted = extract_segment_info(segment)
                             if extracted:
                                 uniq_segments.append(extracted)
-                                frames = get_file_sequence(extracted)
-                                if frames:
-                                    for frame in frames:
-                                        file_list.append(frame)
+                                video_paths.append(extracted)
                 
                 # Audio in sequences
                 if sequence.audio_tracks:
@@ -583,9 +669,6 @@ def collect_media():
                                             if audio.file_path and audio.file_path != '':
                                                 file_list.append(audio.file_path)
 
-        # Remove duplicates and sort list
-        file_list_cleaned = sorted(set(file_list))
-
         print("[ Collect Media ] Took %.2f seconds" % (time.time() - start))
 
         if uncached_only:
@@ -593,16 +676,37 @@ def collect_media():
         else:
             print ("[ Collect Media ] Found %i total sequences with %i unique video clips" % (len(collected_sequences), len(set(uniq_segments))))
 
-        print ("[ Collect Media ] Writing list of files")
+        # Group video paths by source directory so each directory is only scanned once
+        paths_by_directory = {}
+        for path in sorted(set(video_paths)):
+            paths_by_directory.setdefault(os.path.dirname(path), []).append(path)
+
+        print ("[ Collect Media ] Scanning %i source directories and writing list of files, this may take a while..." % len(paths_by_directory))
+
+        start = time.time()
+        written = set()
 
+        # Write contents of file_list to locked dump file, overwritting existing data since we already have that.
+        # Frames are written as each source directory finishes scanning.
+        with open(locked_dump_file_location, "w") as f:
 
-        # Write contents of file_list to locked dump file, overwritting existing data since we already have that
-        f = open(locked_dump_file_location, "w")
+            def write_path(path):
+                if path and path not in written:
+                    written.add(path)
+                    f.write(path + "\n")
 
-        # Create a long string to allow us to just write to the file in one go.
-        file_list_string = '\n'.join(file_list_cleaned)
-        f.write(file_list_string)
-        f.close()
+            for path in file_list:
+                write_path(path)
+
+            for directory in directory_cache.scan_directories(list(paths_by_directory)):
+                for path in paths_by_directory[directory]:
+                    frames = directory_cache.get_file_sequence(path)
+                    if frames:
+                        for frame in frames:
+                            write_path(frame)
+
+        print("[ Collect Media ] Took %.2f seconds" % (time.time() - start))
+        print ("[ Collect Media ] Wrote %i files" % len(written))
 
         # Rename to the non-locked file
         os.rename(locked_dump_file_location, dump_file_location)
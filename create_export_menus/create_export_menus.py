@@ -19,11 +19,11 @@
 
 """
 Script Name: Create Export Menus
-Script Version: 5.5.0
+Script Version: 5.7.0
 Flame Version: 2026
 Written by: Michael Vaglienty
 Creation Date: 03.29.20
-Update Date: 05.25.26
+Update Date: 10.19.26
 
 License: GNU General Public License v3.0 (GPL-3.0) - see LICENSE file for details
 
@@ -52,6 +52,27 @@ To install:
 
 Updates:
 
+    v5.7.0 10.19.26
+        - Added Bulk Export option to export menus. Export paths for all clips are resolved before exporting,
+          exports are grouped by preset and destination and sent to the background unless Import Export
+          is on. Failed exports don't stop the other exports. Export times and failed exports are shown
+          when all exports are done.
+
+    v5.6.0 10.19.26
+        - Export menus are saved in a single registry file (config/export_menus.json) instead of a generated
+          python script per menu. All menus are built by this script's media panel hook, saved and edited
+          menus show up without refreshing python hooks.
+        - Project check is done once when the right-click menu is built instead of once per menu.
+        - Export path tokens are replaced in a single pass. Project, user and date tokens are read once
+          per export.
+        - Menus saved by older versions are moved into the registry. Old menu scripts are renamed to
+          <name>.py.migrated.
+
+    v5.5.1 10.19.26
+        - Setup window opens faster with many saved export presets. Preset versions are cached and Flame's
+          export version is only read once.
+        - Updated to PyFlameLib v5.3.3.
+
     v5.5.0 05.25.26
         - Added Import Export button. When checked, exported clip will be imported back into Flame.
           Only works with Movie preset types.
@@ -184,7 +205,10 @@ Updates:
 
 import os
 import re
-import shutil
+import json
+import datetime
+import tempfile
+import time
 from functools import partial
 from typing import Any
 
@@ -196,9 +220,36 @@ from lib.pyflame_lib_create_export_menus import *
 # ==============================================================================
 
 SCRIPT_NAME = 'Create Export Menus'
-SCRIPT_VERSION = 'v5.5.0'
+SCRIPT_VERSION = 'v5.7.0'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
+# All export menus are saved in this file and loaded by get_media_panel_custom_ui_actions
+EXPORT_MENUS_PATH = os.path.join(SCRIPT_PATH, 'config', 'export_menus.json')
+
+# Folders of generated menu scripts saved by older versions of this script, migrated into EXPORT_MENUS_PATH
+LEGACY_PROJECT_MENUS_DIR = os.path.join(SCRIPT_PATH, 'project_menus')
+LEGACY_SHARED_MENUS_DIR = os.path.join(SCRIPT_PATH, 'shared_menus')
+
+# Export preset settings saved for each preset in an export menu, with default values
+EXPORT_PRESET_DEFAULTS = {
+    'preset_path':               '',
+    'export_path':               '',
+    'use_top_video_track':       False,
+    'foreground':                False,
+    'export_between_marks':      False,
+    'include_subtitles':         False,
+    'export_subtitles_as_files': False,
+    'export_all_subtitles':      False,
+    'import_export':             False,
+    }
+
+# Export path tokens. Clip tokens are resolved for each clip, all others once per export.
+EXPORT_PATH_TOKEN_PATTERN = re.compile(
+    r'<(ProjectName|ProjectNickName|ShotName|SeqName|SEQNAME|UserName|UserNickName|ClipName|Resolution|'
+    r'ClipHeight|ClipWidth|YYYY|YY|MM|DD|Hour|hour|Minute|AMPM|ampm|TapeName)>'
+    )
+EXPORT_PATH_CLIP_TOKENS = {'ShotName', 'SeqName', 'SEQNAME', 'ClipName', 'Resolution', 'ClipHeight', 'ClipWidth', 'TapeName'}
+
 # Widget keys for preset tab dicts (self.create_tab_widgets / self.edit_tab_widgets).
 # All keys that toggle_ui / get_preset_info / disable_ui_elements operate on.
 _TW_TOGGLEABLE = (
@@ -235,6 +286,503 @@ _TW_TAB0_NO_PRESETS = (
     'presets_menu',
 )
 
+# ==============================================================================
+# [Export Menus]
+# ==============================================================================
+
+class ExportMenuRegistry:
+    """
+    Export Menu Registry
+    ====================
+
+    All export menus created with this script, saved in a single JSON file.
+
+    The file is only read again when it changes, so the menus can be asked for every time the
+    right-click menu is built.
+
+    Each menu is a dictionary with these keys:
+
+        `name` (str): Menu name.
+        `visibility` (str): 'Project' or 'Shared'.
+        `project` (str | None): Flame project the menu is visible in. None for shared menus.
+        `flame_version` (str): Minimum Flame version for the menu.
+        `reveal_in_mediahub` (bool): Open export path in the MediaHub after export.
+        `reveal_in_finder` (bool): Open export path in the Finder after export.
+        `bulk_export` (bool): Export in bulk export mode, see `bulk_export`.
+        `presets` (list[dict]): Export presets, using the keys in EXPORT_PRESET_DEFAULTS.
+
+    Args
+    ----
+        `registry_path` (str):
+            Path to export menus JSON file.
+    """
+
+    def __init__(self, registry_path: str) -> None:
+
+        self.registry_path = registry_path
+        self._file_stamp = None
+        self._menus = []
+        self._legacy_menus_checked = False
+
+    @staticmethod
+    def menu_key(visibility: str, name: str, project_name: str | None) -> tuple:
+        """
+        Menu Key
+        ========
+
+        Get the key that identifies a menu. Shared menus are not tied to a project.
+        """
+
+        return (visibility, name, project_name if visibility == 'Project' else None)
+
+    def menus(self) -> list:
+        """
+        Menus
+        =====
+
+        Get all saved export menus. The registry file is read again only if it has changed.
+
+        Returns
+        -------
+            list[dict]: Export menus.
+        """
+
+        try:
+            stat = os.stat(self.registry_path)
+            file_stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            file_stamp = None
+
+        if file_stamp != self._file_stamp:
+            self._menus = self._read() if file_stamp else []
+            self._file_stamp = file_stamp
+
+        return self._menus
+
+    def project_menus(self, project_name: str) -> list:
+        """
+        Project Menus
+        =============
+
+        Get the menus visible in a Flame project: the project's menus and all shared menus.
+
+        Args
+        ----
+            `project_name` (str):
+                Flame project name.
+
+        Returns
+        -------
+            list[dict]: Export menus.
+        """
+
+        return [menu for menu in self.menus() if menu['project'] in (None, project_name)]
+
+    def get_menu(self, visibility: str, name: str, project_name: str | None) -> dict | None:
+        """
+        Get Menu
+        ========
+
+        Get a saved menu.
+
+        Args
+        ----
+            `visibility` (str):
+                'Project' or 'Shared'.
+
+            `name` (str):
+                Menu name.
+
+            `project_name` (str | None):
+                Flame project name, ignored for shared menus.
+
+        Returns
+        -------
+            dict | None: Export menu, or None if the menu is not found.
+        """
+
+        key = self.menu_key(visibility, name, project_name)
+        for menu in self.menus():
+            if self.menu_key(menu['visibility'], menu['name'], menu['project']) == key:
+                return menu
+        return None
+
+    def save_menu(self, menu: dict, replace: tuple | None=None) -> None:
+        """
+        Save Menu
+        =========
+
+        Add a menu to the registry, replacing any menu with the same name and visibility.
+
+        Args
+        ----
+            `menu` (dict):
+                Export menu to save.
+
+            `replace` (tuple | None, optional):
+                Key of a menu to remove, from `menu_key`. Used when a menu is renamed.
+                (Default: `None`)
+        """
+
+        keys = {self.menu_key(menu['visibility'], menu['name'], menu['project']), replace}
+        menus = [saved_menu for saved_menu in self._read()
+                 if self.menu_key(saved_menu['visibility'], saved_menu['name'], saved_menu['project']) not in keys]
+        menus.append(menu)
+        self._write(menus)
+
+    def delete_menu(self, visibility: str, name: str, project_name: str | None) -> None:
+        """
+        Delete Menu
+        ===========
+
+        Remove a menu from the registry.
+
+        Args
+        ----
+            `visibility` (str):
+                'Project' or 'Shared'.
+
+            `name` (str):
+                Menu name.
+
+            `project_name` (str | None):
+                Flame project name, ignored for shared menus.
+        """
+
+        key = self.menu_key(visibility, name, project_name)
+        self._write([menu for menu in self._read()
+                     if self.menu_key(menu['visibility'], menu['name'], menu['project']) != key])
+
+    def migrate_legacy_menus(self) -> int:
+        """
+        Migrate Legacy Menus
+        ====================
+
+        Move menu scripts generated by older versions of this script into the registry. Each
+        migrated script is renamed to `<name>.py.migrated` so Flame no longer loads it, after the
+        registry has been written. Checked once per session. File errors are printed, never raised,
+        as this is called from the menu hook.
+
+        Returns
+        -------
+            int: Number of menus migrated.
+        """
+
+        if self._legacy_menus_checked:
+            return 0
+        self._legacy_menus_checked = True
+
+        menu_files = []
+        menu_dirs = [(LEGACY_SHARED_MENUS_DIR, None)]
+        try:
+            if os.path.isdir(LEGACY_PROJECT_MENUS_DIR):
+                menu_dirs.extend((os.path.join(LEGACY_PROJECT_MENUS_DIR, project_name), project_name)
+                                 for project_name in sorted(os.listdir(LEGACY_PROJECT_MENUS_DIR)))
+        except OSError as e:
+            pyflame.print(f'Could not read export menus: {LEGACY_PROJECT_MENUS_DIR}\n{e}', print_type=PrintType.ERROR)
+        for menu_dir, project_name in menu_dirs:
+            try:
+                if os.path.isdir(menu_dir):
+                    menu_files.extend((os.path.join(menu_dir, file_name), project_name)
+                                      for file_name in sorted(os.listdir(menu_dir)) if file_name.endswith('.py'))
+            except OSError as e:
+                pyflame.print(f'Could not read export menus: {menu_dir}\n{e}', print_type=PrintType.ERROR)
+
+        if not menu_files:
+            return 0
+
+        menus = self._read()
+        saved_keys = {self.menu_key(menu['visibility'], menu['name'], menu['project']) for menu in menus}
+        parsed_paths = []
+        new_menus = 0
+
+        for menu_path, project_name in menu_files:
+            try:
+                menu = parse_legacy_menu(menu_path, project_name)
+            except (OSError, ValueError) as e:
+                pyflame.print(f'Could not migrate export menu: {menu_path}\n{e}', print_type=PrintType.ERROR)
+                continue
+
+            key = self.menu_key(menu['visibility'], menu['name'], menu['project'])
+            if key not in saved_keys:
+                menus.append(menu)
+                saved_keys.add(key)
+                new_menus += 1
+            parsed_paths.append(menu_path)
+
+        # Registry is written before any script is renamed, so a failed write leaves the scripts in place
+        if new_menus:
+            try:
+                self._write(menus)
+            except OSError as e:
+                pyflame.print(f'Could not write export menus: {self.registry_path}\n{e}', print_type=PrintType.ERROR)
+                return 0
+
+        migrated = 0
+
+        for menu_path in parsed_paths:
+            try:
+                os.replace(menu_path, menu_path + '.migrated')
+            except OSError as e:
+                pyflame.print(f'Could not rename migrated export menu: {menu_path}\n{e}', print_type=PrintType.ERROR)
+                continue
+            try:
+                os.remove(menu_path + 'c')
+            except OSError:
+                pass
+            migrated += 1
+
+        if migrated:
+            pyflame.print(f'Export menus migrated to {self.registry_path}: {migrated}')
+
+        return migrated
+
+    def _read(self) -> list:
+        """
+        Read
+        ====
+
+        Read all menus from the registry file. Returns an empty list if the file does not exist.
+        """
+
+        try:
+            with open(self.registry_path, 'r') as f:
+                menus = json.load(f).get('menus', [])
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            pyflame.print(f'Could not read export menus: {self.registry_path}\n{e}', print_type=PrintType.ERROR)
+            return []
+
+        for menu in menus:
+            menu.setdefault('bulk_export', False)
+            menu['presets'] = [{**EXPORT_PRESET_DEFAULTS, **preset} for preset in menu.get('presets', [])]
+
+        return menus
+
+    def _write(self, menus: list) -> None:
+        """
+        Write
+        =====
+
+        Write all menus to the registry file. The file is replaced in one step so the menu hook never
+        reads a partly written file.
+        """
+
+        os.makedirs(os.path.dirname(self.registry_path), exist_ok=True)
+
+        menus = sorted(menus, key=lambda menu: (menu['visibility'], menu['project'] or '', menu['name'].lower()))
+
+        temp_path = f'{self.registry_path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump({'menus': menus}, f, indent=4)
+        os.replace(temp_path, self.registry_path)
+
+        self._file_stamp = None
+
+def parse_legacy_menu(menu_path: str, project_name: str | None) -> dict:
+    """
+    Parse Legacy Menu
+    =================
+
+    Read the settings of a menu script generated by older versions of this script.
+
+    Args
+    ----
+        `menu_path` (str):
+            Path to menu script.
+
+        `project_name` (str | None):
+            Flame project the menu was saved for. None for shared menus.
+
+    Returns
+    -------
+        dict: Export menu.
+
+    Raises
+    ------
+        ValueError:
+            If no export presets are found in the menu script.
+    """
+
+    with open(menu_path, 'r') as f:
+        menu_lines = f.read().splitlines()
+
+    menu = {
+        'name':               os.path.basename(menu_path)[:-3],
+        'visibility':         'Project' if project_name else 'Shared',
+        'project':            project_name,
+        'flame_version':      '',
+        'reveal_in_mediahub': False,
+        'reveal_in_finder':   False,
+        'bulk_export':        False,
+        'presets':            [],
+        }
+
+    preset = None
+
+    for line in menu_lines:
+        line = line.strip()
+        if line.startswith('Script Name: Create Export Menus - Export Menu: '):
+            menu['name'] = line.split(': ', 2)[2]
+        elif line.startswith('Flame Version: '):
+            menu['flame_version'] = line.split(': ', 1)[1]
+        elif line == 'reveal_in_mediahub = True':
+            menu['reveal_in_mediahub'] = True
+        elif line == 'reveal_in_finder = True':
+            menu['reveal_in_finder'] = True
+        elif line.startswith('# Export preset '):
+            if line.endswith(' END'):
+                if preset is not None and preset['preset_path']:
+                    menu['presets'].append(preset)
+                preset = None
+            else:
+                preset = dict(EXPORT_PRESET_DEFAULTS)
+        elif preset is not None:
+            setting = re.fullmatch(r'(?:clip_output\.)?(\w+) = (True|False)', line)
+            if setting and setting.group(1) in preset:
+                preset[setting.group(1)] = setting.group(2) == 'True'
+            elif line.startswith('new_export_path = translate_tokenized_path(clip, '):
+                preset['export_path'] = line.split("'", 2)[1]
+            elif line.startswith('clip_output.export(clip, '):
+                preset['preset_path'] = line.split("'", 2)[1]
+
+    if not menu['presets']:
+        raise ValueError('No export presets found in menu script.')
+
+    return menu
+
+EXPORT_MENUS = ExportMenuRegistry(EXPORT_MENUS_PATH)
+
+class ExportPathTemplate:
+    """
+    Export Path Template
+    ====================
+
+    Export path with tokens. The tokens used in the path are found once, then all tokens are replaced
+    in a single pass of EXPORT_PATH_TOKEN_PATTERN for each clip.
+
+    Args
+    ----
+        `export_path` (str):
+            Export path with tokens.
+    """
+
+    def __init__(self, export_path: str) -> None:
+
+        self.export_path = export_path
+        self.tokens = set(EXPORT_PATH_TOKEN_PATTERN.findall(export_path))
+        self.uses_clip_tokens = bool(self.tokens & EXPORT_PATH_CLIP_TOKENS)
+
+    def resolve(self, token_values: dict) -> str:
+        """
+        Resolve
+        =======
+
+        Replace tokens in the export path.
+
+        Args
+        ----
+            `token_values` (dict):
+                Token values by token name, from `get_export_token_values` and `get_clip_token_values`.
+
+        Returns
+        -------
+            str: Export path.
+        """
+
+        return EXPORT_PATH_TOKEN_PATTERN.sub(lambda match: token_values[match.group(1)], self.export_path)
+
+def get_export_token_values() -> dict:
+    """
+    Get Export Token Values
+    =======================
+
+    Get values of the project, user and date tokens. Read once per export.
+
+    Returns
+    -------
+        dict: Token values by token name.
+    """
+
+    project = flame.project.current_project
+    user = flame.users.current_user
+    date = datetime.datetime.now()
+
+    return {
+        'ProjectName':     str(project.name),
+        'ProjectNickName': str(project.nickname),
+        'UserName':        str(user.name),
+        'UserNickName':    str(user.nickname),
+        'YYYY':            date.strftime('%Y'),
+        'YY':              date.strftime('%y'),
+        'MM':              date.strftime('%m'),
+        'DD':              date.strftime('%d'),
+        'Hour':            date.strftime('%H'),
+        'hour':            date.strftime('%I').lstrip('0'),
+        'Minute':          date.strftime('%M'),
+        'AMPM':            date.strftime('%p'),
+        'ampm':            date.strftime('%p').lower(),
+        }
+
+def get_clip_token_values(clip) -> dict:
+    """
+    Get Clip Token Values
+    =====================
+
+    Get values of the clip tokens. Shot name is taken from the first segment, or from the clip name if
+    the segment has no shot name.
+
+    Args
+    ----
+        `clip` (flame.PyClip):
+            Clip to export.
+
+    Returns
+    -------
+        dict: Token values by token name.
+    """
+
+    clip_name = str(clip.name)[1:-1]
+
+    # Get shot name
+    try:
+        segment = clip.versions[0].tracks[0].segments[0]
+        if segment.shot_name != '':
+            shot_name = str(segment.shot_name)[1:-1]
+        else:
+            shot_name_split = re.split(r'(\d+)', clip_name)
+            if len(shot_name_split) > 1:
+                if shot_name_split[1].isalnum():
+                    shot_name = shot_name_split[0] + shot_name_split[1]
+                else:
+                    shot_name = shot_name_split[0] + shot_name_split[1] + shot_name_split[2]
+            else:
+                shot_name = clip_name
+    except Exception:
+        segment = None
+        shot_name = ''
+
+    # Get tape name
+    try:
+        tape_name = str(segment.tape_name)
+    except Exception:
+        tape_name = ''
+
+    # Sequence name abbreviation from shot name
+    seq_name = re.split('[^a-zA-Z]', shot_name)[0]
+
+    return {
+        'ShotName':   shot_name,
+        'SeqName':    seq_name,
+        'SEQNAME':    seq_name.upper(),
+        'ClipName':   clip_name,
+        'Resolution': f'{clip.width}x{clip.height}',
+        'ClipHeight': str(clip.height),
+        'ClipWidth':  str(clip.width),
+        'TapeName':   tape_name,
+        }
+
 # ==============================================================================
 # [Main Script]
 # ==============================================================================
@@ -266,6 +814,7 @@ class ExportMenuSetup:
     menu_visibility_menu:         Any
     reveal_in_mediahub_pushbutton: Any
     reveal_in_finder_pushbutton:  Any
+    bulk_export_pushbutton:       Any
     create_button:                Any
     done_button:                  Any
 
@@ -282,6 +831,7 @@ class ExportMenuSetup:
     edit_menu_visibility_menu:           Any
     edit_reveal_in_mediahub_pushbutton:  Any
     edit_reveal_in_finder_pushbutton:    Any
+    edit_bulk_export_pushbutton:         Any
     edit_delete_button:                  Any
     edit_duplicate_button:               Any
     edit_save_button:                    Any
@@ -305,12 +855,12 @@ class ExportMenuSetup:
         # Get current project name
         self.flame_project_name = flame.project.current_project.name
 
-        # Create export preset menu folders if they don't exist.
-        self.project_menus_dir, self.shared_menus_dir = self.create_menu_folders()
+        # Move menus saved by older versions of this script into the export menu registry.
+        # Refresh hooks so the old menu scripts are no longer loaded.
+        if EXPORT_MENUS.migrate_legacy_menus():
+            pyflame.refresh_hooks()
 
         # Paths
-        self.menu_template_path = os.path.join(SCRIPT_PATH, 'assets/templates/menu_template')
-        self.current_project_created_presets_path = os.path.join(SCRIPT_PATH, 'project_menus', self.flame_project_name)
         self.project_preset_path = self.get_project_preset_path()
         self.shared_preset_path = '/opt/Autodesk/shared/export/presets'
 
@@ -349,6 +899,7 @@ class ExportMenuSetup:
                 'import_export': False,
                 'reveal_in_mediahub': False,
                 'reveal_in_finder': False,
+                'bulk_export': False,
                 'include_subtitles': False,
                 'subtitles_export_mode': 'Burn in Image',
                 'subtitles_tracks': 'Current Subtitles Track',
@@ -357,29 +908,6 @@ class ExportMenuSetup:
 
         return settings
 
-    def create_menu_folders(self) -> tuple:
-        """
-        Create Menu Folders
-        ===================
-
-        Create project and shared menu folders if they don't exist.
-        Export presets are saved in these folders.
-
-        Returns:
-        --------
-            project_menus_dir, shared_menus_dir (tuple):
-                project_menus_dir (str): Path to project export preset menus folder.
-                shared_menus_dir (str): Path to shared export preset menus folder
-        """
-
-        project_menus_dir = os.path.join(SCRIPT_PATH, 'project_menus')
-        shared_menus_dir = os.path.join(SCRIPT_PATH, 'shared_menus')
-        for folder in [project_menus_dir, shared_menus_dir]:
-            if not os.path.isdir(folder):
-                os.makedirs(folder)
-
-        return project_menus_dir, shared_menus_dir
-
     def get_project_preset_path(self) -> str:
         """
         Get Project Preset Path
@@ -427,7 +955,10 @@ class ExportMenuSetup:
             Get Compatible Preset List
             ==========================
 
-            Get list of shared export presets that are compatible with current version of flame.
+            Get list of export presets that are compatible with current version of flame.
+
+            Preset versions and folder listings come from PyFlameExportPresetCatalog, so presets
+            are only read again when they change.
 
             Args:
             -----
@@ -441,45 +972,8 @@ class ExportMenuSetup:
                 Or empty list if no presets found.
             """
 
-            def check_preset_version(path) -> bool:
-                """
-                Check Preset Version
-                ====================
-
-                Check export presets for flame version compatibility.
-
-                If preset version is less than or equal to current export version then return True.
-
-                Args:
-                -----
-                    path (str):
-                        Path to export preset.
-
-                Returns:
-                --------
-                    bool: True if preset is compatible with current version of flame. False if not.
-                """
-
-                current_export_version, export_version = pyflame.get_export_preset_version(path)
-                return current_export_version <= export_version
-
             try:
-                compatible_preset_list = []
-                preset_list = []
-
-                for root, dirs, files in os.walk(preset_path):
-                    for file in files:
-                        if file.endswith('.xml'):
-                            file_path = os.path.join(root, file)
-                            file = file_path.rsplit(preset_path + '/', 1)[1]
-                            preset_list.append(file)
-
-                for preset in preset_list:
-                    path = os.path.join(preset_path, preset)
-                    if check_preset_version(path):
-                        compatible_preset_list.append(preset[:-4])
-                compatible_preset_list = sorted(compatible_preset_list)
-                return compatible_preset_list
+                return PyFlameExportPresetCatalog.preset_names(preset_path, recursive=True, compatible_only=True)
             except Exception:
                 return []
 
@@ -961,6 +1455,11 @@ class ExportMenuSetup:
                 text='Reveal in Finder',
                 checked=self.settings.reveal_in_finder,
                 )
+            self.bulk_export_pushbutton = PyFlamePushButton(
+                text='Bulk Export',
+                checked=self.settings.bulk_export,
+                tooltip='Resolve all export paths first, export in the background unless Import Export is on, and show a summary of failed exports.',
+                )
 
             # Buttons
             self.create_button = PyFlameButton(
@@ -1003,6 +1502,7 @@ class ExportMenuSetup:
             self.main_tabs.tab_pages['Create'].grid_layout.addWidget(self.after_export_label, 0, 8)
             self.main_tabs.tab_pages['Create'].grid_layout.addWidget(self.reveal_in_finder_pushbutton, 1, 8)
             self.main_tabs.tab_pages['Create'].grid_layout.addWidget(self.reveal_in_mediahub_pushbutton, 2, 8)
+            self.main_tabs.tab_pages['Create'].grid_layout.addWidget(self.bulk_export_pushbutton, 3, 8)
 
             self.main_tabs.tab_pages['Create'].grid_layout.addWidget(horizontal_line_01, 4, 0, 1, 9)
 
@@ -1035,49 +1535,34 @@ class ExportMenuSetup:
                     parent=None,
                     ):
 
-                    if 'Shared: ' in self.edit_saved_export_menu_menu.text:
-                        menu_path = os.path.join(self.shared_menus_dir, menu_name)
-                    else:
-                        menu_path = os.path.join(self.project_menus_dir, self.flame_project_name, menu_name)
+                    menu_visibility = self.edit_saved_export_menu_menu.text.split(': ', 1)[0]
 
-                    os.remove(menu_path + '.py')
-                    try:
-                        os.remove(menu_path + '.pyc')
-                    except Exception:
-                        pass
+                    EXPORT_MENUS.delete_menu(menu_visibility, menu_name, self.flame_project_name)
 
                     pyflame.print(f'Menu deleted: {menu_name}')
 
                     self.get_saved_menus()
 
-                    pyflame.refresh_hooks()
-
             def duplicate_preset() -> None:
                 """
                 Duplicate export menu currently selected in the Export Menus pushbutton menu.
                 """
 
-                menu_name = self.edit_saved_export_menu_menu.text.split(' ', 1)[1]
-
-                if 'Shared: ' in self.edit_saved_export_menu_menu.text:
-                    menu_path = os.path.join(self.shared_menus_dir, menu_name) + '.py'
-                    menu_prefix = 'Shared: '
-                else:
-                    menu_path = os.path.join(self.project_menus_dir, self.flame_project_name, menu_name) + '.py'
-                    menu_prefix = 'Project: '
-
-                # Add 'copy' to menu name and check for existing file. If exists, add ' copy' until unique name is found.
-                new_menu_path = menu_path[:-3] + ' copy.py'
-                while os.path.exists(new_menu_path):
-                    new_menu_path = new_menu_path[:-3] + ' copy.py'
+                menu_visibility, menu_name = self.edit_saved_export_menu_menu.text.split(': ', 1)
 
-                shutil.copy(menu_path, new_menu_path)
+                menu = EXPORT_MENUS.get_menu(menu_visibility, menu_name, self.flame_project_name)
+                if not menu:
+                    return
 
-                self.edit_saved_export_menu_menu.text = menu_prefix + new_menu_path.rsplit('/', 1)[1][:-3]
+                # Add 'copy' to menu name and check for existing menu. If exists, add ' copy' until unique name is found.
+                new_menu_name = menu_name + ' copy'
+                while EXPORT_MENUS.get_menu(menu_visibility, new_menu_name, self.flame_project_name):
+                    new_menu_name += ' copy'
 
-                self.load_preset()
+                EXPORT_MENUS.save_menu({**menu, 'name': new_menu_name, 'presets': [dict(preset) for preset in menu['presets']]})
 
-                pyflame.refresh_hooks()
+                self.get_saved_menus()
+                self.load_preset(preset_to_load=f'{menu_visibility}: {new_menu_name}')
 
                 pyflame.print('Duplicate preset created.')
 
@@ -1130,6 +1615,11 @@ class ExportMenuSetup:
                 text='Reveal in Finder',
                 checked=False,
                 )
+            self.edit_bulk_export_pushbutton = PyFlamePushButton(
+                text='Bulk Export',
+                checked=False,
+                tooltip='Resolve all export paths first, export in the background unless Import Export is on, and show a summary of failed exports.',
+                )
 
             # Buttons
             self.edit_delete_button = PyFlameButton(
@@ -1192,6 +1682,7 @@ class ExportMenuSetup:
             self.main_tabs.tab_pages['Edit'].grid_layout.addWidget(self.edit_after_export_label, 0, 8)
             self.main_tabs.tab_pages['Edit'].grid_layout.addWidget(self.edit_reveal_in_finder_pushbutton, 1, 8)
             self.main_tabs.tab_pages['Edit'].grid_layout.addWidget(self.edit_reveal_in_mediahub_pushbutton, 2, 8)
+            self.main_tabs.tab_pages['Edit'].grid_layout.addWidget(self.edit_bulk_export_pushbutton, 3, 8)
 
             self.main_tabs.tab_pages['Edit'].grid_layout.addWidget(horizontal_line_01, 4, 0, 1, 9)
 
@@ -1239,19 +1730,18 @@ class ExportMenuSetup:
         print('Saved Export Menus:\n')
 
         menu_sources = [
-            ('Project Export Menus', os.path.join(self.project_menus_dir, self.flame_project_name), 'Project: '),
-            ('Shared Export Menus',  self.shared_menus_dir,                                         'Shared: '),
+            ('Project Export Menus', 'Project'),
+            ('Shared Export Menus',  'Shared'),
         ]
 
+        saved_menus = EXPORT_MENUS.project_menus(self.flame_project_name)
+
         all_export_menus = []
 
-        for label, path, prefix in menu_sources:
-            try:
-                menus = sorted(
-                    [prefix + x[:-3] for x in os.listdir(path) if x.endswith('.py')]
-                    )
-            except Exception:
-                menus = []
+        for label, visibility in menu_sources:
+            menus = sorted(
+                [f'{visibility}: {menu["name"]}' for menu in saved_menus if menu['visibility'] == visibility]
+                )
             self.print_list(label, menus)
             all_export_menus.extend(menus)
 
@@ -1315,45 +1805,33 @@ class ExportMenuSetup:
         elif preset_to_load:
             self.edit_saved_export_menu_menu.text = preset_to_load
 
-        selected_menu_name = self.edit_saved_export_menu_menu.text.rsplit(': ', 1)[1]
+        selected_menu_visibility, selected_menu_name = self.edit_saved_export_menu_menu.text.split(': ', 1)
 
         self.edit_menu_name_entry.text = selected_menu_name
+        self.edit_menu_visibility_menu.text = selected_menu_visibility
 
-        # Determine menu path from the visibility prefix ('Shared: ' or 'Project: ')
-        selected_menu_path: str = ''
-        if 'Shared: ' in self.edit_saved_export_menu_menu.text:
-            self.edit_menu_visibility_menu.text = 'Shared'
-            selected_menu_path = os.path.join(self.shared_menus_dir, selected_menu_name) + '.py'
-        elif 'Project: ' in self.edit_saved_export_menu_menu.text:
-            self.edit_menu_visibility_menu.text = 'Project'
-            selected_menu_path = os.path.join(self.project_menus_dir, self.flame_project_name, selected_menu_name) + '.py'
+        menu = EXPORT_MENUS.get_menu(selected_menu_visibility, selected_menu_name, self.flame_project_name)
 
-        if not selected_menu_path:
+        if not menu:
             return
 
-        # Read in menu script
-        with open(selected_menu_path, 'r') as f:
-            menu_lines = f.read().splitlines()
-
-        def get_preset_info(preset_num: str, tab_widgets: dict) -> None:
+        def get_preset_info(preset_num: str, preset: dict, tab_widgets: dict) -> None:
             """
             Get Preset Info
             ===============
 
-            Read preset data from menu_lines and populate the tab's UI widgets.
+            Populate the tab's UI widgets from a saved export preset.
 
             Args:
             -----
                 preset_num (str):
-                    Preset number label used as a marker in the menu file (e.g. 'One').
+                    Preset number label (e.g. 'One').
+                preset (dict):
+                    Export preset settings from the export menu.
                 tab_widgets (dict):
                     Widget dict for the preset tab.
             """
 
-            preset_start_index = menu_lines.index(f'        # Export preset {preset_num}')
-            preset_end_index = menu_lines.index(f'        # Export preset {preset_num} END') + 1
-            preset_lines = menu_lines[preset_start_index:preset_end_index]
-
             enable_btn = tab_widgets['enable_pushbutton']
 
             if enable_btn:
@@ -1361,82 +1839,46 @@ class ExportMenuSetup:
             for key in _TW_TOGGLEABLE:
                 tab_widgets[key].enabled = True
 
-            # Default import_export to False before parsing; stays False if line is absent (older presets)
-            tab_widgets['import_export_pushbutton'].checked = False
-
             print(f'Preset: {preset_num}')
-            for line in preset_lines:
-                if line == '        clip_output.use_top_video_track = True':
-                    tab_widgets['top_layer_pushbutton'].checked = True
-                    print('Use Top Layer: True')
-                elif line == '        clip_output.use_top_video_track = False':
-                    tab_widgets['top_layer_pushbutton'].checked = False
-                    print('Use Top Layer: False')
-                elif line == '        clip_output.foreground = True':
-                    tab_widgets['foreground_pushbutton'].checked = True
-                    print('Foreground Export: True')
-                elif line == '        clip_output.foreground = False':
-                    tab_widgets['foreground_pushbutton'].checked = False
-                    print('Foreground Export: False')
-                elif line == '        clip_output.export_between_marks = True':
-                    tab_widgets['between_marks_pushbutton'].checked = True
-                    print('Export Between Marks: True')
-                elif line == '        clip_output.export_between_marks = False':
-                    tab_widgets['between_marks_pushbutton'].checked = False
-                    print('Export Between Marks: False')
-                elif '        new_export_path = translate_tokenized_path(clip, ' in line:
-                    path = line.split("'", 2)[1]
-                    tab_widgets['export_path_entry'].text = path
-                    print('Export Path:', path)
-                elif '        clip_output.export(clip, ' in line:
-                    preset_path = line.split("'", 2)[1]
-                    preset_name = preset_path.rsplit('/', 1)[1][:-4]
-                    tab_widgets['presets_menu'].text = preset_name
-                    print('Preset Name:', preset_name)
-                elif '        clip_output.include_subtitles = True' in line:
-                    tab_widgets['include_subtitles_pushbutton'].checked = True
-                    tab_widgets['subtitles_export_mode_menu'].enabled = True
-                    tab_widgets['subtitles_tracks_menu'].enabled = True
-                    print('Include subtitles: True')
-                elif '        clip_output.include_subtitles = False' in line:
-                    tab_widgets['include_subtitles_pushbutton'].checked = False
-                    tab_widgets['subtitles_export_mode_menu'].enabled = False
-                    tab_widgets['subtitles_tracks_menu'].enabled = False
-                    print('Include subtitles: False')
-                elif '        clip_output.export_subtitles_as_files = False' in line:
-                    tab_widgets['subtitles_export_mode_menu'].text = 'Burn in Image'
-                    print('Subtitles export mode: Burn in Image')
-                elif '        clip_output.export_subtitles_as_files = True' in line:
-                    tab_widgets['subtitles_export_mode_menu'].text = 'Export as Files'
-                    print('Subtitles export mode: Export as Files')
-                elif '        clip_output.export_all_subtitles = True' in line:
-                    tab_widgets['subtitles_tracks_menu'].text = 'All Subtitles Tracks'
-                    print('Subtitles tracks: All Subtitles Tracks')
-                elif '        clip_output.export_all_subtitles = False' in line:
-                    tab_widgets['subtitles_tracks_menu'].text = 'Current Subtitles Track'
-                    print('Subtitles tracks: Current Subtitles Track')
-                elif line == '        import_export = True':
-                    tab_widgets['import_export_pushbutton'].checked = True
-                    print('Import Export: True')
-                elif line == '        import_export = False':
-                    tab_widgets['import_export_pushbutton'].checked = False
-                    print('Import Export: False')
-
-                if 'clip_output.export' in line:
-                    if 'project' in line:
-                        if 'file_sequence' in line:
-                            tab_widgets['preset_type_menu'].text = 'Project: File Sequence'
-                            print('Saved Preset Type: Project File Seq')
-                        elif 'movie_file' in line:
-                            tab_widgets['preset_type_menu'].text = 'Project: Movie'
-                            print('Saved Preset Type: Project Movie File')
-                    if 'shared' in line:
-                        if 'file_sequence' in line:
-                            tab_widgets['preset_type_menu'].text = 'Shared: File Sequence'
-                            print('Saved Preset Type: Shared File Seq')
-                        elif 'movie_file' in line:
-                            tab_widgets['preset_type_menu'].text = 'Shared: Movie'
-                            print('Saved Preset Type: Shared Movie File')
+
+            tab_widgets['top_layer_pushbutton'].checked = preset['use_top_video_track']
+            print('Use Top Layer:', preset['use_top_video_track'])
+
+            tab_widgets['foreground_pushbutton'].checked = preset['foreground']
+            print('Foreground Export:', preset['foreground'])
+
+            tab_widgets['between_marks_pushbutton'].checked = preset['export_between_marks']
+            print('Export Between Marks:', preset['export_between_marks'])
+
+            tab_widgets['export_path_entry'].text = preset['export_path']
+            print('Export Path:', preset['export_path'])
+
+            # Preset type and name from preset path. Preset name is relative to the movie_file or file_sequence folder.
+            preset_path = preset['preset_path']
+            preset_location = 'Shared' if preset_path.startswith(self.shared_preset_path) else 'Project'
+            if '/file_sequence/' in preset_path:
+                tab_widgets['preset_type_menu'].text = f'{preset_location}: File Sequence'
+                preset_name = preset_path.split('/file_sequence/', 1)[1][:-4]
+            else:
+                tab_widgets['preset_type_menu'].text = f'{preset_location}: Movie'
+                preset_name = preset_path.split('/movie_file/', 1)[-1][:-4]
+            print('Saved Preset Type:', tab_widgets['preset_type_menu'].text)
+            tab_widgets['presets_menu'].text = preset_name
+            print('Preset Name:', preset_name)
+
+            tab_widgets['include_subtitles_pushbutton'].checked = preset['include_subtitles']
+            tab_widgets['subtitles_export_mode_menu'].enabled = preset['include_subtitles']
+            tab_widgets['subtitles_tracks_menu'].enabled = preset['include_subtitles']
+            print('Include subtitles:', preset['include_subtitles'])
+
+            tab_widgets['subtitles_export_mode_menu'].text = 'Export as Files' if preset['export_subtitles_as_files'] else 'Burn in Image'
+            print('Subtitles export mode:', tab_widgets['subtitles_export_mode_menu'].text)
+
+            tab_widgets['subtitles_tracks_menu'].text = 'All Subtitles Tracks' if preset['export_all_subtitles'] else 'Current Subtitles Track'
+            print('Subtitles tracks:', tab_widgets['subtitles_tracks_menu'].text)
+
+            tab_widgets['import_export_pushbutton'].checked = preset['import_export']
+            print('Import Export:', preset['import_export'])
 
             # Enable Import Export only for Movie preset types; clear checked for File Sequence
             if tab_widgets['preset_type_menu'].text in ('Project: Movie', 'Shared: Movie'):
@@ -1466,33 +1908,25 @@ class ExportMenuSetup:
 
         print('Loading Preset...\n')
 
-        if '    reveal_in_mediahub = True' in menu_lines:
-            self.edit_reveal_in_mediahub_pushbutton.checked = True
-            print('Reveal in Mediahub: True')
-        else:
-            self.edit_reveal_in_mediahub_pushbutton.checked = False
-            print('Reveal in Mediahub: False')
+        self.edit_reveal_in_mediahub_pushbutton.checked = menu['reveal_in_mediahub']
+        print('Reveal in Mediahub:', menu['reveal_in_mediahub'])
 
-        if '    reveal_in_finder = True' in menu_lines:
-            self.edit_reveal_in_finder_pushbutton.checked = True
-            print('Reveal in Finder: True')
-        else:
-            self.edit_reveal_in_finder_pushbutton.checked = False
-            print('Reveal in Finder: False')
+        self.edit_reveal_in_finder_pushbutton.checked = menu['reveal_in_finder']
+        print('Reveal in Finder:', menu['reveal_in_finder'])
 
-        # Load preset info for tab 1 (always present)
-        tab_preset_nums = ['One', 'Two', 'Three', 'Four', 'Five']
+        self.edit_bulk_export_pushbutton.checked = menu['bulk_export']
+        print('Bulk Export:', menu['bulk_export'])
 
-        get_preset_info(tab_preset_nums[0], self.edit_tab_widgets[0])
-        preset_menu_texts = [self.edit_tab_widgets[0]['presets_menu'].text]
+        # Load preset info for each saved preset; disable tabs without a saved preset
+        tab_preset_nums = ['One', 'Two', 'Three', 'Four', 'Five']
+        preset_menu_texts = []
 
-        # Load preset info for tabs 2-5; disable tab if preset not found in the menu file
-        for i in range(1, 5):
-            try:
-                get_preset_info(tab_preset_nums[i], self.edit_tab_widgets[i])
-                preset_menu_texts.append(self.edit_tab_widgets[i]['presets_menu'].text)
-            except Exception:
-                disable_ui_elements(self.edit_tab_widgets[i])
+        for i, tab_widgets in enumerate(self.edit_tab_widgets):
+            if i < len(menu['presets']):
+                get_preset_info(tab_preset_nums[i], menu['presets'][i], tab_widgets)
+                preset_menu_texts.append(tab_widgets['presets_menu'].text)
+            else:
+                disable_ui_elements(tab_widgets)
                 preset_menu_texts.append(None)
 
         # Restore preset menu texts (they may be overwritten during the export type detection pass)
@@ -1532,11 +1966,11 @@ class ExportMenuSetup:
         Save Menus
         ==========
 
-        Build and save a Flame right-click export menu Python script from the current UI settings.
+        Build and save a Flame right-click export menu from the current UI settings.
 
         Called when the user clicks the Create or Save button. Collects settings from all
-        preset tabs, validates them, generates the menu script from the template, and writes
-        it to either the project or shared menus directory.
+        preset tabs, validates them, and saves the menu to the export menu registry as either
+        a project or shared menu.
 
         Args:
         -----
@@ -1565,6 +1999,7 @@ class ExportMenuSetup:
                 menu_name_entry  = self.menu_name_entry
                 reveal_mediahub  = self.reveal_in_mediahub_pushbutton
                 reveal_finder    = self.reveal_in_finder_pushbutton
+                bulk_export      = self.bulk_export_pushbutton
             else:
                 prefix = 'edit'
                 tab_widgets_list = self.edit_tab_widgets
@@ -1572,6 +2007,7 @@ class ExportMenuSetup:
                 menu_name_entry  = self.edit_menu_name_entry
                 reveal_mediahub  = self.edit_reveal_in_mediahub_pushbutton
                 reveal_finder    = self.edit_reveal_in_finder_pushbutton
+                bulk_export      = self.edit_bulk_export_pushbutton
 
             settings_dict = {
                 f'{prefix}_tab_zero': {
@@ -1579,6 +2015,7 @@ class ExportMenuSetup:
                     'Menu Name':          menu_name_entry.text,
                     'Reveal in MediaHub': reveal_mediahub.checked,
                     'Reveal in Finder':   reveal_finder.checked,
+                    'Bulk Export':        bulk_export.checked,
                     },
                 }
 
@@ -1646,63 +2083,12 @@ class ExportMenuSetup:
                         if not value['Export Path']:
                             return f'Preset {tab_number}: Enter export path.'
 
-        def get_menu_save_path() -> tuple:
-            """
-            Get Menu Save Path
-            ==================
-
-            Get menu save path and name.
-
-            Returns:
-            --------
-                menu_flame_project, menu_save_path (tuple):
-                    menu_flame_project (str): Flame project name
-                    menu_save_path (str): menu save path
-            """
-
-            if menu_visibility == 'Project':
-                menu_save_dir = os.path.join(self.project_menus_dir, self.flame_project_name)
-                menu_flame_project = self.flame_project_name
-            else:
-                menu_save_dir = self.shared_menus_dir
-                menu_flame_project = 'None'
-
-            if not os.path.isdir(menu_save_dir):
-                os.makedirs(menu_save_dir)
-
-            menu_file_name = menu_name.replace('.', '_') + '.py'
-            menu_save_path = os.path.join(menu_save_dir, menu_file_name)
-
-            return menu_flame_project, menu_save_path
-
-        def create_main_tab_token_dict() -> dict:
-            """
-            Create Main Tab Token Dictionary
-            ================================
-
-            Create dictionary for tokens in menu template with values from main tab.
-
-            Returns:
-            --------
-                dict:
-                    template token dictionary
-            """
-
-            return {
-                '<FlameProject>':       menu_flame_project,
-                '<PresetName>':         menu_name,
-                '<PresetType>':         menu_visibility,
-                '<RevealInMediaHub>':   reveal_in_mediahub,
-                '<RevealInFinder>':     reveal_in_finder,
-                '<FlameMinMaxVersion>': self.flame_min_max_version,
-                }
-
-        def menu_template_preset_lines(tab_options_dict: dict) -> list:
+        def menu_presets(tab_options_dict: dict) -> list:
             """
-            Menu Template Preset Lines
-            ==========================
+            Menu Presets
+            ============
 
-            Create new lines to be added to menu template.
+            Get export preset settings for each enabled preset tab.
 
             Args:
             -----
@@ -1712,7 +2098,7 @@ class ExportMenuSetup:
             Returns:
             --------
                 list:
-                    new lines to be added to menu template
+                    export preset settings dicts, saved in the export menu
             """
 
             def get_preset_path(preset_type_menu: str, preset_menu: str) -> str:
@@ -1729,103 +2115,7 @@ class ExportMenuSetup:
 
                 return os.path.join(preset_dir_path, preset_menu) + '.xml'
 
-            def new_lines(tab_number: str,
-                          top_layer: str,
-                          foreground_export: str,
-                          export_between_marks: str,
-                          import_export_value: bool,
-                          include_subtitles: str,
-                          subtitles_export_mode: str,
-                          subtitles_tracks: str,
-                          export_path: str,
-                          preset_file_path: str) -> None:
-                """
-                Build new lines to be added to menu template.
-                Appends generated lines to the outer ``menu_lines`` list in place.
-                """
-
-                menu_lines.append("")
-                menu_lines.append(f"        # Export preset {tab_number}")
-                menu_lines.append("")
-                menu_lines.append("        # Export using top video track")
-                menu_lines.append(f"        clip_output.use_top_video_track = {top_layer}")
-                menu_lines.append(f"        print('\\n--> Export using top layer: {top_layer}')")
-                menu_lines.append("")
-                menu_lines.append("        # Set export to foreground")
-                menu_lines.append(f"        clip_output.foreground = {foreground_export}")
-                menu_lines.append(f"        print('--> Export in foreground: {foreground_export}')")
-                menu_lines.append("")
-                menu_lines.append("        # Export between markers")
-                menu_lines.append(f"        clip_output.export_between_marks = {export_between_marks}")
-                menu_lines.append(f"        print('--> Export between marks: {export_between_marks}\\n')")
-
-                menu_lines.append("")
-                menu_lines.append("        # Include subtitles")
-                menu_lines.append(f"        clip_output.include_subtitles = {include_subtitles}")
-                menu_lines.append(f"        print('--> Include subtitles: {include_subtitles}\\n')")
-                menu_lines.append("")
-                # Convert menu text selections to the bool values used in the generated script
-                export_as_files = subtitles_export_mode != 'Burn in Image'
-                export_all_tracks = subtitles_tracks == 'All Subtitles Tracks'
-                menu_lines.append("        # Subtitles export mode")
-                menu_lines.append(f"        clip_output.export_subtitles_as_files = {export_as_files}")
-                menu_lines.append(f"        print('--> Subtitles export mode: {export_as_files}\\n')")
-                menu_lines.append("")
-                menu_lines.append("        # Subtitles tracks")
-                menu_lines.append(f"        clip_output.export_all_subtitles = {export_all_tracks}")
-                menu_lines.append(f"        print('--> Subtitles tracks: {export_all_tracks}\\n')")
-
-                menu_lines.append("")
-                menu_lines.append("        # Translate tokens in path")
-                menu_lines.append("")
-                menu_lines.append(f"        new_export_path = translate_tokenized_path(clip, '{export_path}')")
-                menu_lines.append("")
-                menu_lines.append("        if not new_export_path:")
-                menu_lines.append("            return")
-                menu_lines.append("")
-                menu_lines.append("        if not os.path.isdir(new_export_path):")
-                menu_lines.append("            try:")
-                menu_lines.append("                os.makedirs(new_export_path)")
-                menu_lines.append("            except:")
-                menu_lines.append("                PyFlameMessageWindow(")
-                menu_lines.append("                    message=f'Could not create export path.\\n\\nPlease check the export path and try again.\\n\\n{new_export_path}',")
-                menu_lines.append("                    message_type=MessageType.ERROR,")
-                menu_lines.append("                    title='Export Path Error',")
-                menu_lines.append("                    parent=None,")
-                menu_lines.append("                )")
-                menu_lines.append("                return")
-                menu_lines.append("")
-                menu_lines.append(f"        import_export = {import_export_value}")
-                menu_lines.append("")
-                menu_lines.append(f"        if import_export:")
-                menu_lines.append(f"            # Drop a marker file in the export directory to capture the server's clock")
-                menu_lines.append(f"            marker_fd, marker_path = tempfile.mkstemp(prefix='.flame_export_marker_', dir=new_export_path)")
-                menu_lines.append(f"            os.close(marker_fd)")
-                menu_lines.append(f"            export_start_time = os.path.getmtime(marker_path)")
-                menu_lines.append(f"            os.remove(marker_path)")
-                menu_lines.append("")
-
-                menu_lines.append(f"        clip_output.export(clip, '{preset_file_path}', new_export_path)")
-                menu_lines.append("")
-
-                menu_lines.append(f"        if import_export:")
-                menu_lines.append(f"            # Walk the entire tree to find .mov files modified at or after the marker's timestamp")
-                menu_lines.append(f"            exported_files = []")
-                menu_lines.append(f"            for dirpath, dirnames, filenames in os.walk(new_export_path):")
-                menu_lines.append(f"                for f in filenames:")
-                menu_lines.append(f"                    if f.lower().endswith('.mov'):")
-                menu_lines.append(f"                        full_path = os.path.join(dirpath, f)")
-                menu_lines.append(f"                        if os.path.getmtime(full_path) >= export_start_time:")
-                menu_lines.append(f"                            exported_files.append(full_path)")
-                menu_lines.append(f"            for path in sorted(exported_files):")
-                menu_lines.append(f"                flame.import_clips(path, clip.parent)")
-                menu_lines.append(f"                pyflame.print('Imported clip back into Flame.')")
-                menu_lines.append("")
-
-                menu_lines.append(f"        # Export preset {tab_number} END")
-                menu_lines.append("")
-
-            menu_lines = []
+            presets = []
 
             print('tab options dict:', tab_options_dict, '\n')
 
@@ -1833,21 +2123,19 @@ class ExportMenuSetup:
                 tab_number = key.rsplit('_', 1)[1].capitalize()
                 if tab_number != 'Zero':
                     if value['Enabled']:
-                        preset_file_path = get_preset_path(value['Preset Type Menu'], value['Preset Menu'])
-                        new_lines(
-                            tab_number,
-                            value['Top Layer'],
-                            value['Foreground Export'],
-                            value['Export Between Marks'],
-                            value['Import Export'],
-                            value['Include Subtitles'],
-                            value['Subtitles Export Mode'],
-                            value['Subtitles Tracks'],
-                            value['Export Path'],
-                            preset_file_path,
-                            )
-
-            return menu_lines
+                        presets.append({
+                            'preset_path':               get_preset_path(value['Preset Type Menu'], value['Preset Menu']),
+                            'export_path':               value['Export Path'],
+                            'use_top_video_track':       value['Top Layer'],
+                            'foreground':                value['Foreground Export'],
+                            'export_between_marks':      value['Export Between Marks'],
+                            'include_subtitles':         value['Include Subtitles'],
+                            'export_subtitles_as_files': value['Subtitles Export Mode'] != 'Burn in Image',
+                            'export_all_subtitles':      value['Subtitles Tracks'] == 'All Subtitles Tracks',
+                            'import_export':             value['Import Export'],
+                            })
+
+            return presets
 
         def save_config() -> None:
             """
@@ -1867,15 +2155,16 @@ class ExportMenuSetup:
                     'import_export':         tw['import_export_pushbutton'].checked,
                     'reveal_in_mediahub':    self.reveal_in_mediahub_pushbutton.checked,
                     'reveal_in_finder':      self.reveal_in_finder_pushbutton.checked,
+                    'bulk_export':           self.bulk_export_pushbutton.checked,
                     }
                 )
 
-        def get_original_menu_file_path(tab: str) -> str | None:
+        def get_original_menu_key(tab: str) -> tuple | None:
             """
-            Get Original Menu File Path
-            ===========================
+            Get Original Menu Key
+            =====================
 
-            Get path to the original menu file when editing an existing menu.
+            Get the registry key of the original menu when editing an existing menu.
             Returns None when creating a new menu (tab is not 'Edit').
 
             Args:
@@ -1885,92 +2174,16 @@ class ExportMenuSetup:
 
             Returns:
             --------
-                str | None:
-                    original menu file path, or None if tab is not 'Edit'
+                tuple | None:
+                    original menu key, or None if tab is not 'Edit'
             """
 
             if tab != 'Edit':
                 return None
 
-            original_menu_name = self.edit_saved_export_menu_menu.text.split(' ', 1)[1]
-
-            if 'Shared: ' in self.edit_saved_export_menu_menu.text:
-                return os.path.join(self.shared_menus_dir, original_menu_name + '.py')
-            return os.path.join(self.project_menus_dir, self.flame_project_name, original_menu_name + '.py')
-
-        def load_menu_template() -> list:
-            """
-            Load Menu Template
-            ==================
-
-            Open menu template and return as list of lines.
-
-            Returns:
-            --------
-                template_lines (list):
-                    menu template lines
-            """
-
-            with open(self.menu_template_path, 'r') as f:
-                template_lines = f.read().splitlines()
-            return template_lines
-
-        def replace_main_tab_tokens() -> list:
-            """
-            Replace Main Tab Tokens
-            =======================
-
-            Replace tokens in menu template with values from main tab token dictionary.
-
-            Returns:
-            --------
-                template_lines (list):
-                    menu template lines with tokens replaced
-            """
-
-            for key, value in main_tab_token_dict.items():
-                for idx, line in enumerate(template_lines):
-                    if key in line:
-                        template_lines[idx] = re.sub(key, value, line)
-
-            return template_lines
-
-        def insert_menu_lines() -> list:
-            """
-            Insert Menu Lines
-            =================
-
-            Insert new preset menu lines into template.
-
-            Returns:
-            --------
-                template_lines (list):
-                    template lines with new preset menu lines inserted
-            """
-
-            for i in range(len(template_lines)):
-                if template_lines[i] == '    for clip in selection:':
-                    i += 1
-                    for line in menu_lines:
-                        template_lines.insert(i, line)
-                        i += 1
+            original_menu_visibility, original_menu_name = self.edit_saved_export_menu_menu.text.split(': ', 1)
 
-            return template_lines
-
-        def delete_original_menu_file() -> None:
-            """
-            Delete Original Menu File
-            =========================
-
-            Delete original menu file if tab is 'Edit'.
-            """
-
-            if original_menu_file_path:
-                os.remove(original_menu_file_path)
-                try:
-                    os.remove(original_menu_file_path + 'c')
-                except Exception:
-                    pass
+            return EXPORT_MENUS.menu_key(original_menu_visibility, original_menu_name, self.flame_project_name)
 
         def get_main_tab_values(tab_options_dict: dict) -> tuple:
             """
@@ -1986,29 +2199,31 @@ class ExportMenuSetup:
 
             Returns:
             --------
-                menu_visibility, menu_name, reveal_in_mediahub, reveal_in_finder (tuple)
+                menu_visibility, menu_name, reveal_in_mediahub, reveal_in_finder, bulk_export (tuple)
             """
 
             # Initialise with empty defaults; overwritten by the 'tab_zero' entry below
             menu_visibility    = ''
             menu_name          = ''
-            reveal_in_mediahub = ''
-            reveal_in_finder   = ''
+            reveal_in_mediahub = False
+            reveal_in_finder   = False
+            bulk_export        = False
 
             for key, value in tab_options_dict.items():
                 if 'tab_zero' in key:
                     menu_visibility    = value['Menu Visibility']
                     menu_name          = value['Menu Name']
-                    reveal_in_mediahub = str(value['Reveal in MediaHub'])
-                    reveal_in_finder   = str(value['Reveal in Finder'])
+                    reveal_in_mediahub = value['Reveal in MediaHub']
+                    reveal_in_finder   = value['Reveal in Finder']
+                    bulk_export        = value['Bulk Export']
 
-            return menu_visibility, menu_name, reveal_in_mediahub, reveal_in_finder
+            return menu_visibility, menu_name, reveal_in_mediahub, reveal_in_finder, bulk_export
 
-        original_menu_file_path = get_original_menu_file_path(tab)
+        original_menu_key = get_original_menu_key(tab)
 
         tab_options_dict = get_tab_settings(tab)
 
-        menu_visibility, menu_name, reveal_in_mediahub, reveal_in_finder = get_main_tab_values(tab_options_dict)
+        menu_visibility, menu_name, reveal_in_mediahub, reveal_in_finder, bulk_export = get_main_tab_values(tab_options_dict)
 
         # Check preset options for proper entries
         preset_error = preset_check(tab_options_dict)
@@ -2020,21 +2235,20 @@ class ExportMenuSetup:
             )
             return
 
-        menu_flame_project, menu_save_path = get_menu_save_path()
-
-        main_tab_token_dict = create_main_tab_token_dict()
-
-        template_lines = load_menu_template()
-
-        template_lines = replace_main_tab_tokens()
-
-        menu_lines = menu_template_preset_lines(tab_options_dict)
-
-        template_lines = insert_menu_lines()
+        menu = {
+            'name':               menu_name,
+            'visibility':         menu_visibility,
+            'project':            self.flame_project_name if menu_visibility == 'Project' else None,
+            'flame_version':      self.flame_min_max_version,
+            'reveal_in_mediahub': reveal_in_mediahub,
+            'reveal_in_finder':   reveal_in_finder,
+            'bulk_export':        bulk_export,
+            'presets':            menu_presets(tab_options_dict),
+            }
 
-        delete_original_menu_file()
+        menu_key = EXPORT_MENUS.menu_key(menu_visibility, menu_name, self.flame_project_name)
 
-        if os.path.isfile(menu_save_path):
+        if menu_key != original_menu_key and EXPORT_MENUS.get_menu(menu_visibility, menu_name, self.flame_project_name):
             overwrite = PyFlameMessageWindow(
                 message=f'Export menu already exists.\n\nDo you want to overwrite it?',
                 message_type=MessageType.WARNING,
@@ -2044,15 +2258,12 @@ class ExportMenuSetup:
             if not overwrite:
                 return
 
-        # Save new menu file
-        with open(menu_save_path, 'w') as f:
-            for line in template_lines:
-                print(line, file=f)
+        # Save menu to export menu registry. Menus are read from the registry each time the
+        # right-click menu is built, so hooks don't need to be refreshed.
+        EXPORT_MENUS.save_menu(menu, replace=original_menu_key)
 
         save_config()
 
-        pyflame.refresh_hooks()
-
         PyFlameMessageWindow(
             message=f'Export Menu Saved: {menu_name}',
             parent=None,
@@ -2061,10 +2272,357 @@ class ExportMenuSetup:
         self.get_saved_menus()
         self.load_preset(preset_to_load=f'{menu_visibility}: {menu_name}')
 
+# ==============================================================================
+# [Export]
+# ==============================================================================
+
+def export_clips(menu: dict, selection) -> None:
+    """
+    Export Clips
+    ============
+
+    Export selected clips with each export preset in an export menu.
+
+    Export paths for all clips are resolved before anything is exported. In bulk export mode exports
+    are grouped by export preset and destination, sent to the background when the preset allows it,
+    and a failed export doesn't stop the other exports. Each export is timed and failures are shown
+    in a summary when all exports are done.
+
+    Args
+    ----
+        `menu` (dict):
+            Export menu from the export menu registry.
+
+        `selection` (list):
+            Selected clips.
+    """
+
+    pyflame.print_title(f'{SCRIPT_NAME} - Clip Export {SCRIPT_VERSION}')
+
+    pyflame.print(f'Exporting: {menu["name"]}')
+
+    export_jobs = plan_exports(menu, selection)
+    if not export_jobs:
+        return
+
+    if menu['bulk_export']:
+        bulk_export(menu, export_jobs)
+    else:
+        # Initialize Exporter
+        clip_output = flame.PyExporter()
+
+        for export_job in export_jobs:
+            preset = menu['presets'][export_job['preset_index']]
+            apply_preset_settings(clip_output, preset, preset['foreground'])
+            if not create_export_path(export_job['export_path']):
+                return
+            export_clip(clip_output, export_job['clip'], preset, export_job['export_path'])
+            if export_job['preset_index'] == len(menu['presets']) - 1:
+                pyflame.print(f'Exported: {export_job["clip_name"]}\n', text_color=TextColor.GREEN)
+
+    exported_paths = [export_job['export_path'] for export_job in export_jobs if not export_job['error']]
+    new_export_path = exported_paths[-1] if exported_paths else None
+
+    # Open export path in MediaHub after export
+    if menu['reveal_in_mediahub'] and new_export_path:
+        flame.go_to('MediaHub')
+        flame.mediahub.files.set_path(new_export_path)
+        pyflame.print('MediaHub opened to export path.')
+
+    # Open export path in finder after export
+    if menu['reveal_in_finder'] and new_export_path:
+        pyflame.open_in_finder(
+            path=new_export_path,
+            )
+        pyflame.print('Finder opened to export path.')
+
+    pyflame.print('Export complete.', text_color=TextColor.GREEN)
+
+def plan_exports(menu: dict, selection) -> list:
+    """
+    Plan Exports
+    ============
+
+    Resolve the export path of every clip for every export preset in the menu, in export order.
+    Project, user and date tokens are read once, clip tokens once per clip.
+
+    Args
+    ----
+        `menu` (dict):
+            Export menu from the export menu registry.
+
+        `selection` (list):
+            Selected clips.
+
+    Returns
+    -------
+        list[dict]: Export jobs. Empty list if an export path resolves to an empty string.
+    """
+
+    export_token_values = get_export_token_values()
+    path_templates = [ExportPathTemplate(preset['export_path']) for preset in menu['presets']]
+    uses_clip_tokens = any(path_template.uses_clip_tokens for path_template in path_templates)
+
+    export_jobs = []
+
+    for clip in selection:
+        token_values = {**export_token_values, **get_clip_token_values(clip)} if uses_clip_tokens else export_token_values
+
+        for preset_index, path_template in enumerate(path_templates):
+            export_path = path_template.resolve(token_values)
+            print('Tokenized Export Path:', path_template.export_path)
+            print('Translated Export Path:', export_path, '\n')
+
+            if not export_path:
+                return []
+
+            export_jobs.append({
+                'clip':         clip,
+                'clip_name':    str(clip.name)[1:-1],
+                'preset_index': preset_index,
+                'export_path':  export_path,
+                'seconds':      0.0,
+                'error':        '',
+                })
+
+    return export_jobs
+
+def bulk_export(menu: dict, export_jobs: list) -> None:
+    """
+    Bulk Export
+    ===========
+
+    Export all export jobs grouped by export preset and destination. Exporter settings are applied and
+    the destination is created once per group.
+
+    Exports are sent to the background unless the preset is set to Foreground Export or imports exported
+    movies back into Flame, which needs the files to be written before the export call returns. Failed exports are recorded in the
+    export job and the remaining exports carry on. A timing report and failure summary are shown at the
+    end.
+
+    Args
+    ----
+        `menu` (dict):
+            Export menu from the export menu registry.
+
+        `export_jobs` (list[dict]):
+            Export jobs from `plan_exports`.
+    """
+
+    export_groups = {}
+    for export_job in export_jobs:
+        export_groups.setdefault((export_job['preset_index'], export_job['export_path']), []).append(export_job)
+
+    pyflame.print(f'Bulk export: {len(export_jobs)} exports to {len(export_groups)} destinations')
+
+    # Initialize Exporter
+    clip_output = flame.PyExporter()
+
+    background_count = 0
+    start_time = time.perf_counter()
+
+    for (preset_index, export_path), group_jobs in export_groups.items():
+        preset = menu['presets'][preset_index]
+        foreground = preset['foreground'] or preset['import_export']
+        apply_preset_settings(clip_output, preset, foreground)
+
+        try:
+            os.makedirs(export_path, exist_ok=True)
+        except OSError as e:
+            for export_job in group_jobs:
+                export_job['error'] = f'Could not create export path: {e}'
+            continue
+
+        for export_job in group_jobs:
+            export_start_time = time.perf_counter()
+            try:
+                export_clip(clip_output, export_job['clip'], preset, export_path)
+                if not foreground:
+                    background_count += 1
+            except Exception as e:
+                export_job['error'] = str(e) or type(e).__name__
+            export_job['seconds'] = time.perf_counter() - export_start_time
+
+    total_seconds = time.perf_counter() - start_time
+
+    preset_names = [os.path.basename(preset['preset_path'])[:-4] for preset in menu['presets']]
+
+    # Timing report
+    print('\nExport times:\n')
+    for export_job in export_jobs:
+        preset_name = preset_names[export_job['preset_index']]
+        status = f'FAILED: {export_job["error"]}' if export_job['error'] else f'{export_job["seconds"]:.2f} sec'
+        print(f'    {export_job["clip_name"]} [{preset_name}]: {status}')
+    print('')
+
+    failed_jobs = [export_job for export_job in export_jobs if export_job['error']]
+
+    pyflame.print(
+        f'Bulk export: {len(export_jobs) - len(failed_jobs)} of {len(export_jobs)} exports done in {total_seconds:.1f} sec, '
+        f'{background_count} sent to background, {len(failed_jobs)} failed',
+        text_color=TextColor.GREEN if not failed_jobs else None,
+        )
+
+    if failed_jobs:
+        failures = '\n'.join(f'{export_job["clip_name"]} [{preset_names[export_job["preset_index"]]}]: {export_job["error"]}' for export_job in failed_jobs[:20])
+        if len(failed_jobs) > 20:
+            failures += f'\n... and {len(failed_jobs) - 20} more'
+        PyFlameMessageWindow(
+            message=f'{len(failed_jobs)} of {len(export_jobs)} exports failed.\n\n{failures}',
+            message_type=MessageType.ERROR,
+            title=f'{SCRIPT_NAME}: Export Errors',
+            parent=None,
+            )
+
+def apply_preset_settings(clip_output, preset: dict, foreground: bool) -> None:
+    """
+    Apply Preset Settings
+    =====================
+
+    Set exporter options from export preset settings.
+
+    Args
+    ----
+        `clip_output` (flame.PyExporter):
+            Exporter.
+
+        `preset` (dict):
+            Export preset settings.
+
+        `foreground` (bool):
+            Export in the foreground.
+    """
+
+    clip_output.use_top_video_track = preset['use_top_video_track']
+    clip_output.foreground = foreground
+    clip_output.export_between_marks = preset['export_between_marks']
+    clip_output.include_subtitles = preset['include_subtitles']
+    clip_output.export_subtitles_as_files = preset['export_subtitles_as_files']
+    clip_output.export_all_subtitles = preset['export_all_subtitles']
+    print(f'--> Export using top layer: {preset["use_top_video_track"]}')
+    print(f'--> Export in foreground: {foreground}')
+    print(f'--> Export between marks: {preset["export_between_marks"]}')
+    print(f'--> Include subtitles: {preset["include_subtitles"]}\n')
+
+def create_export_path(export_path: str) -> bool:
+    """
+    Create Export Path
+    ==================
+
+    Create export path if it doesn't exist. Shows an error window if it can't be created.
+
+    Args
+    ----
+        `export_path` (str):
+            Export path with tokens resolved.
+
+    Returns
+    -------
+        bool: False if the export path could not be created.
+    """
+
+    if not os.path.isdir(export_path):
+        try:
+            os.makedirs(export_path)
+        except OSError:
+            PyFlameMessageWindow(
+                message=f'Could not create export path.\n\nPlease check the export path and try again.\n\n{export_path}',
+                message_type=MessageType.ERROR,
+                title='Export Path Error',
+                parent=None,
+                )
+            return False
+
+    return True
+
+def export_clip(clip_output, clip, preset: dict, export_path: str) -> None:
+    """
+    Export Clip
+    ===========
+
+    Export a clip with one export preset. Exported movie files are imported back into the clip's
+    library or reel when the preset has Import Export turned on.
+
+    Args
+    ----
+        `clip_output` (flame.PyExporter):
+            Exporter, with preset settings applied.
+
+        `clip` (flame.PyClip):
+            Clip to export.
+
+        `preset` (dict):
+            Export preset settings.
+
+        `export_path` (str):
+            Export path with tokens resolved. Must exist.
+    """
+
+    if preset['import_export']:
+        # Drop a marker file in the export directory to capture the server's clock
+        marker_fd, marker_path = tempfile.mkstemp(prefix='.flame_export_marker_', dir=export_path)
+        os.close(marker_fd)
+        export_start_time = os.path.getmtime(marker_path)
+        os.remove(marker_path)
+
+    clip_output.export(clip, preset['preset_path'], export_path)
+
+    if preset['import_export']:
+        # Walk the entire tree to find .mov files modified at or after the marker's timestamp
+        exported_files = []
+        for dirpath, dirnames, filenames in os.walk(export_path):
+            for f in filenames:
+                if f.lower().endswith('.mov'):
+                    full_path = os.path.join(dirpath, f)
+                    if os.path.getmtime(full_path) >= export_start_time:
+                        exported_files.append(full_path)
+        for path in sorted(exported_files):
+            flame.import_clips(path, clip.parent)
+            pyflame.print('Imported clip back into Flame.')
+
+# ==============================================================================
+# [Scopes]
+# ==============================================================================
+
+def scope_clip(selection):
+
+    for item in selection:
+        if isinstance(item, flame.PyClip):
+            return True
+    return False
+
 # ==============================================================================
 # [Flame Menus]
 # ==============================================================================
 
+def get_media_panel_custom_ui_actions():
+
+    # Export menus from older versions of this script are moved into the export menu registry
+    EXPORT_MENUS.migrate_legacy_menus()
+
+    # Project check is done once here for all menus, not for each menu on every right-click
+    project_name = flame.project.current_project.name
+
+    export_actions = {'Project': [], 'Shared': []}
+
+    for menu in sorted(EXPORT_MENUS.project_menus(project_name), key=lambda menu: menu['name'].lower()):
+        action = {
+            'name': menu['name'],
+            'isVisible': scope_clip,
+            'execute': partial(export_clips, menu),
+            }
+        if menu['flame_version']:
+            action['minimumVersion'] = menu['flame_version']
+        export_actions[menu['visibility']].append(action)
+
+    return [
+        {
+            'name': f'{visibility} Export Presets...',
+            'actions': actions,
+        }
+        for visibility, actions in export_actions.items() if actions
+    ]
+
 def get_main_menu_custom_ui_actions():
 
     return [
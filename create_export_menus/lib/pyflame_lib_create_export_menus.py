@@ -19,10 +19,10 @@
 
 """
 PyFlame Library
-Version: 5.3.2
+Version: 5.3.3
 Written By: Michael Vaglienty
 Creation Date: 10.31.20
-Update Date: 05.25.26
+Update Date: 10.19.26
 
 Minimum Flame 2025.1
 
@@ -2985,6 +2985,9 @@ class _PyFlame:
         Get current export preset version and current Flame preset export version.
         This should be updated with each new version of Flame.
 
+        Versions are read through `PyFlameExportPresetCatalog`, the Flame export version is only read
+        once per session and preset versions are cached until the preset file changes.
+
         Args
         ----
             `preset_path` (str):
@@ -3021,50 +3024,13 @@ class _PyFlame:
 
         print('    Export preset path:', preset_path)
 
-        def get_current_export_version(preset_path) -> str:
-            """
-            Get export version for current export preset XML.
-            """
-
-            # Open export preset XML
-            export_preset_xml_tree = ET.parse(preset_path)
-            root = export_preset_xml_tree.getroot()
-
-            # Get version export preset is currently set to
-            current_export_version = None
-            for setting in root.iter('preset'):
-                current_export_version = setting.get('version')
-                print(f'    Current export preset version: {current_export_version}')
+        # Preset is parsed only up to its <preset> element, Flame's export version is read once per session
+        current_export_version = PyFlameExportPresetCatalog.preset_version(preset_path)
+        print(f'    Current export preset version: {current_export_version}')
 
-            return str(current_export_version) if current_export_version is not None else ''
-
-        def get_export_version() -> str:
-            """
-            Get export version for current version of Flame from the default
-            Jpeg export preset XML.
-            """
-
-            # Open Flame default Jpeg export preset XML
-            preset_dir = flame.PyExporter.get_presets_dir(
-                flame.PyExporter.PresetVisibility.Autodesk, flame.PyExporter.PresetType.Image_Sequence
-            )
-            preset_path = os.path.join(
-                preset_dir, "Jpeg", "Jpeg (8-bit).xml"
-            )
-            preset_xml_tree = ET.parse(preset_path)
-            root = preset_xml_tree.getroot()
-
-            # Get version default export preset is currently set to
-            default_export_version = None
-            for setting in root.iter('preset'):
-                default_export_version = setting.get('version')
-                print(f'    Flame default export preset version: {default_export_version}')
-                print('\n', end='')
-
-            return str(default_export_version) if default_export_version is not None else ''
-
-        current_export_version = get_current_export_version(preset_path)
-        export_version = get_export_version()
+        export_version = PyFlameExportPresetCatalog.export_version()
+        print(f'    Flame default export preset version: {export_version}')
+        print('\n', end='')
 
         return current_export_version, export_version
 
@@ -3173,6 +3139,8 @@ class _PyFlame:
 
         Get Export Preset Names from Shared and Project paths. User paths are not checked.
 
+        Preset folder listings are shared with `PyFlameExportPresetCatalog` and cached until the folders change.
+
         The following are added to the beginning of each preset name:
             Shared: File Sequence:
             Shared: Movie:
@@ -3190,33 +3158,17 @@ class _PyFlame:
         project_file_sequence_path = os.path.join('/opt/Autodesk/', f'{flame.projects.current_project.name}', 'export/presets/flame/file_sequence')
         project_movie_export_path = os.path.join('/opt/Autodesk/', f'{flame.projects.current_project.name}', 'export/presets/flame/movie_file')
 
-        # Get Shared File Sequence Export Presets
-        if os.path.isdir(SHARED_FILE_SEQUENCE_PATH):
-            shared_file_sequence_export_presets = [f'Shared: File Sequence: {p[:-4]}' for p in os.listdir(SHARED_FILE_SEQUENCE_PATH) if p.endswith('.xml')]
-        else:
-            shared_file_sequence_export_presets = []
-            print('Shared File Sequence Export Presets path does not exist:', SHARED_FILE_SEQUENCE_PATH, '\n')
+        def get_presets(preset_dir: str, prefix: str, label: str) -> List[str]:
+            if not os.path.isdir(preset_dir):
+                print(f'{label} Export Presets path does not exist:', preset_dir, '\n')
+                return []
+            return [f'{prefix}: {name}' for name in PyFlameExportPresetCatalog.preset_names(preset_dir)]
 
-        # Get Shared Movie Export Presets
-        if os.path.isdir(SHARED_MOVIE_EXPORT_PATH):
-            shared_movie_export_presets = [f'Shared: Movie: {p[:-4]}' for p in os.listdir(SHARED_MOVIE_EXPORT_PATH) if p.endswith('.xml')]
-        else:
-            shared_movie_export_presets = []
-            print('Shared Movie Export Presets path does not exist:', SHARED_MOVIE_EXPORT_PATH, '\n')
-
-        # Get Project File Sequence Export Presets
-        if os.path.isdir(project_file_sequence_path):
-            project_file_sequence_export_presets = [f'Project: File Sequence: {p[:-4]}' for p in os.listdir(project_file_sequence_path) if p.endswith('.xml')]
-        else:
-            project_file_sequence_export_presets = []
-            print('Project File Sequence Export Presets path does not exist:', project_file_sequence_path, '\n')
-
-        # Get Project Movie Export Presets
-        if os.path.isdir(project_movie_export_path):
-            project_movie_export_presets = [f'Project: Movie: {p[:-4]}' for p in os.listdir(project_movie_export_path) if p.endswith('.xml')]
-        else:
-            project_movie_export_presets = []
-            print('Project Movie Export Presets path does not exist:', project_movie_export_path, '\n')
+        # Get Shared and Project Export Presets
+        shared_file_sequence_export_presets = get_presets(SHARED_FILE_SEQUENCE_PATH, 'Shared: File Sequence', 'Shared File Sequence')
+        shared_movie_export_presets = get_presets(SHARED_MOVIE_EXPORT_PATH, 'Shared: Movie', 'Shared Movie')
+        project_file_sequence_export_presets = get_presets(project_file_sequence_path, 'Project: File Sequence', 'Project File Sequence')
+        project_movie_export_presets = get_presets(project_movie_export_path, 'Project: Movie', 'Project Movie')
 
         # Combine all export presets
         export_presets = shared_file_sequence_export_presets + shared_movie_export_presets + project_file_sequence_export_presets + project_movie_export_presets
@@ -4503,6 +4455,305 @@ class PyFlameConfig:
 
         return data
 
+class PyFlameExportPresetCatalog:
+    """
+    PyFlame Export Preset Catalog
+    =============================
+
+    Catalog of export preset files and their export versions, cached for the Flame session.
+
+    The export version of the current version of Flame is read from Flame's default Jpeg export preset
+    once per session. The export version of each preset is read by parsing the preset XML only until
+    the first `<preset>` element is found. Preset versions are cached by preset path and modification
+    time, and preset folder listings are cached by folder path and modification time, so presets are
+    only read again when they change.
+
+    `pyflame.get_export_preset_version` and `pyflame.get_export_preset_names` use this class.
+
+    All methods are class methods, no instance needs to be created.
+
+    Methods
+    -------
+        `export_version()` -> str:
+            Get the export preset version for the current version of Flame.
+
+        `preset_version(preset_path)` -> str:
+            Get the export preset version of a preset.
+
+        `is_compatible(preset_path)` -> bool:
+            Check if a preset can be used with the current version of Flame.
+
+        `preset_files(preset_dir, recursive=False)` -> list[str]:
+            Get the paths of the presets in a folder, relative to the folder.
+
+        `preset_names(preset_dir, recursive=False, compatible_only=False)` -> list[str]:
+            Get the names of the presets in a folder, relative to the folder, without `.xml`.
+
+        `clear()`:
+            Clear the cached export version, preset versions and folder listings.
+
+    Examples
+    --------
+        To get the presets in the shared movie preset folder that can be used with the current version
+        of Flame:
+        ```
+        preset_names = PyFlameExportPresetCatalog.preset_names(
+            preset_dir=SHARED_MOVIE_EXPORT_PATH,
+            recursive=True,
+            compatible_only=True,
+            )
+        ```
+    """
+
+    _export_version = None
+    _preset_versions = {}
+    _folder_listings = {}
+
+    #-------------------------------------
+    # [Methods]
+    #-------------------------------------
+
+    @classmethod
+    def export_version(cls) -> str:
+        """
+        Export Version
+        ==============
+
+        Get the export preset version for the current version of Flame. Read from Flame's default
+        Jpeg export preset the first time it is asked for.
+
+        Returns
+        -------
+            `export_version` (str):
+                Export preset version for current version of Flame.
+        """
+
+        if cls._export_version is None:
+            preset_dir = flame.PyExporter.get_presets_dir(
+                flame.PyExporter.PresetVisibility.Autodesk, flame.PyExporter.PresetType.Image_Sequence
+            )
+            cls._export_version = cls._read_preset_version(os.path.join(preset_dir, 'Jpeg', 'Jpeg (8-bit).xml'))
+
+        return cls._export_version
+
+    @classmethod
+    def preset_version(cls, preset_path: str) -> str:
+        """
+        Preset Version
+        ==============
+
+        Get the export preset version of a preset. Cached by preset path and modification time.
+
+        Args
+        ----
+            `preset_path` (str):
+                Path of export preset.
+
+        Returns
+        -------
+            `preset_version` (str):
+                Export preset version of the preset. Empty string if the preset has no version.
+
+        Raises
+        ------
+            TypeError:
+                If `preset_path` is not a string.
+        """
+
+        if not isinstance(preset_path, str):
+            pyflame.raise_type_error('PyFlameExportPresetCatalog.preset_version', 'preset_path', 'str', preset_path)
+
+        mtime = os.path.getmtime(preset_path)
+        cached = cls._preset_versions.get(preset_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        preset_version = cls._read_preset_version(preset_path)
+        cls._preset_versions[preset_path] = (mtime, preset_version)
+
+        return preset_version
+
+    @classmethod
+    def is_compatible(cls, preset_path: str) -> bool:
+        """
+        Is Compatible
+        =============
+
+        Check if a preset can be used with the current version of Flame. Presets are compatible when
+        their export version is less than or equal to the export version of the current version of Flame.
+
+        Args
+        ----
+            `preset_path` (str):
+                Path of export preset.
+
+        Returns
+        -------
+            bool: True if the preset is compatible, False if not or if the preset can't be read.
+        """
+
+        try:
+            return cls.preset_version(preset_path) <= cls.export_version()
+        except (OSError, ET.ParseError):
+            return False
+
+    @classmethod
+    def preset_files(cls, preset_dir: str, recursive: bool=False) -> List[str]:
+        """
+        Preset Files
+        ============
+
+        Get the paths of the export presets (.xml) in a folder, relative to the folder. Folder listings
+        are cached by folder path and modification time.
+
+        Args
+        ----
+            `preset_dir` (str):
+                Path of export preset folder.
+
+            `recursive` (bool, optional):
+                Include presets in sub-folders.
+                (Default: `False`)
+
+        Returns
+        -------
+            list[str]: Relative paths of presets. Empty list if the folder does not exist.
+
+        Raises
+        ------
+            TypeError:
+                If `preset_dir` is not a string.
+                If `recursive` is not a boolean.
+        """
+
+        if not isinstance(preset_dir, str):
+            pyflame.raise_type_error('PyFlameExportPresetCatalog.preset_files', 'preset_dir', 'str', preset_dir)
+        elif not isinstance(recursive, bool):
+            pyflame.raise_type_error('PyFlameExportPresetCatalog.preset_files', 'recursive', 'bool', recursive)
+
+        preset_files = []
+        folders = [('', preset_dir)]
+        while folders:
+            relative_dir, folder = folders.pop()
+            listing = cls._list_folder(folder)
+            if listing is None:
+                continue
+            sub_folders, files = listing
+            preset_files.extend(os.path.join(relative_dir, file) for file in files)
+            if recursive:
+                folders.extend((os.path.join(relative_dir, sub_folder), os.path.join(folder, sub_folder)) for sub_folder in sub_folders)
+
+        return preset_files
+
+    @classmethod
+    def preset_names(cls, preset_dir: str, recursive: bool=False, compatible_only: bool=False) -> List[str]:
+        """
+        Preset Names
+        ============
+
+        Get the sorted names of the export presets in a folder, relative to the folder, without `.xml`.
+
+        Args
+        ----
+            `preset_dir` (str):
+                Path of export preset folder.
+
+            `recursive` (bool, optional):
+                Include presets in sub-folders.
+                (Default: `False`)
+
+            `compatible_only` (bool, optional):
+                Only include presets compatible with the current version of Flame.
+                (Default: `False`)
+
+        Returns
+        -------
+            list[str]: Preset names. Empty list if the folder does not exist.
+
+        Raises
+        ------
+            TypeError:
+                If `compatible_only` is not a boolean.
+        """
+
+        if not isinstance(compatible_only, bool):
+            pyflame.raise_type_error('PyFlameExportPresetCatalog.preset_names', 'compatible_only', 'bool', compatible_only)
+
+        return sorted(
+            preset_file[:-4] for preset_file in cls.preset_files(preset_dir, recursive)
+            if not compatible_only or cls.is_compatible(os.path.join(preset_dir, preset_file))
+            )
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Clear
+        =====
+
+        Clear the cached export version, preset versions and folder listings.
+        """
+
+        cls._export_version = None
+        cls._preset_versions.clear()
+        cls._folder_listings.clear()
+
+    #-------------------------------------
+    # [Internal Methods]
+    #-------------------------------------
+
+    @staticmethod
+    def _read_preset_version(preset_path: str) -> str:
+        """
+        Read Preset Version
+        ===================
+
+        Read the version of the first `<preset>` element in an export preset XML. The XML is parsed
+        incrementally and parsing stops as soon as the element is found.
+        """
+
+        for _, element in ET.iterparse(preset_path, events=('start',)):
+            if element.tag == 'preset':
+                preset_version = element.get('version')
+                return str(preset_version) if preset_version is not None else ''
+
+        return ''
+
+    @classmethod
+    def _list_folder(cls, folder: str) -> Tuple[List[str], List[str]] | None:
+        """
+        List Folder
+        ===========
+
+        Get the sub-folders and export presets (.xml) in a folder, cached by folder path and modification
+        time. Returns None if the folder does not exist.
+        """
+
+        try:
+            mtime = os.path.getmtime(folder)
+        except OSError:
+            return None
+
+        cached = cls._folder_listings.get(folder)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        sub_folders = []
+        files = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        sub_folders.append(entry.name)
+                    elif entry.name.endswith('.xml'):
+                        files.append(entry.name)
+        except OSError:
+            return None
+
+        listing = (sorted(sub_folders), sorted(files))
+        cls._folder_listings[folder] = (mtime, listing)
+
+        return listing
+
 # ==============================================================================
 # [PyFlame QT Widgets]
 # ==============================================================================
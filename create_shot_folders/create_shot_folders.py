@@ -19,11 +19,11 @@
 
 """
 Script Name: Create Shot Folders
-Script Version: 5.5.0
+Script Version: 5.5.3
 Flame Version: 2025.1
 Written by: Michael Vaglienty
 Creation Date: 06.09.18
-Update Date: 02.18.26
+Update Date: 10.19.26
 
 License: GNU General Public License v3.0 (GPL-3.0) - see LICENSE file for details
 
@@ -59,6 +59,17 @@ To install:
 
 Updates:
 
+    v5.5.3 10.19.26
+        - File system shot folders are planned once and created with multiple threads. Number of folders created and folders that already existed is shown when done.
+        - Updated to PyFlameLib v5.2.6.
+
+    v5.5.2 10.19.26
+        - Clips are copied to shot folders using a shot folder index built when the shot folders are created instead of searching the Media Panel for every clip.
+        - Updated to PyFlameLib v5.2.5.
+
+    v5.5.1 10.19.26
+        - Updated to PyFlameLib v5.2.4.
+
     v5.5.0 02.18.26
         - Create shot folders for selected clips in Media Panel.
         - Create shot folders for selected timeline segments.
@@ -108,7 +119,7 @@ from lib.pyflame_lib_create_shot_folders import *
 # ==============================================================================
 
 SCRIPT_NAME = 'Create Shot Folders'
-SCRIPT_VERSION = 'v5.5.0'
+SCRIPT_VERSION = 'v5.5.3'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
 # ==============================================================================
@@ -1028,12 +1039,14 @@ class CreateShotFolders():
 
             # Create new shot library
             self.media_panel_dest = flame.projects.current_project.current_workspace.create_library('Shot Folders')
+            self.shot_folder_index = PyFlameShotFolderIndex(self.media_panel_dest)
 
-            # Create Media Panel shot folders
+            # Create Media Panel shot folders, new shot folders are added to the shot folder index
             pyflame.create_media_panel_folders(
                 folder_list=shot_list,
                 folder_structure=self.settings.folders,
                 dest=self.media_panel_dest,
+                shot_folder_index=self.shot_folder_index,
                 )
 
             pyflame.print('Media Panel Shot Folders Created', arrow=True)
@@ -1129,7 +1142,8 @@ class CreateShotFolders():
         Copy Clips
         ==========
 
-        Copy clips to shot folders.
+        Copy clips to shot folders. Shot folders are found with the shot folder index built when the
+        Media Panel shot folders were created.
         """
 
         print('Mode:', self.mode)
@@ -1158,6 +1172,7 @@ class CreateShotFolders():
                 pyobject=clip,
                 search_location=self.media_panel_dest,
                 dest_folder_path=self.settings.plate_folder,
+                shot_folder_index=self.shot_folder_index,
                 )
 
         # If original tab was MediaHub, switch back to it.
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Callable, Dict, List, Tuple, Sequence
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple, Sequence
 from enum import Enum
 import flame
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -117,13 +117,13 @@ class _PyFlame(object):
     @staticmethod
     def create_media_panel_libraries(library_structure: dict[str, Any]) -> None: ...
     @staticmethod
-    def create_media_panel_folder(folder_name: str, folder_structure: dict[str, Any], dest: flame.PyFolder | flame.PyLibrary, shot_name_tag: str = ...) -> None: ...
+    def create_media_panel_folder(folder_name: str, folder_structure: dict[str, Any], dest: flame.PyFolder | flame.PyLibrary, shot_name_tag: str = ...) -> flame.PyFolder: ...
     @staticmethod
-    def create_media_panel_folders(folder_list: list[str], folder_structure: dict[str, Any], dest: flame.PyFolder | flame.PyLibrary) -> None: ...
+    def create_media_panel_folders(folder_list: list[str], folder_structure: dict[str, Any], dest: flame.PyFolder | flame.PyLibrary, shot_folder_index: PyFlameShotFolderIndex | None = ...) -> None: ...
     @staticmethod
     def create_file_system_folder(folder_name: str, folder_structure: dict[str, Any], dest_path: str, skip_existing: bool = ...) -> None: ...
     @staticmethod
-    def create_file_system_folders(folder_list: list[str], folder_structure: dict[str, Any], dest_path: str) -> None: ...
+    def create_file_system_folders(folder_list: list[str], folder_structure: dict[str, Any], dest_path: str, max_workers: int = ...) -> PyFlameFolderPlan: ...
     @staticmethod
     def copy_to_clipboard(value: str | int) -> None: ...
     @staticmethod
@@ -155,7 +155,9 @@ class _PyFlame(object):
     @staticmethod
     def resolve_path_tokens(tokenized_path: str, flame_pyobject: Any = ..., date: Any = ...) -> str: ...
     @staticmethod
-    def resolve_tokens(tokenized_string: str, flame_pyobject: Any = ..., date: Any = ...) -> str: ...
+    def resolve_tokens(tokenized_string: str, flame_pyobject: Any = ..., date: Any = ..., shot_name_tag: str = ...) -> str: ...
+    @staticmethod
+    def resolve_tokens_bulk(tokenized_string: str, flame_pyobjects: List[Any], date: Any = ..., shot_name_tag: str = ...) -> List[str]: ...
     @staticmethod
     def resolve_shot_name(name: str) -> str: ...
     @staticmethod
@@ -183,9 +185,9 @@ class _PyFlame(object):
     @staticmethod
     def get_media_panel_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str) -> flame.PyFolder | None: ...
     @staticmethod
-    def move_to_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str, expand_dest_folder: bool = ...) -> None: ...
+    def move_to_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str, expand_dest_folder: bool = ..., shot_folder_index: PyFlameShotFolderIndex | None = ...) -> None: ...
     @staticmethod
-    def copy_to_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str, expand_dest_folder: bool = ...) -> None: ...
+    def copy_to_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str, expand_dest_folder: bool = ..., shot_folder_index: PyFlameShotFolderIndex | None = ...) -> None: ...
 
 pyflame: Any
 def _load_font() -> Any: ...
@@ -219,6 +221,44 @@ class PyFlameConfig(object):
     def save_config(self: Any, config_values: Dict[str, Any] | None = ..., config_path: str | None = ...) -> None: ...
     def get_config_values(config_path: str) -> Dict[str, Any]: ...
 
+class PyFlameTokenTemplate(object):
+    def __init__(self: Any, tokenized_string: str, date: Any = ..., shot_name_tag: str = ...) -> None: ...
+    @property
+    def tokenized_string(self: Any) -> str: ...
+    @property
+    def tokens(self: Any) -> FrozenSet[str]: ...
+    @classmethod
+    def clear_cache(cls: Any) -> None: ...
+    def resolve(self: Any, flame_pyobject: Any = ...) -> str: ...
+    def resolve_many(self: Any, flame_pyobjects: List[Any]) -> List[str]: ...
+
+class PyFlameShotFolderIndex(object):
+    def __init__(self: Any, search_location: flame.PyLibrary | flame.PyFolder, shot_name_tag: str = ...) -> None: ...
+    @property
+    def search_location(self: Any) -> flame.PyLibrary | flame.PyFolder: ...
+    @property
+    def shot_names(self: Any) -> List[str]: ...
+    def refresh(self: Any) -> None: ...
+    def add_shot_folder(self: Any, folder: flame.PyFolder) -> None: ...
+    def get_shot_folder(self: Any, shot_name: str) -> flame.PyFolder | None: ...
+    def get_folder(self: Any, shot_name: str, dest_folder_path: str) -> flame.PyFolder | None: ...
+
+class PyFlameFolderPlan(object):
+    def __init__(self: Any, folder_structure: dict[str, Any], dest_path: str) -> None: ...
+    @property
+    def dest_path(self: Any) -> str: ...
+    @property
+    def paths(self: Any) -> List[str]: ...
+    @property
+    def created_count(self: Any) -> int: ...
+    @property
+    def existing_count(self: Any) -> int: ...
+    @property
+    def failed_paths(self: Any) -> List[str]: ...
+    def add_folder(self: Any, folder_name: str) -> List[str]: ...
+    def add_folders(self: Any, folder_list: List[str]) -> None: ...
+    def create(self: Any, max_workers: int = ...) -> None: ...
+
 class PyFlameButton(QtWidgets.QPushButton):
     def __init__(self: 'PyFlameButton', text: str = ..., connect: Callable[..., None] = ..., color: Color = ..., enabled: bool = ..., width: int | None = ..., height: int | None = ..., tooltip: str | None = ..., tooltip_delay: int = ..., tooltip_duration: int = ...) -> None: ...
     @property
@@ -19,10 +19,10 @@
 
 """
 PyFlame Library
-Version: 5.2.3
+Version: 5.2.6
 Written By: Michael Vaglienty
 Creation Date: 10.31.20
-Update Date: 02.24.26
+Update Date: 10.19.26
 
 License: GNU General Public License v3.0 (GPL-3.0) - see LICENSE file for details
 
@@ -84,6 +84,7 @@ import importlib.util
 from shiboken6 import isValid
 import xml.etree.ElementTree as ET
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from subprocess import PIPE, Popen
 from typing import Any, Callable, Dict, List, Tuple, Sequence
@@ -1043,7 +1044,7 @@ class _PyFlame:
         pyflame.print('Media Panel Libraries and Folders Created', arrow=True)
 
     @staticmethod
-    def create_media_panel_folder(folder_name: str, folder_structure: dict[str, Any], dest: flame.PyFolder | flame.PyLibrary, shot_name_tag: str='') -> None:
+    def create_media_panel_folder(folder_name: str, folder_structure: dict[str, Any], dest: flame.PyFolder | flame.PyLibrary, shot_name_tag: str='') -> flame.PyFolder:
         """
         Create Media Panel Folder
         =========================
@@ -1075,6 +1076,11 @@ class _PyFlame:
                 If `dest` is not a flame.PyFolder or flame.PyLibrary.
                 If `shot_name_tag` is not a string.
 
+        Returns
+        -------
+            `root_folder` (flame.PyFolder):
+                The main folder created in the media panel.
+
         Example
         -------
             To create media panel folders:
@@ -1149,8 +1155,10 @@ class _PyFlame:
 
         pyflame.print(f'Media Panel Folder Created: {folder_name}', arrow=True)
 
+        return root_folder
+
     @staticmethod
-    def create_media_panel_folders(folder_list: list[str], folder_structure: dict[str, Any], dest: flame.PyFolder | flame.PyLibrary) -> None:
+    def create_media_panel_folders(folder_list: list[str], folder_structure: dict[str, Any], dest: flame.PyFolder | flame.PyLibrary, shot_folder_index: 'PyFlameShotFolderIndex | None'=None) -> None:
         """
         Create Media Panel Folders
         ==========================
@@ -1168,12 +1176,17 @@ class _PyFlame:
             `dest` (Folder):
                 The destination folder/library in the Media Panel where the folders will be created.
 
+            `shot_folder_index` (PyFlameShotFolderIndex | None):
+                Shot folder index to add the new shot folders to.
+                (Default: `None`)
+
         Raises
         ------
             TypeError:
                 If `folder_list` is not a list.
                 If `folder_structure` is not a dictionary.
                 If `dest` is not a flame.PyFolder or flame.PyLibrary.
+                If `shot_folder_index` is not a PyFlameShotFolderIndex or None.
 
         Notes
         -----
@@ -1215,13 +1228,17 @@ class _PyFlame:
             pyflame.raise_type_error('pyflame.create_media_panel_folders', 'folder_structure', 'dict', folder_structure)
         if not isinstance(dest, (flame.PyFolder, flame.PyLibrary)):
             pyflame.raise_type_error('pyflame.create_media_panel_folders', 'dest', 'flame.PyFolder | flame.PyLibrary', dest)
+        if shot_folder_index is not None and not isinstance(shot_folder_index, PyFlameShotFolderIndex):
+            pyflame.raise_type_error('pyflame.create_media_panel_folders', 'shot_folder_index', 'PyFlameShotFolderIndex | None', shot_folder_index)
 
         pyflame.print('Creating Media Panel Folders...')
         pyflame.print('Folder Structure:', underline=True, print_to_flame=False, text_color=TextColor.BLUE)
         pyflame.print_dict(folder_structure)
 
         for folder_name in folder_list:
-            _PyFlame.create_media_panel_folder(folder_name, folder_structure, dest, folder_name)
+            root_folder = _PyFlame.create_media_panel_folder(folder_name, folder_structure, dest, folder_name)
+            if shot_folder_index is not None:
+                shot_folder_index.add_shot_folder(root_folder)
 
     @staticmethod
     def create_file_system_folder(folder_name: str, folder_structure: dict[str, Any], dest_path: str, skip_existing: bool=False) -> None:
@@ -1283,31 +1300,6 @@ class _PyFlame:
             ```
         """
 
-        def create_sub_folders(value: dict, parent_folder: str) -> None:
-            """
-            Create Sub-Folders
-            ==================
-
-            Recursively create sub-folders based on the provided folder structure.
-
-            Args
-            ----
-                `value` (dict):
-                    Nested dictionary representing folder structure.
-
-                `parent_folder` (str):
-                    The parent folder where the sub-folders will be created.
-            """
-
-            for key, value in value.items():
-                key = pyflame.resolve_tokens(key) # Resolve tokens in folder name
-                folder = os.path.join(parent_folder, key)
-                try:
-                    os.makedirs(folder, exist_ok=True)
-                except OSError as e:
-                    print(f"Error creating directory {folder}: {e}")
-                create_sub_folders(value, folder)
-
         #Validate arguments
         if not isinstance(folder_name, str):
             pyflame.raise_type_error('pyflame.create_file_system_folder', 'folder_name', 'str', folder_name)
@@ -1319,37 +1311,38 @@ class _PyFlame:
             pyflame.raise_type_error('pyflame.create_file_system_folder', 'skip_existing', 'bool', skip_existing)
 
         # Create folders
-        for key, value in folder_structure.items():
-            folder_name = pyflame.resolve_tokens(folder_name) # Resolve tokens in folder name
-            parent_folder = os.path.join(dest_path, folder_name)
-            if not os.path.isdir(parent_folder) or not skip_existing:
-                try:
-                    os.makedirs(parent_folder, exist_ok=True)
-                    pyflame.print(
-                        text=f'Creating File System Folders For: {folder_name}',
-                        new_line=False,
-                        text_color=TextColor.GREEN,
-                        )
-                except OSError as e:
-                    print(f"Error creating directory {parent_folder}: {e}")
-                create_sub_folders(value, parent_folder)
-            else:
-                pyflame.print(
-                    text=f'File system folder: {folder_name} already exists, skipping.',
-                    new_line=False,
-                    )
+        folder_name = pyflame.resolve_tokens(folder_name) # Resolve tokens in folder name
+        if skip_existing and os.path.isdir(os.path.join(dest_path, folder_name)):
+            pyflame.print(
+                text=f'File system folder: {folder_name} already exists, skipping.',
+                new_line=False,
+                )
+            return
+
+        folder_plan = PyFlameFolderPlan(folder_structure, dest_path)
+        folder_plan.add_folder(folder_name)
+        folder_plan.create()
+
+        pyflame.print(
+            text=f'Creating File System Folders For: {folder_name}',
+            new_line=False,
+            text_color=TextColor.GREEN,
+            )
 
         # Refresh Media Panel
         flame.execute_shortcut("Refresh the MediaHub's Folders and Files")
 
     @staticmethod
-    def create_file_system_folders(folder_list: list[str], folder_structure: dict[str, Any], dest_path: str) -> None:
+    def create_file_system_folders(folder_list: list[str], folder_structure: dict[str, Any], dest_path: str, max_workers: int=8) -> 'PyFlameFolderPlan':
         """
         Create File System Folders
         ==========================
 
         Create file system folders for a list of folders. Tokens can be used in folder names.
 
+        Tokens in the folder structure are resolved once, all folder paths are planned and de-duplicated,
+        then created with up to `max_workers` threads. The MediaHub is refreshed once when done.
+
         Args
         ----
             `folder_list` (list[str]):
@@ -1361,18 +1354,28 @@ class _PyFlame:
             `dest_path` (str):
                 Path where folders will be created.
 
+            `max_workers` (int, optional):
+                Maximum number of folders to create at the same time.
+                (Default: `8`)
+
+        Returns
+        -------
+            `folder_plan` (PyFlameFolderPlan):
+                Folder plan with the number of folders created and folders that already existed.
+
         Raises
         ------
             TypeError:
                 If `folder_list` is not a list.
                 If `folder_structure` is not a dictionary.
                 If `dest_path` is not a string.
+                If `max_workers` is not an integer.
 
         Notes
         -----
             Tokens can be used in folder names.
 
-            Uses _PyFlame.create_file_system_folder() to create each folder in list.
+            Uses PyFlameFolderPlan to create the folders.
 
         Example
         -------
@@ -1426,13 +1429,31 @@ class _PyFlame:
             pyflame.raise_type_error('pyflame.create_file_system_folders', 'folder_structure', 'dict', folder_structure)
         if not isinstance(dest_path, str):
             pyflame.raise_type_error('pyflame.create_file_system_folders', 'dest_path', 'str', dest_path)
+        if not isinstance(max_workers, int):
+            pyflame.raise_type_error('pyflame.create_file_system_folders', 'max_workers', 'int', max_workers)
 
         pyflame.print('Creating File System Folders', text_color=TextColor.GREEN)
         pyflame.print('Folder Structure:', underline=True, print_to_flame=False, text_color=TextColor.BLUE)
         pyflame.print_dict(folder_structure)
 
-        for folder_name in folder_list:
-            _PyFlame.create_file_system_folder(folder_name, folder_structure, dest_path)
+        folder_plan = PyFlameFolderPlan(folder_structure, dest_path)
+        folder_plan.add_folders(folder_list)
+        folder_plan.create(max_workers=max_workers)
+
+        pyflame.print(
+            text=f'File System Folders Created: {folder_plan.created_count}  Already Existing: {folder_plan.existing_count}',
+            text_color=TextColor.GREEN,
+            )
+        if folder_plan.failed_paths:
+            pyflame.print(
+                text=f'Unable to create {len(folder_plan.failed_paths)} file system folders, see terminal for details.',
+                print_type=PrintType.WARNING,
+                )
+
+        # Refresh Media Panel
+        flame.execute_shortcut("Refresh the MediaHub's Folders and Files")
+
+        return folder_plan
 
     @staticmethod
     def copy_to_clipboard(value: str | int) -> None:
@@ -2449,13 +2470,17 @@ class _PyFlame:
         return pyflame.resolve_tokens(tokenized_path, flame_pyobject, date) # Resolve path tokens
 
     @staticmethod
-    def resolve_tokens(tokenized_string: str, flame_pyobject=None, date=None) -> str:
+    def resolve_tokens(tokenized_string: str, flame_pyobject=None, date=None, shot_name_tag: str = 'ShotName') -> str:
         """
         Resolve Path Tokens
         ===================
 
         Resolves strings containing tokens.
 
+        The string is resolved with `PyFlameTokenTemplate`. To resolve the same string for many
+        Flame PyObjects use `pyflame.resolve_tokens_bulk` or a `PyFlameTokenTemplate` so project,
+        user, and date values are only looked up once.
+
         Args
         ----
             `tokenized_string` (str):
@@ -2469,6 +2494,10 @@ class _PyFlame:
                 Date/time to use for token translation. If None is passed datetime value will be gotten each time function is run.
                 (Default: `None`)
 
+            `shot_name_tag` (str, optional):
+                Batch group tag used to get the shot name of a PyBatch (<shot_name_tag>: <shot_name>).
+                (Default: `ShotName`)
+
         Supported tokens:
         ----------------
             <ProjectName>, <ProjectNickName>, <UserName>, <UserNickName>, <YYYY>, <YY>, <MM>, <DD>, <Hour>, <Minute>, <AMPM>, <ampm>
@@ -2493,7 +2522,7 @@ class _PyFlame:
         -------
             To resolve path tokens:
             ```
-            export_path = pyflame.translate_path_tokens(
+            export_path = pyflame.resolve_tokens(
                 tokenized_string=custom_export_path,
                 flame_pyobject=clip,
                 date=date
@@ -2505,252 +2534,64 @@ class _PyFlame:
         if not isinstance(tokenized_string, str):
             pyflame.raise_type_error('pyflame.resolve_tokens', 'tokenized_string', 'str', tokenized_string)
 
-        def get_seq_name(name):
-            """
-            Get sequence name abreviation from shot name
-            """
-
-            seq_name = re.split('[^a-zA-Z]', name)[0]
-            return seq_name
+        return PyFlameTokenTemplate(tokenized_string, date=date, shot_name_tag=shot_name_tag).resolve(flame_pyobject)
 
-        pyflame.print('Resolving Tokens', new_line=False)
-        print('----------------')
+    @staticmethod
+    def resolve_tokens_bulk(tokenized_string: str, flame_pyobjects: list, date=None, shot_name_tag: str = 'ShotName') -> list[str]:
+        """
+        Resolve Tokens Bulk
+        ===================
 
-        print('Checking for tokens in string:', tokenized_string)
+        Resolves a string containing tokens for each Flame PyObject in a list.
 
-        # Check if string has tokens
-        if not re.search(r'<.*?>', tokenized_string):
-            pyflame.print(f'No tokens found in string: {tokenized_string}')
-            return tokenized_string
-        else:
-            pyflame.print(f'Tokens found in string, resolving...')
-        # Get time values for token conversion
-        if not date:
-            date = datetime.datetime.now()
-
-        yyyy = date.strftime('%Y')
-        yy = date.strftime('%y')
-        mm = date.strftime('%m')
-        dd = date.strftime('%d')
-        hour = date.strftime('%I')
-        if hour.startswith('0'):
-            hour = hour[1:]
-        minute = date.strftime('%M')
-        ampm_caps = date.strftime('%p')
-        ampm = str(date.strftime('%p')).lower()
-
-        # Replace tokens in path
-        resolved_path = re.sub('<ProjectName>', flame.projects.current_project.name, tokenized_string)
-        resolved_path = re.sub('<ProjectNickName>', flame.projects.current_project.nickname, resolved_path)
-        resolved_path = re.sub('<UserName>', flame.users.current_user.name, resolved_path)
-        resolved_path = re.sub('<UserNickName>', flame.users.current_user.nickname, resolved_path)
-        resolved_path = re.sub('<YYYY>', yyyy, resolved_path)
-        resolved_path = re.sub('<YY>', yy, resolved_path)
-        resolved_path = re.sub('<MM>', mm, resolved_path)
-        resolved_path = re.sub('<DD>', dd, resolved_path)
-        resolved_path = re.sub('<Hour>', hour, resolved_path)
-        resolved_path = re.sub('<Minute>', minute, resolved_path)
-        resolved_path = re.sub('<AMPM>', ampm_caps, resolved_path)
-        resolved_path = re.sub('<ampm>', ampm, resolved_path)
-
-        # Get Batch Group Name - Only works when a PyBatch object is passed as the flame_pyobject argument.
-        if '<BatchGroupName>' in tokenized_string and isinstance(flame_pyobject, flame.PyBatch):
-            resolved_path = re.sub('<BatchGroupName>', str(flame_pyobject.name)[1:-1], resolved_path)
-
-        # Resolve tokens for flame pyobjects
-        if flame_pyobject:
-            if isinstance(flame_pyobject, flame.PyClip):
-
-                def resolve_clip_tokens(clip, resolved_path: str) -> str:
-                    """
-                    Resolve Clip Tokens
-                    ===================
-                    """
-
-                    clip_name = str(clip.name)[1:-1] # Get clip name
-
-                    # Get shot name from clip
-                    try:
-                        if clip.versions[0].tracks[0].segments[0].shot_name != '':
-                            shot_name = str(clip.versions[0].tracks[0].segments[0].shot_name)[1:-1]
-                        else:
-                            shot_name = pyflame.resolve_shot_name(clip_name)
-                    except:
-                        shot_name = ''
-
-                    # Get tape name from clip
-                    try:
-                        tape_name = str(clip.versions[0].tracks[0].segments[0].tape_name) # Get tape name
-                    except:
-                        tape_name = ''
-
-                    seq_name = get_seq_name(shot_name) # Get Seq Name from shot name
-
-                    # Replace clip tokens in path
-                    resolved_path = re.sub('<ShotName>', shot_name, resolved_path)
-                    resolved_path = re.sub('<SeqName>', seq_name, resolved_path)
-                    resolved_path = re.sub('<SEQNAME>', seq_name.upper(), resolved_path)
-                    resolved_path = re.sub('<ClipName>', str(clip.name)[1:-1], resolved_path)
-                    resolved_path = re.sub('<Resolution>', str(clip.width) + 'x' + str(clip.height), resolved_path)
-                    resolved_path = re.sub('<ClipHeight>', str(clip.height), resolved_path)
-                    resolved_path = re.sub('<ClipWidth>', str(clip.width), resolved_path)
-                    resolved_path = re.sub('<TapeName>', tape_name, resolved_path)
-
-                    return resolved_path
-
-                resolved_path = resolve_clip_tokens(flame_pyobject, resolved_path)
-
-            elif isinstance(flame_pyobject, flame.PySegment):
-
-                def resolve_segment_tokens(segment, resolved_path: str) -> str:
-                    """
-                    Resolve Segment Tokens
-                    ======================
-
-                    Args
-                    ----
-                        `segment` (flame.PySegment):
-                            Flame PySegment object.
-
-                        `resolved_path` (str):
-                            Resolved path with tokens.
-
-                    Returns
-                    -------
-                        `resolved_path` (str):
-                            Resolved path with tokens.
-                    """
-
-                    segment_name = str(segment.name)[1:-1]
-
-                    # Get shot name from clip
-                    try:
-                        if segment.shot_name != '':
-                            shot_name = str(segment.shot_name)[1:-1]
-                        else:
-                            shot_name = pyflame.resolve_shot_name(segment_name)
-                    except:
-                        shot_name = ''
-
-                    # Get tape name from segment
-                    try:
-                        tape_name = str(segment.tape_name)
-                    except:
-                        tape_name = ''
-
-                    seq_name = get_seq_name(shot_name) # Get Seq Name from shot name
-
-                    # Replace segment tokens in path
-                    resolved_path = re.sub('<ShotName>', shot_name, resolved_path)
-                    resolved_path = re.sub('<SeqName>', seq_name, resolved_path)
-                    resolved_path = re.sub('<SEQNAME>', seq_name.upper(), resolved_path)
-                    resolved_path = re.sub('<ClipName>', segment_name, resolved_path)
-                    resolved_path = re.sub('<Resolution>', 'Unable to Resolve', resolved_path)
-                    resolved_path = re.sub('<ClipHeight>', 'Unable to Resolve', resolved_path)
-                    resolved_path = re.sub('<ClipWidth>', 'Unable to Resolve', resolved_path)
-                    resolved_path = re.sub('<TapeName>', tape_name, resolved_path)
-
-                    return resolved_path
-
-                resolved_path = resolve_segment_tokens(flame_pyobject, resolved_path)
-
-            elif isinstance(flame_pyobject, flame.PyBatch):
-
-                def resolve_batch_tokens(batch, resolved_path: str) -> str:
-                    """
-                    Resolve Batch Tokens
-                    ====================
-
-                    Batch is checked for a ShotName tag(ShotName:<shot_name>). If found, it is used to resolve the shot name token.
-                    Otherwise, any Render nodes in the batch are checked for a shot name. If a shot name is found, it is used to resolve the shot name token.
-                    If no shot name is found, the batch name is used to resolve the shot name token.
-
-                    Args
-                    ----
-                        `batch` (flame.PyBatch):
-                            Flame PyBatch object.
-
-                        `resolved_path` (str):
-                            Resolved path with tokens.
-
-                    Returns
-                    -------
-                        `resolved_path` (str):
-                            Resolved path with tokens.
-                    """
-
-                    def get_shot_name_tag(batch) -> str:
-                        """
-                        Get Shot Name Tag
-                        """
-
-                        # Check for ShotName tag
-                        if batch.tags.get_value() != []:
-                            print('Batch Tags:', batch.tags.get_value())
-                            for tag in batch.tags.get_value():
-                                if tag.startswith('ShotName:'):
-                                    shot_name = tag.split(': ')[1]
-                                    print(f'Batch Shot Name Tag Found: {shot_name}')
-                                    return shot_name
-                        else:
-                            print('No Batch Shot Name Tags Found')
-                            return None
-
-                    def get_shot_name_from_render_nodes(batch) -> str:
-                        """
-                        Get Shot Name from Render Nodes
-                        """
-
-                        render_node_types = ['Render', 'Write File']
-                        render_nodes = [node for node in batch.nodes if node.type in render_node_types]
-
-                        if render_nodes:
-                            shot_name = str(render_nodes[0].shot_name)[1:-1]
-                            if shot_name:
-                                print(f'Render Node Shot Name Found: {shot_name}')
-                                return shot_name
-                            else:
-                                print('Render Node Shot Name Not Found')
-                                return None
-                        else:
-                            print('No Render Nodes Found')
-                            return None
-
-                    shot_name = None
-                    print('Checking for Shot Name Tag...')
-                    if batch.tags:
-                        shot_name = get_shot_name_tag(batch)
-                        print(f'Shot Name from Batch Tag: {shot_name}')
-                    else:
-                        print('No Batch Shot Name Tags Found')
+        The string is only split into tokens once and project, user, and date values are only looked up
+        once for the whole list. See `pyflame.resolve_tokens` for supported tokens.
 
-                    if not shot_name:
-                        shot_name = get_shot_name_from_render_nodes(batch)
-                        print(f'Shot Name from Render Nodes: {shot_name}')
+        Args
+        ----
+            `tokenized_string` (str):
+                String with tokens to be translated.
 
-                    if not shot_name:
-                        shot_name = pyflame.resolve_shot_name(str(batch.name)[1:-1])
-                        print(f'Shot Name from Batch Name: {shot_name}')
+            `flame_pyobjects` (list):
+                List of Flame PyClip/PySegment/PyBatch objects.
 
-                    print('\n', end='')
+            `date` (datetime, optional):
+                Date/time to use for token translation. If None is passed the current time is used for the whole list.
+                (Default: `None`)
 
-                    seq_name = get_seq_name(shot_name) # Get Seq Name from shot name
+            `shot_name_tag` (str, optional):
+                Batch group tag used to get the shot name of a PyBatch (<shot_name_tag>: <shot_name>).
+                (Default: `ShotName`)
 
-                    # Replace tokens in path
-                    resolved_path = re.sub('<ShotName>', shot_name, resolved_path)
-                    resolved_path = re.sub('<SeqName>', seq_name, resolved_path)
-                    resolved_path = re.sub('<SEQNAME>', seq_name.upper(), resolved_path)
+        Returns
+        -------
+            `resolved_strings` (list[str]):
+                Resolved strings in the same order as `flame_pyobjects`.
 
-                    print(f'Resolved Path: {resolved_path}')
+        Raises
+        ------
+            TypeError:
+                If `tokenized_string` is not a string.
+                If `flame_pyobjects` is not a list.
 
-                    return resolved_path
-                print(6)
-                resolved_path = resolve_batch_tokens(flame_pyobject, resolved_path)
+        Example
+        -------
+            To resolve export paths for all selected clips:
+            ```
+            export_paths = pyflame.resolve_tokens_bulk(
+                tokenized_string=custom_export_path,
+                flame_pyobjects=selection,
+                )
+            ```
+        """
 
-        pyflame.print(f'Resolved Tokenized String: {resolved_path}', text_color=TextColor.GREEN, new_line=False)
-        print('----------------\n')
+        # Validate Argument types
+        if not isinstance(tokenized_string, str):
+            pyflame.raise_type_error('pyflame.resolve_tokens_bulk', 'tokenized_string', 'str', tokenized_string)
+        elif not isinstance(flame_pyobjects, (list, tuple)):
+            pyflame.raise_type_error('pyflame.resolve_tokens_bulk', 'flame_pyobjects', 'list', flame_pyobjects)
 
-        return resolved_path
+        return PyFlameTokenTemplate(tokenized_string, date=date, shot_name_tag=shot_name_tag).resolve_many(flame_pyobjects)
 
     @staticmethod
     def resolve_shot_name(name: str) -> str:
@@ -3563,7 +3404,10 @@ class _PyFlame:
         Get Media Panel Folder
         ======================
 
-        Recursively find Media Panel shot folder from path. Path can be a single folder or a nested folder.
+        Find Media Panel shot folder from path. Path can be a single folder or a nested folder.
+
+        Shot folders are found with `PyFlameShotFolderIndex`. To find folders for many items, build one
+        `PyFlameShotFolderIndex` and use `PyFlameShotFolderIndex.get_folder` instead.
 
         Path should be in the following format:
             <shot_folder>/<folder_name>
@@ -3589,8 +3433,8 @@ class _PyFlame:
 
         Returns
         -------
-            dest_folder (flame.PyFolder):
-                Destination folder object.
+            dest_folder (flame.PyFolder | None):
+                Destination folder object. None if the shot folder is not found.
 
         Examples
         --------
@@ -3615,67 +3459,11 @@ class _PyFlame:
         if not isinstance(dest_folder_path, str):
             pyflame.raise_type_error('pyflame.get_media_panel_shot_folder', 'dest_folder_path', 'str', dest_folder_path)
 
-        def get_folder_from_path(folder: flame.PyFolder, media_panel_folder_path: str) -> flame.PyFolder:
-            """
-            Get Folder from Path
-            ====================
-
-            Recursively find Media Panel folder from path
-
-            Args
-            ----
-                folder (flame.PyFolder):
-                    Media Panel Folder to search through for destination folder.
-
-                media_panel_folder_path (str):
-                    Media Panel destination folder path.
-                    Example 'Shot_Folder/Plates'
-
-            Returns
-            -------
-                dest_folder (flame.PyFolder):
-                    Destination folder.
-            """
-
-
-            def find_next_folder(folder: flame.PyFolder, folder_list: list) -> flame.PyFolder:
-                """
-                Find Next Folder
-                ===============
-
-                Recursively find next folder in folder list.
-                """
-
-                for sub_folder in folder.folders:
-                    if sub_folder.name == folder_list[0]:
-                        return find_next_folder(sub_folder, folder_list[1:])
-                return folder
-
-            # Convert media_panel_folder_path to list and remove first element (root folder)
-            folder_list = media_panel_folder_path.split('/', 1)[1].split('/')
-
-            # Find destination folder
-            dest_folder = find_next_folder(shot_folder, folder_list)
-
-            return dest_folder
-
-        # Create target tag for shot folder search
-        target_tag = f'ShotName: {shot_name}'
-
-        # Search through search_location(flame.PyLibrary or flame.PyFolder) for shot folder with matching target tag
-        shot_folder = pyflame.find_by_tag(search_location.folders, target_tag)
-
-        # If dest_folder_path is a single folder, return shot_folder
-        if '/' not in dest_folder_path:
-            dest_folder = shot_folder
-        else:
-            # If dest_folder_path is a nested folder, recursively find the destination folder
-            dest_folder = get_folder_from_path(shot_folder, dest_folder_path)
-
-        return dest_folder
+        # Search through search_location(flame.PyLibrary or flame.PyFolder) for shot folder tagged with shot name
+        return PyFlameShotFolderIndex(search_location).get_folder(shot_name, dest_folder_path)
 
     @staticmethod
-    def move_to_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str, expand_dest_folder: bool=True) -> None:
+    def move_to_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str, expand_dest_folder: bool=True, shot_folder_index: 'PyFlameShotFolderIndex | None'=None) -> None:
         """
         Move to Shot Folder
         ===================
@@ -3703,6 +3491,11 @@ class _PyFlame:
                 Expands the destination folder after move is complete.
                 (Default: True)
 
+            shot_folder_index (PyFlameShotFolderIndex | None):
+                Shot folder index for search_location. Pass the same index when moving or copying many items
+                so the Media Panel is only searched once. If None, search_location is searched.
+                (Default: None)
+
         Examples
         --------
             Move to shot folder:
@@ -3727,9 +3520,14 @@ class _PyFlame:
             pyflame.raise_type_error('pyflame.move_to_shot_folder', 'dest_folder_path', 'str', dest_folder_path)
         if not isinstance(expand_dest_folder, bool):
             pyflame.raise_type_error('pyflame.move_to_shot_folder', 'expand_dest_folder', 'bool', expand_dest_folder)
+        if shot_folder_index is not None and not isinstance(shot_folder_index, PyFlameShotFolderIndex):
+            pyflame.raise_type_error('pyflame.move_to_shot_folder', 'shot_folder_index', 'PyFlameShotFolderIndex | None', shot_folder_index)
 
         # Get Destination Folder
-        dest_folder = pyflame.get_media_panel_shot_folder(shot_name, pyobject, search_location, dest_folder_path)
+        if shot_folder_index is not None:
+            dest_folder = shot_folder_index.get_folder(shot_name, dest_folder_path)
+        else:
+            dest_folder = pyflame.get_media_panel_shot_folder(shot_name, pyobject, search_location, dest_folder_path)
 
         # If Destination Folder is None, print error and return
         if dest_folder is None:
@@ -3744,7 +3542,7 @@ class _PyFlame:
             dest_folder.expanded = True
 
     @staticmethod
-    def copy_to_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str, expand_dest_folder: bool=True) -> None:
+    def copy_to_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str, expand_dest_folder: bool=True, shot_folder_index: 'PyFlameShotFolderIndex | None'=None) -> None:
         """
         Copy to Shot Folder
         ===================
@@ -3772,6 +3570,11 @@ class _PyFlame:
                 Expands the destination folder after copy is complete.
                 (Default: True)
 
+            shot_folder_index (PyFlameShotFolderIndex | None):
+                Shot folder index for search_location. Pass the same index when moving or copying many items
+                so the Media Panel is only searched once. If None, search_location is searched.
+                (Default: None)
+
         Example
         -------
             Copy to shot folder:
@@ -3796,10 +3599,15 @@ class _PyFlame:
             pyflame.raise_type_error('pyflame.copy_to_shot_folder', 'dest_folder_path', 'str', dest_folder_path)
         if not isinstance(expand_dest_folder, bool):
             pyflame.raise_type_error('pyflame.copy_to_shot_folder', 'expand_dest_folder', 'bool', expand_dest_folder)
+        if shot_folder_index is not None and not isinstance(shot_folder_index, PyFlameShotFolderIndex):
+            pyflame.raise_type_error('pyflame.copy_to_shot_folder', 'shot_folder_index', 'PyFlameShotFolderIndex | None', shot_folder_index)
 
 
         # Get Destination Folder
-        dest_folder = pyflame.get_media_panel_shot_folder(shot_name, pyobject, search_location, dest_folder_path)
+        if shot_folder_index is not None:
+            dest_folder = shot_folder_index.get_folder(shot_name, dest_folder_path)
+        else:
+            dest_folder = pyflame.get_media_panel_shot_folder(shot_name, pyobject, search_location, dest_folder_path)
 
         # If Destination Folder is None, print error and return
         if dest_folder is None:
@@ -4376,6 +4184,929 @@ class PyFlameConfig:
         with open(config_path, 'r') as f:
             return json.load(f)
 
+class PyFlameTokenTemplate:
+    """
+    PyFlame Token Template
+    ======================
+
+    Tokenized string that is split into text and tokens once and can then be resolved any number of times.
+
+    Project, user, and date token values are looked up the first time the template is resolved and are
+    reused for every resolve after that. Clip, segment, and batch group values are only looked up for
+    tokens that are in the string. Resolving a template is one dictionary lookup per token, so one
+    template can resolve paths for hundreds of clips, segments, or batch groups.
+
+    Tokens that can't be resolved are left in the string unchanged.
+
+    `pyflame.resolve_tokens` and `pyflame.resolve_tokens_bulk` use this class.
+
+    Args
+    ----
+        `tokenized_string` (str):
+            String with tokens to be resolved.
+
+        `date` (datetime, optional):
+            Date/time to use for date tokens. If None is passed, the time the template is first resolved is used.
+            (Default: `None`)
+
+        `shot_name_tag` (str, optional):
+            Batch group tag used to get the shot name of a PyBatch (<shot_name_tag>: <shot_name>).
+            (Default: `ShotName`)
+
+    Properties
+    ----------
+        `tokenized_string` (str):
+            Get the tokenized string.
+
+        `tokens` (frozenset[str]):
+            Get the tokens found in the tokenized string.
+
+    Methods
+    -------
+        `resolve(flame_pyobject=None)` -> str:
+            Resolve the template.
+
+        `resolve_many(flame_pyobjects)` -> list[str]:
+            Resolve the template for each Flame PyObject in a list.
+
+        `clear_cache()`:
+            Clear split template cache. (Class method)
+
+    Supported tokens:
+    ----------------
+        <ProjectName>, <ProjectNickName>, <UserName>, <UserNickName>, <YYYY>, <YY>, <MM>, <DD>, <Hour>, <Minute>, <AMPM>, <ampm>
+
+        Additional tokens available when Flame PyObjects are resolved:
+            PyClip and PySegment:
+                <ShotName>, <SeqName>, <SEQNAME>, <ClipName>, <Resolution>, <ClipHeight>, <ClipWidth>, <TapeName>
+            PyBatch:
+                <BatchGroupName>, <ShotName>, <SeqName>, <SEQNAME>
+
+    Examples
+    --------
+        To resolve an export path for each selected clip:
+        ```
+        export_path_template = PyFlameTokenTemplate('/jobs/<ProjectName>/<ShotName>/<YYYY>-<MM>-<DD>')
+
+        for clip in selection:
+            export_path = export_path_template.resolve(clip)
+        ```
+
+        To resolve all paths in one call:
+        ```
+        export_paths = export_path_template.resolve_many(selection)
+        ```
+    """
+
+    PROJECT_TOKENS = frozenset({'<ProjectName>', '<ProjectNickName>'})
+    USER_TOKENS = frozenset({'<UserName>', '<UserNickName>'})
+    DATE_TOKENS = frozenset({'<YYYY>', '<YY>', '<MM>', '<DD>', '<Hour>', '<Minute>', '<AMPM>', '<ampm>'})
+    SHOT_TOKENS = frozenset({'<ShotName>', '<SeqName>', '<SEQNAME>'})
+    CLIP_TOKENS = SHOT_TOKENS | frozenset({'<ClipName>', '<Resolution>', '<ClipHeight>', '<ClipWidth>', '<TapeName>'})
+    BATCH_TOKENS = SHOT_TOKENS | frozenset({'<BatchGroupName>'})
+
+    # Split templates by tokenized string. Shared by all templates.
+    _parts_cache: dict[str, tuple[str, ...]] = {}
+
+    def __init__(self: 'PyFlameTokenTemplate',
+                 tokenized_string: str,
+                 date=None,
+                 shot_name_tag: str='ShotName',
+                 ) -> None:
+
+        # Validate Arguments
+        if not isinstance(tokenized_string, str):
+            pyflame.raise_type_error('PyFlameTokenTemplate', 'tokenized_string', 'str', tokenized_string)
+        elif date is not None and not isinstance(date, datetime.datetime):
+            pyflame.raise_type_error('PyFlameTokenTemplate', 'date', 'datetime | None', date)
+        elif not isinstance(shot_name_tag, str):
+            pyflame.raise_type_error('PyFlameTokenTemplate', 'shot_name_tag', 'str', shot_name_tag)
+
+        self._tokenized_string = tokenized_string
+        self._date = date
+        self._shot_name_tag = shot_name_tag
+
+        # Text is at even indexes, tokens are at odd indexes
+        self._parts = self._split(tokenized_string)
+        self._tokens = frozenset(self._parts[1::2])
+
+        self._global_values = None
+
+    #-------------------------------------
+    # [Properties]
+    #-------------------------------------
+
+    @property
+    def tokenized_string(self) -> str:
+        """
+        Tokenized String
+        ================
+
+        Get the tokenized string.
+        """
+
+        return self._tokenized_string
+
+    @property
+    def tokens(self) -> frozenset:
+        """
+        Tokens
+        ======
+
+        Get the tokens found in the tokenized string.
+        """
+
+        return self._tokens
+
+    #-------------------------------------
+    # [Methods]
+    #-------------------------------------
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Clear Cache
+        ===========
+
+        Clear split template cache.
+        """
+
+        cls._parts_cache.clear()
+
+    def resolve(self, flame_pyobject=None) -> str:
+        """
+        Resolve
+        =======
+
+        Resolve the template.
+
+        Args
+        ----
+            `flame_pyobject` (flame.PyClip | flame.PySegment | flame.PyBatch, optional):
+                Flame PyObject used to resolve clip, segment, or batch group tokens.
+                (Default: `None`)
+
+        Returns
+        -------
+            `resolved_string` (str):
+                String with resolved tokens.
+        """
+
+        if not self._tokens:
+            return self._tokenized_string
+
+        values = self._get_global_values()
+        if flame_pyobject is not None:
+            values = {**values, **self._get_pyobject_values(flame_pyobject)}
+
+        parts = list(self._parts)
+        for index in range(1, len(parts), 2):
+            parts[index] = values.get(parts[index], parts[index])
+
+        return ''.join(parts)
+
+    def resolve_many(self, flame_pyobjects: list) -> list[str]:
+        """
+        Resolve Many
+        ============
+
+        Resolve the template for each Flame PyObject in a list.
+
+        Args
+        ----
+            `flame_pyobjects` (list):
+                List of Flame PyClip/PySegment/PyBatch objects.
+
+        Returns
+        -------
+            `resolved_strings` (list[str]):
+                Resolved strings in the same order as `flame_pyobjects`.
+
+        Raises
+        ------
+            TypeError:
+                If `flame_pyobjects` is not a list or tuple.
+        """
+
+        if not isinstance(flame_pyobjects, (list, tuple)):
+            pyflame.raise_type_error('PyFlameTokenTemplate.resolve_many', 'flame_pyobjects', 'list', flame_pyobjects)
+
+        return [self.resolve(flame_pyobject) for flame_pyobject in flame_pyobjects]
+
+    #-------------------------------------
+    # [Internal Methods]
+    #-------------------------------------
+
+    @classmethod
+    def _split(cls, tokenized_string: str) -> tuple[str, ...]:
+        """
+        Split
+        =====
+
+        Split string into text and tokens. Results are cached by string.
+        """
+
+        parts = cls._parts_cache.get(tokenized_string)
+        if parts is None:
+            parts = tuple(re.split(r'(<[^<>]+>)', tokenized_string))
+            cls._parts_cache[tokenized_string] = parts
+
+        return parts
+
+    def _get_global_values(self) -> dict[str, str]:
+        """
+        Get Global Values
+        =================
+
+        Get project, user, and date token values. Values are only looked up once per template.
+        """
+
+        if self._global_values is not None:
+            return self._global_values
+
+        values = {}
+
+        if self._tokens & self.PROJECT_TOKENS:
+            project = flame.projects.current_project
+            values['<ProjectName>'] = project.name
+            values['<ProjectNickName>'] = project.nickname
+
+        if self._tokens & self.USER_TOKENS:
+            user = flame.users.current_user
+            values['<UserName>'] = user.name
+            values['<UserNickName>'] = user.nickname
+
+        if self._tokens & self.DATE_TOKENS:
+            date = self._date or datetime.datetime.now()
+            values['<YYYY>'] = date.strftime('%Y')
+            values['<YY>'] = date.strftime('%y')
+            values['<MM>'] = date.strftime('%m')
+            values['<DD>'] = date.strftime('%d')
+            values['<Hour>'] = date.strftime('%I').lstrip('0')
+            values['<Minute>'] = date.strftime('%M')
+            values['<AMPM>'] = date.strftime('%p')
+            values['<ampm>'] = date.strftime('%p').lower()
+
+        self._global_values = values
+
+        return values
+
+    def _get_pyobject_values(self, flame_pyobject) -> dict[str, str]:
+        """
+        Get PyObject Values
+        ===================
+
+        Get clip, segment, or batch group token values for tokens in the template.
+        """
+
+        if isinstance(flame_pyobject, flame.PyClip):
+            if not self._tokens & self.CLIP_TOKENS:
+                return {}
+
+            try:
+                segment = flame_pyobject.versions[0].tracks[0].segments[0]
+            except:
+                segment = None
+
+            values = self._get_shot_values(segment, str(flame_pyobject.name)[1:-1])
+            values['<ClipName>'] = str(flame_pyobject.name)[1:-1]
+            values['<Resolution>'] = f'{flame_pyobject.width}x{flame_pyobject.height}'
+            values['<ClipHeight>'] = str(flame_pyobject.height)
+            values['<ClipWidth>'] = str(flame_pyobject.width)
+
+        elif isinstance(flame_pyobject, flame.PySegment):
+            if not self._tokens & self.CLIP_TOKENS:
+                return {}
+
+            values = self._get_shot_values(flame_pyobject, str(flame_pyobject.name)[1:-1])
+            values['<ClipName>'] = str(flame_pyobject.name)[1:-1]
+            values['<Resolution>'] = 'Unable to Resolve'
+            values['<ClipHeight>'] = 'Unable to Resolve'
+            values['<ClipWidth>'] = 'Unable to Resolve'
+
+        elif isinstance(flame_pyobject, flame.PyBatch):
+            if not self._tokens & self.BATCH_TOKENS:
+                return {}
+
+            values = {'<BatchGroupName>': str(flame_pyobject.name)[1:-1]}
+            if self._tokens & self.SHOT_TOKENS:
+                values.update(self._get_seq_values(self._get_batch_shot_name(flame_pyobject)))
+
+        else:
+            values = {}
+
+        return values
+
+    def _get_shot_values(self, segment, name: str) -> dict[str, str]:
+        """
+        Get Shot Values
+        ===============
+
+        Get shot, sequence, and tape name token values from a segment. If the segment has no
+        shot name, the shot name is resolved from `name`.
+        """
+
+        values = {}
+
+        if self._tokens & self.SHOT_TOKENS:
+            try:
+                if segment.shot_name != '':
+                    shot_name = str(segment.shot_name)[1:-1]
+                else:
+                    shot_name = pyflame.resolve_shot_name(name)
+            except:
+                shot_name = ''
+            values.update(self._get_seq_values(shot_name))
+
+        if '<TapeName>' in self._tokens:
+            try:
+                values['<TapeName>'] = str(segment.tape_name)
+            except:
+                values['<TapeName>'] = ''
+
+        return values
+
+    @staticmethod
+    def _get_seq_values(shot_name: str) -> dict[str, str]:
+        """
+        Get Seq Values
+        ==============
+
+        Get shot name and sequence name token values. Sequence name is the leading letters of the shot name.
+        """
+
+        seq_name = re.split('[^a-zA-Z]', shot_name)[0]
+
+        return {
+            '<ShotName>': shot_name,
+            '<SeqName>': seq_name,
+            '<SEQNAME>': seq_name.upper(),
+            }
+
+    def _get_batch_shot_name(self, batch) -> str:
+        """
+        Get Batch Shot Name
+        ===================
+
+        Batch is checked for a ShotName tag(ShotName: <shot_name>). If not found, the first Render or
+        Write File node is checked for a shot name. If no shot name is found, the shot name is resolved
+        from the batch group name.
+        """
+
+        # Check for ShotName tag
+        for tag in batch.tags.get_value():
+            if tag.startswith(f'{self._shot_name_tag}:'):
+                return tag.split(':', 1)[1].strip()
+
+        # Check first render node for shot name
+        for node in batch.nodes:
+            if node.type in ('Render', 'Write File'):
+                shot_name = str(node.shot_name)[1:-1]
+                if shot_name:
+                    return shot_name
+                break
+
+        return pyflame.resolve_shot_name(str(batch.name)[1:-1])
+
+class PyFlameShotFolderIndex:
+    """
+    PyFlame Shot Folder Index
+    =========================
+
+    Index of the Media Panel shot folders in a Library or Folder.
+
+    Shot folders are found by their shot name tag (ShotName: <shot_name>) with one pass over the
+    folders in the search location when the index is created. Destination folder paths inside a
+    shot folder are found the first time they are asked for and are then cached. Folders created
+    after the index is built can be added with `add_shot_folder`.
+
+    Build one index per operation and pass it to `pyflame.move_to_shot_folder` or
+    `pyflame.copy_to_shot_folder` when moving or copying many items so the Media Panel is not
+    searched again for every item.
+
+    Args
+    ----
+        `search_location` (flame.PyLibrary | flame.PyFolder):
+            Media Panel Library or Folder containing the shot folders.
+
+        `shot_name_tag` (str, optional):
+            Tag type used to tag shot folders (<shot_name_tag>: <shot_name>).
+            (Default: `ShotName`)
+
+    Properties
+    ----------
+        `search_location` (flame.PyLibrary | flame.PyFolder):
+            Get the Library or Folder containing the shot folders.
+
+        `shot_names` (list[str]):
+            Get the shot names in the index.
+
+    Methods
+    -------
+        `get_shot_folder(shot_name)` -> flame.PyFolder | None:
+            Get the shot folder for a shot name.
+
+        `get_folder(shot_name, dest_folder_path)` -> flame.PyFolder | None:
+            Get a folder inside a shot folder from a path.
+
+        `add_shot_folder(folder)`:
+            Add a tagged shot folder to the index.
+
+        `refresh()`:
+            Rebuild the index from the search location.
+
+    Examples
+    --------
+        To copy clips to their shot folders:
+        ```
+        shot_folder_index = PyFlameShotFolderIndex(shot_library)
+
+        for clip in selection:
+            pyflame.copy_to_shot_folder(
+                shot_name=str(clip.shot_name)[1:-1],
+                pyobject=clip,
+                search_location=shot_library,
+                dest_folder_path='Shot_Folder/Plates',
+                shot_folder_index=shot_folder_index,
+                )
+        ```
+    """
+
+    def __init__(self: 'PyFlameShotFolderIndex',
+                 search_location: flame.PyLibrary | flame.PyFolder,
+                 shot_name_tag: str='ShotName',
+                 ) -> None:
+
+        # Validate Arguments
+        if not isinstance(search_location, (flame.PyLibrary, flame.PyFolder)):
+            pyflame.raise_type_error('PyFlameShotFolderIndex', 'search_location', 'flame.PyLibrary | flame.PyFolder', search_location)
+        elif not isinstance(shot_name_tag, str):
+            pyflame.raise_type_error('PyFlameShotFolderIndex', 'shot_name_tag', 'str', shot_name_tag)
+
+        self._search_location = search_location
+        self._tag_prefix = f'{shot_name_tag}: '
+
+        self.refresh()
+
+    #-------------------------------------
+    # [Properties]
+    #-------------------------------------
+
+    @property
+    def search_location(self) -> flame.PyLibrary | flame.PyFolder:
+        """
+        Search Location
+        ===============
+
+        Get the Library or Folder containing the shot folders.
+        """
+
+        return self._search_location
+
+    @property
+    def shot_names(self) -> list[str]:
+        """
+        Shot Names
+        ==========
+
+        Get the shot names in the index.
+        """
+
+        return list(self._shot_folders)
+
+    #-------------------------------------
+    # [Methods]
+    #-------------------------------------
+
+    def refresh(self) -> None:
+        """
+        Refresh
+        =======
+
+        Rebuild the index from the search location.
+        """
+
+        self._shot_folders = {}
+        self._folders = {}
+
+        for folder in self._search_location.folders:
+            self.add_shot_folder(folder)
+
+    def add_shot_folder(self, folder: flame.PyFolder) -> None:
+        """
+        Add Shot Folder
+        ===============
+
+        Add a shot folder to the index. Folders without a shot name tag are ignored.
+        If a shot name is already in the index the first folder found is kept.
+
+        Args
+        ----
+            `folder` (flame.PyFolder):
+                Shot folder to add.
+        """
+
+        for tag in folder.tags.get_value():
+            if tag.startswith(self._tag_prefix):
+                self._shot_folders.setdefault(tag[len(self._tag_prefix):], folder)
+                return
+
+    def get_shot_folder(self, shot_name: str) -> flame.PyFolder | None:
+        """
+        Get Shot Folder
+        ===============
+
+        Get the shot folder for a shot name.
+
+        Args
+        ----
+            `shot_name` (str):
+                Name of shot.
+
+        Returns
+        -------
+            `shot_folder` (flame.PyFolder | None):
+                Shot folder, or None if no folder is tagged with the shot name.
+        """
+
+        return self._shot_folders.get(shot_name)
+
+    def get_folder(self, shot_name: str, dest_folder_path: str) -> flame.PyFolder | None:
+        """
+        Get Folder
+        ==========
+
+        Get a folder inside a shot folder from a path. The first folder in the path is the shot folder.
+        If a folder in the path doesn't exist, the last folder found is returned.
+
+        Path should be in the following format:
+            <shot_folder>
+            <shot_folder>/<folder_name>
+            <shot_folder>/<folder_name>/<folder_name>
+            ...
+
+        Args
+        ----
+            `shot_name` (str):
+                Name of shot.
+
+            `dest_folder_path` (str):
+                Destination folder path in Shot Folder.
+                Example 'Shot_Folder/Plates'
+
+        Returns
+        -------
+            `dest_folder` (flame.PyFolder | None):
+                Destination folder, or None if the shot folder is not found.
+        """
+
+        dest_folder = self._folders.get((shot_name, dest_folder_path))
+        if dest_folder is not None:
+            return dest_folder
+
+        dest_folder = self.get_shot_folder(shot_name)
+        if dest_folder is None:
+            return None
+
+        for folder_name in dest_folder_path.split('/')[1:]:
+            sub_folder = next((sub_folder for sub_folder in dest_folder.folders if sub_folder.name == folder_name), None)
+            if sub_folder is None:
+                break
+            dest_folder = sub_folder
+
+        self._folders[(shot_name, dest_folder_path)] = dest_folder
+
+        return dest_folder
+
+class PyFlameFolderPlan:
+    """
+    PyFlame Folder Plan
+    ===================
+
+    Plan of file system folders to create from a folder structure.
+
+    The top level folder in the folder structure stands for each folder added to the plan (for example
+    `Shot_Folder`), its sub-folders are created inside each added folder. This matches how
+    `pyflame.create_file_system_folder` has always used the folder structure.
+
+    Tokens in the folder structure are resolved once when the plan is created. Each folder added to
+    the plan is expanded into the full list of folder paths using the resolved folder structure.
+    Paths are only added to the plan once, so folder names that resolve to the same path are only
+    created once.
+
+    Folders are created one folder depth at a time, parent folders before sub-folders, with a bounded
+    pool of threads so many folders can be created at once on network storage. Each folder is created
+    with a single `os.mkdir` call and folders that already exist are counted, not created again.
+
+    `pyflame.create_file_system_folders` and `pyflame.create_file_system_folder` use this class.
+
+    Args
+    ----
+        `folder_structure` (dict):
+            Dictionary representing the folder structure to create. Sub-folders of the top level folder
+            are created in each folder added to the plan.
+
+        `dest_path` (str):
+            Path where folders will be created.
+
+    Properties
+    ----------
+        `dest_path` (str):
+            Get the path where folders will be created.
+
+        `paths` (list[str]):
+            Get all folder paths in the plan, parent folders before sub-folders.
+
+        `created_count` (int):
+            Get the number of folders created by `create`.
+
+        `existing_count` (int):
+            Get the number of folders that already existed when `create` was run.
+
+        `failed_paths` (list[str]):
+            Get the folder paths that could not be created by `create`.
+
+    Methods
+    -------
+        `add_folder(folder_name)` -> list[str]:
+            Add a folder and its folder structure to the plan.
+
+        `add_folders(folder_list)`:
+            Add a list of folders and their folder structures to the plan.
+
+        `create(max_workers=8)`:
+            Create all folders in the plan.
+
+    Examples
+    --------
+        To create shot folders:
+        ```
+        folder_plan = PyFlameFolderPlan(
+            folder_structure=folder_structure,
+            dest_path='/path/to/dest/folder',
+            )
+        folder_plan.add_folders(['PYT_0010', 'PYT_0020', 'PYT_0030'])
+        folder_plan.create()
+
+        print(folder_plan.created_count, folder_plan.existing_count)
+        ```
+    """
+
+    def __init__(self: 'PyFlameFolderPlan',
+                 folder_structure: dict[str, Any],
+                 dest_path: str,
+                 ) -> None:
+
+        # Validate Arguments
+        if not isinstance(folder_structure, dict):
+            pyflame.raise_type_error('PyFlameFolderPlan', 'folder_structure', 'dict', folder_structure)
+        elif not isinstance(dest_path, str):
+            pyflame.raise_type_error('PyFlameFolderPlan', 'dest_path', 'str', dest_path)
+
+        self._dest_path = dest_path
+
+        # Resolve folder structure once, relative to each folder added to the plan
+        self._relative_paths = []
+        for sub_folders in folder_structure.values():
+            if isinstance(sub_folders, dict):
+                self._resolve_folder_structure(sub_folders, '')
+
+        self._paths = {}
+        self._created_count = 0
+        self._existing_count = 0
+        self._failed_paths = []
+
+    #-------------------------------------
+    # [Properties]
+    #-------------------------------------
+
+    @property
+    def dest_path(self) -> str:
+        """
+        Dest Path
+        =========
+
+        Get the path where folders will be created.
+        """
+
+        return self._dest_path
+
+    @property
+    def paths(self) -> list[str]:
+        """
+        Paths
+        =====
+
+        Get all folder paths in the plan, parent folders before sub-folders.
+        """
+
+        return sorted(self._paths, key=lambda path: (self._paths[path], path))
+
+    @property
+    def created_count(self) -> int:
+        """
+        Created Count
+        =============
+
+        Get the number of folders created by `create`.
+        """
+
+        return self._created_count
+
+    @property
+    def existing_count(self) -> int:
+        """
+        Existing Count
+        ==============
+
+        Get the number of folders that already existed when `create` was run.
+        """
+
+        return self._existing_count
+
+    @property
+    def failed_paths(self) -> list[str]:
+        """
+        Failed Paths
+        ============
+
+        Get the folder paths that could not be created by `create`.
+        """
+
+        return list(self._failed_paths)
+
+    #-------------------------------------
+    # [Methods]
+    #-------------------------------------
+
+    def add_folder(self, folder_name: str) -> list[str]:
+        """
+        Add Folder
+        ==========
+
+        Add a folder and its folder structure to the plan. Tokens can be used in the folder name.
+
+        Args
+        ----
+            `folder_name` (str):
+                Name of the main folder to create.
+
+        Returns
+        -------
+            `folder_paths` (list[str]):
+                Paths of the main folder and all of its sub-folders.
+
+        Raises
+        ------
+            TypeError:
+                If `folder_name` is not a string.
+        """
+
+        if not isinstance(folder_name, str):
+            pyflame.raise_type_error('PyFlameFolderPlan.add_folder', 'folder_name', 'str', folder_name)
+
+        folder_path = os.path.normpath(os.path.join(self._dest_path, PyFlameTokenTemplate(folder_name).resolve()))
+
+        folder_paths = [folder_path] + [os.path.normpath(os.path.join(folder_path, relative_path)) for relative_path in self._relative_paths]
+        for path in folder_paths:
+            self._paths.setdefault(path, path.count(os.sep))
+
+        return folder_paths
+
+    def add_folders(self, folder_list: list[str]) -> None:
+        """
+        Add Folders
+        ===========
+
+        Add a list of folders and their folder structures to the plan.
+
+        Args
+        ----
+            `folder_list` (list[str]):
+                List of folder names to create.
+
+        Raises
+        ------
+            TypeError:
+                If `folder_list` is not a list.
+        """
+
+        if not isinstance(folder_list, list):
+            pyflame.raise_type_error('PyFlameFolderPlan.add_folders', 'folder_list', 'list', folder_list)
+
+        for folder_name in folder_list:
+            self.add_folder(folder_name)
+
+    def create(self, max_workers: int=8) -> None:
+        """
+        Create
+        ======
+
+        Create all folders in the plan. Folders are created one folder depth at a time using up to
+        `max_workers` threads. Folders that fail to be created are added to `failed_paths` and their
+        sub-folders are skipped.
+
+        Args
+        ----
+            `max_workers` (int, optional):
+                Maximum number of folders to create at the same time.
+                (Default: `8`)
+
+        Raises
+        ------
+            TypeError:
+                If `max_workers` is not an integer.
+            ValueError:
+                If `max_workers` is less than 1.
+        """
+
+        if not isinstance(max_workers, int):
+            pyflame.raise_type_error('PyFlameFolderPlan.create', 'max_workers', 'int', max_workers)
+        if max_workers < 1:
+            pyflame.raise_value_error('PyFlameFolderPlan.create', 'max_workers', 'int greater than 0', max_workers)
+
+        self._created_count = 0
+        self._existing_count = 0
+        self._failed_paths = []
+
+        # Group paths by folder depth
+        depths = {}
+        for path, depth in self._paths.items():
+            depths.setdefault(depth, []).append(path)
+
+        try:
+            os.makedirs(self._dest_path, exist_ok=True)
+        except OSError as e:
+            print(f'Error creating directory {self._dest_path}: {e}')
+            self._failed_paths = self.paths
+            return
+
+        failed_parents = set()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for depth in sorted(depths):
+                paths = [path for path in sorted(depths[depth]) if os.path.dirname(path) not in failed_parents]
+                for path, result in zip(paths, executor.map(self._create_path, paths)):
+                    if result is True:
+                        self._created_count += 1
+                    elif result is False:
+                        self._existing_count += 1
+                    else:
+                        print(f'Error creating directory {path}: {result}')
+                        self._failed_paths.append(path)
+                        failed_parents.add(path)
+
+                # Skip sub-folders of folders that failed
+                for path in depths[depth]:
+                    if os.path.dirname(path) in failed_parents:
+                        failed_parents.add(path)
+
+    #-------------------------------------
+    # [Internal Methods]
+    #-------------------------------------
+
+    def _resolve_folder_structure(self, folder_structure: dict[str, Any], parent_path: str) -> None:
+        """
+        Resolve Folder Structure
+        ========================
+
+        Resolve tokens in folder structure folder names and add the relative path of each folder.
+        Parent folders are added before their sub-folders.
+        """
+
+        for folder_name, sub_folders in folder_structure.items():
+            relative_path = os.path.join(parent_path, PyFlameTokenTemplate(folder_name).resolve())
+            self._relative_paths.append(relative_path)
+            if isinstance(sub_folders, dict):
+                self._resolve_folder_structure(sub_folders, relative_path)
+
+    @staticmethod
+    def _create_path(path: str) -> bool | OSError:
+        """
+        Create Path
+        ===========
+
+        Create a single folder. Returns True if the folder was created, False if it already exists,
+        or the error if it could not be created.
+        """
+
+        try:
+            os.mkdir(path)
+            return True
+        except FileNotFoundError:
+            # Parent folder is not in the plan (folder name with a path separator)
+            try:
+                os.makedirs(path)
+                return True
+            except OSError as e:
+                return e
+        except FileExistsError:
+            if os.path.isdir(path):
+                return False
+            return FileExistsError(f'File exists and is not a folder: {path}')
+        except OSError as e:
+            return e
+
 # ==============================================================================
 # [PyFlame QT Widgets]
 # ==============================================================================
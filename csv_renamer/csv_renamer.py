@@ -19,11 +19,11 @@
 
 """
 Script Name: CSV Renamer
-Script Version: 1.0.0
+Script Version: 1.0.1
 Flame Version: 2025.1
 Written by: Michael Vaglienty
 Creation Date: 05.04.26
-Update Date: 05.25.26
+Update Date: 10.19.26
 
 License: GNU General Public License v3.0 (GPL-3.0) - see LICENSE file for details
 
@@ -56,6 +56,10 @@ To install:
 
 Updates:
 
+    v1.0.1 10.19.26
+        - Updated to PyFlameLib v5.3.3.
+        - Large CSV files now load in chunks without locking the UI.
+
     v1.0.0 05.04.26
         - Initial release.
 """
@@ -73,7 +77,7 @@ from lib.pyflame_lib_csv_renamer import *
 # ==============================================================================
 
 SCRIPT_NAME = 'CSV Renamer'
-SCRIPT_VERSION = 'v1.0.0'
+SCRIPT_VERSION = 'v1.0.1'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
 # ==============================================================================
@@ -217,7 +221,7 @@ class CSVRenamer:
             selected_indexes = self.csv_table.selectionModel().selectedIndexes()
             if not selected_indexes:
                 return
-            new_name = self.csv_table.model.itemFromIndex(selected_indexes[0]).text()
+            new_name = selected_indexes[0].data()
             old_label = self.selected_clips_menu.text
 
             obj.name = new_name
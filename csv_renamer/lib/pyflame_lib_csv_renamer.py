@@ -19,10 +19,10 @@
 
 """
 PyFlame Library
-Version: 5.3.2
+Version: 5.3.3
 Written By: Michael Vaglienty
 Creation Date: 10.31.20
-Update Date: 05.25.26
+Update Date: 10.19.26
 
 Minimum Flame 2025.1
 
@@ -83,6 +83,7 @@ import shutil
 import subprocess
 import traceback
 import importlib.util
+import itertools
 from shiboken6 import isValid
 import xml.etree.ElementTree as ET
 from enum import Enum
@@ -4503,6 +4504,613 @@ class PyFlameConfig:
 
         return data
 
+class PyFlameCSVData:
+    """
+    PyFlameCSVData
+    ==============
+
+    Column-oriented in-memory store for CSV files.
+
+    Each column is held as its own list of strings, so whole-column lookups
+    (headers, token columns, ratio columns...) do not need to walk every row.
+    Files are read in chunks and parsed once: `PyFlameCSVData.load()` caches
+    the result by file path and only re-reads the file when its modification
+    time or size changes. This lets a script validate a CSV, build its own data
+    from it and show it in a `PyFlameTable` while only parsing the file once.
+
+    Rows shorter than the header row are padded with empty strings. Rows longer
+    than the header row add new, unnamed columns.
+
+    Args
+    ----
+        `headers` (List[str] | None, optional):
+            Column header labels.
+            (Default: `None`)
+
+        `rows` (List[List[str]] | None, optional):
+            Row data to fill the store with.
+            (Default: `None`)
+
+    Properties
+    ----------
+        `headers` (List[str]):
+            Get a copy of the column header labels.
+
+        `row_count` (int):
+            Get the number of data rows (header row not included).
+
+        `column_count` (int):
+            Get the number of columns.
+
+        `csv_file_path` (str | None):
+            Get the path of the file the data was loaded from.
+
+    Methods
+    -------
+        `load(csv_file_path: str, chunk_size: int=5000, use_cache: bool=True) -> PyFlameCSVData`:
+            Load a CSV file. Class method.
+
+        `clear_cache(csv_file_path: str | None=None) -> None`:
+            Clear cached CSV data. Class method.
+
+        `cell(row: int, column: int) -> str`:
+            Get the value of a cell.
+
+        `set_cell(row: int, column: int, value: str) -> None`:
+            Set the value of a cell.
+
+        `column(column: int | str) -> List[str]`:
+            Get a copy of a column by index or header label.
+
+        `row(row: int) -> List[str]`:
+            Get a row as a list of values.
+
+        `rows(start: int=0, stop: int | None=None)`:
+            Iterate over rows as lists of values.
+
+        `row_dicts()`:
+            Iterate over rows as dictionaries keyed by header label.
+
+        `insert_rows(row: int, count: int=1) -> None`:
+            Insert empty rows.
+
+        `remove_rows(row: int, count: int=1) -> None`:
+            Remove rows.
+
+        `insert_columns(column: int, count: int=1, header: str='') -> None`:
+            Insert empty columns.
+
+        `remove_columns(column: int, count: int=1) -> None`:
+            Remove columns.
+
+        `set_header(column: int, text: str) -> None`:
+            Set a column header label.
+
+        `save(csv_file_path: str) -> None`:
+            Write the data to a CSV file.
+
+    Examples
+    --------
+        ```
+        # Load CSV file
+        csv_data = PyFlameCSVData.load('path/to/csv/file.csv')
+
+        # Get column by header label
+        shot_names = csv_data.column('SHOT')
+
+        # Iterate over rows as dictionaries
+        for row_dict in csv_data.row_dicts():
+            print(row_dict['SHOT'])
+        ```
+    """
+
+    _cache: Dict[str, Tuple[Tuple[int, int], 'PyFlameCSVData']] = {}
+
+    def __init__(self, headers: List[str] | None=None, rows: List[List[str]] | None=None) -> None:
+
+        # Validate Argument types
+        if headers is not None and not isinstance(headers, list):
+            pyflame.raise_type_error('PyFlameCSVData', 'headers', 'None | list[str]', headers)
+        if rows is not None and not isinstance(rows, list):
+            pyflame.raise_type_error('PyFlameCSVData', 'rows', 'None | list[list[str]]', rows)
+
+        self._headers: List[str] = [str(header) for header in headers] if headers else []
+        self._columns: List[List[str]] = [[] for _ in self._headers]
+        self._row_count = 0
+        self._csv_file_path: str | None = None
+
+        if rows:
+            self._append_rows(rows)
+
+    #-------------------------------------
+    # [Properties]
+    #-------------------------------------
+
+    @property
+    def headers(self) -> List[str]:
+        """
+        Headers
+        =======
+
+        Get a copy of the column header labels.
+        """
+
+        return list(self._headers)
+
+    @property
+    def row_count(self) -> int:
+        """
+        Row Count
+        =========
+
+        Get the number of data rows. The header row is not included.
+        """
+
+        return self._row_count
+
+    @property
+    def column_count(self) -> int:
+        """
+        Column Count
+        ============
+
+        Get the number of columns.
+        """
+
+        return len(self._columns)
+
+    @property
+    def csv_file_path(self) -> str | None:
+        """
+        CSV File Path
+        =============
+
+        Get the path of the file the data was loaded from, or `None` if the data was not loaded from a file.
+        """
+
+        return self._csv_file_path
+
+    #-------------------------------------
+    # [Class Methods]
+    #-------------------------------------
+
+    @classmethod
+    def load(cls, csv_file_path: str, chunk_size: int=5000, use_cache: bool=True) -> 'PyFlameCSVData':
+        """
+        Load
+        ====
+
+        Load a CSV file. The file is read in chunks of `chunk_size` rows and each chunk
+        is added to the column lists in one pass.
+
+        The result is cached by file path. Loading the same unchanged file again returns
+        the cached data without re-reading the file.
+
+        Args
+        ----
+            `csv_file_path` (str):
+                Path to the CSV file.
+
+            `chunk_size` (int, optional):
+                Number of rows to read per chunk.
+                (Default: `5000`)
+
+            `use_cache` (bool, optional):
+                Return cached data if the file has not changed since it was last loaded.
+                (Default: `True`)
+
+        Returns
+        -------
+            PyFlameCSVData:
+                The loaded CSV data.
+
+        Raises
+        ------
+            TypeError:
+                If `csv_file_path` is not a string.
+                If `chunk_size` is not an integer.
+                If `use_cache` is not a boolean.
+            ValueError:
+                If `chunk_size` is less than 1.
+
+        Example
+        -------
+            ```
+            csv_data = PyFlameCSVData.load('path/to/csv/file.csv')
+            ```
+        """
+
+        # Validate Argument types
+        if not isinstance(csv_file_path, str):
+            pyflame.raise_type_error('PyFlameCSVData.load', 'csv_file_path', 'str', csv_file_path)
+        if not isinstance(chunk_size, int):
+            pyflame.raise_type_error('PyFlameCSVData.load', 'chunk_size', 'int', chunk_size)
+        if not isinstance(use_cache, bool):
+            pyflame.raise_type_error('PyFlameCSVData.load', 'use_cache', 'bool', use_cache)
+
+        # Validate Argument values
+        if chunk_size < 1:
+            pyflame.raise_value_error('PyFlameCSVData.load', 'chunk_size', 'int greater than 0', chunk_size)
+
+        csv_file_path = os.path.abspath(csv_file_path)
+        file_stat = os.stat(csv_file_path)
+        file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        # Return cached data if file has not changed
+        if use_cache:
+            cached = cls._cache.get(csv_file_path)
+            if cached and cached[0] == file_key:
+                return cached[1]
+
+        csv_data = cls()
+        csv_data._csv_file_path = csv_file_path
+
+        with open(csv_file_path, 'r', newline='', encoding='utf-8', errors='replace') as file:
+            reader = csv.reader(file)
+            csv_data._headers = next(reader, [])
+            csv_data._columns = [[] for _ in csv_data._headers]
+
+            # Read rows in chunks
+            while True:
+                chunk = list(itertools.islice(reader, chunk_size))
+                if not chunk:
+                    break
+                csv_data._append_rows(chunk)
+
+        cls._cache[csv_file_path] = (file_key, csv_data)
+
+        return csv_data
+
+    @classmethod
+    def clear_cache(cls, csv_file_path: str | None=None) -> None:
+        """
+        Clear Cache
+        ===========
+
+        Clear cached CSV data.
+
+        Args
+        ----
+            `csv_file_path` (str | None, optional):
+                Path of the file to remove from the cache. If `None`, the whole cache is cleared.
+                (Default: `None`)
+        """
+
+        if csv_file_path is None:
+            cls._cache.clear()
+        else:
+            cls._cache.pop(os.path.abspath(csv_file_path), None)
+
+    #-------------------------------------
+    # [Methods]
+    #-------------------------------------
+
+    def cell(self, row: int, column: int) -> str:
+        """
+        Cell
+        ====
+
+        Get the value of a cell.
+
+        Args
+        ----
+            `row` (int):
+                Row index.
+
+            `column` (int):
+                Column index.
+
+        Returns
+        -------
+            str:
+                The cell value.
+        """
+
+        return self._columns[column][row]
+
+    def set_cell(self, row: int, column: int, value: str) -> None:
+        """
+        Set Cell
+        ========
+
+        Set the value of a cell.
+
+        Args
+        ----
+            `row` (int):
+                Row index.
+
+            `column` (int):
+                Column index.
+
+            `value` (str):
+                New cell value.
+        """
+
+        self._detach()
+        self._columns[column][row] = str(value)
+
+    def column(self, column: int | str) -> List[str]:
+        """
+        Column
+        ======
+
+        Get a copy of a column by index or header label.
+
+        Args
+        ----
+            `column` (int | str):
+                Column index or header label.
+
+        Returns
+        -------
+            List[str]:
+                The column values.
+
+        Raises
+        ------
+            TypeError:
+                If `column` is not an integer or string.
+            ValueError:
+                If `column` is a header label that does not exist.
+        """
+
+        if isinstance(column, str):
+            if column not in self._headers:
+                pyflame.raise_value_error('PyFlameCSVData.column', 'column', f'one of {self._headers}', column)
+            column = self._headers.index(column)
+        elif not isinstance(column, int):
+            pyflame.raise_type_error('PyFlameCSVData.column', 'column', 'int | str', column)
+
+        return list(self._columns[column])
+
+    def row(self, row: int) -> List[str]:
+        """
+        Row
+        ===
+
+        Get a row as a list of values.
+
+        Args
+        ----
+            `row` (int):
+                Row index.
+
+        Returns
+        -------
+            List[str]:
+                The row values.
+        """
+
+        return [column[row] for column in self._columns]
+
+    def rows(self, start: int=0, stop: int | None=None):
+        """
+        Rows
+        ====
+
+        Iterate over rows as lists of values.
+
+        Args
+        ----
+            `start` (int, optional):
+                First row index.
+                (Default: `0`)
+
+            `stop` (int | None, optional):
+                Row index to stop before. If `None`, iterate to the last row.
+                (Default: `None`)
+
+        Yields
+        ------
+            List[str]:
+                The row values.
+        """
+
+        stop = self._row_count if stop is None else min(stop, self._row_count)
+        column_slices = [column[start:stop] for column in self._columns]
+
+        for row in zip(*column_slices):
+            yield list(row)
+
+    def row_dicts(self):
+        """
+        Row Dicts
+        =========
+
+        Iterate over rows as dictionaries keyed by header label.
+
+        Yields
+        ------
+            Dict[str, str]:
+                The row values keyed by header label.
+        """
+
+        for row in self.rows():
+            yield dict(zip(self._headers, row))
+
+    def insert_rows(self, row: int, count: int=1) -> None:
+        """
+        Insert Rows
+        ===========
+
+        Insert empty rows.
+
+        Args
+        ----
+            `row` (int):
+                Index to insert the rows at.
+
+            `count` (int, optional):
+                Number of rows to insert.
+                (Default: `1`)
+        """
+
+        self._detach()
+        for column in self._columns:
+            column[row:row] = [''] * count
+        self._row_count += count
+
+    def remove_rows(self, row: int, count: int=1) -> None:
+        """
+        Remove Rows
+        ===========
+
+        Remove rows.
+
+        Args
+        ----
+            `row` (int):
+                Index of the first row to remove.
+
+            `count` (int, optional):
+                Number of rows to remove.
+                (Default: `1`)
+        """
+
+        self._detach()
+        for column in self._columns:
+            del column[row:row + count]
+        self._row_count = len(self._columns[0]) if self._columns else 0
+
+    def insert_columns(self, column: int, count: int=1, header: str='') -> None:
+        """
+        Insert Columns
+        ==============
+
+        Insert empty columns.
+
+        Args
+        ----
+            `column` (int):
+                Index to insert the columns at.
+
+            `count` (int, optional):
+                Number of columns to insert.
+                (Default: `1`)
+
+            `header` (str, optional):
+                Header label for the new columns.
+                (Default: `''`)
+        """
+
+        self._detach()
+        self._headers[column:column] = [header] * count
+        self._columns[column:column] = [[''] * self._row_count for _ in range(count)]
+
+    def remove_columns(self, column: int, count: int=1) -> None:
+        """
+        Remove Columns
+        ==============
+
+        Remove columns.
+
+        Args
+        ----
+            `column` (int):
+                Index of the first column to remove.
+
+            `count` (int, optional):
+                Number of columns to remove.
+                (Default: `1`)
+        """
+
+        self._detach()
+        del self._headers[column:column + count]
+        del self._columns[column:column + count]
+
+    def set_header(self, column: int, text: str) -> None:
+        """
+        Set Header
+        ==========
+
+        Set a column header label.
+
+        Args
+        ----
+            `column` (int):
+                Column index.
+
+            `text` (str):
+                New header label.
+        """
+
+        self._detach()
+        self._headers[column] = str(text)
+
+    def save(self, csv_file_path: str) -> None:
+        """
+        Save
+        ====
+
+        Write the data to a CSV file.
+
+        Args
+        ----
+            `csv_file_path` (str):
+                Path to save the CSV file to.
+
+        Raises
+        ------
+            TypeError:
+                If `csv_file_path` is not a string.
+        """
+
+        # Validate Argument
+        if not isinstance(csv_file_path, str):
+            pyflame.raise_type_error('PyFlameCSVData.save', 'csv_file_path', 'str', csv_file_path)
+
+        with open(csv_file_path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(self._headers)
+            writer.writerows(self.rows())
+
+        # Saved data matches the file, cache it so the next load does not re-read the file
+        csv_file_path = os.path.abspath(csv_file_path)
+        file_stat = os.stat(csv_file_path)
+        self._csv_file_path = csv_file_path
+        self._cache[csv_file_path] = ((file_stat.st_mtime_ns, file_stat.st_size), self)
+
+    #-------------------------------------
+    # [Internal Methods]
+    #-------------------------------------
+
+    def _append_rows(self, rows: List[List[str]]) -> None:
+        """
+        Append Rows
+        ===========
+
+        Append a chunk of rows to the column lists. Rows are padded to the column count,
+        and any row longer than the current column count adds new columns.
+        """
+
+        width = max(len(row) for row in rows)
+
+        # Add unnamed columns for rows longer than the header row
+        while len(self._columns) < width:
+            self._headers.append('')
+            self._columns.append([''] * self._row_count)
+
+        column_count = len(self._columns)
+        padded_rows = [row + [''] * (column_count - len(row)) if len(row) < column_count else row for row in rows]
+
+        for column, values in zip(self._columns, zip(*padded_rows)):
+            column.extend(values)
+
+        self._row_count += len(rows)
+
+    def _detach(self) -> None:
+        """
+        Detach
+        ======
+
+        Remove this data from the load cache before it is modified so unsaved edits are not
+        returned by later calls to `PyFlameCSVData.load()`.
+        """
+
+        if self._csv_file_path and self._cache.get(self._csv_file_path, (None, None))[1] is self:
+            del self._cache[self._csv_file_path]
+
 # ==============================================================================
 # [PyFlame QT Widgets]
 # ==============================================================================
@@ -15258,6 +15866,190 @@ class PyFlameSlider(QtWidgets.QLineEdit):
     def leaveEvent(self, event):
         self.tooltip_popup.leave_event()
 
+class _PyFlameTableModel(QtCore.QAbstractTableModel):
+    """
+    PyFlame Table Model
+    ===================
+
+    Table model used by `PyFlameTable`. Not intended to be used outside of this file.
+
+    Cells are read straight from a `PyFlameCSVData` store instead of creating an item
+    object per cell. Rows are handed to the view in chunks of `fetch_size` as the view
+    scrolls (`canFetchMore`/`fetchMore`), so large CSV files open without building the
+    whole table up front.
+
+    Args
+    ----
+        `fetch_size` (int, optional):
+            Number of rows to add to the view each time more rows are needed.
+            (Default: `500`)
+
+        `parent` (QtCore.QObject | None, optional):
+            Parent object.
+            (Default: `None`)
+    """
+
+    def __init__(self, fetch_size: int=500, parent: QtCore.QObject | None=None) -> None:
+        super().__init__(parent)
+
+        self.fetch_size = fetch_size
+        self._csv_data = PyFlameCSVData()
+        self._fetched_rows = 0
+
+    @property
+    def csv_data(self) -> PyFlameCSVData:
+        """
+        CSV Data
+        ========
+
+        Get the CSV data store backing the model.
+        """
+
+        return self._csv_data
+
+    def set_csv_data(self, csv_data: PyFlameCSVData) -> None:
+        """
+        Set CSV Data
+        ============
+
+        Replace the data shown by the model. Only the first chunk of rows is added to the view.
+        """
+
+        self.beginResetModel()
+        self._csv_data = csv_data
+        self._fetched_rows = min(self.fetch_size, csv_data.row_count)
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """
+        Clear
+        =====
+
+        Remove all rows and columns from the model.
+        """
+
+        self.set_csv_data(PyFlameCSVData())
+
+    #-------------------------------------
+    # [QAbstractTableModel Overrides]
+    #-------------------------------------
+
+    def rowCount(self, parent: QtCore.QModelIndex=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._fetched_rows
+
+    def columnCount(self, parent: QtCore.QModelIndex=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._csv_data.column_count
+
+    def canFetchMore(self, parent: QtCore.QModelIndex=QtCore.QModelIndex()) -> bool:
+        return not parent.isValid() and self._fetched_rows < self._csv_data.row_count
+
+    def fetchMore(self, parent: QtCore.QModelIndex=QtCore.QModelIndex()) -> None:
+
+        if parent.isValid():
+            return
+
+        rows_to_fetch = min(self.fetch_size, self._csv_data.row_count - self._fetched_rows)
+        if rows_to_fetch <= 0:
+            return
+
+        self.beginInsertRows(QtCore.QModelIndex(), self._fetched_rows, self._fetched_rows + rows_to_fetch - 1)
+        self._fetched_rows += rows_to_fetch
+        self.endInsertRows()
+
+    def data(self, index: QtCore.QModelIndex, role: int=QtCore.Qt.DisplayRole) -> Any:
+
+        if not index.isValid():
+            return None
+
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self._csv_data.cell(index.row(), index.column())
+
+        return None
+
+    def setData(self, index: QtCore.QModelIndex, value: Any, role: int=QtCore.Qt.EditRole) -> bool:
+
+        if not index.isValid() or role != QtCore.Qt.EditRole:
+            return False
+
+        self._csv_data.set_cell(index.row(), index.column(), str(value))
+        self.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole])
+
+        return True
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int=QtCore.Qt.DisplayRole) -> Any:
+
+        if role != QtCore.Qt.DisplayRole:
+            return None
+
+        if orientation == QtCore.Qt.Horizontal:
+            headers = self._csv_data.headers
+            return headers[section] if section < len(headers) else None
+
+        return str(section + 1)
+
+    def setHeaderData(self, section: int, orientation: QtCore.Qt.Orientation, value: Any, role: int=QtCore.Qt.EditRole) -> bool:
+
+        if orientation != QtCore.Qt.Horizontal or role not in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return False
+
+        self._csv_data.set_header(section, str(value))
+        self.headerDataChanged.emit(orientation, section, section)
+
+        return True
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags:
+
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEditable
+
+    def insertRows(self, row: int, count: int, parent: QtCore.QModelIndex=QtCore.QModelIndex()) -> bool:
+
+        if parent.isValid() or row < 0 or row > self._fetched_rows or count < 1:
+            return False
+
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._csv_data.insert_rows(row, count)
+        self._fetched_rows += count
+        self.endInsertRows()
+
+        return True
+
+    def removeRows(self, row: int, count: int, parent: QtCore.QModelIndex=QtCore.QModelIndex()) -> bool:
+
+        if parent.isValid() or row < 0 or count < 1 or row + count > self._fetched_rows:
+            return False
+
+        self.beginRemoveRows(parent, row, row + count - 1)
+        self._csv_data.remove_rows(row, count)
+        self._fetched_rows -= count
+        self.endRemoveRows()
+
+        return True
+
+    def insertColumns(self, column: int, count: int, parent: QtCore.QModelIndex=QtCore.QModelIndex()) -> bool:
+
+        if parent.isValid() or column < 0 or column > self._csv_data.column_count or count < 1:
+            return False
+
+        self.beginInsertColumns(parent, column, column + count - 1)
+        self._csv_data.insert_columns(column, count)
+        self.endInsertColumns()
+
+        return True
+
+    def removeColumns(self, column: int, count: int, parent: QtCore.QModelIndex=QtCore.QModelIndex()) -> bool:
+
+        if parent.isValid() or column < 0 or count < 1 or column + count > self._csv_data.column_count:
+            return False
+
+        self.beginRemoveColumns(parent, column, column + count - 1)
+        self._csv_data.remove_columns(column, count)
+        self.endRemoveColumns()
+
+        return True
+
 class PyFlameTable(QtWidgets.QTableView):
     """
     PyFlameTable
@@ -15265,6 +16057,10 @@ class PyFlameTable(QtWidgets.QTableView):
 
     Custom QT Table Widget Subclass
 
+    CSV files are loaded into a `PyFlameCSVData` store and shown through a lazy table model.
+    Rows are added to the view in chunks as the table is scrolled and column widths are
+    sized from the first rows only, so large CSV files open without locking the UI.
+
     Args
     ----
         `csv_file_path` (str, optional):
@@ -15305,6 +16101,9 @@ class PyFlameTable(QtWidgets.QTableView):
             Get or set the file path to the loaded CSV file.
             (Default: `None`)
 
+        `csv_data` (PyFlameCSVData):
+            Get the CSV data shown in the table, including rows not yet scrolled into view.
+
         `alternating_row_colors` (bool):
             Get or set alternating row colors.
             (Default: `True`)
@@ -15397,7 +16196,7 @@ class PyFlameTable(QtWidgets.QTableView):
         self.tooltip_duration = tooltip_duration
 
         # Set Model
-        self.model = QtGui.QStandardItemModel()
+        self.model = _PyFlameTableModel(parent=self)
         self.setModel(self.model)
 
         # Configure headers
@@ -15406,6 +16205,9 @@ class PyFlameTable(QtWidgets.QTableView):
         self.horizontalHeader().setDefaultAlignment(QtCore.Qt.AlignLeft)
         self.horizontalHeader().sectionDoubleClicked.connect(self._rename_column_header)
 
+        # Only check the first rows when resizing columns to fit contents
+        self.horizontalHeader().setResizeContentsPrecision(100)
+
         # Set right-click context menus
         self.verticalHeader().setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.horizontalHeader().setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
@@ -15436,6 +16238,24 @@ class PyFlameTable(QtWidgets.QTableView):
 
         return self._csv_file_path
 
+    @property
+    def csv_data(self) -> PyFlameCSVData:
+        """
+        CSV Data
+        ========
+
+        Get the CSV data shown in the table. Includes rows that have not been scrolled into view yet.
+
+        Examples
+        --------
+            ```
+            # Get all values in the SHOT column
+            shot_names = table.csv_data.column('SHOT')
+            ```
+        """
+
+        return self.model.csv_data
+
     @property
     def alternating_row_colors(self) -> bool:
         """
@@ -15825,6 +16645,9 @@ class PyFlameTable(QtWidgets.QTableView):
 
         Load CSV file into the table.
 
+        The file is parsed once into a `PyFlameCSVData` store. If the script has already loaded
+        the same unchanged file with `PyFlameCSVData.load()`, the cached data is used.
+
         Args
         ----
             csv_file_path: str
@@ -15852,26 +16675,11 @@ class PyFlameTable(QtWidgets.QTableView):
         if not csv_file_path:
             return
 
-        # Clear table
-        self.model.clear()
-
-        # Read CSV file
-        with open(csv_file_path, "r", encoding="utf-8") as file:
-            reader = csv.reader(file)
-            data = list(reader)
-
-            # If data is not empty, set column count and header labels
-            if data:
-                self.model.setColumnCount(len(data[0]))
-                self.model.setHorizontalHeaderLabels(data[0])
-
-                # Append rows
-                for row in data[1:]:
-                    items = [QtGui.QStandardItem(cell) for cell in row]
-                    self.model.appendRow(items)
+        # Load CSV data, only the first chunk of rows is added to the view
+        self.model.set_csv_data(PyFlameCSVData.load(csv_file_path))
 
-                # Resize columns to fit
-                self.resizeColumnsToContents()
+        # Resize columns to fit
+        self.resizeColumnsToContents()
 
     def save_csv_file(self, csv_file_path: str) -> None:
         """
@@ -15902,18 +16710,8 @@ class PyFlameTable(QtWidgets.QTableView):
         if not isinstance(csv_file_path, str):
             pyflame.raise_type_error('PyFlameTable.save_csv_file', 'csv_file_path', 'str', csv_file_path)
 
-        # Open file for writing
-        with open(csv_file_path, "w", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-
-            # Write headers
-            headers = [self.model.headerData(col, QtCore.Qt.Horizontal) for col in range(self.model.columnCount())]
-            writer.writerow(headers)
-
-            # Write rows
-            for row in range(self.model.rowCount()):
-                row_data = [self.model.item(row, col).text() if self.model.item(row, col) else "" for col in range(self.model.columnCount())]
-                writer.writerow(row_data)
+        # Write all rows, including rows not yet scrolled into view
+        self.model.csv_data.save(csv_file_path)
 
     #-------------------------------------
     # [Internal Methods]
@@ -15963,14 +16761,10 @@ class PyFlameTable(QtWidgets.QTableView):
         if not selected_indexes:
             return
 
-        item = self.model.itemFromIndex(selected_indexes[0])
-        if not item:
-            return
-
         # Open input dialog to get new value
         rename_selected_cells = PyFlameInputDialog(
             label_text='Enter New Value',
-            text=item.text(),
+            text=selected_indexes[0].data(),
             title='Rename Selected Cells',
             parent = self.parentWidget() if isinstance(self.parentWidget(), PyFlameWindow) else None
             )
@@ -15979,9 +16773,7 @@ class PyFlameTable(QtWidgets.QTableView):
         cell_text = rename_selected_cells.text
         if cell_text:
             for index in selected_indexes:
-                item = self.model.itemFromIndex(index)
-                if item:
-                    item.setText(cell_text)
+                self.model.setData(index, cell_text)
 
     def _show_row_menu(self, position: tuple) -> None:
         """
@@ -16056,7 +16848,13 @@ class PyFlameTable(QtWidgets.QTableView):
         """
 
         selected_rows = sorted(set(index.row() for index in self.selectionModel().selectedRows()))
-        insert_row = selected_rows[-1] + 1 if selected_rows else self.model.rowCount()
+        if selected_rows:
+            insert_row = selected_rows[-1] + 1
+        else:
+            # Fetch remaining rows so the new row is added after the last row of the file
+            while self.model.canFetchMore():
+                self.model.fetchMore()
+            insert_row = self.model.rowCount()
         self.model.insertRow(insert_row)
 
     def _delete_selected_rows(self) -> None:
@@ -19,11 +19,11 @@
 
 """
 Script Name: Delete Empty Folders
-Script Version: 1.6.0
+Script Version: 1.7.0
 Flame Version: 2025.1
 Written by: Michael Vaglienty
 Creation Date: 11.15.23
-Update Date: 03.31.26
+Update Date: 10.19.26
 
 License: GNU General Public License v3.0 (GPL-3.0) - see LICENSE file for details
 
@@ -33,6 +33,9 @@ Description:
 
     Delete any empty folders in selected Library or Folder.
 
+    Folders that only contain empty folders are also deleted. Use the Dry Run menu to list
+    empty folders without deleting them.
+
 URL:
     https://github.com/logik-portal/python/delete_empty_folders
 
@@ -40,12 +43,20 @@ Menu:
 
     Right-click on Folder or Library in Media Panel -> Delete Empty Folders
 
+    Right-click on Folder or Library in Media Panel -> Delete Empty Folders (Dry Run)
+
 To install:
 
     Copy script folder into /opt/Autodesk/shared/python
 
 Updates:
 
+    v1.7.0 10.19.26
+        - Folder tree is now checked in a single pass. Folders that only contain empty folders are found
+          in the same pass and deleted bottom-up.
+        - Added Dry Run menu to list empty folders without deleting them.
+        - Summary of folders checked and empty folders deleted is shown when done.
+
     v1.6.0 03.31.26
         - Updated to PyFlameLib v5.3.0.
 
@@ -80,7 +91,7 @@ from lib.pyflame_lib_delete_empty_folders import *
 # ==============================================================================
 
 SCRIPT_NAME = 'Delete Empty Folders'
-SCRIPT_VERSION = 'v1.6.0'
+SCRIPT_VERSION = 'v1.7.0'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
 # ==============================================================================
@@ -89,7 +100,7 @@ SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
 class DeleteEmptyFolders:
 
-    def __init__(self, selection):
+    def __init__(self, selection, dry_run: bool=False):
 
         pyflame.print_title(f'{SCRIPT_NAME} {SCRIPT_VERSION}')
 
@@ -98,6 +109,7 @@ class DeleteEmptyFolders:
             return
 
         self.selection = selection
+        self.dry_run = dry_run
 
         self.delete_empty_folders()
 
@@ -107,45 +119,118 @@ class DeleteEmptyFolders:
         ====================
 
         Loop through selection(Library or Folder) and delete empty folders.
+
+        Each Library or Folder is walked once. Folders are checked after their sub-folders (post-order), so a
+        folder that only contains empty folders is found in the same pass. Empty folders are then deleted
+        bottom-up. In dry run mode the empty folders are only listed.
+        """
+
+        if self.dry_run:
+            pyflame.print('Checking for empty folders (dry run, nothing will be deleted)...')
+        else:
+            pyflame.print('Checking for and deleting empty folders...')
+
+        folder_count = 0
+        empty_folders = []
+
+        # Loop through selection and find empty folders
+        for root_folder in self.selection:
+            root_path = str(root_folder.name)[1:-1]
+            root_folder_count, root_empty_folders = self.find_empty_folders(root_folder, root_path)
+            folder_count += root_folder_count
+            empty_folders.extend(root_empty_folders)
+
+        if self.dry_run:
+            for folder, folder_path in empty_folders:
+                pyflame.print(f'Empty folder: {folder_path}', indent=1)
+        else:
+            # Folders are in post-order, sub-folders are deleted before their parent folders
+            for folder, folder_path in empty_folders:
+                pyflame.print(f'Deleting empty folder: {folder_path}', indent=1)
+                flame.delete(folder)
+
+        self.print_summary(folder_count, empty_folders)
+
+    def find_empty_folders(self, root_folder, root_path: str) -> tuple[int, list]:
         """
+        Find Empty Folders
+        ==================
 
-        def check_folders(root_folder):
+        Walk the folder tree once in post-order and find all folders that are empty, or that will be empty
+        once their empty sub-folders are deleted. The root folder is never included.
 
-            while True:
-                # Find empty folders
-                empty_folders = find_empty_folders(root_folder)
+        Args
+        ----
+            `root_folder` (flame.PyLibrary | flame.PyFolder):
+                Library or Folder to check.
 
-                # If no empty folders, break the loop
-                if not empty_folders:
-                    break
+            `root_path` (str):
+                Media Panel path of the root folder, used when listing folders.
 
-                # Delete found empty folders
-                for folder in empty_folders:
-                    pyflame.print(f'Deleting empty folder: {str(folder.name)[1:-1]}')
-                    flame.delete(folder)
+        Returns
+        -------
+            `folder_count` (int):
+                Number of folders checked, not including the root folder.
 
-            pyflame.print('All empty folders have been deleted.', text_color=TextColor.GREEN)
+            `empty_folders` (list[tuple[flame.PyFolder, str]]):
+                Empty folders and their paths, sub-folders before their parent folders.
+        """
+
+        empty_folders = []
+        folder_count = 0
+
+        def check_folder(folder, folder_path: str) -> bool:
+            nonlocal folder_count
 
-        def find_empty_folders(folder, parent=None):
+            # Check sub-folders first
+            sub_folders = list(folder.folders)
+            empty_sub_folders = 0
+            for sub_folder in sub_folders:
+                if check_folder(sub_folder, f'{folder_path}/{str(sub_folder.name)[1:-1]}'):
+                    empty_sub_folders += 1
 
-            empty_folders = []
+            if folder is root_folder:
+                return False
 
-            # Iterate through each subfolder
-            for subfolder in list(folder.folders):
-                # Recursively check each subfolder
-                empty_folders.extend(find_empty_folders(subfolder, folder))
+            folder_count += 1
 
-            # Check if the current folder is empty
-            if not folder.children and not folder.folders and parent is not None:
-                empty_folders.append(folder)
+            # Folder is empty if it has no clips, sequences, or other items and all of its sub-folders are empty
+            if empty_sub_folders == len(sub_folders) and all(isinstance(child, flame.PyFolder) for child in folder.children):
+                empty_folders.append((folder, folder_path))
+                return True
 
-            return empty_folders
+            return False
 
-        pyflame.print('Checking for and deleting empty folders...')
+        check_folder(root_folder, root_path)
 
-        # Loop through selection and check for empty folders
-        for folder in self.selection:
-            check_folders(folder)
+        return folder_count, empty_folders
+
+    def print_summary(self, folder_count: int, empty_folders: list) -> None:
+        """
+        Print Summary
+        =============
+
+        Print number of folders checked and number of empty folders found or deleted.
+        """
+
+        if self.dry_run:
+            message = f'Folders checked: {folder_count}\nEmpty folders found: {len(empty_folders)}\n\nNo folders were deleted.'
+        else:
+            message = f'Folders checked: {folder_count}\nEmpty folders deleted: {len(empty_folders)}'
+
+        pyflame.print(message, text_color=TextColor.GREEN)
+
+        if self.dry_run:
+            PyFlameMessageWindow(
+                message=message + '\n\nSee terminal for list of empty folders.',
+                message_type=MessageType.INFO,
+                title=f'{SCRIPT_NAME}: Dry Run',
+                parent=None,
+                )
+
+def dry_run_empty_folders(selection):
+
+    DeleteEmptyFolders(selection, dry_run=True)
 
 # ==============================================================================
 # [Scopes]
@@ -171,10 +256,17 @@ def get_media_panel_custom_ui_actions():
                {
                     'name': 'Delete Empty Folders',
                     'order': 1,
-                    'separator': 'below',
                     'execute': DeleteEmptyFolders,
                     'isVisible': scope_library_folder,
                     'minimumVersion': '2025.1'
+               },
+               {
+                    'name': 'Delete Empty Folders (Dry Run)',
+                    'order': 2,
+                    'separator': 'below',
+                    'execute': dry_run_empty_folders,
+                    'isVisible': scope_library_folder,
+                    'minimumVersion': '2025.1'
                }
            ]
         }
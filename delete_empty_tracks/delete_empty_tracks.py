@@ -1,10 +1,10 @@
 """
 Script Name: Delete Empty Tracks
-Script Version: 1.0
+Script Version: 1.1
 Flame Version: 2021.1
 Written by: Fred Warren
 Creation Date: 07.15.21
-Update Date: 07.15.21
+Update Date: 10.19.26
 
 Script Type: MediaPanel
 
@@ -14,6 +14,9 @@ Description:
    tracks of a <PySequence>. The minimumVersion is set to 2021.1 because
    <PySegment>.type is used.
 
+   Each sequence is read once into a timeline snapshot, then only the empty
+   tracks are deleted.
+
 Menu:
 
     Media Panel:
@@ -27,6 +30,10 @@ To install:
 
 Updates:
 
+    v1.1 10.19.26
+        - Read each sequence once into a timeline snapshot and only delete the
+          empty tracks found in it.
+
     v1.0 07.15.21
         - Initial release.
 """
@@ -43,40 +50,42 @@ def get_media_panel_custom_ui_actions():
                 return True
         return False
 
-    def delete_empty_video_tracks(selection):
+    def delete_empty_tracks(tracks):
+        """
+        Delete the empty tracks of a timeline snapshot. The second track of a
+        stereo pair is deleted with the first one, so it is skipped.
+        """
         import flame
 
+        skip_track = None
+        for track in tracks:
+            if (track.kind, track.group_index, track.track_index) == skip_track:
+                continue
+            if track.is_empty:
+                if track.stereo:
+                    skip_track = (track.kind, track.group_index, track.track_index + 1)
+                flame.delete(track.track)
+
+    def delete_empty_video_tracks(selection):
+        from lib.timeline_snapshot_delete_empty_tracks import TimelineSnapshot
+
         for clip in selection:
-            for version in clip.versions:
-                skip_next_chn = False
-                for track in version.tracks:
-                    if skip_next_chn:
-                        skip_next_chn = False
-                        continue
-                    if len(track.segments) == 1 and track.segments[0].type == "Gap":
-                       skip_next_chn = version.stereo
-                       flame.delete(track)
+            delete_empty_tracks(TimelineSnapshot(clip, audio=False).video_tracks)
 
     def delete_empty_audio_tracks(selection):
-        import flame
+        from lib.timeline_snapshot_delete_empty_tracks import TimelineSnapshot
 
         for clip in selection:
-            for audio_track in clip.audio_tracks:
-                skip_next_chn = False
-                for channel in audio_track.channels:
-                    if skip_next_chn:
-                        skip_next_chn = False
-                        continue
-                    if len(channel.segments) == 1 and channel.segments[0].type == "Gap":
-                        skip_next_chn = audio_track.stereo
-                        flame.delete(channel)
+            delete_empty_tracks(TimelineSnapshot(clip, video=False).audio_tracks)
 
     def delete_all_empty_tracks(selection):
         """
-        Execute both actions at once.
+        Execute both actions at once, reading each sequence once.
         """
-        delete_empty_video_tracks(selection)
-        delete_empty_audio_tracks(selection)
+        from lib.timeline_snapshot_delete_empty_tracks import TimelineSnapshot
+
+        for clip in selection:
+            delete_empty_tracks(TimelineSnapshot(clip).tracks())
 
     return [
         {
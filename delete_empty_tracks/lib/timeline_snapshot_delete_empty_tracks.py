@@ -0,0 +1,233 @@
+"""
+Timeline Snapshot
+
+Reads the versions, tracks and segments of a sequence once into compact interval lists
+per track.  Gaps, overlaps, occluded segments and empty tracks are then found from the
+snapshot without walking the Flame API again, so a tool can work out its list of edits
+first and only call Flame for the edits.
+
+Frames are counted from the start of the sequence.  Segment positions are the running
+total of the record durations on each track, record_in is not read because Flame prints
+an error when it is read on some segment types.
+
+This file is vendored into each script that uses it, as timeline_snapshot_<script>.py.
+Keep the copies in sync.
+"""
+
+from bisect import bisect_left, bisect_right
+
+VIDEO = 'video'
+AUDIO = 'audio'
+
+
+class IntervalSet:
+    """Union of [start, end) frame intervals, kept as sorted lists of merged intervals.
+
+    Adding an interval and testing coverage or overlap are binary searches, so building
+    the coverage of n segments and querying it is O(n log n).
+    """
+
+    def __init__(self, intervals=()):
+        self.starts = []
+        self.ends = []
+        for start, end in sorted(intervals):
+            self.add(start, end)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def add(self, start, end):
+        """Add an interval, merging it with the intervals it overlaps or touches."""
+        if end <= start:
+            return
+        first = bisect_left(self.ends, start)
+        last = bisect_right(self.starts, end)
+        if first < last:
+            start = min(start, self.starts[first])
+            end = max(end, self.ends[last - 1])
+        self.starts[first:last] = [start]
+        self.ends[first:last] = [end]
+
+    def covers(self, start, end):
+        """Return True if the whole of [start, end) is inside the set."""
+        index = bisect_right(self.starts, start) - 1
+        return index >= 0 and self.ends[index] >= end
+
+    def overlaps(self, start, end):
+        """Return True if any part of [start, end) is inside the set."""
+        index = bisect_right(self.ends, start)
+        return index < len(self.starts) and self.starts[index] < end
+
+
+class TrackSnapshot:
+    """Segments of one video track or audio channel.
+
+    Attributes:
+        track: PyTrack or PyAudioTrack channel.
+        kind: VIDEO or AUDIO.
+        group_index: Index of the version (video) or audio track (audio) in the sequence.
+        track_index: Index of the track in the version, or of the channel in the audio track.
+        stereo: True if the version or audio track is stereo.
+        segments: PySegment objects in timeline order.
+        starts: Start frame of each segment.
+        ends: End frame of each segment, exclusive.
+        gaps: True for each segment that is a gap.
+        selected: True for each segment that was selected, if read.
+    """
+
+    __slots__ = ('track', 'kind', 'group_index', 'track_index', 'stereo', 'segments',
+                 'starts', 'ends', 'gaps', 'selected')
+
+    def __init__(self, track, kind, group_index, track_index, stereo=False,
+                 read_selected=False):
+        self.track = track
+        self.kind = kind
+        self.group_index = group_index
+        self.track_index = track_index
+        self.stereo = stereo
+        self.segments = list(track.segments)
+        self.starts = []
+        self.ends = []
+        self.gaps = []
+        self.selected = []
+
+        frame = 0
+        for segment in self.segments:
+            self.starts.append(frame)
+            frame += int(segment.record_duration.frame)
+            self.ends.append(frame)
+            self.gaps.append(segment.type == 'Gap')
+            if read_selected:
+                self.selected.append(bool(segment.selected))
+
+    @property
+    def is_empty(self):
+        """True if the track only holds gaps."""
+        return bool(self.segments) and all(self.gaps)
+
+    def gap_indexes(self):
+        """Indexes of the gap segments."""
+        return [index for index, gap in enumerate(self.gaps) if gap]
+
+    def content(self):
+        """IntervalSet of the frames covered by segments that are not gaps."""
+        content = IntervalSet()
+        for start, end, gap in zip(self.starts, self.ends, self.gaps):
+            if not gap:
+                content.add(start, end)
+        return content
+
+    def indexes_between(self, start, end):
+        """Indexes of the segments overlapping [start, end)."""
+        first = bisect_right(self.ends, start)
+        last = bisect_left(self.starts, end)
+        return list(range(first, last))
+
+
+class TimelineSnapshot:
+    """Read a sequence once into a TrackSnapshot per video track and audio channel.
+
+    Args:
+        sequence: PySequence or PyClip to read.
+        video: Read the video tracks of every version.
+        audio: Read the audio channels of every audio track.
+        read_selected: Also read which segments are selected.
+    """
+
+    def __init__(self, sequence, video=True, audio=True, read_selected=False):
+        self.sequence = sequence
+        self.video_tracks = []
+        self.audio_tracks = []
+
+        if video:
+            for version_index, version in enumerate(sequence.versions):
+                stereo = bool(version.stereo)
+                for track_index, track in enumerate(version.tracks):
+                    self.video_tracks.append(TrackSnapshot(
+                            track, VIDEO, version_index, track_index, stereo, read_selected))
+
+        if audio:
+            for audio_index, audio_track in enumerate(sequence.audio_tracks):
+                stereo = bool(audio_track.stereo)
+                for channel_index, channel in enumerate(audio_track.channels):
+                    self.audio_tracks.append(TrackSnapshot(
+                            channel, AUDIO, audio_index, channel_index, stereo, read_selected))
+
+    def tracks(self, kind=None):
+        """Track snapshots of one kind, or all of them."""
+        if kind == VIDEO:
+            return self.video_tracks
+        if kind == AUDIO:
+            return self.audio_tracks
+        return self.video_tracks + self.audio_tracks
+
+    def gaps(self, kind=None):
+        """List of (track snapshot, segment index) for every gap."""
+        return [(track, index) for track in self.tracks(kind) for index in track.gap_indexes()]
+
+    def empty_tracks(self, kind=None):
+        """Track snapshots that only hold gaps."""
+        return [track for track in self.tracks(kind) if track.is_empty]
+
+    def overlaps(self, start, end, kind=VIDEO):
+        """List of (track snapshot, segment index) for the segments, not gaps, in [start, end)."""
+        return [(track, index) for track in self.tracks(kind)
+                for index in track.indexes_between(start, end) if not track.gaps[index]]
+
+    def selected_segments(self, kind=VIDEO):
+        """List of (track snapshot, segment index) for the selected segments, not gaps,
+        ordered bottom to top: by version, then track, then time.
+        """
+        return [(track, index) for track in sorted(
+                        self.tracks(kind), key=lambda track: (track.group_index, track.track_index))
+                for index, selected in enumerate(track.selected)
+                if selected and not track.gaps[index]]
+
+    @staticmethod
+    def visible_segments(layered_segments):
+        """Drop the segments that are fully covered by segments above them.
+
+        Args:
+            layered_segments: List of (track snapshot, segment index) ordered bottom to
+                top, as returned by selected_segments.  Only these segments cover each
+                other.
+
+        Returns:
+            The segments that are at least partly visible, in the same order.
+        """
+        coverage = IntervalSet()
+        visible = []
+
+        # Segments on one track never overlap, so each can be added to the coverage
+        # as soon as it has been tested.
+        for track, index in reversed(layered_segments):
+            start, end = track.starts[index], track.ends[index]
+            if not coverage.covers(start, end):
+                visible.append((track, index))
+            coverage.add(start, end)
+
+        visible.reverse()
+        return visible
+
+    def occluded_segments(self, kind=VIDEO):
+        """List of (track snapshot, segment index) for the segments, not gaps, that are
+        fully covered by segments on higher tracks of the same version.
+        """
+        occluded = []
+        versions = {}
+        for track in self.tracks(kind):
+            versions.setdefault(track.group_index, []).append(track)
+
+        for tracks in versions.values():
+            coverage = IntervalSet()
+            for track in sorted(tracks, key=lambda track: track.track_index, reverse=True):
+                for index, (start, end, gap) in enumerate(zip(track.starts, track.ends, track.gaps)):
+                    if not gap and coverage.covers(start, end):
+                        occluded.append((track, index))
+                for start, end in track.content():
+                    coverage.add(start, end)
+
+        return occluded
@@ -19,11 +19,11 @@
 
 """
 Script Name: Delete Iterations
-Script Version: 1.7.0
+Script Version: 1.8.0
 Flame Version: 2025.1
 Written by: Michael Vaglienty
 Creation Date: 01.23.23
-Update Date: 03.26.26
+Update Date: 10.19.26
 
 License: GNU General Public License v3.0 (GPL-3.0) - see LICENSE file for details
 
@@ -56,6 +56,12 @@ To install:
 
 Updates:
 
+    v1.8.0 10.19.26
+        - Selection is scanned once for batch groups and iterations to delete. Number of batch groups and iterations
+          to delete is shown for confirmation before anything is deleted.
+        - Iterations are deleted in chunks with a progress window. Deletion can be cancelled.
+        - Updated to PyFlameLib v5.3.1.
+
     v1.7.0 03.26.26
         - Updated to PyFlameLib v5.3.0.
 
@@ -101,9 +107,11 @@ from lib.pyflame_lib_delete_iterations import *
 # ==============================================================================
 
 SCRIPT_NAME = 'Delete Iterations'
-SCRIPT_VERSION = 'v1.7.0'
+SCRIPT_VERSION = 'v1.8.0'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
+DELETE_CHUNK_SIZE = 25 # Iterations deleted between progress window updates
+
 # ==============================================================================
 # [Main Script]
 # ==============================================================================
@@ -147,16 +155,14 @@ class DeleteIterations:
                     }
                 )
 
+            # Close window
+            self.window.close()
+
             pyflame.print(f'Deleting iterations. Keeping last {self.settings.iterations_to_keep} iterations.', text_color=TextColor.GREEN)
 
             # Delete iterations
             self.cleanup()
 
-            pyflame.print('Iterations deleted.', text_color=TextColor.GREEN)
-
-            # Close window
-            self.window.close()
-
         def close_window():
             """
             Close Window
@@ -215,101 +221,165 @@ class DeleteIterations:
         Cleanup
         =======
 
-        Delete iterations from selection based on selection type.
+        Delete iterations from selection in two phases.
+
+        First, the selection is scanned once to find every batch group and the iterations to delete from it.
+        The number of batch groups and iterations found is shown for confirmation. Then the iterations are
+        deleted in chunks with a progress window that can be used to cancel the deletion.
         """
 
-        if isinstance(self.selection[0], flame.PyDesktop):
-            self.clean_desktop()
-        elif isinstance(self.selection[0], flame.PyBatch):
-            self.clean_batch_group()
-        elif isinstance(self.selection[0], flame.PyFolder):
-            self.clean_folder()
-        elif isinstance(self.selection[0], flame.PyLibrary):
-            self.clean_library()
+        self.scan_selection()
 
-    def delete_iterations(self, batch_group):
-        """
-        Delete Iterations
-        ==================
+        iterations_to_delete = sum(len(iterations) for _, iterations, _, _ in self.batch_group_iterations)
+        iterations_total = sum(iteration_count for _, _, iteration_count, _ in self.batch_group_iterations)
+
+        if not iterations_to_delete:
+            PyFlameMessageWindow(
+                message=f'No iterations to delete.\n\nBatch groups found: {len(self.batch_group_iterations)}',
+                message_type=MessageType.INFO,
+                parent=None,
+                )
+            return
 
-        Delete iterations from batch group.
+        # Confirm deletion
+        delete_confirmed = PyFlameMessageWindow(
+            message=(
+                f'Batch groups found: {len(self.batch_group_iterations)}\n'
+                f'Iterations found: {iterations_total}\n'
+                f'Iterations to delete: {iterations_to_delete}\n\n'
+                'See terminal for iterations to delete from each batch group.\n\n'
+                'Delete iterations?'
+                ),
+            message_type=MessageType.WARNING,
+            parent=None,
+            )
 
-        Deletes all iterations if iterations_to_keep is set to 0. Otherwise, keeps the specified number of iterations.
+        if delete_confirmed:
+            self.delete_scanned_iterations(iterations_to_delete)
 
-        Args:
-        -----
-            batch_group (flame.PyBatch): Batch Group to delete iterations from.
+    def scan_selection(self):
         """
+        Scan Selection
+        ==============
 
-        if self.settings.iterations_to_keep != 0:
-            for iteration in batch_group.batch_iterations[:-self.settings.iterations_to_keep]:
-                flame.delete(iteration, confirm=False)
-        else:
-            for iteration in batch_group.batch_iterations:
-                flame.delete(iteration, confirm=False)
+        Scan selection(Desktop, Batch Groups, Libraries, or Folders) once and find the iterations to delete from
+        each batch group. Libraries and Folders are searched for batch groups including in any sub-folders.
 
-    def clean_desktop(self):
+        Results are stored in self.batch_group_iterations as a list of:
+            (batch_group, iterations_to_delete, iteration_count, set_current_batch_group)
         """
-        Clean Desktop
-        =============
 
-        Loop through selection(Desktop) and delete iterations from all batch groups in the desktop.
+        self.batch_group_iterations = []
+
+        if isinstance(self.selection[0], flame.PyDesktop):
+            workspace = flame.projects.current_project.current_workspace
+            for batch_group in workspace.desktop.batch_groups:
+                self.scan_batch_group(batch_group, set_current_batch_group=True)
+        elif isinstance(self.selection[0], flame.PyBatch):
+            for batch_group in self.selection:
+                self.scan_batch_group(batch_group)
+        elif isinstance(self.selection[0], (flame.PyFolder, flame.PyLibrary)):
+            folders = list(self.selection)
+            while folders:
+                folder = folders.pop()
+                for batch_group in folder.batch_groups:
+                    self.scan_batch_group(batch_group)
+                folders.extend(folder.folders)
+
+    def scan_batch_group(self, batch_group, set_current_batch_group: bool=False):
         """
+        Scan Batch Group
+        ================
 
-        workspace = flame.projects.current_project.current_workspace
-        for batch_group in workspace.desktop.batch_groups:
-            workspace.desktop.current_batch_group = batch_group
-            self.delete_iterations(batch_group)
+        Find the iterations to delete from a batch group.
 
-    def clean_batch_group(self):
-        """
-        Clean Batch Group
-        =================
+        Deletes all iterations if iterations_to_keep is set to 0. Otherwise, keeps the specified number of iterations.
+
+        Args:
+        -----
+            batch_group (flame.PyBatch): Batch Group to find iterations in.
 
-        Loop through selection(Batch Group) and delete iterations from all batch groups in the selection.
+            set_current_batch_group (bool): Make batch group the current batch group before deleting iterations. (Desktop only)
         """
 
-        for batch_group in self.selection:
-            self.delete_iterations(batch_group)
+        iterations = list(batch_group.batch_iterations)
 
-    def find_batch_group(self, folder):
+        if self.settings.iterations_to_keep != 0:
+            iterations_to_delete = iterations[:-self.settings.iterations_to_keep]
+        else:
+            iterations_to_delete = iterations
+
+        self.batch_group_iterations.append((batch_group, iterations_to_delete, len(iterations), set_current_batch_group))
+
+        pyflame.print(
+            text=f'{str(batch_group.name)[1:-1]}: {len(iterations)} iterations, {len(iterations_to_delete)} to delete',
+            indent=1,
+            print_to_flame=False,
+            )
+
+    def delete_scanned_iterations(self, iterations_to_delete: int):
         """
-        Find Batch Group
-        ================
+        Delete Scanned Iterations
+        =========================
 
-        Recursively find Batch Groups inside folders and libraries and delete all their iterations.
+        Delete the iterations found by scan_selection in chunks of DELETE_CHUNK_SIZE. The progress window is updated
+        and UI events are processed after each chunk. Deletion stops after the current chunk if Cancel is clicked.
 
         Args:
         -----
-            folder (flame.PyFolder): Folder to search for Batch Groups in.
+            iterations_to_delete (int): Total number of iterations to delete.
         """
 
-        for batch_group in folder.batch_groups:
-            self.delete_iterations(batch_group)
-        for folders in folder.folders:
-            self.find_batch_group(folders)
+        def cancel_deletion():
+            self.cancelled = True
 
-    def clean_library(self):
-        """
-        Clean Library
-        =============
+        self.cancelled = False
 
-        Loop through selection(Library) and delete iterations from all batch groups in the library including in any folders.
-        """
+        progress_window = PyFlameProgressWindow(
+            task='Deleting Iterations',
+            total_tasks=iterations_to_delete,
+            title='Deleting Iterations...',
+            cancel_connect=cancel_deletion,
+            parent=None,
+            )
 
-        for top_library in self.selection:
-            self.find_batch_group(top_library)
+        workspace = flame.projects.current_project.current_workspace
+        deleted = 0
 
-    def clean_folder(self):
-        """
-        Clean Folder
-        =============
+        for batch_group, iterations, _, set_current_batch_group in self.batch_group_iterations:
+            if self.cancelled:
+                break
+            if not iterations:
+                continue
 
-        Loop through selection(Folder) and delete iterations from all batch groups in the folders.
-        """
+            if set_current_batch_group:
+                workspace.desktop.current_batch_group = batch_group
 
-        for top_folder in self.selection:
-            self.find_batch_group(top_folder)
+            for iteration in iterations:
+                flame.delete(iteration, confirm=False)
+                deleted += 1
+
+                # Update progress and let UI respond after each chunk
+                if deleted % DELETE_CHUNK_SIZE == 0:
+                    progress_window.current_task = deleted
+                    QtWidgets.QApplication.processEvents()
+                    if self.cancelled:
+                        break
+
+        progress_window.current_task = deleted
+
+        if self.cancelled:
+            progress_window.tasks_completed(
+                title='Deletion Cancelled',
+                text_append=f'Deletion cancelled. {deleted} of {iterations_to_delete} iterations deleted.',
+                )
+            pyflame.print(f'Deletion cancelled. {deleted} of {iterations_to_delete} iterations deleted.', print_type=PrintType.WARNING)
+        else:
+            progress_window.tasks_completed(
+                title='Iterations Deleted',
+                text_append=f'{deleted} iterations deleted from {len(self.batch_group_iterations)} batch groups.',
+                )
+            pyflame.print(f'{deleted} iterations deleted.', text_color=TextColor.GREEN)
 
 # ==============================================================================
 # [Scopes]
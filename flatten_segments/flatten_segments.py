@@ -1,15 +1,19 @@
 """
 Script Name: Flatten Segments
-Script Version: 2.1.0
+Script Version: 2.2.0
 Flame Version: 2025
 Written By: Kieran Hanrahan
 Creation Date: 01.12.24
-Update Date: 03.07.25
+Update Date: 10.19.26
 
 Description:
 
     Takes vertically stacked segments and flattens them to just the top most segments.
 
+    The sequence is read once into a timeline snapshot.  Selected segments that are
+    completely covered by selected segments above them are skipped, only the segments
+    that stay visible are copied to the flattened track.
+
     URL: http://github.com/khanrahan/flatten-segments
 
 Menus:
@@ -18,13 +22,13 @@ Menus:
 
 To Install:
 
-    For all users, copy this file to:
+    For all users, copy this folder to:
     /opt/Autodesk/shared/python/
 
-    For a specific user on Linux, copy this file to:
+    For a specific user on Linux, copy this folder to:
     /home/<user_name>/flame/python/
 
-    For a specific user on Mac, copy this file to:
+    For a specific user on Mac, copy this folder to:
     /Users/<user_name>/Library/Preferences/Autodesk/flame/python/
 """
 
@@ -33,8 +37,10 @@ from functools import partial
 import flame
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from lib.timeline_snapshot_flatten_segments import TimelineSnapshot
+
 TITLE = 'Flatten Segments'
-VERSION_INFO = (2, 1, 0)
+VERSION_INFO = (2, 2, 0)
 VERSION = '.'.join([str(num) for num in VERSION_INFO])
 TITLE_VERSION = f'{TITLE} v{VERSION}'
 MESSAGE_PREFIX = '[PYTHON]'
@@ -269,6 +275,7 @@ class FlattenSegments:
         self.desktop = flame.project.current_project.current_workspace.desktop
         self.sequence = None
         self.sequence_current_time_initial = None
+        self.snapshot = None
         self.reel_temp = None
         self.destination_version = None
         self.destination_track = None
@@ -307,25 +314,6 @@ class FlattenSegments:
         """A timeline seems possible to be PyClip or a PySequence."""
         return self.get_specific_parent(child, (flame.PyClip, flame.PySequence))
 
-    def get_parent_track(self, flame_object):
-        """Get parent PyTrack object."""
-        return self.get_specific_parent(flame_object, (flame.PyTrack))
-
-    def get_parent_version(self, flame_object):
-        """Get parent PyVersion object."""
-        return self.get_specific_parent(flame_object, (flame.PyVersion))
-
-    def get_track_index(self, segment):
-        """Get index of parent PyTrack."""
-        track = self.get_parent_track(segment)
-        version = self.get_parent_version(segment)
-        return version.tracks.index(track)
-
-    def get_version_index(self, segment):
-        """Get index of parent PyVersion."""
-        version = self.get_parent_version(segment)
-        return self.sequence.versions.index(version)
-
     def deselect_selection(self):
         """Deselect everything so that lifting from the sequence may begin."""
         for item in self.selection:
@@ -335,22 +323,19 @@ class FlattenSegments:
         """Sort selected PySegment objects.
 
         Put the selected segments in order from left to right, bottom to top.  This
-        is necessary so segments on higher tracks overwrite the lower ones.
+        is necessary so segments on higher tracks overwrite the lower ones.  The
+        snapshot of the sequence also tells which segments are completely covered by
+        the selected segments above them.  Those would be overwritten anyway, so they
+        are left out.
         """
-        segment_version_track = []
+        ordered_segments = self.snapshot.selected_segments()
+        visible_segments = self.snapshot.visible_segments(ordered_segments)
 
-        for segment in self.selection:
-            if not isinstance(segment, flame.PySegment):  # skip PyTransitions
-                continue
-            if segment.type == 'Gap':
-                continue
-            segment_version_track.append(
-                    (segment,
-                     self.get_version_index(segment),
-                     self.get_track_index(segment)))
-
-        ordered_segments = sorted(segment_version_track, key=lambda x: (x[1], x[2]))
-        self.selection = [obj for (obj, version, track) in ordered_segments]
+        skipped = len(ordered_segments) - len(visible_segments)
+        if skipped:
+            self.message(f'Skipping {skipped} segments covered by segments above them.')
+
+        self.selection = [track.segments[index] for track, index in visible_segments]
 
     def create_temp_reel(self):
         """Create temporary reel.
@@ -405,6 +390,9 @@ class FlattenSegments:
         self.sequence = self.get_parent_sequence(self.selection[0])
         self.sequence_current_time_initial = self.sequence.current_time.get_value()
 
+        # Read Sequence & Selection Once
+        self.snapshot = TimelineSnapshot(self.sequence, audio=False, read_selected=True)
+
         # Prepare Selection
         self.deselect_selection()
         self.sort_selection()
@@ -1,13 +1,15 @@
-# FrameIO Get Comments v2.0 — Uppercut VFX Pipeline
+# FrameIO Get Comments v2.1 — Uppercut VFX Pipeline
 # Fully API-driven version (no XML)
 # Author: John Geehreng
-# Updated: 2025-11-25
+# Updated: 2026-10-19
 
 import flame
+import os
+import re
+import json
 import math
-import requests
-# import re
-# import os
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from lib.frame_io_api import (
     validate_config,
     get_fio_projects,
@@ -17,10 +19,16 @@ from lib.frame_io_api import (
 )
 
 SCRIPT_NAME = 'FrameIO Get Comments'
-VERSION = 'v2.0.2'
+VERSION = 'v2.1.0'
 
 DEBUG = False
 
+# Author names and the last sync time of each FrameIO file, kept between sessions
+COMMENT_SYNC_CACHE_PATH = os.path.expanduser("~/flame/python/frame_io/comment_sync_cache.json")
+
+# Number of FrameIO requests run at the same time
+MAX_WORKERS = 8
+
 def log(msg):
     print(f"[{SCRIPT_NAME}] {msg}")
 
@@ -34,80 +42,192 @@ def safe_colour_label(obj):
     except Exception:
         obj.colour = (0.1137, 0.2627, 0.1764)
 
+def cfg_val(cfg, *keys, default=None):
+    """
+    Safely pull a value from cfg, whether it's:
+      - an object with attributes (cfg.account_id), or
+      - a dict, possibly nested (cfg["frame_io"]["account_id"])
+    """
 
-# --- Main Class ---
-class frame_io_get_comments(object):
-
-    def __init__(self, selection):
-        # Load system-wide config
-        self.cfg = validate_config()
-
-        # Determine frame rate from first relevant item
-        self.frame_rate = self.get_frame_rate(selection)
-
-        # Get current Flame project name (exact match mode)
-        self.project_name = flame.projects.current_project.nickname
-        log(f"Starting FrameIO Comment Sync for project '{self.project_name}'")
-
-        # Resolve FrameIO project
-        self.root_asset_id, self.project_id = get_fio_projects(self.cfg, self.project_name)
-
-        # Process comments
-        self.get_comments(selection)
-
-    def get_frame_rate(self, selection):
-        for item in selection:
-            fr = None
-            if isinstance(item, flame.PySegment):
-                fr = item.parent.parent.parent.frame_rate
-            elif isinstance(item, flame.PyClip):
-                fr = item.frame_rate
-            if fr:
-                try:
-                    return math.ceil(float(str(fr).split(" ")[0]))
-                except:
-                    return 24
-        return 24
-
-    # ----------------------
-    # Config helper — works for dict OR object, nested or flat
-    # ----------------------
-
-    def _cfg_val(self, *keys, default=None):
-        """
-        Safely pull a value from self.cfg, whether it's:
-          - an object with attributes (cfg.account_id), or
-          - a dict, possibly nested (cfg["frame_io"]["account_id"])
-        """
-        cfg = self.cfg
-
-        # Object-style attributes
-        if not isinstance(cfg, dict):
-            for k in keys:
-                if hasattr(cfg, k):
-                    return getattr(cfg, k)
-            return default
-
-        # Top-level dict keys
+    # Object-style attributes
+    if not isinstance(cfg, dict):
         for k in keys:
-            if k in cfg:
-                return cfg[k]
+            if hasattr(cfg, k):
+                return getattr(cfg, k)
+        return default
 
-        # Common nested keys
-        for container_key in ("frame_io", "frameio", "frame_io_settings", "frameio_config"):
-            sub = cfg.get(container_key)
-            if isinstance(sub, dict):
-                for k in keys:
-                    if k in sub:
-                        return sub[k]
+    # Top-level dict keys
+    for k in keys:
+        if k in cfg:
+            return cfg[k]
 
-        return default
+    # Common nested keys
+    for container_key in ("frame_io", "frameio", "frame_io_settings", "frameio_config"):
+        sub = cfg.get(container_key)
+        if isinstance(sub, dict):
+            for k in keys:
+                if k in sub:
+                    return sub[k]
 
-    # ----------------------
-    # Author Resolution Logic
-    # ----------------------
+    return default
 
-    def resolve_author(self, info, author_cache):
+def parse_time(value):
+    """Parse a FrameIO ISO 8601 time string. Returns an aware datetime, or None."""
+    if not value:
+        return None
+    value = str(value).replace("Z", "+00:00")
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        # Older Pythons only read 3 or 6 digit fractions
+        try:
+            parsed = datetime.fromisoformat(re.sub(r"\.\d+", "", value))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+def comment_time(info):
+    """Newest created/updated time of a comment and its replies, or None if it has none."""
+    newest = None
+    for c in [info] + list(info.get("replies") or []):
+        for key in ("created_at", "updated_at"):
+            t = parse_time(c.get(key))
+            if t and (newest is None or t > newest):
+                newest = t
+    return newest
+
+
+# ----------------------
+# Comment Sync
+# ----------------------
+
+class CommentSyncCache(object):
+    """
+    Author names and per-file last sync times, saved to COMMENT_SYNC_CACHE_PATH.
+
+    authors: "guest:<review_link_id>:<anonymous_user_id>", "owner:<owner_id>" or
+             "comment:<comment_id>" -> author name
+    files:   FrameIO file id -> newest comment time seen at its last sync (ISO 8601)
+    """
+
+    def __init__(self, path=COMMENT_SYNC_CACHE_PATH):
+        self.path = path
+        self.authors = {}
+        self.files = {}
+        self.changed = False
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            self.authors = dict(data.get("authors") or {})
+            self.files = dict(data.get("files") or {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            log(f"WARNING: Could not read comment sync cache '{path}', starting a new one: {e}")
+
+    def set_author(self, key, name):
+        if name and self.authors.get(key) != name:
+            self.authors[key] = name
+            self.changed = True
+
+    def set_last_sync(self, file_id, synced_at):
+        value = synced_at.isoformat()
+        if self.files.get(file_id) != value:
+            self.files[file_id] = value
+            self.changed = True
+
+    def last_sync(self, file_id):
+        return parse_time(self.files.get(file_id))
+
+    def save(self):
+        if not self.changed:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"authors": self.authors, "files": self.files}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self.changed = False
+        except OSError as e:
+            log(f"WARNING: Could not save comment sync cache '{self.path}': {e}")
+
+
+class CommentSyncEngine(object):
+    """
+    Fetch the comments of many FrameIO files at once.
+
+    - Comments for all files are listed concurrently.
+    - Comments that are not newer than a file's last sync are dropped, unless full_sync is set.
+    - Authors missing from the cache are looked up concurrently, in batches: each review link's
+      guest list and each reply's owner is only requested once.
+    - Author names and the newest comment time of each file are saved to the cache.
+
+    Only makes FrameIO requests, no Flame API calls, so the worker threads never touch Flame.
+    """
+
+    def __init__(self, cfg, cache, full_sync=False, max_workers=MAX_WORKERS):
+        self.cfg = cfg
+        self.cache = cache
+        self.full_sync = full_sync
+        self.max_workers = max_workers
+        self.failed = {}
+
+    def sync(self, file_ids):
+        """Returns {file_id: [comments]} with only the comments new since each file's last sync."""
+
+        file_ids = list(dict.fromkeys(f for f in file_ids if f))
+        if not file_ids:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            # Comments for every file
+            results = dict(zip(file_ids, executor.map(self._fetch_comments, file_ids)))
+
+            comments_by_file = {}
+            for file_id, result in results.items():
+                if isinstance(result, Exception):
+                    self.failed[file_id] = result
+                    log(f"WARNING: Failed to get comments for file {file_id}: {result}")
+                    continue
+                comments_by_file[file_id] = self._new_comments(file_id, result)
+
+            comments = [c for file_comments in comments_by_file.values() for c in file_comments]
+            self._remember_owners(comments)
+
+            # Review link guest lists, once per review link
+            review_links = {
+                c.get("review_link_id")
+                for c in self._with_replies(comments)
+                if c.get("anonymous_user_id") and c.get("review_link_id")
+                and f"guest:{c['review_link_id']}:{c['anonymous_user_id']}" not in self.cache.authors
+            }
+            if review_links and self._guest_lookup_settings():
+                debug(f"Looking up guests of {len(review_links)} review link(s)")
+                for rl_id, guests in zip(review_links, executor.map(self._fetch_guest_users, review_links)):
+                    for u in guests:
+                        self.cache.set_author(f"guest:{rl_id}:{u.get('id')}", u.get("name") or u.get("email") or "Unknown")
+
+            # Reply owners, once per reply
+            comment_ids = list(dict.fromkeys(info.get("id") for info in self._unresolved(comments) if info.get("id")))
+            if comment_ids:
+                debug(f"Looking up owners of {len(comment_ids)} comment(s)")
+                for comment_id, owner in zip(comment_ids, executor.map(self._fetch_comment_owner, comment_ids)):
+                    owner = owner or {}
+                    name = owner.get("name") or owner.get("email")
+                    self.cache.set_author(f"comment:{comment_id}", name)
+                    if owner.get("id"):
+                        self.cache.set_author(f"owner:{owner['id']}", name)
+
+        self.cache.save()
+        return comments_by_file
+
+    def author(self, info):
+        """Author of a comment or reply, from the comment itself or the cache. None if unknown."""
 
         # 1) Direct anonymous_user payload
         anon = info.get("anonymous_user")
@@ -116,40 +236,13 @@ class frame_io_get_comments(object):
             if name:
                 return name
 
+        # 2) Review-link guest users
         anon_id = info.get("anonymous_user_id")
         rl_id = info.get("review_link_id")
-
-        # 2) Review-link guest users (only if we can safely read cfg)
         if anon_id and rl_id:
-            cache_key = f"{rl_id}:{anon_id}"
-            if cache_key in author_cache:
-                return author_cache[cache_key]
-
-            account_id = self._cfg_val("account_id")
-            headers = self._cfg_val("headers")
-            session = self._cfg_val("session")
-
-            # If any critical piece is missing, skip this lookup gracefully
-            if account_id and headers and session:
-                url = (
-                    f"https://api.frame.io/v2/accounts/"
-                    f"{account_id}/review-links/{rl_id}/guest-users"
-                )
-
-                try:
-                    resp = session.get(url, headers=headers)
-                    if resp.status_code == 200:
-                        for u in resp.json():
-                            if u.get("id") == anon_id:
-                                name = u.get("name") or u.get("email") or "Unknown"
-                                author_cache[cache_key] = name
-                                return name
-                    else:
-                        if DEBUG:
-                            print(f"[{SCRIPT_NAME} DEBUG] Guest lookup {rl_id}/{anon_id} returned {resp.status_code}")
-                except Exception as e:
-                    if DEBUG:
-                        print(f"[{SCRIPT_NAME} DEBUG] Guest lookup failed: {e}")
+            name = self.cache.authors.get(f"guest:{rl_id}:{anon_id}")
+            if name:
+                return name
 
         # 3) Standard fields
         user = info.get("user") or {}
@@ -169,23 +262,130 @@ class frame_io_get_comments(object):
 
         # 4) V4 quirk: nested `replies` come back with no owner/user/creator
         # field at all (Frame.io's schema only embeds `owner` on the
-        # top-level comment, not on replies). Fall back to a per-reply
-        # lookup via the single "show comment" endpoint, which does return
-        # an owner. Cache by comment id to avoid repeat lookups.
+        # top-level comment, not on replies). Use the owner of another
+        # comment with the same owner id, or the reply's own lookup via the
+        # single "show comment" endpoint.
+        owner_id = info.get("owner_id")
+        if owner_id and f"owner:{owner_id}" in self.cache.authors:
+            return self.cache.authors[f"owner:{owner_id}"]
+
         comment_id = info.get("id")
         if comment_id:
-            cache_key = f"comment:{comment_id}"
-            if cache_key in author_cache:
-                return author_cache[cache_key]
+            return self.cache.authors.get(f"comment:{comment_id}")
 
-            fetched_owner = get_comment_owner(self.cfg, comment_id) or {}
-            name = fetched_owner.get("name") or fetched_owner.get("email")
-            if name:
-                author_cache[cache_key] = name
-                return name
+        return None
 
-        return "Unknown"
+    # ----------------------
+    # Internal
+    # ----------------------
+
+    def _fetch_comments(self, file_id):
+        try:
+            return get_asset_comments(self.cfg, file_id)
+        except Exception as e:
+            return e
+
+    def _new_comments(self, file_id, comments):
+        """Drop comments that are not newer than the file's last sync and save the newest time."""
+
+        newest = last_sync = self.cache.last_sync(file_id)
+        new_comments = []
+        for info in comments:
+            t = comment_time(info)
+            if t and (newest is None or t > newest):
+                newest = t
+            # Comments without a time are always kept, existing markers are skipped later
+            if self.full_sync or last_sync is None or t is None or t > last_sync:
+                new_comments.append(info)
+
+        if newest:
+            self.cache.set_last_sync(file_id, newest)
+
+        debug(f"{len(new_comments)} of {len(comments)} comment(s) new since last sync for file {file_id}")
+        return new_comments
+
+    def _remember_owners(self, comments):
+        """Cache owner names of top-level comments so replies by the same owner need no lookup."""
+        for info in comments:
+            owner = info.get("owner") or {}
+            if owner.get("id"):
+                self.cache.set_author(f"owner:{owner['id']}", owner.get("name") or owner.get("email"))
+
+    def _with_replies(self, comments):
+        """Comments and their replies that have text."""
+        for info in comments:
+            for c in [info] + list(info.get("replies") or []):
+                if (c.get("text") or "").strip():
+                    yield c
+
+    def _unresolved(self, comments):
+        return [c for c in self._with_replies(comments) if self.author(c) is None]
+
+    def _guest_lookup_settings(self):
+        account_id = cfg_val(self.cfg, "account_id")
+        headers = cfg_val(self.cfg, "headers")
+        session = cfg_val(self.cfg, "session")
+
+        # If any critical piece is missing, skip guest lookups gracefully
+        if account_id and headers and session:
+            return account_id, headers, session
+        return None
+
+    def _fetch_guest_users(self, rl_id):
+        account_id, headers, session = self._guest_lookup_settings()
+        url = (
+            f"https://api.frame.io/v2/accounts/"
+            f"{account_id}/review-links/{rl_id}/guest-users"
+        )
 
+        try:
+            resp = session.get(url, headers=headers)
+            if resp.status_code == 200:
+                return resp.json()
+            debug(f"Guest lookup {rl_id} returned {resp.status_code}")
+        except Exception as e:
+            debug(f"Guest lookup failed: {e}")
+        return []
+
+    def _fetch_comment_owner(self, comment_id):
+        return get_comment_owner(self.cfg, comment_id)
+
+
+# --- Main Class ---
+class frame_io_get_comments(object):
+
+    def __init__(self, selection, full_sync=False):
+        # Load system-wide config
+        self.cfg = validate_config()
+
+        # Determine frame rate from first relevant item
+        self.frame_rate = self.get_frame_rate(selection)
+
+        # Get current Flame project name (exact match mode)
+        self.project_name = flame.projects.current_project.nickname
+        log(f"Starting FrameIO Comment Sync for project '{self.project_name}'")
+
+        # Resolve FrameIO project
+        self.root_asset_id, self.project_id = get_fio_projects(self.cfg, self.project_name)
+
+        self.sync_engine = CommentSyncEngine(self.cfg, CommentSyncCache(), full_sync=full_sync)
+
+        # Process comments
+        self.get_comments(selection)
+
+    def get_frame_rate(self, selection):
+        for item in selection:
+            fr = None
+            if isinstance(item, flame.PySegment):
+                fr = item.parent.parent.parent.frame_rate
+            elif isinstance(item, flame.PyClip):
+                fr = item.frame_rate
+            if fr:
+                try:
+                    return math.ceil(float(str(fr).split(" ")[0]))
+                except:
+                    return 24
+        return 24
 
     # ----------------------
     # Main Comment Logic
@@ -195,9 +395,10 @@ class frame_io_get_comments(object):
 
         fps = float(self.frame_rate)
         total_markers = 0
-        comment_cache = {}
         total_items = 0
 
+        # Read names from Flame first, then fetch everything from FrameIO in one go
+        items = []
         for item in selection:
 
             # Identify whether clip or segment
@@ -212,22 +413,33 @@ class frame_io_get_comments(object):
             else:
                 continue
 
-            # Fetch FrameIO asset comments
-            if base_name in comment_cache:
-                comments = comment_cache[base_name]
-            else:
-                _, _, _, file_id = find_fio_asset(self.cfg, self.project_id, base_name)
-                comments = get_asset_comments(self.cfg, file_id) if file_id else []
-                comment_cache[base_name] = comments
+            items.append((item, sequence_obj, is_segment, base_name))
+
+        # Find FrameIO files, once per name (the project index is built on the first search)
+        file_ids = {}
+        for _, _, _, base_name in items:
+            if base_name not in file_ids:
+                _, _, _, file_ids[base_name] = find_fio_asset(self.cfg, self.project_id, base_name)
+
+        comments_by_file = self.sync_engine.sync(file_ids.values())
+
+        for item, sequence_obj, is_segment, base_name in items:
 
+            file_id = file_ids[base_name]
+            if not file_id:
+                log(f"No FrameIO asset found for '{base_name}'")
+                continue
+            if file_id in self.sync_engine.failed:
+                continue
+
+            comments = comments_by_file.get(file_id) or []
             if not comments:
-                log(f"No comments found for '{base_name}'")
+                log(f"No new comments found for '{base_name}'")
                 continue
 
             total_items += 1
             markers_for_item = 0
             combined_texts = []
-            author_cache = {}
 
             for info in comments:
                 # V4's list endpoint only returns top-level comments; replies
@@ -238,7 +450,7 @@ class frame_io_get_comments(object):
                     continue
 
                 # Author for top-level comment
-                author = self.resolve_author(info, author_cache)
+                author = self.sync_engine.author(info) or "Unknown"
                 if author == "Unknown":
                     log(
                         f"NOTE: Could not resolve author for a comment on '{base_name}' — "
@@ -257,15 +469,11 @@ class frame_io_get_comments(object):
                 replies = info.get('replies') or []
                 reply_pairs = []
                 for r in replies:
-                    # print("\n=== RAW REPLY JSON ===")
-                    # print(r)
-                    # print("=== END RAW REPLY ===\n")
-
                     r_text = (r.get("text") or "").strip()
                     if not r_text:
                         continue
 
-                    r_author = self.resolve_author(r, author_cache)
+                    r_author = self.sync_engine.author(r) or "Unknown"
                     if r_author == "Unknown":
                         log(
                             f"NOTE: Could not resolve reply author for a reply on '{base_name}' — "
@@ -321,13 +529,21 @@ class frame_io_get_comments(object):
 
         log(f"Done. Total markers added: {total_markers}.")
 
+        message = f"Added {total_markers} marker(s) across {total_items} item(s)."
+        if self.sync_engine.failed:
+            message += f"\n\nComments could not be fetched for {len(self.sync_engine.failed)} FrameIO file(s). See the console for details."
+
         flame.messages.show_in_dialog(
             title=f"{SCRIPT_NAME}: Done",
-            message=f"Added {total_markers} marker(s) across {total_items} item(s).",
+            message=message,
             type="info",
             buttons=["Ok"]
         )
 
+def frame_io_get_all_comments(selection):
+    """Get Comments, ignoring the last sync time of each file."""
+    frame_io_get_comments(selection, full_sync=True)
+
 
 # ---------------
 # Flame Menus
@@ -346,9 +562,16 @@ def get_timeline_custom_ui_actions():
             'name': 'Get Comments',
             'order': 0,
             'isVisible': scope_segment,
-            'separator': 'below',
             'execute': frame_io_get_comments,
             'minimumVersion': '2023.2'
+        },
+        {
+            'name': 'Get All Comments',
+            'order': 0,
+            'isVisible': scope_segment,
+            'separator': 'below',
+            'execute': frame_io_get_all_comments,
+            'minimumVersion': '2023.2'
         }]
     }]
 
@@ -362,5 +585,12 @@ def get_media_panel_custom_ui_actions():
             'separator': 'above',
             'execute': frame_io_get_comments,
             'minimumVersion': '2023.2'
+        },
+        {
+            'name': 'Get All Comments',
+            'order': 2,
+            'isVisible': scope_clip,
+            'execute': frame_io_get_all_comments,
+            'minimumVersion': '2023.2'
         }]
     }]
@@ -19,10 +19,10 @@
 
 """
 PyFlame Library
-Version: 5.5.0
+Version: 5.5.1
 Written By: Michael Vaglienty
 Creation Date: 10.31.20
-Update Date: 07.22.26
+Update Date: 10.19.26
 
 Minimum Flame 2025.1
 
@@ -28655,6 +28655,11 @@ class PyFlameProgressWindow:
             Enable message bar at bottom of window.
             (Default: `False`)
 
+        `cancel_connect` (Callable | None):
+            Function to call when the Cancel button is clicked. If `None`, no Cancel button is shown.
+            The Cancel button is disabled when `tasks_completed` is called.
+            (Default: `None`)
+
     Properties
     ----------
         `text` (str):
@@ -28763,6 +28768,7 @@ class PyFlameProgressWindow:
                  title_align: Align | None=None,
                  line_color: Color=Color.BLUE,
                  message_bar: bool=False,
+                 cancel_connect: Callable | None=None,
                  ) -> None:
 
         # Validate Parent
@@ -28770,6 +28776,8 @@ class PyFlameProgressWindow:
             pyflame.raise_type_error('PyFlameProgressWindow', 'parent', 'PyFlameWindow | None', parent)
         if not isinstance(task_progress_message, str):
             pyflame.raise_type_error('PyFlameProgressWindow', 'task_progress_message', 'str', parent)
+        if cancel_connect is not None and not callable(cancel_connect):
+            pyflame.raise_type_error('PyFlameProgressWindow', 'cancel_connect', 'Callable | None', cancel_connect)
 
         print(
             f'{TextColor.BLUE.value}' + # Set text color
@@ -28806,12 +28814,22 @@ class PyFlameProgressWindow:
             enabled=False,
             )
 
+        self.cancel_button = PyFlameButton(
+            text='Cancel',
+            connect=cancel_connect,
+            enabled=cancel_connect is not None,
+            )
+
         #-------------------------------------
         # [Window Layout]
         #-------------------------------------
 
         self.progress_window.grid_layout.addWidget(self.text_edit, 0, 0, 6, 4)
         self.progress_window.grid_layout.addWidget(self.progress_bar, 6, 0, 1, 4)
+        if cancel_connect is not None:
+            self.progress_window.grid_layout.addWidget(self.cancel_button, 8, 2)
+        else:
+            self.cancel_button.hide()
         self.progress_window.grid_layout.addWidget(self.done_button, 8, 3)
 
         #-------------------------------------
@@ -29414,5 +29432,8 @@ class PyFlameProgressWindow:
         if text_append:
             self.text_append(text_append)
 
+        # Nothing left to cancel
+        self.cancel_button.enabled = False
+
         if done_button_enabled:
             self.enable_done_button()
@@ -20,11 +20,11 @@
 
 """
 Script Name: Logik Portal
-Script Version: 7.2.1
+Script Version: 7.3.0
 Flame Version: 2025.1
 Written by: Michael Vaglienty
 Creation Date: 10.31.20
-Update Date: 08.05.26
+Update Date: 10.19.26
 
 Script Type: Flame Main Menu
 
@@ -49,6 +49,11 @@ To install:
 
 Updates:
 
+    v7.3.0 10.19.26
+        - Matchbox and Pixel Expression collections now download and install in the background with a progress window and Cancel button.
+        - Collection zips are extracted while downloading instead of after. Existing collection is only replaced once the new one is fully extracted.
+        - Updated to PyFlameLib v5.5.1.
+
     v7.2.1 08.05.26
         - Fixed - python compatibility issues with python 3.11.
 
@@ -258,8 +263,12 @@ import re
 import html
 import json
 import time
+import shlex
 import shutil
+import struct
 import zipfile
+import zlib
+import threading
 import urllib.request
 import subprocess
 import webbrowser
@@ -267,6 +276,7 @@ import ast
 import sys
 
 import flame
+from PySide6 import QtCore
 from lib.pyflame_lib_logik_portal import *
 
 # ==============================================================================
@@ -274,9 +284,504 @@ from lib.pyflame_lib_logik_portal import *
 # ==============================================================================
 
 SCRIPT_NAME = 'Logik Portal'
-SCRIPT_VERSION = 'v7.2.1'
+SCRIPT_VERSION = 'v7.3.0'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
+# ==============================================================================
+# [Collection Installer]
+# ==============================================================================
+
+class ZipStreamError(Exception):
+    """
+    Raised when a zip entry can not be extracted while the zip is still downloading.
+    """
+
+class ZipStreamReader:
+    """
+    Zip Stream Reader
+    =================
+
+    Read zip entries from a forward-only stream, such as an HTTP response, using the local
+    file headers. Lets entries be extracted while the rest of the zip is still downloading.
+
+    Stored and deflated entries are supported. Entries written with a data descriptor
+    (sizes unknown in the local header) are only supported when deflated, as the end of a
+    stored entry can not be found without the central directory. Unsupported entries raise
+    `ZipStreamError`.
+
+    Args
+    ----
+        `read` (Callable[[int], bytes]):
+            Function that returns up to n bytes from the stream and b'' at the end of the stream.
+    """
+
+    LOCAL_HEADER = b'PK\x03\x04'
+    DATA_DESCRIPTOR = b'PK\x07\x08'
+    END_SIGNATURES = (b'PK\x01\x02', b'PK\x05\x06', b'PK\x06\x06', b'PK\x06\x07')
+    READ_SIZE = 64 * 1024
+
+    def __init__(self, read: Callable[[int], bytes]) -> None:
+
+        self._read = read
+        self._buffer = bytearray()
+
+    def entries(self):
+        """
+        Entries
+        =======
+
+        Iterate over the zip entries.
+
+        Yields
+        ------
+            tuple[str, Iterator[bytes] | None]:
+                Entry name and an iterator of uncompressed data chunks. Directory entries yield `None`.
+                The data iterator must be fully consumed before moving to the next entry.
+        """
+
+        while True:
+            signature = self._read_exact(4, allow_eof=True)
+            if not signature or signature in self.END_SIGNATURES:
+                return
+            if signature != self.LOCAL_HEADER:
+                raise ZipStreamError(f'Unexpected zip signature: {signature!r}')
+
+            header = self._read_exact(26)
+            flags, method = struct.unpack('<HH', header[2:6])
+            crc, compressed_size, uncompressed_size, name_length, extra_length = struct.unpack('<IIIHH', header[10:26])
+            name = self._read_exact(name_length).decode('utf-8' if flags & 0x800 else 'cp437')
+            extra = self._read_exact(extra_length)
+
+            if flags & 0x1:
+                raise ZipStreamError(f'Encrypted zip entries are not supported: {name}')
+            if method not in (0, 8):
+                raise ZipStreamError(f'Unsupported zip compression method {method}: {name}')
+
+            # Zip64 sizes are stored in the extra field
+            if compressed_size == 0xFFFFFFFF or uncompressed_size == 0xFFFFFFFF:
+                uncompressed_size, compressed_size = self._zip64_sizes(extra, uncompressed_size, compressed_size)
+
+            has_data_descriptor = bool(flags & 0x8)
+            if has_data_descriptor and method == 0:
+                raise ZipStreamError(f'Stored zip entry with data descriptor can not be streamed: {name}')
+
+            if name.endswith('/'):
+                data = self._entry_data(method, None if has_data_descriptor else compressed_size)
+                for _ in data:
+                    pass
+                if has_data_descriptor:
+                    self._skip_data_descriptor()
+                yield name, None
+                continue
+
+            yield name, self._checked_entry_data(name, method, crc, None if has_data_descriptor else compressed_size, has_data_descriptor)
+
+    #-------------------------------------
+    # [Internal Methods]
+    #-------------------------------------
+
+    def _checked_entry_data(self, name: str, method: int, crc: int, compressed_size: int | None, has_data_descriptor: bool):
+
+        checksum = 0
+        for chunk in self._entry_data(method, compressed_size):
+            checksum = zlib.crc32(chunk, checksum)
+            yield chunk
+
+        if has_data_descriptor:
+            crc = self._skip_data_descriptor()
+
+        if checksum != crc:
+            raise ZipStreamError(f'CRC check failed: {name}')
+
+    def _entry_data(self, method: int, compressed_size: int | None):
+
+        decompressor = zlib.decompressobj(-15) if method == 8 else None
+        remaining = compressed_size
+
+        while True:
+            if remaining is not None:
+                if remaining <= 0:
+                    break
+                chunk = self._read_some(min(self.READ_SIZE, remaining))
+                remaining -= len(chunk)
+            else:
+                chunk = self._read_some(self.READ_SIZE)
+
+            if not chunk:
+                raise ZipStreamError('Zip stream ended unexpectedly')
+
+            if decompressor is None:
+                yield chunk
+                continue
+
+            data = decompressor.decompress(chunk)
+            if data:
+                yield data
+
+            if decompressor.eof:
+                # Hand back bytes read past the end of the deflate stream
+                self._buffer[:0] = decompressor.unused_data
+                break
+
+        if decompressor is not None:
+            data = decompressor.flush()
+            if data:
+                yield data
+
+    def _skip_data_descriptor(self) -> int:
+
+        crc = self._read_exact(4)
+        if crc == self.DATA_DESCRIPTOR:
+            crc = self._read_exact(4)
+
+        # Sizes are 4 bytes each, or 8 bytes each for zip64. Zip64 descriptors are
+        # followed by the next signature 8 bytes later than standard ones.
+        sizes = self._peek(20)
+        if len(sizes) >= 12 and sizes[8:12] not in (self.LOCAL_HEADER, self.DATA_DESCRIPTOR) + self.END_SIGNATURES and sizes[16:20] in (self.LOCAL_HEADER,) + self.END_SIGNATURES:
+            self._read_exact(16)
+        else:
+            self._read_exact(8)
+
+        return struct.unpack('<I', crc)[0]
+
+    @staticmethod
+    def _zip64_sizes(extra: bytes, uncompressed_size: int, compressed_size: int) -> Tuple[int, int]:
+
+        offset = 0
+        while offset + 4 <= len(extra):
+            header_id, data_size = struct.unpack('<HH', extra[offset:offset + 4])
+            data = extra[offset + 4:offset + 4 + data_size]
+            if header_id == 0x0001:
+                values = list(struct.unpack(f'<{len(data) // 8}Q', data[:len(data) // 8 * 8]))
+                if uncompressed_size == 0xFFFFFFFF and values:
+                    uncompressed_size = values.pop(0)
+                if compressed_size == 0xFFFFFFFF and values:
+                    compressed_size = values.pop(0)
+                break
+            offset += 4 + data_size
+
+        return uncompressed_size, compressed_size
+
+    def _fill(self, size: int) -> None:
+
+        while len(self._buffer) < size:
+            chunk = self._read(max(self.READ_SIZE, size - len(self._buffer)))
+            if not chunk:
+                break
+            self._buffer += chunk
+
+    def _peek(self, size: int) -> bytes:
+
+        self._fill(size)
+        return bytes(self._buffer[:size])
+
+    def _read_some(self, size: int) -> bytes:
+
+        if not self._buffer:
+            self._fill(1)
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return chunk
+
+    def _read_exact(self, size: int, allow_eof: bool=False) -> bytes:
+
+        self._fill(size)
+        if len(self._buffer) < size:
+            if allow_eof and not self._buffer:
+                return b''
+            raise ZipStreamError('Zip stream ended unexpectedly')
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+class CollectionInstaller(QtCore.QThread):
+    """
+    Collection Installer
+    ====================
+
+    Download a Logik Portal collection zip and install it off the GUI thread.
+
+    Entries are extracted while the zip downloads into a staging folder next to the install
+    folder. Unwanted files are skipped and folders are flattened during extraction, so the
+    installed tree is never walked again afterwards. The finished staging folder replaces the
+    existing install folder with a rename, so the install folder is never left half-written.
+
+    The downloaded bytes are also written to a temp zip file. If an entry can not be
+    extracted from the stream, the rest of the zip is downloaded and extracted from that file.
+
+    If the install path is not writeable, the staging folder is created in the temp folder and
+    moved into place with sudo.
+
+    Args
+    ----
+        `url` (str):
+            Collection zip download url.
+
+        `install_path` (str):
+            Folder to install the collection into.
+
+        `folder_name` (str):
+            Name of the installed collection folder inside `install_path`.
+
+        `temp_folder` (str):
+            Temp folder for the downloaded zip.
+
+        `strip_components` (int, optional):
+            Number of leading path components to remove from each zip entry.
+            (Default: `1`)
+
+        `flatten` (bool, optional):
+            Move the contents of each top-level folder up into the install folder.
+            Name conflicts get a numeric suffix (name_1, name_2...).
+            (Default: `False`)
+
+        `skip_file_names` (tuple[str], optional):
+            File names to skip during extraction. Not case sensitive.
+            (Default: `()`)
+
+        `system_password` (str, optional):
+            System password used with sudo when the install path is not writeable.
+            (Default: `''`)
+
+    Signals
+    -------
+        `progress` (object, object):
+            Bytes downloaded and total bytes. Total is 0 if the server does not send a size.
+
+        `finished_install` (str):
+            Path of the installed collection folder.
+
+        `failed` (str):
+            Error message.
+
+        `cancelled`:
+            Emitted when the install was cancelled.
+    """
+
+    progress = QtCore.Signal(object, object)
+    finished_install = QtCore.Signal(str)
+    failed = QtCore.Signal(str)
+    cancelled = QtCore.Signal()
+
+    PROGRESS_INTERVAL = 0.2
+
+    def __init__(self,
+                 url: str,
+                 install_path: str,
+                 folder_name: str,
+                 temp_folder: str,
+                 strip_components: int=1,
+                 flatten: bool=False,
+                 skip_file_names: tuple=(),
+                 system_password: str='',
+                 ) -> None:
+        super().__init__()
+
+        self.url = url
+        self.install_path = install_path
+        self.folder_name = folder_name
+        self.temp_folder = temp_folder
+        self.strip_components = strip_components
+        self.flatten = flatten
+        self.skip_file_names = {name.upper() for name in skip_file_names}
+        self.system_password = system_password
+
+        self._cancel_event = threading.Event()
+        self._flattened_names: Dict[Tuple[str, str], str] = {}
+        self._used_names: set = set()
+        self._bytes_read = 0
+        self._total_bytes = 0
+        self._last_progress = 0.0
+
+    def cancel(self) -> None:
+        """
+        Cancel
+        ======
+
+        Stop the download. The existing install folder is left untouched.
+        """
+
+        self._cancel_event.set()
+
+    #-------------------------------------
+    # [QThread]
+    #-------------------------------------
+
+    def run(self) -> None:
+
+        use_sudo = not os.access(self.install_path, os.W_OK)
+        staging_root = self.temp_folder if use_sudo else self.install_path
+        staging_path = os.path.join(staging_root, f'.{self.folder_name}.installing')
+        temp_zip_path = os.path.join(self.temp_folder, f'{self.folder_name.lower()}_download.zip')
+
+        try:
+            self._remove_tree(staging_path)
+            os.makedirs(staging_path)
+
+            with urllib.request.urlopen(self.url, timeout=600) as response, open(temp_zip_path, 'wb') as temp_zip:
+                self._total_bytes = int(response.headers.get('Content-Length') or 0)
+
+                def read(size: int) -> bytes:
+                    if self._cancel_event.is_set():
+                        raise InterruptedError
+                    chunk = response.read(size)
+                    temp_zip.write(chunk)
+                    self._report_progress(len(chunk))
+                    return chunk
+
+                try:
+                    self._extract_stream(read, staging_path)
+                except ZipStreamError as error:
+                    # Finish the download and extract from the temp zip instead
+                    print(f'Unable to extract while downloading ({error}). Extracting from downloaded zip...')
+                    while read(ZipStreamReader.READ_SIZE):
+                        pass
+                    temp_zip.close()
+                    self._remove_tree(staging_path)
+                    os.makedirs(staging_path)
+                    self._flattened_names.clear()
+                    self._used_names.clear()
+                    self._extract_file(temp_zip_path, staging_path)
+
+            self._install(staging_path, os.path.join(self.install_path, self.folder_name), use_sudo)
+
+        except InterruptedError:
+            self._remove_tree(staging_path)
+            self.cancelled.emit()
+        except Exception as error:
+            self._remove_tree(staging_path)
+            self.failed.emit(str(error))
+        else:
+            self.finished_install.emit(os.path.join(self.install_path, self.folder_name))
+        finally:
+            if os.path.exists(temp_zip_path):
+                os.remove(temp_zip_path)
+
+    #-------------------------------------
+    # [Internal Methods]
+    #-------------------------------------
+
+    def _report_progress(self, size: int) -> None:
+
+        self._bytes_read += size
+        now = time.monotonic()
+        if now - self._last_progress >= self.PROGRESS_INTERVAL or not size:
+            self._last_progress = now
+            self.progress.emit(self._bytes_read, self._total_bytes)
+
+    def _extract_stream(self, read: Callable[[int], bytes], staging_path: str) -> None:
+
+        for name, data in ZipStreamReader(read).entries():
+            dest = self._entry_destination(name, staging_path) if data is not None else None
+            if dest is None:
+                for _ in data or ():
+                    pass
+                continue
+            with open(dest, 'wb') as out_file:
+                for chunk in data:
+                    out_file.write(chunk)
+
+    def _extract_file(self, zip_path: str, staging_path: str) -> None:
+
+        with zipfile.ZipFile(zip_path, 'r') as zip_file:
+            for info in zip_file.infolist():
+                if self._cancel_event.is_set():
+                    raise InterruptedError
+                if info.is_dir():
+                    continue
+                dest = self._entry_destination(info.filename, staging_path)
+                if dest is None:
+                    continue
+                with zip_file.open(info) as source, open(dest, 'wb') as out_file:
+                    shutil.copyfileobj(source, out_file)
+
+    def _entry_destination(self, name: str, staging_path: str) -> str | None:
+        """
+        Get the extraction path for a zip entry, or None if the entry should be skipped.
+        """
+
+        parts = [part for part in name.replace('\\', '/').split('/') if part]
+        if any(part == '..' for part in parts) or name.startswith('/'):
+            raise ZipStreamError(f'Unsafe path in zip: {name}')
+
+        parts = parts[self.strip_components:]
+        if not parts or parts[-1].upper() in self.skip_file_names:
+            return None
+
+        # Move items inside top-level folders up one level
+        if self.flatten:
+            if len(parts) == 1:
+                parts = [self._flattened_name('', parts[0])]
+            else:
+                parts = [self._flattened_name(parts[0], parts[1])] + parts[2:]
+
+        dest = os.path.join(staging_path, *parts)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+
+        return dest
+
+    def _flattened_name(self, folder: str, name: str) -> str:
+
+        key = (folder, name)
+        if key not in self._flattened_names:
+            flattened_name = name
+            base_name, extension = os.path.splitext(name)
+            counter = 1
+            while flattened_name in self._used_names:
+                flattened_name = f'{base_name}_{counter}{extension}'
+                counter += 1
+            self._flattened_names[key] = flattened_name
+            self._used_names.add(flattened_name)
+
+        return self._flattened_names[key]
+
+    def _install(self, staging_path: str, install_path: str, use_sudo: bool) -> None:
+        """
+        Replace the existing install folder with the staging folder. The existing folder is restored if the swap fails.
+        """
+
+        if use_sudo:
+            backup_path = f'{install_path}.previous'
+            command = (
+                f'rm -rf {shlex.quote(backup_path)} && '
+                f'if [ -e {shlex.quote(install_path)} ]; then mv {shlex.quote(install_path)} {shlex.quote(backup_path)}; fi && '
+                f'{{ mv {shlex.quote(staging_path)} {shlex.quote(install_path)} || '
+                f'{{ if [ -e {shlex.quote(backup_path)} ]; then mv {shlex.quote(backup_path)} {shlex.quote(install_path)}; fi; exit 1; }}; }} && '
+                f'rm -rf {shlex.quote(backup_path)}'
+                )
+            process = subprocess.Popen(
+                ['sudo', '-S', 'sh', '-c', command],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                )
+            stdout, stderr = process.communicate(input=self.system_password + '\n')
+            if process.returncode != 0:
+                raise Exception(f'Failed to install with sudo: {stderr}')
+            return
+
+        # Swap folders with renames on the same file system, then delete the old folder
+        backup_path = os.path.join(self.install_path, f'.{self.folder_name}.previous')
+        self._remove_tree(backup_path)
+        if os.path.exists(install_path):
+            os.rename(install_path, backup_path)
+        try:
+            os.rename(staging_path, install_path)
+        except OSError:
+            if os.path.exists(backup_path):
+                os.rename(backup_path, install_path)
+            raise
+        self._remove_tree(backup_path)
+
+    @staticmethod
+    def _remove_tree(path: str) -> None:
+
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.exists(path):
+            os.remove(path)
+
 # ==============================================================================
 # [Main Script]
 # ==============================================================================
@@ -329,6 +834,7 @@ class LogikPortal:
         self.installed_script_dict = {}
         self.file_description = ''
         self.batch_group: Any = None
+        self.collection_installer: CollectionInstaller | None = None
 
         # JSON Paths
         self.python_scripts_json_path = os.path.join(self.temp_folder, 'python_scripts.json')
@@ -552,6 +1058,9 @@ class LogikPortal:
 
         def close_window():
 
+            # Stop any collection install still running in the background
+            self.cancel_collection_install()
+
             # Clean up temp folder
             if os.path.exists(self.temp_folder):
                 shutil.rmtree(self.temp_folder)
@@ -1875,176 +2384,23 @@ class LogikPortal:
                 """
                 Download all pixel expressions from Logik Portal and save to the destination path.
 
+                Pixel expressions are extracted while the collection downloads.
+
                 Args
                 ----
                     system_password: System password for sudo (if needed)
                 """
 
-                def remove_folder(path: str) -> bool:
-                    """
-                    Remove Folder
-                    =============
-
-                    Remove a folder, using sudo if permission is denied.
-
-                    Args
-                    ----
-                        path (str):
-                            Path to remove
-
-                    Returns
-                    -------
-                        bool:
-                            True if folder was removed successfully, False if errors occurred
-                    """
-
-                    if not os.path.exists(str(path)):
-                        return True
-
-                    try:
-                        # Try normal removal first
-                        if os.path.isdir(str(path)):
-                            shutil.rmtree(str(path))
-                        else:
-                            os.remove(str(path))
-                        print(f'Removed: {path}')
-                        return True
-                    except PermissionError:
-                        # If permission denied, use sudo
-                        print(f'Permission denied. Attempting to remove with sudo...')
-                        try:
-                            remove_cmd = ['sudo', '-S', 'rm', '-rf', str(path)]
-                            process = subprocess.Popen(
-                                remove_cmd,
-                                stdin=subprocess.PIPE,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                text=True
-                            )
-                            stdout, stderr = process.communicate(input=system_password + '\n')
-
-                            if process.returncode != 0:
-                                raise Exception(f'Failed to remove with sudo: {stderr}')
-
-                            print(f'Removed: {path} (using sudo)')
-                            return True
-                        except Exception as e:
-                            print(f'Error removing with sudo: {e}')
-                            raise
-                    except Exception as e:
-                        print(f'Error removing: {e}')
-                        raise
-
-                def move_pixel_expressions(source: str, destination: str) -> bool:
-                    """
-                    Move Folder
-                    ===========
-
-                    Move pixel expressions folder to destination, using sudo if permission is denied.
-
-                    Args
-                    ----
-                        source: Source path to move from
-                        destination: Destination path to move to
-                    """
-
-                    try:
-                        # Try normal move first
-                        shutil.move(str(source), str(destination))
-                        print(f'Moved folder to: {destination}\n')
-                        return True
-                    except PermissionError:
-                        # If permission denied, use sudo
-                        print(f'Permission denied. Attempting to move with sudo...')
-                        try:
-                            # Move with sudo
-                            move_cmd = ['sudo', '-S', 'mv', str(source), str(destination)]
-                            process = subprocess.Popen(
-                                move_cmd,
-                                stdin=subprocess.PIPE,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                text=True
-                                )
-                            stdout, stderr = process.communicate(input=system_password + '\n')
-
-                            if process.returncode != 0:
-                                raise Exception(f'Failed to move with sudo: {stderr}')
-
-                            print(f'Moved folder to: {destination} (using sudo)\n')
-                            return True
-                        except Exception as e:
-                            print(f'Error moving with sudo: {e}')
-                            raise
-                    except Exception as e:
-                        print(f'Error moving folder: {e}')
-                        raise
-
-                # Open download progress window to download pixel expressions
-                progress_window = PyFlameProgressWindow(
+                self.install_collection(
                     title='Logik Portal: Pixel Expressions',
-                    total_tasks=2,
-                    parent=self.window,
+                    task='Downloading Pixel Expressions',
+                    url='https://logik-portal.com/download_pixel_expressions_all.php?source=app',
+                    install_path=pixel_expression_download_path,
+                    folder_name='LOGIK_PIXEL_EXPRESSIONS',
+                    temp_folder=self.temp_pixel_expression_folder,
+                    system_password=system_password,
                     )
 
-                # Initialize and display the text by setting processing_task
-                progress_window.current_task = 1
-                progress_window.text_append(f'Downloading Pixel Expressions...')
-
-                pyflame.print('Downloading Pixel Expressions...', new_line=False)
-
-                # Logik Portal Pixel Expressions Download URL
-                zip_url = 'https://logik-portal.com/download_pixel_expressions_all.php?source=app'
-
-                # Temporary download path
-                temp_download_path = os.path.join(self.temp_pixel_expression_folder, 'pixel_expressions_all.zip')
-
-                print('Temp Download Path:', temp_download_path)
-
-                # Download Pixel Expressions to temporary download path
-                with urllib.request.urlopen(zip_url, timeout=600) as resp, open(temp_download_path, 'wb') as out_file:
-                    shutil.copyfileobj(resp, out_file)
-                pyflame.print(f'Pixel Expressions Downloaded To: {temp_download_path}')
-
-                # If file didn't download, give user error message and return
-                if not os.path.exists(temp_download_path):
-                    PyFlameMessageWindow(
-                        title='Error',
-                        message='Failed to download Pixel Expressions',
-                        parent=self.window,
-                        )
-                    return
-
-                progress_window.current_task = 2
-                progress_window.text_append(f'Extracting Pixel Expressions...')
-
-                pyflame.print('Extracting Pixel Expressions...', new_line=False)
-
-                with zipfile.ZipFile(temp_download_path, 'r') as zip_ref:
-                    zip_ref.extractall(self.temp_pixel_expression_folder)
-
-                logik_folder = os.path.join(self.temp_pixel_expression_folder, 'LOGIK_PIXEL_EXPRESSIONS')
-
-                # Delete the zip file
-                os.remove(temp_download_path)
-                pyflame.print(f'Deleted zip file: {temp_download_path}')
-
-                # Logik install path
-                logik_install_path = os.path.join(pixel_expression_download_path, 'LOGIK_PIXEL_EXPRESSIONS')
-
-                # Always remove existing Logik folder in destination to ensure clean overwrite
-                if os.path.exists(pixel_expression_download_path):
-                    print(f'Removing existing Logik folder in destination: {logik_install_path}')
-                    remove_folder(logik_install_path)
-
-                pyflame.print('Moving Logik folder to destination...')
-
-                # Move the Logik folder to destination (will use sudo if needed)
-                move_pixel_expressions(logik_folder, logik_install_path)
-
-                progress_window.tasks_completed()
-                progress_window.text_append(f'Pixel Expressions Installed\n\n{logik_install_path}')
-
             # Open file browser to select pixel expression install location
             path = pyflame.file_browser(
                 title='Select Logik Pixel Expression Install Directory',
@@ -2230,309 +2586,26 @@ class LogikPortal:
                 """
                 Download Logik Matchbox Collection from Logik Portal and install it to the destination path.
 
+                Matchboxes are extracted while the collection downloads. Category folders are flattened
+                and README.md files are skipped during extraction.
+
                 Args
                 ----
                     system_password: System password for sudo (if needed)
                 """
 
-                def remove_folder(path: str) -> bool:
-                    """
-                    Remove Folder
-                    =============
-
-                    Remove a folder, using sudo if permission is denied.
-
-                    Args
-                    ----
-                        path (str):
-                            Path to remove
-
-                    Returns
-                    -------
-                        bool:
-                            True if folder was removed successfully, False if errors occurred
-                    """
-
-                    if not os.path.exists(str(path)):
-                        return True
-
-                    try:
-                        # Try normal removal first
-                        if os.path.isdir(str(path)):
-                            shutil.rmtree(str(path))
-                        else:
-                            os.remove(str(path))
-                        print(f'Removed: {path}')
-                        return True
-                    except PermissionError:
-                        # If permission denied, use sudo
-                        print(f'Permission denied. Attempting to remove with sudo...')
-                        try:
-                            remove_cmd = ['sudo', '-S', 'rm', '-rf', str(path)]
-                            process = subprocess.Popen(
-                                remove_cmd,
-                                stdin=subprocess.PIPE,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                text=True
-                            )
-                            stdout, stderr = process.communicate(input=system_password + '\n')
-
-                            if process.returncode != 0:
-                                raise Exception(f'Failed to remove with sudo: {stderr}')
-
-                            print(f'Removed: {path} (using sudo)')
-                            return True
-                        except Exception as e:
-                            print(f'Error removing with sudo: {e}')
-                            raise
-                    except Exception as e:
-                        print(f'Error removing: {e}')
-                        raise
-
-                def move_matchboxes(source: str, destination: str) -> bool:
-                    """
-                    Move Folder
-                    ===========
-
-                    Move a folder to destination, using sudo if permission is denied.
-
-                    Args
-                    ----
-                        source: Source path to move from
-                        destination: Destination path to move to
-                    """
-
-                    try:
-                        # Try normal move first
-                        shutil.move(str(source), str(destination))
-                        print(f'Moved folder to: {destination}\n')
-                        return True
-                    except PermissionError:
-                        # If permission denied, use sudo
-                        print(f'Permission denied. Attempting to move with sudo...')
-                        try:
-                            # Move with sudo
-                            move_cmd = ['sudo', '-S', 'mv', str(source), str(destination)]
-                            process = subprocess.Popen(
-                                move_cmd,
-                                stdin=subprocess.PIPE,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                text=True
-                                )
-                            stdout, stderr = process.communicate(input=system_password + '\n')
-
-                            if process.returncode != 0:
-                                raise Exception(f'Failed to move with sudo: {stderr}')
-
-                            print(f'Moved folder to: {destination} (using sudo)\n')
-                            return True
-                        except Exception as e:
-                            print(f'Error moving with sudo: {e}')
-                            raise
-                    except Exception as e:
-                        print(f'Error moving folder: {e}')
-                        raise
-
-                def flatten_directory(root_path: str) -> bool:
-                    """
-                    Flatten Directory
-                    =================
-
-                    Move all files and folders from top-level directories to the root path,
-                    then delete the empty directories. Also deletes any README.md files encountered.
-
-                    Args
-                    ----
-                        root_path (str):
-                            The root directory path to flatten
-
-                    Returns
-                    -------
-                        bool:
-                            True if successful, False if errors occurred
-                    """
-
-                    def delete_readme_files(path: str) -> None:
-                        """
-                        Recursively delete all README.md files in a directory.
-
-                        Args
-                        ----
-                            path (str):
-                                Path to search for README.md files
-                        """
-                        if os.path.isdir(path):
-                            for root_dir, dirs, files in os.walk(path):
-                                for file in files:
-                                    if file.upper() == 'README.MD':
-                                        try:
-                                            file_path = os.path.join(root_dir, file)
-                                            os.unlink(file_path)
-                                        except Exception:
-                                            pass
-                        elif os.path.isfile(path) and os.path.basename(path).upper() == 'README.MD':
-                            try:
-                                os.unlink(path)
-                            except Exception:
-                                pass
-
-                    if not os.path.exists(root_path):
-                        return False
-
-                    if not os.path.isdir(root_path):
-                        return False
-
-                    # Delete any README.md files in the root directory first
-                    try:
-                        for item in os.listdir(root_path):
-                            item_path = os.path.join(root_path, item)
-                            if os.path.isfile(item_path) and item.upper() == 'README.MD':
-                                try:
-                                    os.unlink(item_path)
-                                except Exception:
-                                    pass
-                    except Exception:
-                        pass
-
-                    # Get all top-level items
-                    try:
-                        top_level_items = [os.path.join(root_path, item) for item in os.listdir(root_path)]
-                    except Exception:
-                        return False
-
-                    # Filter to only directories
-                    top_level_dirs = [item for item in top_level_items if os.path.isdir(item)]
-
-                    if not top_level_dirs:
-                        return True
-
-                    # Process each directory
-                    for dir_path in top_level_dirs:
-                        # Get all contents of this directory
-                        try:
-                            contents = [os.path.join(dir_path, item) for item in os.listdir(dir_path)]
-                        except Exception:
-                            continue
-
-                        if not contents:
-                            try:
-                                os.rmdir(dir_path)
-                            except Exception:
-                                pass
-                            continue
-
-                        # Move each item to root (or delete if README.md)
-                        for item in contents:
-                            item_name = os.path.basename(item)
-
-                            # Delete README.md files instead of moving them
-                            if os.path.isfile(item) and item_name.upper() == 'README.MD':
-                                try:
-                                    os.unlink(item)
-                                except Exception:
-                                    pass
-                                continue
-
-                            # If it's a directory, delete any README.md files inside it first
-                            if os.path.isdir(item):
-                                delete_readme_files(item)
-
-                            dest_path = os.path.join(root_path, item_name)
-
-                            # Handle naming conflicts
-                            if os.path.exists(dest_path):
-                                counter = 1
-                                base_name, extension = os.path.splitext(item_name)
-                                while os.path.exists(dest_path):
-                                    new_name = f'{base_name}_{counter}{extension}'
-                                    dest_path = os.path.join(root_path, new_name)
-                                    counter += 1
-
-                            try:
-                                shutil.move(item, dest_path)
-                            except Exception:
-                                pass
-
-                        # Delete the now-empty directory
-                        try:
-                            os.rmdir(dir_path)
-                        except Exception:
-                            pass
-
-                    return True
-
-                # Open download progress window to download matchbox collection
-                progress_window = PyFlameProgressWindow(
+                self.install_collection(
                     title='Logik Portal: Matchbox',
-                    total_tasks=2,
-                    parent=self.window,
+                    task='Downloading Matchbox Collection',
+                    url='https://logik-portal.com/download_matchbox_all.php?source=app',
+                    install_path=matchbox_install_path,
+                    folder_name='LOGIK',
+                    temp_folder=self.temp_matchbox_folder,
+                    flatten=True,
+                    skip_file_names=('README.MD',),
+                    system_password=system_password,
                     )
 
-                # Initialize and display the text by setting processing_task
-                progress_window.current_task = 1
-                progress_window.text_append(f'Downloading Matchbox Collection...')
-
-                pyflame.print('Downloading Matchbox Collection...', new_line=False)
-
-                # Logik Portal Matchbox Collection Download URL
-                zip_url = 'https://logik-portal.com/download_matchbox_all.php?source=app'
-
-                # Temporary download path
-                temp_download_path = os.path.join(self.temp_matchbox_folder, 'matchbox_all.zip')
-
-                # Download Matchbox Collection to temporary download path
-                with urllib.request.urlopen(zip_url, timeout=600) as resp, open(temp_download_path, 'wb') as out_file:
-                    shutil.copyfileobj(resp, out_file)
-                pyflame.print(f'Matchbox Collection Downloaded To: {temp_download_path}')
-
-                # If file didn't download, give user error message and return
-                if not os.path.exists(temp_download_path):
-                    PyFlameMessageWindow(
-                        title='Error',
-                        message='Failed to download Matchbox Collection',
-                        parent=self.window,
-                        )
-                    return
-
-                progress_window.current_task = 2
-                progress_window.text_append(f'Extracting Matchbox Collection...')
-
-                pyflame.print('Extracting Matchbox Collection...', new_line=False)
-
-                with zipfile.ZipFile(temp_download_path, 'r') as zip_ref:
-                    zip_ref.extractall(self.temp_matchbox_folder)
-
-                extracted_folder = os.path.join(self.temp_matchbox_folder, 'matchbox-main')
-                logik_folder = os.path.join(self.temp_matchbox_folder, 'LOGIK')
-
-                # Rename extracted folder to Logik
-                os.rename(extracted_folder, logik_folder)
-                pyflame.print('Matchbox Extraction Complete')
-
-                # Delete the zip file
-                os.remove(temp_download_path)
-                pyflame.print(f'Deleted zip file: {temp_download_path}')
-
-                # Logik install path
-                logik_install_path = os.path.join(matchbox_install_path, 'LOGIK')
-
-                # Always remove existing Logik folder in destination to ensure clean overwrite
-                if os.path.exists(matchbox_install_path):
-                    print(f'Removing existing Logik folder in destination: {logik_install_path}')
-                    remove_folder(logik_install_path)
-
-                pyflame.print('Moving Logik folder to destination...')
-                # Move the Logik folder to destination (will use sudo if needed)
-                move_matchboxes(logik_folder, logik_install_path)
-
-                # Flatten the Logik folders and clean up
-                flatten_directory(logik_install_path)
-
-                progress_window.tasks_completed()
-                progress_window.text_append(f'Matchbox Collection Installed')
-
             # Open file browser to select matchbox install location
             path = pyflame.file_browser(
                 title='Select Logik Matchbox Install Directory',
@@ -3556,6 +3629,124 @@ class LogikPortal:
     # [Common]
     # ==============================================================================
 
+    def install_collection(self,
+                           title: str,
+                           task: str,
+                           url: str,
+                           install_path: str,
+                           folder_name: str,
+                           temp_folder: str,
+                           flatten: bool=False,
+                           skip_file_names: tuple=(),
+                           system_password: str='',
+                           ) -> None:
+        """
+        Install Collection
+        ==================
+
+        Download and install a collection zip in the background using `CollectionInstaller`.
+
+        Progress is shown in a progress window with a Cancel button. The Portal can still be used
+        while the collection installs.
+
+        Args
+        ----
+            title (str):
+                Progress window title.
+
+            task (str):
+                Task text shown in the progress window.
+
+            url (str):
+                Collection zip download url.
+
+            install_path (str):
+                Folder to install the collection into.
+
+            folder_name (str):
+                Name of the installed collection folder.
+
+            temp_folder (str):
+                Temp folder for the downloaded zip.
+
+            flatten (bool):
+                Move the contents of each top-level folder up into the collection folder.
+
+            skip_file_names (tuple):
+                File names to skip during extraction.
+
+            system_password (str):
+                System password for sudo (if needed)
+        """
+
+        def update_progress(bytes_read: int, total_bytes: int) -> None:
+
+            megabytes_read = bytes_read // 1048576
+            progress_window.total_tasks = max(1, total_bytes // 1048576, megabytes_read)
+            progress_window.current_task = megabytes_read
+
+        def install_finished(collection_path: str) -> None:
+
+            pyflame.print(f'{task.replace("Downloading ", "")} Installed: {collection_path}', text_color=TextColor.GREEN)
+            progress_window.tasks_completed(text_append=f'Installed\n\n{collection_path}')
+
+        def install_failed(error: str) -> None:
+
+            pyflame.print(f'Install failed: {error}', print_type=PrintType.ERROR)
+            progress_window.tasks_completed(task_progress_message=f'Install failed\n\n{error}')
+
+        def install_cancelled() -> None:
+
+            pyflame.print('Install cancelled.', print_type=PrintType.WARNING)
+            progress_window.tasks_completed(task_progress_message='Install cancelled. Existing files were not changed.')
+
+        if self.collection_installer and self.collection_installer.isRunning():
+            PyFlameMessageWindow(
+                message='A collection is already being installed.\n\nWait for it to finish or cancel it first.',
+                message_type=MessageType.WARNING,
+                parent=self.window,
+                )
+            return
+
+        pyflame.print(f'{task}...')
+
+        self.collection_installer = CollectionInstaller(
+            url=url,
+            install_path=install_path,
+            folder_name=folder_name,
+            temp_folder=temp_folder,
+            flatten=flatten,
+            skip_file_names=skip_file_names,
+            system_password=system_password,
+            )
+
+        progress_window = PyFlameProgressWindow(
+            title=title,
+            task=task,
+            total_tasks=1,
+            task_progress_message='{task}: [{processing_task} of {total_tasks} MB] ({progress:.1f}%)',
+            parent=self.window,
+            cancel_connect=self.collection_installer.cancel,
+            )
+
+        self.collection_installer.progress.connect(update_progress)
+        self.collection_installer.finished_install.connect(install_finished)
+        self.collection_installer.failed.connect(install_failed)
+        self.collection_installer.cancelled.connect(install_cancelled)
+        self.collection_installer.start()
+
+    def cancel_collection_install(self) -> None:
+        """
+        Cancel Collection Install
+        =========================
+
+        Cancel a running collection install and wait for the install thread to clean up.
+        """
+
+        if self.collection_installer and self.collection_installer.isRunning():
+            self.collection_installer.cancel()
+            self.collection_installer.wait()
+
     def get_json_description(
         self,
         label,
@@ -3753,6 +3944,9 @@ class LogikPortal:
 
         self.window.close()
 
+        # Stop any collection install still running in the background
+        self.cancel_collection_install()
+
         try:
             shutil.rmtree(self.temp_folder)
             print('--> Clearing temp files.\n')
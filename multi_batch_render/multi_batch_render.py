@@ -19,11 +19,11 @@
 
 """
 Script Name: Multi Batch Render
-Script Version: 4.15.0
+Script Version: 4.16.0
 Flame Version: 2025.1
 Written by: Michael Vaglienty
 Creation Date: 12.12.18
-Update Date: 07.22.26
+Update Date: 10.19.26
 
 License: GNU General Public License v3.0 (GPL-3.0) - see LICENSE file for details
 
@@ -48,6 +48,13 @@ To install:
 
 Updates:
 
+    v4.16.0 10.19.26
+        - Batch groups are rendered by priority. Set priority with a batch group tag: RenderPriority: <number>. Higher numbers render first.
+        - Batch groups can be rendered after another batch group with a batch group tag: RenderAfter: <batch group name>. If the other batch group fails or is skipped, the batch group is skipped.
+        - Added Retry Failed option. Batch groups that fail to submit to the Background Reactor are retried after the rest of the batch groups.
+        - Background Reactor submissions are confirmed by checking the batch group for the render clip instead of always waiting 1 second.
+        - Render time, status, and attempts for each batch group are shown when rendering is complete.
+
     v4.15.0 07.22.26
         - Updated to PyFlameLib v5.5.0.
         - Misc UI updates.
@@ -164,9 +171,186 @@ from lib.pyflame_lib_multi_batch_render import *
 # ==============================================================================
 
 SCRIPT_NAME = 'Multi Batch Render'
-SCRIPT_VERSION = 'v4.15.0'
+SCRIPT_VERSION = 'v4.16.0'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
+RENDER_PRIORITY_TAG = 'RenderPriority' # Batch group tag used to set render priority (RenderPriority: <number>)
+RENDER_AFTER_TAG = 'RenderAfter' # Batch group tag used to render a batch group after another (RenderAfter: <batch group name>)
+REACTOR_SUBMIT_TIMEOUT = 1.0 # Max seconds to wait for a Background Reactor submission to show up in the batch group
+REACTOR_POLL_INTERVAL = 0.1 # Seconds between Background Reactor submission checks
+
+# ==============================================================================
+# [Render Scheduler]
+# ==============================================================================
+
+class RenderScheduler:
+    """
+    Render Scheduler
+    ================
+
+    Render queue for batch groups.
+
+    Batch groups are rendered in order of priority, highest first. Batch groups with the same priority are
+    rendered in the order they were added. Batch groups that fail are added back to the end of the queue and
+    retried up to `retries` times. Time taken for each batch group is recorded.
+
+    A batch group that has to render after other batch groups waits until they are finished, even if it has a
+    higher priority. If one of them fails or is skipped the batch group is skipped. Batch groups that are not in
+    the queue are ignored. Batch groups that wait on each other in a loop are skipped.
+
+    Args:
+    -----
+        render_function (Callable):
+            Function called to render a batch group. Takes the batch group and returns one of the RenderScheduler
+            status values: RENDERED, SUBMITTED, SKIPPED, FAILED, or ABORTED.
+
+        retries (int):
+            Number of times a failed batch group is retried.
+            (Default: 1)
+    """
+
+    RENDERED = 'Rendered'
+    SUBMITTED = 'Submitted'
+    SKIPPED = 'Skipped'
+    FAILED = 'Failed'
+    ABORTED = 'Aborted'
+
+    def __init__(self, render_function, retries: int=1):
+
+        self.render_function = render_function
+        self.retries = retries
+        self.entries = []
+
+    def add(self, batch_group, priority: int=0, after: list | None=None) -> None:
+        """
+        Add
+        ===
+
+        Add batch group to render queue.
+
+        Args:
+        -----
+            batch_group (flame.PyBatch):
+                Batch group to render.
+
+            priority (int):
+                Render priority. Higher priority batch groups are rendered first.
+                (Default: 0)
+
+            after (list | None):
+                Names of batch groups that have to be finished before this batch group is rendered.
+                (Default: None)
+        """
+
+        name = str(batch_group.name)[1:-1]
+
+        self.entries.append({
+            'batch_group': batch_group,
+            'name': name,
+            'priority': priority,
+            'after': [after_name for after_name in after or [] if after_name != name],
+            'status': None,
+            'attempts': 0,
+            'render_time': 0.0,
+            })
+
+    def run(self, entry_done=None) -> bool:
+        """
+        Run
+        ===
+
+        Render all batch groups in the queue.
+
+        Args:
+        -----
+            entry_done (Callable | None):
+                Function called with the entry dictionary each time a batch group is finished (not retried).
+                (Default: None)
+
+        Returns:
+        --------
+            bool:
+                False if a render was aborted, otherwise True.
+        """
+
+        queue = sorted(self.entries, key=lambda entry: -entry['priority'])
+        queued_names = {entry['name'] for entry in self.entries}
+        finished = {}
+
+        def skip(entry, message: str) -> None:
+            pyflame.print(f'{entry["name"]}: {message}', print_type=PrintType.WARNING)
+            entry['status'] = self.SKIPPED
+            finished[entry['name']] = entry['status']
+            if entry_done:
+                entry_done(entry)
+
+        while queue:
+            # Get first batch group in queue that is not waiting on other batch groups
+            entry = next((entry for entry in queue if all(name in finished or name not in queued_names for name in entry['after'])), None)
+            if entry is None:
+                for entry in queue:
+                    skip(entry, f'Batch groups in {RENDER_AFTER_TAG} tags wait on each other. Skipping.')
+                break
+            queue.remove(entry)
+
+            # Skip batch group if a batch group it renders after failed or was skipped
+            failed_names = [name for name in entry['after'] if finished.get(name) in (self.SKIPPED, self.FAILED)]
+            if failed_names:
+                skip(entry, f'{", ".join(failed_names)} did not render. Skipping.')
+                continue
+
+            entry['attempts'] += 1
+
+            start_time = time.monotonic()
+            entry['status'] = self.render_function(entry['batch_group'])
+            entry['render_time'] += time.monotonic() - start_time
+
+            if entry['status'] == self.ABORTED:
+                return False
+
+            # Retry failed batch groups after the rest of the queue
+            if entry['status'] == self.FAILED and entry['attempts'] <= self.retries:
+                pyflame.print(f'{entry["name"]}: Render failed, retrying ({entry["attempts"]} of {self.retries})', print_type=PrintType.WARNING)
+                queue.append(entry)
+                continue
+
+            finished[entry['name']] = entry['status']
+            if entry_done:
+                entry_done(entry)
+
+        return True
+
+    @property
+    def failed_entries(self) -> list:
+        """
+        Failed Entries
+        ==============
+
+        Entries for batch groups that were skipped or failed after all retries.
+        """
+
+        return [entry for entry in self.entries if entry['status'] in (self.SKIPPED, self.FAILED)]
+
+    def stats_text(self) -> str:
+        """
+        Stats Text
+        ==========
+
+        Render time, attempts, and status for each batch group that was rendered.
+        """
+
+        finished = [entry for entry in self.entries if entry['status'] is not None]
+        if not finished:
+            return ''
+
+        name_width = max(len('Batch Group'), *(len(entry['name']) for entry in finished))
+        lines = [f'{"Batch Group":<{name_width}}  {"Status":<9}  {"Attempts":>8}  {"Time":>9}']
+        for entry in finished:
+            lines.append(f'{entry["name"]:<{name_width}}  {entry["status"]:<9}  {entry["attempts"]:>8}  {entry["render_time"]:>8.1f}s')
+        lines.append(f'Total render time: {sum(entry["render_time"] for entry in finished):.1f}s')
+
+        return '\n'.join(lines)
+
 # ==============================================================================
 # [Main Script]
 # ==============================================================================
@@ -209,6 +393,7 @@ class MultiBatchRender:
             config_values={
                 'close_after_render': False,
                 'render_option'     : 'Foreground',
+                'render_retries'    : 1,
                 }
             )
 
@@ -268,6 +453,7 @@ class MultiBatchRender:
                 config_values={
                     'close_after_render': self.close_batch_pushbutton.checked,
                     'render_option': self.render_option_menu.text,
+                    'render_retries': int(self.retry_menu.text),
                     }
                 )
 
@@ -331,6 +517,11 @@ class MultiBatchRender:
             style=Style.UNDERLINE,
             )
 
+        self.retry_label = PyFlameLabel(
+            text='Retry Failed',
+            style=Style.UNDERLINE,
+            )
+
         # Listbox
         self.batch_group_list = PyFlameListWidget(
             header='Desktop Batch Groups',
@@ -356,6 +547,16 @@ class MultiBatchRender:
                 'BG Reactor',
                 ],
             )
+        self.retry_menu = PyFlameMenu(
+            text=str(self.settings.render_retries),
+            menu_options=[
+                '0',
+                '1',
+                '2',
+                '3',
+                ],
+            tooltip='Number of times to retry batch groups that fail to submit to the Background Reactor. Foreground render errors stop the render and are not retried.',
+            )
 
         # Buttons
         self.render_btn = PyFlameButton(
@@ -381,6 +582,9 @@ class MultiBatchRender:
         self.window.grid_layout.addWidget(self.close_batch_pushbutton, 5, 3)
         self.window.grid_layout.addWidget(self.exit_flame, 6, 3)
 
+        self.window.grid_layout.addWidget(self.retry_label, 7, 3)
+        self.window.grid_layout.addWidget(self.retry_menu, 8, 3)
+
         self.window.grid_layout.addWidget(self.cancel_btn, 10, 2)
         self.window.grid_layout.addWidget(self.render_btn, 10, 3)
 
@@ -449,12 +653,50 @@ class MultiBatchRender:
                     new_node.smart_replace = smart_replace
                     n.delete()
 
-        def render_batch_group(batch_to_render) -> bool:
+        def count_batch_group_clips(batch_group) -> int:
+            """
+            Count Batch Group Clips
+            =======================
+
+            Count clips in batch group schematic and shelf reels. Used to confirm Background Reactor submissions,
+            the render clip is added to the batch group when the render is submitted.
+            """
+
+            try:
+                return sum(len(reel.clips) for reel in list(batch_group.reels) + list(batch_group.shelf_reels))
+            except Exception:
+                return 0
+
+        def wait_for_reactor_submission(batch_group, clips_before: int) -> bool:
+            """
+            Wait For Reactor Submission
+            ===========================
+
+            Poll the batch group until the Background Reactor render clip shows up, for up to REACTOR_SUBMIT_TIMEOUT
+            seconds. Renders submitted too fast can be skipped by the Background Reactor. Renders to Write File nodes
+            only don't add a clip, so these wait the full timeout.
+
+            Returns:
+            --------
+                bool:
+                    True if the submission was confirmed.
+            """
+
+            end_time = time.monotonic() + REACTOR_SUBMIT_TIMEOUT
+            while time.monotonic() < end_time:
+                QtWidgets.QApplication.processEvents()
+                if count_batch_group_clips(batch_group) > clips_before:
+                    return True
+                time.sleep(REACTOR_POLL_INTERVAL)
+
+            return False
+
+        def render_batch_group(batch_to_render) -> str:
             """
             Render Batch Group
             ==================
 
-            Render batch group.
+            Open and render batch group.
 
             Args:
                 batch_to_render (flame.PyBatchGroup):
@@ -462,51 +704,101 @@ class MultiBatchRender:
 
             Returns:
             --------
-                bool:
-                    True if render is successful, False if render fails.
+                str:
+                    RenderScheduler status: RENDERED, SUBMITTED, SKIPPED, FAILED, or ABORTED.
             """
 
             self.progress_window.text_append(f'{str(batch_to_render.name)[1:-1]}')
 
+            # Open Selected Batch Group
+            batch_to_render.open()
+
+            # Close other batch groups if close_after_render is checked
+            if self.settings.close_after_render:
+                try:
+                    for batch in self.desktop_batch_group_object_list:
+                        if batch != batch_to_render:
+                            batch.close()
+                except:
+                    pass
+
             # Check for Render or Write node before rendering
             # If none found, skip and print message
             if [node for node in batch_to_render.nodes if node.type in ('Render', 'Write File')] == []:
-                self.failed_render_list.append(batch_to_render.name)
                 pyflame.print(
                     text=f'{batch_to_render.name} has no render or write nodes. Skipping.',
                     print_type=PrintType.WARNING,
                     )
+                return RenderScheduler.SKIPPED
+
+            # Replace render/write nodes - fix for flame render node bug
+            duplicate_render_nodes()
+
+            # Render - if render is aborted by user, stop rendering
+            if self.settings.render_option == 'Foreground':
+                try:
+                    batch_to_render.render(render_option='Foreground')
+                except Exception as e:
+                    pyflame.print(
+                        text=f'{str(batch_to_render.name)[1:-1]}: Render failed - {e}',
+                        print_type=PrintType.WARNING,
+                    )
+                    return RenderScheduler.ABORTED
+                return RenderScheduler.RENDERED
+
+            # Background Reactor - failed submissions are retried by the scheduler
+            clips_before = count_batch_group_clips(batch_to_render)
+            try:
+                batch_to_render.render(render_option='Background Reactor')
+            except RuntimeError:
+                return RenderScheduler.FAILED
+
+            if wait_for_reactor_submission(batch_to_render, clips_before):
+                pyflame.print(f'{str(batch_to_render.name)[1:-1]}: Submitted to Background Reactor')
             else:
-                # Replace render/write nodes - fix for flame render node bug
-                duplicate_render_nodes()
-
-                # Render - if render fails add to failed render list
-                if self.settings.render_option == 'Foreground':
-                    # If render is aborted by user, return False
-                    try:
-                        batch_to_render.render(render_option='Foreground')
-                    except Exception as e:
-                        self.failed_render_list.append(batch_to_render.name)
-                        pyflame.print(
-                            text=f'{str(batch_to_render.name)[1:-1]}: Render failed - {e}',
-                            print_type=PrintType.WARNING,
-                        )
-                        return False
-
-                elif self.settings.render_option == 'BG Reactor':
-                    try:
-                        batch_to_render.render(render_option='Background Reactor')
-                        pyflame.print(f'{str(batch_to_render.name)[1:-1]}: Submitted to Background Reactor')
-                        # Wait for 1 second to allow time for render to be submitted. Renders submitted to fast cause
-                        # renders to be skipped.
-                        time.sleep(1)
-                    except RuntimeError:
-                        self.failed_render_list.append(batch_to_render.name)
-                        self.reactor_render_success = False
-
-            # Update Progress
+                pyflame.print(f'{str(batch_to_render.name)[1:-1]}: Submitted to Background Reactor (not confirmed)')
+            return RenderScheduler.SUBMITTED
+
+        def get_render_priority(batch_group) -> int:
+            """
+            Get Render Priority
+            ===================
+
+            Get batch group render priority from RenderPriority tag (RenderPriority: <number>). Defaults to 0.
+            """
+
+            try:
+                for tag in batch_group.tags.get_value():
+                    if tag.startswith(f'{RENDER_PRIORITY_TAG}:'):
+                        return int(tag.split(':', 1)[1].strip())
+            except (AttributeError, ValueError):
+                pass
+
+            return 0
+
+        def get_render_after(batch_group) -> list:
+            """
+            Get Render After
+            ================
+
+            Get names of batch groups to render before this batch group from RenderAfter tags (RenderAfter: <batch group name>).
+            """
+
+            try:
+                return [tag.split(':', 1)[1].strip() for tag in batch_group.tags.get_value() if tag.startswith(f'{RENDER_AFTER_TAG}:')]
+            except AttributeError:
+                return []
+
+        def entry_done(entry) -> None:
+            """
+            Entry Done
+            ==========
+
+            Update progress window when a batch group is finished.
+            """
+
             self.batch_groups_rendered += 1
-            return True
+            self.progress_window.current_task = self.batch_groups_rendered
 
         def set_progress_window_complete() -> None:
             """
@@ -526,6 +818,8 @@ class MultiBatchRender:
             elif self.settings.render_option == 'BG Reactor':
                 pyflame.print('Submitting Renders Complete')
                 self.progress_window.title = 'Submitting Renders Complete'
+            if self.render_stats_text:
+                self.progress_window.text_append(self.render_stats_text)
 
         def show_failed_renders() -> None:
             """
@@ -535,8 +829,6 @@ class MultiBatchRender:
             Show failed renders if any renders fail.
             """
 
-            failed_renders = ''
-
             if self.settings.render_option == 'BG Reactor' and not self.reactor_render_success:
                 self.progress_window.title = 'Render Failed'
                 self.progress_window.line_color = Color.RED
@@ -545,8 +837,7 @@ class MultiBatchRender:
 
             # If any renders fail, show list when done
             if self.failed_render_list != []:
-                for fail in self.failed_render_list:
-                    failed_renders += fail
+                failed_renders = '\n'.join(self.failed_render_list)
 
                 # Send list of failed renders to progress window
                 self.progress_window.title = 'Render Failed'
@@ -589,34 +880,25 @@ class MultiBatchRender:
             self.progress_window.task = 'Submitting Batch Render to Background Reactor'
 
         # Initialize batch groups rendered
-        self.batch_groups_rendered = 1
+        self.batch_groups_rendered = 0
 
-        # Initialize render abort
-        render_successful = True
-
-        # Render Selected Batch Groups
+        # Queue selected batch groups by render priority and RenderAfter tags
+        scheduler = RenderScheduler(render_batch_group, retries=self.settings.render_retries)
         for batch_group_number in self.selected_batch_groups:
+            batch_group = self.desktop_batch_group_object_list[batch_group_number]
+            scheduler.add(batch_group, priority=get_render_priority(batch_group), after=get_render_after(batch_group))
 
-            # Set Progress Window Progress
-            self.progress_window.current_task = self.batch_groups_rendered
-            batch_to_render = self.desktop_batch_group_object_list[batch_group_number]
-
-            # Open Selected Batch Group
-            batch_to_render.open()
+        # Render Selected Batch Groups
+        render_successful = scheduler.run(entry_done=entry_done)
 
-            # Close other batch groups if close_after_render is checked
-            if self.settings.close_after_render:
-                try:
-                    for batch in self.desktop_batch_group_object_list:
-                        if batch != batch_to_render:
-                            batch.close()
-                except:
-                    pass
+        self.failed_render_list = [entry['name'] for entry in scheduler.failed_entries]
+        self.reactor_render_success = not any(entry['status'] == RenderScheduler.FAILED for entry in scheduler.failed_entries)
 
-            # Render Selected Batch Group
-            render_successful = render_batch_group(batch_to_render)
-            if not render_successful:
-                break
+        # Print render stats
+        self.render_stats_text = scheduler.stats_text()
+        if self.render_stats_text:
+            pyflame.print('Render Stats:', underline=True, print_to_flame=False)
+            print(self.render_stats_text + '\n')
 
         # If render is aborted by user, show error message and return
         if not render_successful:
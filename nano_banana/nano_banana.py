@@ -19,11 +19,11 @@
 
 """
 Script Name: Nano Banana
-Script Version: 1.2.0
+Script Version: 1.3.0
 Flame Version: 2025.2
 Written by: Michael Vaglienty
 Creation Date: 03.13.26
-Update Date: 08.18.26
+Update Date: 10.19.26
 
 License: GNU General Public License v3.0 (GPL-3.0) - see LICENSE file for details
 
@@ -83,6 +83,10 @@ Workflow:
     Buttons:
 
         Send Prompt: Sends the current prompt to Nano Banana at the selected model and resolution.
+                     Prompts are sent in the background, Flame can be used while waiting for images.
+                     Set Variations to generate more than one image for each prompt, images are added
+                     to the Image Gallery as they arrive. The number of requests sent at the same time
+                     can be set in the script setup.
 
         Import to Flame: Import the current selected image in the Image Gallery to the media panel.
 
@@ -107,6 +111,15 @@ To install:
 
 Updates:
 
+    v1.3.0 10.19.26
+        - Prompts and Gemini Chat messages are sent in the background. Flame is no longer blocked while
+          waiting for a response.
+        - Added Variations menu to generate up to 4 images for each prompt. Images are added to the
+          Image Gallery as they arrive.
+        - Added Parallel Requests setting to the script setup.
+        - Prompt images are only encoded once when sent with several prompts.
+        - API key is only verified on startup if it hasn't been verified in the last 12 hours.
+
     v1.2.0 08.18.26
         - Updated to use Google's current Nano Banana models.
             - Added: Gemini 3.1 Flash Lite Image (Nano Banana 2 Lite).
@@ -141,12 +154,18 @@ Updates:
 # ==============================================================================
 
 import base64
+import hashlib
 import json
 import os
+import queue
 import random
+import time
 import urllib.error
 import urllib.request
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, partial
+from typing import Any, Callable
 
 import flame
 from PySide6 import QtCore, QtGui
@@ -157,7 +176,7 @@ from lib.pyflame_lib_nano_banana import *
 # ==============================================================================
 
 SCRIPT_NAME    = 'Nano Banana'
-SCRIPT_VERSION = 'v1.2.0'
+SCRIPT_VERSION = 'v1.3.0'
 SCRIPT_PATH    = os.path.abspath(os.path.dirname(__file__))
 
 # Aspect ratios supported by all current Nano Banana image models.
@@ -188,6 +207,32 @@ DEFAULT_IMAGE_MODEL = 'gemini-3.1-flash-image (Nano Banana 2)'
 # Text model used by the Gemini Chat button.
 CHAT_MODEL = 'gemini-3.7-flash'
 
+# Gemini API server. Set NANO_BANANA_API_URL to send requests to a different server, such as a local test server.
+API_URL = os.environ.get('NANO_BANANA_API_URL', 'https://generativelanguage.googleapis.com').rstrip('/')
+
+# Request timeouts in seconds. 180s safely accommodates 4K generation on Pro.
+IMAGE_REQUEST_TIMEOUT = 180
+CHAT_REQUEST_TIMEOUT = 60
+
+# A verified API key is not checked again on startup until this many seconds have passed.
+API_KEY_CHECK_TTL = 12 * 60 * 60
+API_KEY_CHECK_PATH = os.path.join(SCRIPT_PATH, 'config', 'api_key_check.json')
+
+# Number of images generated for each prompt, and number of requests sent at the same time.
+VARIATION_OPTIONS = ['1', '2', '3', '4']
+MAX_PARALLEL_REQUEST_OPTIONS = ['1', '2', '3', '4', '6', '8']
+
+# Number of encoded prompt images kept in memory.
+ENCODED_IMAGE_CACHE_SIZE = 8
+
+IMAGE_MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    }
+
 # ==============================================================================
 # [Main Script]
 # ==============================================================================
@@ -218,6 +263,8 @@ def load_config() -> PyFlameConfig:
             'model': DEFAULT_IMAGE_MODEL,
             'resolution': '1K',
             'aspect_ratio': '1:1',
+            'variations': '1',
+            'max_parallel_requests': '4',
             },
         )
 
@@ -247,9 +294,10 @@ def verify_api_key(api_key: str) -> bool:
         return False
 
     try:
-        url = f'https://generativelanguage.googleapis.com/v1/models?key={api_key}'
+        url = f'{API_URL}/v1/models?key={api_key}'
         urllib.request.urlopen(url, timeout=10)
         print_pass_fail('API Key Verified', True)
+        save_api_key_check(api_key)
         return True
     except urllib.error.HTTPError as e:
         if e.code in (400, 403):
@@ -297,6 +345,394 @@ def verify_internet_connection() -> bool:
             )
         return False
 
+def api_key_check_is_current(api_key: str) -> bool:
+    """
+    API Key Check Is Current
+    ========================
+
+    Check if the API key was verified within API_KEY_CHECK_TTL seconds. Only a hash of the key is
+    saved with the time it was verified.
+    """
+
+    api_key = api_key.strip() if api_key else ''
+    if not api_key:
+        return False
+
+    try:
+        with open(API_KEY_CHECK_PATH, 'r') as f:
+            key_check = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    return (
+        key_check.get('key_hash') == hashlib.sha256(api_key.encode()).hexdigest()
+        and time.time() - key_check.get('verified', 0) < API_KEY_CHECK_TTL
+        )
+
+def save_api_key_check(api_key: str) -> None:
+    """
+    Save API Key Check
+    ==================
+
+    Save a hash of a verified API key and the time it was verified.
+    """
+
+    try:
+        os.makedirs(os.path.dirname(API_KEY_CHECK_PATH), exist_ok=True)
+        with open(API_KEY_CHECK_PATH, 'w') as f:
+            json.dump({'key_hash': hashlib.sha256(api_key.strip().encode()).hexdigest(), 'verified': time.time()}, f)
+    except OSError as e:
+        print(f'Unable to save API key check: {e}')
+
+class NanoBananaError(Exception):
+    """
+    Nano Banana Error
+    =================
+
+    Error from a Nano Banana/Gemini request. The message is shown to the user.
+    """
+
+@lru_cache(maxsize=ENCODED_IMAGE_CACHE_SIZE)
+def _encode_image(image_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Read and encode a prompt image. Cached by encode_image.
+    """
+
+    mime = IMAGE_MIME_TYPES.get(os.path.splitext(image_path)[1].lower(), 'image/png')
+    with open(image_path, 'rb') as img_file:
+        img_b64 = base64.b64encode(img_file.read()).decode()
+
+    return {
+        'inlineData': {
+            'mimeType': mime,
+            'data': img_b64,
+            }
+        }
+
+def encode_image(image_path: str) -> dict:
+    """
+    Encode Image
+    ============
+
+    Get the request part for a prompt image, with the image base64 encoded inline.
+
+    Encoded images are cached by path, modification time and size, so a prompt image sent with
+    several prompts or variations is only read and encoded once. The returned dict is shared, don't
+    change it.
+    """
+
+    stat = os.stat(image_path)
+    return _encode_image(image_path, stat.st_mtime_ns, stat.st_size)
+
+def post_request(model: str, api_key: str, payload: dict, timeout: int) -> dict:
+    """
+    Post Request
+    ============
+
+    Send a generateContent request to the Gemini API and return the decoded response.
+
+    Raises
+    ------
+        NanoBananaError:
+            If the request fails or the response can't be decoded.
+    """
+
+    req = urllib.request.Request(
+        f'{API_URL}/v1beta/models/{model}:generateContent?key={api_key}',
+        data=json.dumps(payload).encode(),
+        headers={'Content-Type': 'application/json'},
+        method='POST',
+        )
+
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return json.loads(response.read().decode())
+    except urllib.error.HTTPError as e:
+        # Read error body for more specific feedback (400 often has useful details)
+        try:
+            err_body = e.read().decode()
+            err_detail = json.loads(err_body).get('error', {}).get('message', err_body)
+        except Exception:
+            err_detail = 'Please try again.'
+        raise NanoBananaError(f'Nano Banana API request failed (HTTP {e.code}).\n\n{err_detail}') from e
+    except (urllib.error.URLError, OSError) as e:
+        raise NanoBananaError('Unable to reach the Nano Banana API.\n\nPlease check your internet connection and try again.') from e
+    except ValueError as e:
+        raise NanoBananaError('Invalid response from the Nano Banana API.\n\nPlease try again.') from e
+
+def generate_image(api_key: str, model: str, prompt_text: str, image_path: str | None, aspect_ratio: str, image_size: str, images_path: str, variation: int=0) -> tuple[str, str]:
+    """
+    Generate Image
+    ==============
+
+    Send a prompt to Nano Banana and save the returned image to the images folder. Safe to run on a
+    worker thread, no Flame or UI calls are made.
+
+    Args
+    ----
+        `api_key` (str):
+            Google/Gemini API key.
+
+        `model` (str):
+            Image model id.
+
+        `prompt_text` (str):
+            Prompt text.
+
+        `image_path` (str | None):
+            Prompt image, or None to send the prompt text only.
+
+        `aspect_ratio` (str):
+            Image aspect ratio.
+
+        `image_size` (str):
+            Image resolution: 1K, 2K or 4K.
+
+        `images_path` (str):
+            Folder to save the image in.
+
+        `variation` (int, optional):
+            Variation number added to the image file name. 0 for no variation number.
+            (Default: `0`)
+
+    Returns
+    -------
+        tuple[str, str]: Path of the saved image and any text the model returned with the image.
+
+    Raises
+    ------
+        NanoBananaError:
+            If the request fails or no image is returned.
+    """
+
+    parts: list[dict[str, Any]] = [{'text': prompt_text}]
+    if image_path:
+        parts.append(encode_image(image_path))
+
+    result = post_request(
+        model=model,
+        api_key=api_key,
+        payload={
+            'contents': [{'parts': parts}],
+            'generationConfig': {
+                'responseModalities': ['TEXT', 'IMAGE'],
+                'imageConfig': {
+                    'aspectRatio': aspect_ratio,
+                    'imageSize': image_size,
+                    },
+                },
+            },
+        timeout=IMAGE_REQUEST_TIMEOUT,
+        )
+
+    response_parts = result.get('candidates', [{}])[0].get('content', {}).get('parts', [])
+
+    # Capture both text and image from the response.
+    # The model sometimes returns a text description alongside the image.
+    image_data = None
+    mime_type = None
+    model_text = []
+
+    for part in response_parts:
+        if part.get('text'):
+            model_text.append(part['text'])
+        inline = part.get('inlineData')
+        if inline and not image_data:
+            image_data = inline.get('data')
+            mime_type = inline.get('mimeType', 'image/png')
+
+    if not image_data:
+        message = 'No image was returned from the Nano Banana API.\n\nTry a different prompt.'
+        if model_text:
+            message += f'\n\nModel: {" ".join(model_text)}'
+        raise NanoBananaError(message)
+
+    ext = '.png' if 'png' in (mime_type or 'image/png') else '.jpg'
+    file_name = f'nano_banana_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
+    if variation:
+        file_name += f'_{variation}'
+
+    os.makedirs(images_path, exist_ok=True)
+
+    # Images from parallel requests can finish in the same second, never overwrite an image.
+    image_bytes = base64.b64decode(image_data)
+    save_path = os.path.join(images_path, file_name + ext)
+    count = 1
+    while True:
+        try:
+            with open(save_path, 'xb') as f:
+                f.write(image_bytes)
+            break
+        except FileExistsError:
+            count += 1
+            save_path = os.path.join(images_path, f'{file_name}_{count}{ext}')
+
+    return save_path, ' '.join(model_text)
+
+def chat_message(api_key: str, prompt_text: str, image_path: str | None) -> str:
+    """
+    Chat Message
+    ============
+
+    Send a message to Gemini and return the text response. If an image path is given, the image is
+    sent along with the message (e.g. for "describe this image" or "improve this prompt based on the
+    image"). Safe to run on a worker thread, no Flame or UI calls are made.
+
+    Raises
+    ------
+        NanoBananaError:
+            If the request fails or no text is returned.
+    """
+
+    # ---- Inject scope guard so responses stay prompt-focused ----
+    prompt_scope_instruction = (
+        'You are a prompt-writing assistant for image generation. '
+        'Stay strictly focused on helping the user write, improve, or analyze '
+        'image prompts and image descriptions. '
+        'If asked about unrelated topics, briefly refuse and redirect to prompt help. '
+        'Keep responses concise, actionable, and on-subject.'
+    )
+
+    # ---- Build request parts: fixed instruction, user text, then optional image ----
+    parts: list[dict[str, Any]] = [
+        {'text': prompt_scope_instruction},
+        {'text': f'User request:\n{prompt_text}'},
+    ]
+    if image_path:
+        parts.append(encode_image(image_path))
+
+    # ---- Text-only generation config (no image output) ----
+    # Gemini API expects "role" and "parts" in each content object.
+    result = post_request(
+        model=CHAT_MODEL,
+        api_key=api_key,
+        payload={
+            'contents': [{'role': 'user', 'parts': parts}],
+            'generationConfig': {
+                'temperature': 0.7,
+                },
+            },
+        timeout=CHAT_REQUEST_TIMEOUT,
+        )
+
+    # ---- Extract text from response (expect text, not image) ----
+    response_parts = result.get('candidates', [{}])[0].get('content', {}).get('parts', [])
+    response_text = ' '.join(p.get('text', '') for p in response_parts if p.get('text')).strip()
+
+    if not response_text:
+        raise NanoBananaError('No text response from the Nano Banana API.\n\nTry a different message.')
+
+    return 'Gemini: ' + response_text
+
+class GenerationQueue:
+    """
+    Generation Queue
+    ================
+
+    Run Nano Banana/Gemini requests on worker threads so Flame is not blocked while waiting for
+    images.
+
+    Up to `max_workers` requests are sent at the same time, the rest wait in the queue. When a request
+    finishes, its callback is called with the request's Future the next time `poll` is called. Call
+    `poll` from a timer on the UI thread so callbacks can update the UI.
+
+    Args
+    ----
+        `max_workers` (int):
+            Maximum number of requests sent at the same time.
+
+    Examples
+    --------
+        ```
+        generation_queue = GenerationQueue(max_workers=4)
+        for variation in range(1, 5):
+            generation_queue.submit(image_generated, generate_image, api_key, model, prompt_text, ...)
+
+        # On the UI thread, from a timer
+        generation_queue.poll()
+        ```
+    """
+
+    def __init__(self, max_workers: int) -> None:
+
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='nano_banana')
+        self._finished = queue.Queue()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """
+        Pending
+        =======
+
+        Number of requests whose callback has not been called yet.
+        """
+
+        return self._pending
+
+    def submit(self, callback: Callable[[Future], None], function: Callable, *args, **kwargs) -> Future:
+        """
+        Submit
+        ======
+
+        Queue a request.
+
+        Args
+        ----
+            `callback` (Callable[[Future], None]):
+                Called by `poll` with the Future of the request when the request is finished.
+
+            `function` (Callable):
+                Request function to run on a worker thread. Must not make Flame or UI calls.
+
+            `*args`, `**kwargs`:
+                Arguments for `function`.
+
+        Returns
+        -------
+            Future: Future of the request.
+        """
+
+        self._pending += 1
+        future = self._executor.submit(function, *args, **kwargs)
+        future.add_done_callback(lambda done_future: self._finished.put((callback, done_future)))
+
+        return future
+
+    def poll(self) -> int:
+        """
+        Poll
+        ====
+
+        Call the callbacks of finished requests. Call from the UI thread.
+
+        Returns
+        -------
+            int: Number of callbacks called.
+        """
+
+        called = 0
+        while True:
+            try:
+                callback, future = self._finished.get_nowait()
+            except queue.Empty:
+                return called
+            self._pending -= 1
+            called += 1
+            if not future.cancelled():
+                callback(future)
+
+    def shutdown(self) -> None:
+        """
+        Shutdown
+        ========
+
+        Cancel queued requests. Requests already sent are left to finish in the background, their
+        images are still saved to the images folder.
+        """
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
 class NanoBanana:
 
     def __init__(self, selection) -> None:
@@ -331,12 +767,19 @@ class NanoBanana:
         ==============
 
         Check for internet connection, CURL installed, and API key.
+
+        An API key verified within API_KEY_CHECK_TTL seconds is not checked again. The internet
+        connection is not checked either, requests show an error if Nano Banana can't be reached.
         """
 
         # Check script path, if path is incorrect, stop script.
         if not pyflame.verify_script_install():
             return False
 
+        if api_key_check_is_current(self.settings.api_key):
+            print_pass_fail('API Key Verified (cached)', True)
+            return True
+
         # Check for internet connection
         if not verify_internet_connection():
             return False
@@ -409,22 +852,81 @@ class NanoBanana:
                     'model': self.select_model_menu.text,
                     'resolution': self.image_resolution_menu.text,
                     'aspect_ratio': self.aspect_ratio_menu.text,
+                    'variations': self.variations_menu.text,
                     }
                 )
 
+        def add_prompt_to_history(prompt_text: str, response_text: str | None=None) -> None:
+            """
+            Add Prompt to History
+            =====================
+
+            Append a prompt to the history text edit. The prompt is right-aligned and an optional
+            Gemini response is left-aligned.
+            """
+
+            cursor = self.prompt_history_text_edit.textCursor()
+            cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+
+            # Add separator if there is existing content.
+            if self.prompt_history_text_edit.document().characterCount() > 1:
+                cursor.insertBlock()
+                cursor.insertText('\n')
+
+            # Append prompt text as right-aligned user input.
+            cursor.insertBlock()
+            fmt = QtGui.QTextBlockFormat()
+            fmt.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight)
+            cursor.mergeBlockFormat(fmt)
+            cursor.insertText(prompt_text)
+
+            if response_text:
+                # Add a blank line after the user prompt.
+                cursor.insertBlock()
+
+                # Append Gemini response (left-aligned).
+                cursor.insertBlock()
+                fmt = QtGui.QTextBlockFormat()
+                fmt.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft)
+                cursor.mergeBlockFormat(fmt)
+                cursor.insertText(response_text)
+
+            self.prompt_history_text_edit.setTextCursor(cursor)
+
+        def prompt_image_path() -> str | None:
+            """
+            Prompt Image Path
+            =================
+
+            Get the path of the prompt image, or None if there is no prompt image.
+            """
+
+            if self.prompt_image_widget.has_image and self.prompt_image_widget.image_path:
+                return self.prompt_image_widget.image_path
+            return None
+
+        def poll_generation_queue() -> None:
+            """
+            Poll Generation Queue
+            =====================
+
+            Handle finished requests. Stops the poll timer when no requests are left.
+            """
+
+            self.generation_queue.poll()
+            if not self.generation_queue.pending:
+                self.generation_timer.stop()
+
         def send_prompt() -> None:
             """
             Send Prompt
             ==========
 
-            Send prompt text to the Nano Banana API and save the
-            returned image to the images folder.
+            Queue the prompt text to be sent to the Nano Banana API once for each variation.
+            Requests run in the background, each returned image is saved to the images folder
+            and added to the gallery as soon as it arrives.
             """
 
-            pyflame.print('Sending prompt... Please wait...')
-            self.banana_message_entry.text = 'Sending prompt... Please wait...'
-            pyflame.pause()
-
             # Get prompt text
             prompt_text = self.prompt_text_edit.text_str.strip()
             if not prompt_text:
@@ -439,191 +941,95 @@ class NanoBanana:
             selected_model = selected_model.rsplit(' (', 1)[0].strip()
             print('Selected Model:', selected_model)
 
-            url = (
-                'https://generativelanguage.googleapis.com/v1beta/'
-                f'models/{selected_model}:generateContent?key={self.settings.api_key}'
-            )
-
-            parts: list[dict[str, Any]] = [{'text': prompt_text}]
+            variations = int(self.variations_menu.text)
 
-            if self.prompt_image_widget.has_image and self.prompt_image_widget.image_path:
-                image_path = self.prompt_image_widget.image_path
-                ext = os.path.splitext(image_path)[1].lower()
-                mime_map = {
-                    '.png': 'image/png',
-                    '.jpg': 'image/jpeg',
-                    '.jpeg': 'image/jpeg',
-                    '.gif': 'image/gif',
-                    '.webp': 'image/webp',
+            # Prompt state for the callbacks of all variations of this prompt
+            prompt = {
+                'text': prompt_text,
+                'variations': variations,
+                'finished': 0,
+                'images': 0,
+                'errors': [],
                 }
-                mime = mime_map.get(ext, 'image/png')
-                with open(image_path, 'rb') as img_file:
-                    img_b64 = base64.b64encode(img_file.read()).decode()
-                parts.append({
-                        'inlineData': {
-                        'mimeType': mime,
-                        'data': img_b64,
-                    }
-                })
 
-            aspect_ratio = self.aspect_ratio_menu.text.strip() or '1:1'
-            image_size = self.image_resolution_menu.text.strip().upper() or '1K'
+            for variation in range(1, variations + 1):
+                self.generation_queue.submit(
+                    partial(image_generated, prompt),
+                    generate_image,
+                    api_key=self.settings.api_key,
+                    model=selected_model,
+                    prompt_text=prompt_text,
+                    image_path=prompt_image_path(),
+                    aspect_ratio=self.aspect_ratio_menu.text.strip() or '1:1',
+                    image_size=self.image_resolution_menu.text.strip().upper() or '1K',
+                    images_path=self.settings.images_path,
+                    variation=variation if variations > 1 else 0,
+                    )
 
-            image_config = {
-                'aspectRatio': aspect_ratio,
-                'imageSize': image_size,
-                }
+            self.generation_timer.start()
 
-            # Bump timeout to 180s to safely accommodate 4K generation on Pro.
-            request_timeout = 180
+            pyflame.print(f'Sending prompt... {variations} image(s) queued.')
+            self.banana_message_entry.text = f'Generating {variations} image(s)... {self.generation_queue.pending} request(s) in progress.'
 
-            generation_config = {
-                'responseModalities': ['TEXT', 'IMAGE'],
-                'imageConfig': image_config,
-            }
+        def image_generated(prompt: dict, future: Future) -> None:
+            """
+            Image Generated
+            ===============
 
-            payload = json.dumps({
-                'contents': [{'parts': parts}],
-                'generationConfig': generation_config,
-            }).encode()
+            Called on the UI thread when an image request is finished. Shows the image and adds
+            it to the gallery. The first image of a prompt is added to the prompt image.
+            """
 
-            req = urllib.request.Request(
-                url,
-                data=payload,
-                headers={'Content-Type': 'application/json'},
-                method='POST',
-            )
+            prompt['finished'] += 1
 
             try:
-                with urllib.request.urlopen(req, timeout=request_timeout) as response:
-                    result = json.loads(response.read().decode())
-            except urllib.error.HTTPError as e:
-                PyFlameMessageWindow(
-                    message=f'Nano Banana API request failed (HTTP {e.code}).\n\nPlease try again.',
-                    message_type=MessageType.ERROR,
-                    parent=self.main_window,
-                    )
-                return
-            except (urllib.error.URLError, OSError):
-                PyFlameMessageWindow(
-                    message='Unable to reach the Nano Banana API.\n\nPlease check your internet connection and try again.',
-                    message_type=MessageType.ERROR,
-                    parent=self.main_window,
-                    )
-                return
-
-            response_parts = result.get('candidates', [{}])[0].get('content', {}).get('parts', [])
-
-            # Capture both text and image from the response.
-            # The model sometimes returns a text description alongside the image.
-            image_data = None
-            mime_type = None
-            model_text = []
-
-            for part in response_parts:
-                if part.get('text'):
-                    model_text.append(part['text'])
-                inline = part.get('inlineData')
-                if inline and not image_data:
-                    image_data = inline.get('data')
-                    mime_type = inline.get('mimeType', 'image/png')
-
-            # Log any text the model returned alongside the image.
-            if model_text:
-                combined = ' '.join(model_text)
-                pyflame.print(f'Model: {combined}')
-                self.banana_message_entry.text = combined
+                save_path, model_text = future.result()
+            except Exception as e:
+                prompt['errors'].append(str(e))
+                pyflame.print(f'Image request failed: {e}', print_type=PrintType.ERROR)
             else:
-                self.banana_message_entry.text = 'Image generated successfully.'
-
-            if not image_data:
-                PyFlameMessageWindow(
-                    message='No image was returned from the Nano Banana API.\n\nTry a different prompt.',
-                    message_type=MessageType.ERROR,
-                    parent=self.main_window,
-                    )
-                return
+                prompt['images'] += 1
 
-            mime = mime_type or 'image/png'
-            ext = '.png' if 'png' in mime else '.jpg'
-            from datetime import datetime
-            filename = f'nano_banana_{datetime.now().strftime("%Y%m%d_%H%M%S")}{ext}'
-            save_path = os.path.join(self.settings.images_path, filename)
+                pyflame.print(f'Image saved: {save_path}')
 
-            os.makedirs(self.settings.images_path, exist_ok=True)
+                # Log any text the model returned alongside the image.
+                if model_text:
+                    pyflame.print(f'Model: {model_text}')
 
-            with open(save_path, 'wb') as f:
-                f.write(base64.b64decode(image_data))
+                self.banana_image_widget.image = save_path
+                self.image_gallery.refresh()
 
-            pyflame.print(f'Image saved: {save_path}')
+                if prompt['images'] == 1:
+                    add_prompt_to_history(prompt['text'])
+                    if self.prompt_text_edit.text_str.strip() == prompt['text']:
+                        self.prompt_text_edit.text_str = ''
+                    self.prompt_image_widget.image = save_path
 
-            self.banana_image_widget.image = save_path
+            status = f'{prompt["images"]} of {prompt["variations"]} image(s) generated.'
+            if self.generation_queue.pending > 1:
+                status += f' {self.generation_queue.pending - 1} request(s) in progress.'
+            self.banana_message_entry.text = status
 
-            self.image_gallery.refresh()
-
-            history_cursor = self.prompt_history_text_edit.textCursor()
-            history_cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
-
-            # Add separator if there is existing content.
-            if self.prompt_history_text_edit.document().characterCount() > 1:
-                history_cursor.insertBlock()
-                history_cursor.insertText('\n')
-
-            # Append prompt text as right-aligned user input.
-            history_cursor.insertBlock()
-            history_fmt = QtGui.QTextBlockFormat()
-            history_fmt.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight)
-            history_cursor.mergeBlockFormat(history_fmt)
-            history_cursor.insertText(prompt_text)
-            self.prompt_history_text_edit.setTextCursor(history_cursor)
-            self.prompt_text_edit.text_str = ''
-            self.prompt_image_widget.image = save_path
+            if prompt['finished'] == prompt['variations'] and prompt['errors']:
+                message = prompt['errors'][0]
+                if prompt['variations'] > 1:
+                    message = f'{len(prompt["errors"])} of {prompt["variations"]} images failed.\n\n{message}'
+                PyFlameMessageWindow(
+                    message=message,
+                    message_type=MessageType.ERROR,
+                    parent=self.main_window,
+                    )
 
         def send_message() -> None:
             """
             Send Message
             ============
 
-            Send a text prompt to Gemini and display the text response in the
-            prompt text edit. If prompt_image_widget has an image, it is sent
-            along with the message (e.g. for "describe this image" or "improve
-            this prompt based on the image").
+            Queue a text prompt to be sent to Gemini. The text response is shown in the prompt
+            history when it arrives. If prompt_image_widget has an image, it is sent along with
+            the message.
             """
 
-            def append_gemini_response_to_prompt(text_edit: PyFlameTextEdit, user_text: str, gemini_text: str) -> None:
-                """
-                Append a user message and Gemini response to the history text edit.
-                The user message is right-aligned and the Gemini response is left-aligned.
-                """
-                cursor = text_edit.textCursor()
-                cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
-
-                # Add separator if there is existing content.
-                if text_edit.document().characterCount() > 1:
-                    cursor.insertBlock()
-                    cursor.insertText('\n')
-
-                # Append user message (right-aligned).
-                cursor.insertBlock()
-                fmt = QtGui.QTextBlockFormat()
-                fmt.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight)
-                cursor.mergeBlockFormat(fmt)
-                cursor.insertText(user_text)
-
-                # Add a blank line after the user prompt.
-                cursor.insertBlock()
-
-                # Append Gemini response (left-aligned).
-                cursor.insertBlock()
-                fmt = QtGui.QTextBlockFormat()
-                fmt.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft)
-                cursor.mergeBlockFormat(fmt)
-                cursor.insertText(gemini_text)
-
-                text_edit.setTextCursor(cursor)
-
-            model = CHAT_MODEL
-
             # ---- Validate prompt text ----
             prompt_text = self.prompt_text_edit.text_str.strip()
             if not prompt_text:
@@ -634,109 +1040,43 @@ class NanoBanana:
                 )
                 return
 
-            # ---- Show wait state ----
-            pyflame.print('Sending message... Please wait...')
-            self.banana_message_entry.text = 'Sending message... Please wait...'
-            pyflame.pause()
-
-            # ---- Build API URL for the requested text model ----
-            url = (
-                'https://generativelanguage.googleapis.com/v1beta/'
-                f'models/{model}:generateContent?key={self.settings.api_key}'
-            )
+            self.generation_queue.submit(
+                partial(message_received, prompt_text),
+                chat_message,
+                api_key=self.settings.api_key,
+                prompt_text=prompt_text,
+                image_path=prompt_image_path(),
+                )
 
-            # ---- Inject scope guard so responses stay prompt-focused ----
-            prompt_scope_instruction = (
-                'You are a prompt-writing assistant for image generation. '
-                'Stay strictly focused on helping the user write, improve, or analyze '
-                'image prompts and image descriptions. '
-                'If asked about unrelated topics, briefly refuse and redirect to prompt help. '
-                'Keep responses concise, actionable, and on-subject.'
-            )
+            self.generation_timer.start()
 
-            # ---- Build request parts: fixed instruction, user text, then optional image ----
-            parts: list[dict[str, Any]] = [
-                {'text': prompt_scope_instruction},
-                {'text': f'User request:\n{prompt_text}'},
-            ]
+            pyflame.print('Sending message...')
+            self.banana_message_entry.text = 'Sending message...'
 
-            # Include the prompt image if present (for image-aware responses)
-            if self.prompt_image_widget.has_image and self.prompt_image_widget.image_path:
-                image_path = self.prompt_image_widget.image_path
-                ext = os.path.splitext(image_path)[1].lower()
-                mime_map = {
-                    '.png': 'image/png',
-                    '.jpg': 'image/jpeg',
-                    '.jpeg': 'image/jpeg',
-                    '.gif': 'image/gif',
-                    '.webp': 'image/webp',
-                }
-                mime = mime_map.get(ext, 'image/png')
-                with open(image_path, 'rb') as img_file:
-                    img_b64 = base64.b64encode(img_file.read()).decode()
-                parts.append({
-                    'inlineData': {
-                        'mimeType': mime,
-                        'data': img_b64,
-                    }
-                })
-
-            # ---- Build payload: text-only generation config (no image output) ----
-            # Gemini API expects "role" and "parts" in each content object.
-            payload = json.dumps({
-                'contents': [{'role': 'user', 'parts': parts}],
-                'generationConfig': {
-                    'temperature': 0.7,
-                },
-            }).encode()
-
-            # ---- Send request ----
-            req = urllib.request.Request(
-                url,
-                data=payload,
-                headers={'Content-Type': 'application/json'},
-                method='POST',
-            )
-            try:
-                with urllib.request.urlopen(req, timeout=60) as response:
-                    result = json.loads(response.read().decode())
-            except urllib.error.HTTPError as e:
-                # Read error body for more specific feedback (400 often has useful details)
-                try:
-                    err_body = e.read().decode()
-                    err_json = json.loads(err_body)
-                    err_detail = err_json.get('error', {}).get('message', err_body)
-                except Exception:
-                    err_detail = str(e)
-                PyFlameMessageWindow(
-                    message=f'Nano Banana API request failed (HTTP {e.code}).\n\n{err_detail}',
-                    message_type=MessageType.ERROR,
-                    parent=self.main_window,
-                )
-                return
-            except (urllib.error.URLError, OSError):
-                PyFlameMessageWindow(
-                    message='Unable to reach the Nano Banana API.\n\nPlease check your internet connection and try again.',
-                    message_type=MessageType.ERROR,
-                    parent=self.main_window,
-                )
-                return
+        def message_received(prompt_text: str, future: Future) -> None:
+            """
+            Message Received
+            ================
 
-            # ---- Extract text from response (expect text, not image) ----
-            response_parts = result.get('candidates', [{}])[0].get('content', {}).get('parts', [])
-            response_text = "Gemini: " + ' '.join(p.get('text', '') for p in response_parts if p.get('text')).strip()
+            Called on the UI thread when a Gemini Chat request is finished. Adds the message and
+            response to the prompt history.
+            """
 
-            if not response_text:
+            try:
+                response_text = future.result()
+            except Exception as e:
+                self.banana_message_entry.text = 'Message failed.'
                 PyFlameMessageWindow(
-                    message='No text response from the Nano Banana API.\n\nTry a different message.',
+                    message=str(e),
                     message_type=MessageType.ERROR,
                     parent=self.main_window,
                 )
                 return
 
             # ---- Append user message (right-aligned) and Gemini response (left-aligned) to history ----
-            append_gemini_response_to_prompt(self.prompt_history_text_edit, prompt_text, response_text)
-            self.prompt_text_edit.text_str = ''
+            add_prompt_to_history(prompt_text, response_text)
+            if self.prompt_text_edit.text_str.strip() == prompt_text:
+                self.prompt_text_edit.text_str = ''
             self.banana_message_entry.text = 'Message received.'
             pyflame.print('Message received.')
 
@@ -903,10 +1243,17 @@ class NanoBanana:
 
         def close_window() -> None:
 
+            # Cancel queued requests, requests already sent still save their images.
+            self.generation_timer.stop()
+            self.generation_queue.shutdown()
+
             self.main_window.close()
 
         # ------------------------------------------------------------------------------
 
+        # Requests run on worker threads. The timer handles finished requests on the UI thread.
+        self.generation_queue = GenerationQueue(max_workers=int(self.settings.max_parallel_requests))
+
         self.main_window = PyFlameWindow(
             title=f'{SCRIPT_NAME} <small>{SCRIPT_VERSION}',
             parent=None,
@@ -920,6 +1267,10 @@ class NanoBanana:
                 },
             )
 
+        self.generation_timer = QtCore.QTimer(self.main_window)
+        self.generation_timer.setInterval(100)
+        self.generation_timer.timeout.connect(poll_generation_queue)
+
         # Labels
         self.prompt_label = PyFlameLabel(
             text='Prompt',
@@ -946,6 +1297,9 @@ class NanoBanana:
         self.aspect_ratio_label = PyFlameLabel(
             text='Aspect Ratio',
             )
+        self.variations_label = PyFlameLabel(
+            text='Variations',
+            )
 
         # Entries
         self.banana_message_entry = PyFlameEntry(
@@ -1015,6 +1369,11 @@ class NanoBanana:
         self.aspect_ratio_menu = PyFlameMenu(
             text=self.settings.aspect_ratio,
             )
+        self.variations_menu = PyFlameMenu(
+            text=self.settings.variations if self.settings.variations in VARIATION_OPTIONS else VARIATION_OPTIONS[0],
+            menu_options=VARIATION_OPTIONS,
+            tooltip='Number of images to generate for each prompt',
+            )
 
         # Buttons
         self.done_button = PyFlameButton(
@@ -1086,6 +1445,8 @@ class NanoBanana:
         self.main_window.grid_layout.addWidget(self.image_resolution_menu, 19, 5)
         self.main_window.grid_layout.addWidget(self.aspect_ratio_label, 19, 6)
         self.main_window.grid_layout.addWidget(self.aspect_ratio_menu, 19, 7)
+        self.main_window.grid_layout.addWidget(self.variations_label, 20, 4)
+        self.main_window.grid_layout.addWidget(self.variations_menu, 20, 5)
 
         self.main_window.grid_layout.addWidget(self.banana_image_label, 0, 9, 1, 3)
         self.main_window.grid_layout.addWidget(self.banana_image_widget, 1, 9, 17, 3)
@@ -1190,6 +1551,7 @@ class NanoBananaSetup:
                 config_values={
                     'api_key': self.api_key_entry.text,
                     'images_path': self.images_path_entry.text,
+                    'max_parallel_requests': self.max_parallel_requests_menu.text,
                     }
                 )
 
@@ -1223,6 +1585,9 @@ class NanoBananaSetup:
         self.images_path_label = PyFlameLabel(
             text='Images Path',
             )
+        self.max_parallel_requests_label = PyFlameLabel(
+            text='Parallel Requests',
+            )
 
         # Entries
         self.api_key_entry = PyFlameEntry(
@@ -1233,6 +1598,11 @@ class NanoBananaSetup:
             )
 
         # Menus
+        self.max_parallel_requests_menu = PyFlameMenu(
+            text=self.settings.max_parallel_requests,
+            menu_options=MAX_PARALLEL_REQUEST_OPTIONS,
+            tooltip='Maximum number of requests sent to Nano Banana at the same time',
+            )
         self.images_path_token_menu = PyFlameTokenMenu(
             token_dest=self.images_path_entry,
             token_dict={
@@ -1268,6 +1638,8 @@ class NanoBananaSetup:
         self.setup_window.grid_layout.addWidget(self.images_path_entry, 1, 1, 1, 3)
         self.setup_window.grid_layout.addWidget(self.images_path_browse_button, 1, 4)
         self.setup_window.grid_layout.addWidget(self.images_path_token_menu, 1, 5)
+        self.setup_window.grid_layout.addWidget(self.max_parallel_requests_label, 2, 0)
+        self.setup_window.grid_layout.addWidget(self.max_parallel_requests_menu, 2, 1)
         self.setup_window.grid_layout.addWidget(self.setup_cancel_button, 3, 4)
         self.setup_window.grid_layout.addWidget(self.setup_save, 3, 5)
 
@@ -19,11 +19,11 @@
 
 """
 Script Name: Neat Freak
-Script Version: 2.2.0
+Script Version: 2.3.0
 Flame Version: 2025.1
 Written by: Michael Vaglienty
 Creation Date: 10.22.21
-Update Date: 04.19.26
+Update Date: 10.19.26
 
 License: GNU General Public License v3.0 (GPL-3.0) - see LICENSE file for details
 
@@ -67,6 +67,7 @@ Menus:
 
     Batch:
         Right-click on any clips(s) in batch -> Neat Freak... -> Neat Denoise Selected Clips
+        Right-click in batch -> Neat Freak... -> Undo Neat Denoise
 
     Media Panel:
         Right-click on any clips(s) in media panel -> Neat Freak... -> Neat Denoise Selected Clips
@@ -77,6 +78,13 @@ To install:
 
 Updates:
 
+    v2.3.0 10.19.26
+        - Neat node setups for all selected clips are built in one pass. The Neat profile or plugin is
+          loaded into one Neat node which is then duplicated for every clip.
+        - If building fails, all nodes created so far are removed.
+        - Added Undo Neat Denoise to remove the nodes created by the last Neat Denoise in batch.
+        - Time taken for each clip is printed to the terminal.
+
     v2.2.0 04.19.26
         - Updated to work in Flame 2027+.
         - Added option to save/use Neat node profiles.
@@ -150,6 +158,7 @@ Updates:
 # ==============================================================================
 
 import os
+import time
 
 import flame
 from lib.pyflame_lib_neat_freak import *
@@ -159,9 +168,15 @@ from lib.pyflame_lib_neat_freak import *
 # ==============================================================================
 
 SCRIPT_NAME = 'Neat Freak'
-SCRIPT_VERSION = 'v2.2.0'
+SCRIPT_VERSION = 'v2.3.0'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
+NEAT_NODE_OFFSET = (300, -25) # Neat node position relative to clip
+RENDER_NODE_OFFSET = (300, 0) # Render node position relative to Neat node
+
+# Nodes created by the last Neat Denoise in batch, for Undo Neat Denoise
+last_build = []
+
 # ==============================================================================
 # [Main Script]
 # ==============================================================================
@@ -178,8 +193,6 @@ class NeatFreak:
 
         # Init Variables
         self.selection = selection
-        self.y_position = 0
-        self.x_position = 0
         self.batch_duration = 1
         self.created_nodes = []
         self.selected_neat_node_profile = None
@@ -231,13 +244,8 @@ class NeatFreak:
                 return
 
         # Create Neat/Render node setups for all clips in selection
-        for clip in self.selection:
-            self.x_position = clip.pos_x
-            self.y_position = clip.pos_y
-
-            self.get_clip_info(clip)
-
-            self.create_batch_nodes(clip)
+        if not self.create_batch_nodes(self.selection):
+            return
 
         # Select new nodes in batch group and frame them
         new_selection = list(self.selection) + self.created_nodes
@@ -313,28 +321,42 @@ class NeatFreak:
 
         print('Selected Neat node profile:', self.selected_neat_node_profile, '\n')
 
+        # Default setups to try, in order, when no profile is selected. Once a setup loads it is used for all segments.
+        if self.selected_neat_node_profile:
+            neat_setups = [self.selected_neat_node_profile]
+        else:
+            neat_setups = [
+                f'{SCRIPT_PATH}/assets/timeline_fx_default_setups/Neat_v6.openfx_node',
+                f'{SCRIPT_PATH}/assets/timeline_fx_default_setups/Neat_v5.openfx_node',
+                ]
+
+        clip_times = []
+
         for item in self.selection:
             if item.type == 'Video Segment':
+                start_time = time.perf_counter()
                 try:
                     neat_ofx = item.create_effect('OpenFX')
                 except:
                     pyflame.print('Error creating Neat OFX on segment')
                     continue
-                if self.selected_neat_node_profile:
-                    neat_ofx.load_setup(self.selected_neat_node_profile)
-                    pyflame.print(f'{item.name}: Neat OFX setup loaded from profile.')
-                else:
+                for neat_setup in list(neat_setups):
                     try:
-                        neat_ofx.load_setup(f'{SCRIPT_PATH}/assets/timeline_fx_default_setups/Neat_v6.openfx_node')
-                        pyflame.print(f'{item.name}: Loaded default Neat OFX v6 setup.')
+                        neat_ofx.load_setup(neat_setup)
+                        neat_setups = [neat_setup]
+                        break
                     except:
-                        try:
-                            neat_ofx.load_setup(f'{SCRIPT_PATH}/assets/timeline_fx_default_setups/Neat_v5.openfx_node')
-                            pyflame.print(f'{item.name}: Loaded default Neat OFX v5 setup.')
-                        except:
-                            flame.delete(neat_ofx)
-                            pyflame.print(f'{item.name}: Error loading Neat OFX setup.')
-                            return
+                        if neat_setup == self.selected_neat_node_profile:
+                            raise
+                        neat_setups.remove(neat_setup)
+                else:
+                    flame.delete(neat_ofx)
+                    pyflame.print(f'{item.name}: Error loading Neat OFX setup.')
+                    return
+                pyflame.print(f'{item.name}: Neat OFX setup loaded: {os.path.basename(neat_setups[0])}')
+                clip_times.append((str(item.name)[1:-1], time.perf_counter() - start_time))
+
+        self.print_timing_report(clip_times)
 
         PyFlameMessageWindow(
             message=f'Neat OFX added to selected timeline segments.',
@@ -451,7 +473,7 @@ class NeatFreak:
 
         self.select_profile_window.exec_()
 
-    def get_clip_info(self, clip):
+    def get_clip_info(self, clip) -> dict:
         """
         Get Clip Info
         =============
@@ -462,166 +484,276 @@ class NeatFreak:
         ----
             clip (PyFlameClip):
                 Flame clip object.
+
+        Returns
+        -------
+            dict:
+                Clip name, duration, frame rate, timecode and shot name.
         """
 
-        self.clip_name = str(clip.name)[1:-1]
-        self.clip_duration = clip.duration
-        self.clip_frame_rate = clip.clip.frame_rate
-        self.clip_timecode = clip.clip.start_time
-        self.clip_shot_name = pyflame.resolve_shot_name(self.clip_name)
+        clip_name = str(clip.name)[1:-1]
 
-    def create_batch_nodes(self, clip) -> None:
+        return {
+            'clip_name': clip_name,
+            'clip_duration': clip.duration,
+            'clip_frame_rate': clip.clip.frame_rate,
+            'clip_timecode': clip.clip.start_time,
+            'clip_shot_name': pyflame.resolve_shot_name(clip_name),
+            }
+
+    def plan_batch_nodes(self, clips) -> list:
         """
-        Create Batch Nodes
-        ==================
+        Plan Batch Nodes
+        ================
 
-        Create Neat/Render node setups for clip.
+        Read everything needed to build the Neat/Render node setups of all clips before any nodes are created:
+        clip info and Neat/Render node positions.
 
         Args
         ----
-            clip (PyFlameClip):
-               Flame clip object.
+            clips (list):
+                Flame clip nodes.
 
         Returns
         -------
-            None
+            list:
+                One dict per clip with the clip, its clip info and node positions.
         """
 
-        def set_render_destination():
-            """
-            Set Render Destination
-            ======================
+        plan = []
 
-            Set render destination reel. If reel does not exist, create it.
-            """
+        for clip in clips:
+            clip_plan = self.get_clip_info(clip)
+            clip_plan['clip'] = clip
+            clip_plan['neat_pos'] = (clip.pos_x + NEAT_NODE_OFFSET[0], clip.pos_y + NEAT_NODE_OFFSET[1])
+            clip_plan['render_pos'] = (clip_plan['neat_pos'][0] + RENDER_NODE_OFFSET[0], clip_plan['neat_pos'][1] + RENDER_NODE_OFFSET[1])
+            plan.append(clip_plan)
 
-            render_destination = None
+        return plan
+
+    def set_render_destination(self) -> None:
+        """
+        Set Render Destination
+        ======================
+
+        Set render destination reel. If reel does not exist, create it.
+        """
 
-            if self.settings.render_reel_type == 'Schematic':
-                for reel in self.batch_group.reels:
-                    if reel.name == self.settings.render_reel_name:
-                        return
-                if not render_destination:
-                    reel = self.batch_group.create_reel(self.settings.render_reel_name) # Create schematic reel
+        if self.settings.render_reel_type == 'Schematic':
+            for reel in self.batch_group.reels:
+                if reel.name == self.settings.render_reel_name:
                     return
-            elif self.settings.render_reel_type == 'Shelf':
-                for reel in self.batch_group.shelf_reels:
-                    if reel.name == self.settings.render_reel_name:
-                        return
-                if not render_destination:
-                    self.batch_group.create_shelf_reel(self.settings.render_reel_name)
+            reel = self.batch_group.create_reel(self.settings.render_reel_name) # Create schematic reel
+            self.created_reels.append(reel)
+        elif self.settings.render_reel_type == 'Shelf':
+            for reel in self.batch_group.shelf_reels:
+                if reel.name == self.settings.render_reel_name:
                     return
+            reel = self.batch_group.create_shelf_reel(self.settings.render_reel_name)
+            self.created_reels.append(reel)
 
-        def add_render_node(node_type: str):
-            """
-            Add Render Node
-            ===============
+    def create_neat_node(self):
+        """
+        Create Neat Node
+        ================
 
-            Add render node to batch group and set render node values.
+        Add Neat node to batch group and set Neat node values.
 
-            Args
-            ----
-                node_type (str):
-                    Type of render node to add. 'Render' or 'Write File'.
+        If a Neat node profile is selected, load the profile instead of using default Neat settings.
 
-            Returns
-            -------
-                render_node (PyFlameNode):
-                    Render node object.
-            """
+        Returns
+        -------
+            neat_node (PyNode):
+                Neat node object. None if Neat OFX is not found.
+        """
 
-            # Create render node
-            render_node = self.batch_group.create_node(node_type)
+        # Try to add an OpenFX node. If not found, return None.
+        try:
+            neat_node = self.batch_group.create_node('OpenFX')
+        except:
+            return None
 
-            # Set basic metadata for render/write file node for Flame 2027+
+        # Load Neat node profile if selected
+        if self.selected_neat_node_profile:
+            neat_node.load_node_setup(self.selected_neat_node_profile)
+            return neat_node
+
+        # Try to load Neat v6, if not found, try Neat v5.
+        try:
+            neat_node.change_plugin('Reduce Noise v6')
+        except:
             try:
-                render_node.basic_metadata = 'Custom Values'
-                render_node.collapsed = True
+                neat_node.change_plugin('Reduce Noise v5')
             except:
-                pass
+                flame.delete(neat_node)
+                return None
 
-            # Set render node values
-            render_node.name = self.clip_name + self.settings.render_node_suffix
-            render_node.range_start = self.batch_group.start_frame
-            render_node.range_end = int(str(self.batch_group.start_frame)) + int(str(self.clip_duration)) - 1
-            render_node.frame_rate = self.clip_frame_rate
-            render_node.source_timecode = self.clip_timecode
-            render_node.record_timecode = self.clip_timecode
-            render_node.destination = ('Batch Reels', f'{self.settings.render_reel_name}')
+        return neat_node
 
-            if self.clip_shot_name:
-                render_node.shot_name = self.clip_shot_name
+    def create_render_node(self, clip_plan: dict):
+        """
+        Create Render Node
+        ==================
 
-            self.created_nodes.append(render_node)
+        Add render node to batch group and set render node values.
 
-            return render_node
+        Args
+        ----
+            clip_plan (dict):
+                Clip info from plan_batch_nodes.
 
-        def add_neat_node():
-            """
-            Add Neat Node
-            =============
+        Returns
+        -------
+            render_node (PyNode):
+                Render or Write File node object.
+        """
 
-            Add Neat node to batch group and set Neat node values.
+        # Create render node
+        render_node = self.batch_group.create_node(self.settings.render_node_type)
+        self.created_nodes.append(render_node)
+
+        # Set basic metadata for render/write file node for Flame 2027+
+        try:
+            render_node.basic_metadata = 'Custom Values'
+            render_node.collapsed = True
+        except:
+            pass
+
+        # Set render node values
+        render_node.name = clip_plan['clip_name'] + self.settings.render_node_suffix
+        render_node.range_start = self.batch_start_frame
+        render_node.range_end = self.batch_start_frame + int(str(clip_plan['clip_duration'])) - 1
+        render_node.frame_rate = clip_plan['clip_frame_rate']
+        render_node.source_timecode = clip_plan['clip_timecode']
+        render_node.record_timecode = clip_plan['clip_timecode']
+        render_node.destination = self.render_destination
+
+        if clip_plan['clip_shot_name']:
+            render_node.shot_name = clip_plan['clip_shot_name']
 
-            If a Neat node profile is selected, load the profile instead of creating a new Neat node.
-            """
+        if not self.settings.render_node_enabled:
+            render_node.bypass = True
 
-            # Try to add an OpenFX node. If not found, return None.
-            try:
-                neat_node = self.batch_group.create_node('OpenFX')
-                neat_node.pos_x = self.x_position + 300
-                neat_node.pos_y = self.y_position - 25
-                self.created_nodes.append(neat_node)
-            except:
-                return None
+        return render_node
 
-            # Load Neat node profile if selected
-            if self.selected_neat_node_profile:
-                neat_node.load_node_setup(self.selected_neat_node_profile)
-                return neat_node
+    def create_batch_nodes(self, clips) -> bool:
+        """
+        Create Batch Nodes
+        ==================
 
-            # Try to load Neat v6, if not found, try Neat v5.
-            try:
-                neat_node.change_plugin('Reduce Noise v6')
-            except:
-                try:
-                    neat_node.change_plugin('Reduce Noise v5')
-                except:
-                    flame.delete(neat_node)
-                    return None
+        Create Neat/Render node setups for all clips in one pass.
 
-            return neat_node
+        The Neat profile or plugin is only loaded into the first Neat node, the Neat nodes of all other clips are
+        duplicates of it. Node positions, clip info and the render destination are worked out before any nodes
+        are created.
+
+        If building fails, all nodes and reels created so far are deleted. Otherwise the new nodes are kept for
+        Undo Neat Denoise.
+
+        Args
+        ----
+            clips (list):
+               Flame clip nodes.
+
+        Returns
+        -------
+            bool:
+                True if node setups were created for all clips.
+        """
+
+        if not clips:
+            return False
+
+        self.created_reels = []
+        self.render_destination = ('Batch Reels', f'{self.settings.render_reel_name}')
+        self.batch_start_frame = int(str(self.batch_group.start_frame))
 
-        # Add Neat Node, if Neat OFX is not found, show error message and return.
-        neat_node = add_neat_node()
-        if not neat_node:
+        plan = self.plan_batch_nodes(clips)
+
+        # Load Neat profile/plugin once. If Neat OFX is not found, show error message and return.
+        start_time = time.perf_counter()
+        neat_template = self.create_neat_node()
+        if not neat_template:
             PyFlameMessageWindow(
                 message='Neat OFX not found. Install Neat and try again.',
                 message_type=MessageType.ERROR,
                 parent=None,
                 )
-            return
+            return False
+        self.created_nodes.append(neat_template)
+        setup_time = time.perf_counter() - start_time
 
-        # Set render destination
-        set_render_destination()
+        clip_times = []
 
-        # Add Render Node or Write File Node
-        render_node = add_render_node(node_type=self.settings.render_node_type)
+        try:
+            self.set_render_destination()
 
-        # Set render node position
-        render_node.pos_x = neat_node.pos_x + 300
-        render_node.pos_y = neat_node.pos_y - 0
+            for clip_plan in plan:
+                start_time = time.perf_counter()
 
-        # Connect nodes: Clip -> Neat -> Render
-        flame.batch.connect_nodes(clip, 'Default', neat_node, 'Default')
-        flame.batch.connect_nodes(neat_node, 'Default', render_node, 'Default')
+                # First clip uses the Neat node the profile/plugin was loaded into, others use a duplicate of it.
+                if clip_plan is plan[0]:
+                    neat_node = neat_template
+                else:
+                    neat_node = neat_template.duplicate()
+                    self.created_nodes.append(neat_node)
+                neat_node.pos_x, neat_node.pos_y = clip_plan['neat_pos']
 
-        self.y_position = self.y_position - 200
+                # Add Render Node or Write File Node
+                render_node = self.create_render_node(clip_plan)
+                render_node.pos_x, render_node.pos_y = clip_plan['render_pos']
 
-        if not self.settings.render_node_enabled:
-            render_node.bypass = True
+                # Connect nodes: Clip -> Neat -> Render
+                self.batch_group.connect_nodes(clip_plan['clip'], 'Default', neat_node, 'Default')
+                self.batch_group.connect_nodes(neat_node, 'Default', render_node, 'Default')
+
+                clip_times.append((clip_plan['clip_name'], time.perf_counter() - start_time))
+                pyflame.print(f'Created Neat/Render node setup for: {clip_plan["clip_name"]}')
+
+        except Exception as e:
+            pyflame.print(f'Error creating Neat/Render node setups: {e}', print_type=PrintType.ERROR)
+            delete_flame_objects(self.created_nodes + self.created_reels)
+            self.created_nodes = []
+            PyFlameMessageWindow(
+                message=f'Error creating Neat/Render node setups. No nodes were added.\n\n{e}',
+                message_type=MessageType.ERROR,
+                parent=None,
+                )
+            return False
 
-        pyflame.print(f'Created Neat/Render node setup for: {self.clip_name}')
+        last_build[:] = self.created_nodes
+
+        self.print_timing_report(clip_times, setup_time)
+
+        return True
+
+    def print_timing_report(self, clip_times: list, setup_time: float=0.0) -> None:
+        """
+        Print Timing Report
+        ===================
+
+        Print time taken for each clip and in total to the terminal.
+
+        Args
+        ----
+            clip_times (list):
+                List of (clip name, seconds).
+
+            setup_time (float):
+                Seconds taken to load the Neat profile/plugin.
+                (Default: `0.0`)
+        """
+
+        if not clip_times:
+            return
+
+        print('\nNeat Freak Timing:\n')
+        if setup_time:
+            print(f'    {"Neat profile/plugin load":<50} {setup_time:8.2f} sec')
+        for clip_name, seconds in clip_times:
+            print(f'    {clip_name:<50} {seconds:8.2f} sec')
+        total_time = setup_time + sum(seconds for _, seconds in clip_times)
+        print(f'\n    {f"Total ({len(clip_times)} clips)":<50} {total_time:8.2f} sec\n')
 
     # ==============================================================================
 
@@ -798,6 +930,32 @@ def neat_timeline_clips(selection):
     script = NeatFreak(selection)
     script.timeline_neat_clips()
 
+def delete_flame_objects(flame_objects) -> None:
+    """
+    Delete Flame Objects
+    ====================
+
+    Delete nodes/reels, skipping any that have already been deleted.
+    """
+
+    for flame_object in reversed(flame_objects):
+        try:
+            flame.delete(flame_object)
+        except:
+            pass
+
+def undo_neat_build(selection):
+    """
+    Undo Neat Build
+    ===============
+
+    Delete the nodes created by the last Neat Denoise in batch. Render reels are left in place.
+    """
+
+    pyflame.print(f'Deleting {len(last_build)} nodes created by last Neat Denoise...')
+    delete_flame_objects(last_build)
+    last_build.clear()
+
 def setup(selection):
 
     script = NeatFreak(selection)
@@ -853,6 +1011,10 @@ def scope_neat_node(selection):
             return True
     return False
 
+def scope_undo_neat_build(selection):
+
+    return bool(last_build)
+
 def scope_segment(selection):
 
     for item in selection:
@@ -908,6 +1070,13 @@ def get_batch_custom_ui_actions():
                     'execute': save_neat_node_profile,
                     'minimumVersion': '2025.1'
                 },
+                {
+                    'name': 'Undo Neat Denoise',
+                    'order': 2,
+                    'isVisible': scope_undo_neat_build,
+                    'execute': undo_neat_build,
+                    'minimumVersion': '2025.1'
+                },
             ]
         }
     ]
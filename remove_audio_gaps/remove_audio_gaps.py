@@ -2,18 +2,21 @@
 Script Name: Remove Audio Gaps
 Written By: Kieran Hanrahan
 
-Script Version: 2.0.0
+Script Version: 2.1.0
 Flame Version: 2022
 
 URL: http://github.com/khanrahan/remove-audio-gaps
 
 Creation Date: 01.10.24
-Update Date: 03.17.25
+Update Date: 10.19.26
 
 Description:
 
     Remove silent gaps on the audio tracks.
 
+    The audio channels are read once into a timeline snapshot, then only the gaps are
+    deleted.
+
 Menus:
 
     Right-click selected items on the Desktop --> Edit... --> Remove Audio Gaps
@@ -21,20 +24,22 @@ Menus:
 
 To Install:
 
-    For all users, copy this file to:
+    For all users, copy this folder to:
     /opt/Autodesk/shared/python/
 
-    For a specific user on Linux, copy this file to:
+    For a specific user on Linux, copy this folder to:
     /home/<user_name>/flame/python/
 
-    For a specific user on Mac, copy this file to:
+    For a specific user on Mac, copy this folder to:
     /Users/<user_name>/Library/Preferences/Autodesk/flame/python/
 """
 
 import flame
 
+from lib.timeline_snapshot_remove_audio_gaps import AUDIO, TimelineSnapshot
+
 TITLE = 'Remove Audio Gaps'
-VERSION_INFO = (2, 0, 0)
+VERSION_INFO = (2, 1, 0)
 VERSION = '.'.join([str(num) for num in VERSION_INFO])
 TITLE_VERSION = f'{TITLE} v{VERSION}'
 MESSAGE_PREFIX = '[PYTHON]'
@@ -46,12 +51,18 @@ def message(string):
 
 
 def remove_audio_gaps(sequence):
-    """Loop through all the audio tracks and remove any silent audio gaps."""
-    for audio_track in sequence.audio_tracks:
-        for track in audio_track.channels:
-            for item in track.segments:
-                if item.name == '':  # no name indicates audio gap
-                    flame.delete(item)
+    """Remove any silent audio gaps from all the audio tracks.
+
+    Gaps are deleted last first on each channel, so deleting a gap does not move the
+    gaps that are still to be deleted.  Returns the number of gaps removed.
+    """
+    snapshot = TimelineSnapshot(sequence, video=False)
+    gaps = snapshot.gaps(AUDIO)
+
+    for track, index in reversed(gaps):
+        flame.delete(track.segments[index])
+
+    return len(gaps)
 
 
 def process_selection(selection):
@@ -60,7 +71,8 @@ def process_selection(selection):
     message(f'Script called from {__file__}')
 
     for sequence in selection:
-        remove_audio_gaps(sequence)
+        count = remove_audio_gaps(sequence)
+        message(f'Removed {count} audio gaps from {sequence.name.get_value()}.')
 
     message('Done!')
 
@@ -0,0 +1,148 @@
+# Tag Tools
+# Copyright (c) 2026 Kyle Obley
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# License:       GNU General Public License v3.0 (GPL-3.0)
+#                https://www.gnu.org/licenses/gpl-3.0.en.html
+
+"""
+Tag Writer
+==========
+
+Writes tags into the comment metadata of QuickTime files, many files at a time.
+
+Used by Tag Tools inside Flame, and run on its own by the Backburner job that
+tags the files of a background export once the export jobs are done:
+
+    python3 tag_writer.py /path/to/manifest.json
+
+This file must not import flame or the PyFlame library so it can run outside of Flame.
+"""
+
+# ==============================================================================
+# [Imports]
+# ==============================================================================
+
+import os
+import sys
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from lib.qt_metadata import QuickTimeFile
+except ImportError:
+    # Run on its own from the lib folder
+    from qt_metadata import QuickTimeFile
+
+# ==============================================================================
+# [Constants]
+# ==============================================================================
+
+COMMENT_KEY = "com.apple.quicktime.comment"
+MAX_WORKERS = 4 # Files written at the same time
+
+# ==============================================================================
+# [Tag Writing]
+# ==============================================================================
+
+def write_tags(full_path, tags):
+    """
+    Write tags to a QuickTime file. The file is only saved if its tags changed.
+
+    :param full_path: Path of the QuickTime file
+    :param tags: Tags as a string, joined with +
+    :return: True if the file was saved, False if it already had the tags
+    """
+
+    qt = QuickTimeFile(full_path)
+    if qt.get_metadata(COMMENT_KEY) == tags:
+        return False
+
+    qt.set_metadata(COMMENT_KEY, tags)
+    qt.save(full_path)
+    return True
+
+def write_tags_bulk(writes, max_workers=MAX_WORKERS):
+    """
+    Write tags to many QuickTime files, several files at a time. A failed file
+    does not stop the others.
+
+    :param writes: List of (full_path, tags). If a path is listed more than once
+                   the last tags are written.
+    :param max_workers: Number of files written at the same time
+    :return: Dict of full_path -> True (saved), False (unchanged) or the exception
+    """
+
+    latest = dict(writes)
+    if not latest:
+        return {}
+
+    def write(item):
+        try:
+            return write_tags(*item)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(latest))) as executor:
+        results = dict(zip(latest, executor.map(write, latest.items())))
+
+    for full_path, result in results.items():
+        basename = os.path.basename(full_path)
+        if isinstance(result, Exception):
+            print(f"[ Tag Tools ] Error: Could not write tags to {basename}: {result}")
+        elif result:
+            print(f"[ Tag Tools ] Updated {basename} with the following tags: {latest[full_path]}")
+        else:
+            print(f"[ Tag Tools ] {basename} already has the following tags: {latest[full_path]}")
+
+    return results
+
+# ==============================================================================
+# [Manifest]
+# ==============================================================================
+
+def save_manifest(manifest_path, writes):
+    """Save a list of (full_path, tags) for a Backburner job to write later."""
+
+    with open(manifest_path, "w") as f:
+        json.dump({"writes": [{"path": p, "tags": t} for p, t in writes]}, f, indent=4)
+
+def load_manifest(manifest_path):
+    """Load the list of (full_path, tags) saved by save_manifest."""
+
+    with open(manifest_path) as f:
+        return [(w["path"], w["tags"]) for w in json.load(f)["writes"]]
+
+def main(argv):
+    """Write the tags of a manifest. The manifest is removed once every file is written."""
+
+    if len(argv) != 1:
+        print("Usage: tag_writer.py <manifest.json>")
+        return 2
+
+    manifest_path = argv[0]
+    results = write_tags_bulk(load_manifest(manifest_path))
+
+    failed = [p for p, result in results.items() if isinstance(result, Exception)]
+    if failed:
+        print(f"[ Tag Tools ] Error: {len(failed)} of {len(results)} file(s) could not be tagged. Keeping {manifest_path}")
+        return 1
+
+    os.remove(manifest_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
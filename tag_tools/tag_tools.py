@@ -19,11 +19,11 @@
 
 """
 Script Name:    Tag Tools
-Script Version: 1.5.1
+Script Version: 1.6.0
 Flame Version:  2025.1
 Written by:     Kyle Obley
 Creation Date:  03.12.26
-Update Date:    09.12.26
+Update Date:    10.19.26
 
 License:        GNU General Public License v3.0 (GPL-3.0) - see LICENSE file for details
 
@@ -52,6 +52,12 @@ To install:
 
 Updates:
 
+    v1.6.0 10.19.26
+        - Tags are written after a background export too. All files of an export are tagged by a single
+          Backburner job that waits for all of the export jobs.
+        - Tags are written to several files at a time and files that already have the tags are not saved again.
+        - Set TAG_TOOLS_DRY_RUN=1 to print Backburner jobs instead of submitting them.
+
     v1.5.1 09.12.26
         - Adjusted formating to adhear to Logik-Portal requirements.
 
@@ -99,7 +105,9 @@ import flame
 import shutil
 import csv
 import time
+import shlex
 from lib.qt_metadata import QuickTimeFile
+from lib.tag_writer import write_tags, write_tags_bulk, save_manifest
 from lib.pyflame_lib_tag_tools import *
 
 # ==============================================================================
@@ -107,8 +115,12 @@ from lib.pyflame_lib_tag_tools import *
 # ==============================================================================
 
 SCRIPT_NAME    = 'Tag Tools'
-SCRIPT_VERSION = 'v1.5.1'
+SCRIPT_VERSION = 'v1.6.0'
 SCRIPT_PATH    = os.path.abspath(os.path.dirname(__file__))
+TAG_WRITER_PATH = os.path.join(SCRIPT_PATH, 'lib', 'tag_writer.py')
+
+# Set to 1 to print Backburner jobs instead of submitting them
+DRY_RUN = os.environ.get('TAG_TOOLS_DRY_RUN', '0') == '1'
 
 
 # ==============================================================================
@@ -274,11 +286,12 @@ against the name of a .mov or .mp4.\n\nIf a match is found, then it will copy th
         # Use a directory lookup to find a match
         selection_map = {item.name.get_value(): item for item in selection}
 
+        writes = []
         for f in files:
             base_name = os.path.splitext(f)[0]
             match = selection_map.get(base_name)
 
-            # Found a match. Extract the tags and send to post export function.
+            # Found a match. Extract the tags and add them to the files to write.
             if match:
                 print(f"[ Tag Tools ] Match found: {match.name.get_value()} -> {f}")
                 matched_file = os.path.join(source_dir, f)
@@ -287,10 +300,10 @@ against the name of a .mov or .mp4.\n\nIf a match is found, then it will copy th
                 tags = []
                 tags = list_to_string(match.tags.get_value())
 
-                # Send to our post export function
-                set_tags_post_export(matched_file, tags)
+                writes.append((matched_file, tags))
 
-                print(f"[ Tag Tools ] Updated {f} with the following tags: {tags}\n")
+        # Write all matches at once
+        write_tags_bulk(writes)
 
 
 def set_internal_and_client_name(selection):
@@ -368,12 +381,7 @@ def get_tags_from_qt(selection):
                 set_tag(clip, tag_name, value)
 
 def set_tags_post_export(full_path, tags):
-    #print(f"Set Tags Post : Full path: {full_path}")
-    #print(f"Set Tags Post :Tags: {tags}")
-
-    qt = QuickTimeFile(full_path)
-    qt.set_metadata("com.apple.quicktime.comment", tags)
-    qt.save(full_path)
+    write_tags(full_path, tags)
 
 
 # ==============================================================================
@@ -382,23 +390,115 @@ def set_tags_post_export(full_path, tags):
 
 
 class HooksOverride(object):
-        def __init__(self, foreground):
+        def __init__(self, foreground, job_builder):
             self._foreground = foreground
+            self._job_builder = job_builder
 
         def postExportAsset(self, info, userData, *args, **kwargs):
             del args, kwargs  # Unused necessary parameters
             full_path = os.path.join(info["destinationPath"], info["resolvedPath"])
 
+            # Tags are written once the whole export has been sent, see TagJobBuilder
             if self._foreground:
-                set_tags_post_export(full_path, userData)
+                self._job_builder.add(full_path, userData)
             else:
-                create_python_backburner_job(
-                    job_name="Updating tags %s" % info["assetName"],
-                    description="Updating tags %s" % info["assetName"],
-                    dependencies=info["backgroundJobId"],
-                    function="set_tags_post_export",
-                    args=[full_path, userData],
-                )
+                self._job_builder.add(full_path, userData, info.get("backgroundJobId"))
+
+class TagJobBuilder(object):
+    """
+    Collects the tag writes of one export and writes them all at once.
+
+    Foreground exports are tagged straight away when submit() is called. Background
+    exports are tagged by a single Backburner job that depends on all of the export
+    jobs, and runs lib/tag_writer.py on a manifest of the files and their tags saved
+    next to the exports.
+
+    :param foreground: True if the export ran in the foreground
+    :param manifest_dir: Folder to save the manifest to for background exports
+    :param backend: Object with a submit(job_name, description, dependencies, cmd)
+                    method. BackburnerBackend by default, or DryRunBackend if
+                    TAG_TOOLS_DRY_RUN=1.
+    """
+
+    def __init__(self, foreground, manifest_dir, backend=None):
+        self.foreground = foreground
+        self.manifest_dir = manifest_dir
+        self.backend = backend or (DryRunBackend() if DRY_RUN else BackburnerBackend())
+        self.writes = []
+        self.dependencies = []
+
+    def add(self, full_path, tags, dependency=None):
+        """Add a file to tag, and the Backburner id of the job that exports it."""
+
+        self.writes.append((full_path, tags))
+        if dependency and str(dependency) not in self.dependencies:
+            self.dependencies.append(str(dependency))
+
+    def submit(self):
+        """
+        Write the tags, or send the Backburner job that writes them.
+
+        :return backburner_job_id: Id of the Backburner job created, None for foreground exports
+        """
+
+        if not self.writes:
+            return None
+
+        if self.foreground:
+            write_tags_bulk(self.writes)
+            return None
+
+        timestamp = time.strftime('%Y%m%d_%H%M%S', time.localtime())
+        manifest_path = os.path.join(self.manifest_dir, f".tag_tools_{timestamp}_{os.getpid()}.json")
+        save_manifest(manifest_path, self.writes)
+
+        cmd = " ".join(shlex.quote(arg) for arg in [flame_python_path(), TAG_WRITER_PATH, manifest_path])
+
+        return self.backend.submit(
+            job_name="Updating tags (%d files)" % len(self.writes),
+            description="Updating tags in %s" % self.manifest_dir,
+            dependencies=self.dependencies,
+            cmd=cmd,
+        )
+
+class BackburnerBackend(object):
+    """Submits jobs to Backburner with cmdjob."""
+
+    def submit(self, job_name, description, dependencies, cmd):
+        return create_backburner_job(job_name, description, dependencies, cmd)
+
+class DryRunBackend(object):
+    """
+    Prints jobs instead of submitting them, so the job graph can be checked
+    without a Backburner manager. Jobs are kept in self.jobs and given ids
+    starting at dry-run-1.
+    """
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, job_name, description, dependencies, cmd):
+        job_id = "dry-run-%d" % (len(self.jobs) + 1)
+        self.jobs.append({
+            "id": job_id,
+            "job_name": job_name,
+            "description": description,
+            "dependencies": list(dependencies or []),
+            "cmd": cmd,
+        })
+
+        print(f"[ Tag Tools ] Dry run job {job_id}: {job_name}")
+        print(f"[ Tag Tools ]   Depends on: {', '.join(dependencies) if dependencies else 'None'}")
+        print(f"[ Tag Tools ]   Command:    {cmd}")
+        return job_id
+
+def flame_python_path():
+    """Python bundled with the current version of Flame, used to run lib/tag_writer.py on Backburner."""
+
+    python_path = os.path.join("/opt", "Autodesk", "python", str(flame.get_version()), "bin", "python3")
+    if os.path.isfile(python_path):
+        return python_path
+    return "python3"
 
 def create_backburner_job(job_name, description, dependencies, cmd):
     """
@@ -453,36 +553,6 @@ def create_backburner_job(job_name, description, dependencies, cmd):
 
     return None
 
-def create_python_backburner_job(job_name, description, dependencies, function, args=None):
-    """
-    Send a callback to this Python file using command line job to backburner.
-
-    :note: Beware. The file must be executable and will use the Python
-           interpreter bundled with Flame. Change the header for a different
-           Python intepreter.
-
-    :param job_name: Name of the backburner job
-    :param description: Description of the backburner job
-    :param dependencies: None if the backburner job should execute arbitrarily.
-                         If you want to set up the job to executes after another
-                         known task, pass the backburner id or a list of ids
-                         here. This is typically used in conjunction with a
-                         postExportAsset hook where the export task runs on
-                         backburner. In this case, the hook will return the
-                         backburner id. By passing that id to this method,
-                         you create a job which only executes after the main
-                         export task has completed.
-    :param function: Function name to call
-    :param args: Function arguments
-    :return backburner_job_id: Id of the backburner job created
-    """
-    return create_backburner_job(
-        job_name=job_name,
-        description=description,
-        dependencies=dependencies,
-        cmd=" ".join([os.path.abspath(__file__), function, " ".join(args)]),
-    )
-
 def execute_command(command):
 
 
@@ -580,8 +650,7 @@ class tag_tools_export:
             preset_path = pyflame.convert_export_preset_name_to_path(self.preset_menu.text)
 
             # Get foreground option
-            #foreground = self.foreground_button.checked
-            foreground = True
+            foreground = self.foreground_button.checked
 
             # Between marks option
             between_marks = self.between_marks_button.checked
@@ -604,7 +673,11 @@ class tag_tools_export:
             exporter.export_between_marks = between_marks
             #exporter.include_subtitles = True
             #exporter.export_subtitles_as_files = True
-            
+
+            # Tags for all sequences are written together after the export
+            job_builder = TagJobBuilder(foreground, destination_path)
+            hooks = HooksOverride(foreground, job_builder)
+
             for item in self.selection:
                 print(f"[ Tag Tools ] Exporting: {item.name.get_value()}")
 
@@ -615,7 +688,9 @@ class tag_tools_export:
                 tags = list_to_string(item.tags.get_value())
 
                 # Export sequence
-                exporter.export(item, preset_path, destination_path, hooks=HooksOverride(foreground), hooks_user_data=tags)
+                exporter.export(item, preset_path, destination_path, hooks=hooks, hooks_user_data=tags)
+
+            job_builder.submit()
 
         def close_window() -> None:
             """
@@ -2,18 +2,21 @@
 Script Name: Tidy Nodes
 Written By: Kieran Hanrahan
 
-Script Version: 2.0.1
+Script Version: 2.1.0
 Flame Version: 2025
 
 URL: http://github.com/khanrahan/tidy-nodes
 
 Creation Date: 02.01.24
-Update Date: 03.11.25
+Update Date: 10.19.26
 
 Description:
 
     Align, distribute, or both (aka tidy) nodes in the Action or Batch schematic.
 
+    Layout Graph arranges the selected Batch nodes in columns following their
+    connections, upstream nodes on the left.  Undo Layout moves the nodes back.
+
 Menus:
 
     Right-click selected items in the Action schematic --> Tidy Nodes...
@@ -31,15 +34,24 @@ To Install:
     /Users/<user_name>/Library/Preferences/Autodesk/flame/python/
 """
 
+from collections import deque
+
 import flame
 from PySide6 import QtCore, QtGui, QtWidgets
 
 TITLE = 'Tidy Nodes'
-VERSION_INFO = (2, 0, 1)
+VERSION_INFO = (2, 1, 0)
 VERSION = '.'.join([str(num) for num in VERSION_INFO])
 TITLE_VERSION = f'{TITLE} v{VERSION}'
 MESSAGE_PREFIX = '[PYTHON]'
 
+LAYOUT_SPACING_X = 250
+LAYOUT_SPACING_Y = 100
+LAYOUT_SWEEPS = 4
+
+# Nodes and starting positions of the last Layout Graph, for Undo Layout
+last_layout = []
+
 
 class FlameButton(QtWidgets.QPushButton):
     """
@@ -682,6 +694,103 @@ class FlameSlider(QtWidgets.QLineEdit):
             self.setText('%.2f' % float(value))
 
 
+def layered_layout(positions, edges, spacing_x=LAYOUT_SPACING_X,
+                   spacing_y=LAYOUT_SPACING_Y, sweeps=LAYOUT_SWEEPS):
+    """Compute a layered layout for a node graph.
+
+    Nodes are put in columns by their longest path from an upstream node, so every
+    connection flows left to right.  The order within each column is refined with
+    barycenter sweeps, then each node is placed at the average height of the nodes
+    connected to it and pushed apart to keep the columns free of overlaps.  Each
+    sweep sorts the columns, so the layout is O(n log n) per sweep.
+
+    Args:
+        positions (list):
+            Integer x, y starting position of each node.
+        edges (list):
+            Tuples of (upstream index, downstream index) into positions.
+        spacing_x (int):
+            Distance between columns.
+        spacing_y (int):
+            Minimum distance between nodes in a column.
+        sweeps (int):
+            Number of down and up stream ordering sweeps.
+
+    Returns:
+        List of integer x, y destination positions in the same order as positions.
+    """
+    count = len(positions)
+    upstream = [[] for _ in range(count)]
+    downstream = [[] for _ in range(count)]
+    for up, down in set(edges):
+        if up != down:
+            upstream[down].append(up)
+            downstream[up].append(down)
+
+    # Longest path layering.  Nodes left on a cycle are released left to right.
+    layer = [0] * count
+    indegree = [len(ups) for ups in upstream]
+    queue = deque(index for index in range(count) if not indegree[index])
+    waiting = sorted(range(count), key=lambda index: positions[index][0])
+    done = [False] * count
+    for _ in range(count):
+        if not queue:
+            queue.append(next(index for index in waiting if not done[index]))
+        index = queue.popleft()
+        done[index] = True
+        for down in downstream[index]:
+            if not done[down]:
+                layer[down] = max(layer[down], layer[index] + 1)
+                indegree[down] -= 1
+                if indegree[down] == 0:
+                    queue.append(down)
+
+    columns = [[] for _ in range(max(layer) + 1 if count else 0)]
+    for index in sorted(range(count), key=lambda index: positions[index][1]):
+        columns[layer[index]].append(index)
+
+    # Barycenter ordering
+    rank = [0] * count
+    for column in columns:
+        for position, index in enumerate(column):
+            rank[index] = position
+
+    def order_column(column, neighbors):
+        def barycenter(index):
+            if neighbors[index]:
+                return sum(rank[neighbor] for neighbor in neighbors[index]) / len(neighbors[index])
+            return rank[index]
+        column.sort(key=barycenter)
+        for position, index in enumerate(column):
+            rank[index] = position
+
+    for _ in range(sweeps):
+        for column in columns[1:]:
+            order_column(column, upstream)
+        for column in reversed(columns[:-1]):
+            order_column(column, downstream)
+
+    # Place each column at the height of its upstream nodes, spaced by spacing_y
+    origin_x = min(x for x, _ in positions) if count else 0
+    destinations = [None] * count
+    for number, column in enumerate(columns):
+        targets = []
+        for index in column:
+            placed = [destinations[up][1] for up in upstream[index] if destinations[up]]
+            targets.append(sum(placed) / len(placed) if placed else positions[index][1])
+
+        heights = []
+        for target in targets:
+            heights.append(max(target, heights[-1] + spacing_y) if heights else target)
+        shift = sum(target - height for target, height in zip(targets, heights)) / len(column)
+
+        for index, height in zip(column, heights):
+            destinations[index] = (int(round(origin_x + number * spacing_x)),
+                                   int(round(height + shift)))
+
+    return destinations
+
+
 class TidyNodes:
     """Tidy selected nodes in the Action or Batch schematic.
 
@@ -693,6 +802,8 @@ class TidyNodes:
             Selected node objects from Flame.
         starting_positions (list):
             Integer x, y starting positions of node objects in selection.
+        current_positions (list):
+            Integer x, y positions last written to the node objects in selection.
         boundaries (dict):
             Integer max and min values for x & y axis of selection node objects.
         center (tuple):
@@ -708,6 +819,7 @@ class TidyNodes:
 
         self.starting_positions = []
         self.get_starting_positions()
+        self.current_positions = list(self.starting_positions)
 
         self.boundaries = None
         self.get_boundaries()
@@ -773,28 +885,78 @@ class TidyNodes:
                 (self.boundaries['y_max'] - self.boundaries['y_min']) /
                 (len(self.selection) - 1))))
 
-        nodes_sorted_x = sorted(zip(self.selection, self.starting_positions),
-                                key=lambda node: node[1][0])
-        nodes_sorted_y = sorted(zip(self.selection, self.starting_positions),
-                                key=lambda node: node[1][1])
+        nodes_sorted_x = sorted(range(len(self.selection)),
+                                key=lambda index: self.starting_positions[index][0])
+        nodes_sorted_y = sorted(range(len(self.selection)),
+                                key=lambda index: self.starting_positions[index][1])
 
-        dest_x = [nodes_sorted_x[0][1][0] + spacing_x * num
+        dest_x = [self.starting_positions[nodes_sorted_x[0]][0] + spacing_x * num
                   for num in range(len(self.selection))]
-        dest_y = [nodes_sorted_y[0][1][1] + spacing_y * num
+        dest_y = [self.starting_positions[nodes_sorted_y[0]][1] + spacing_y * num
                   for num in range(len(self.selection))]
 
+        destinations = [list(pos) for pos in self.current_positions]
+
         # skip first and last.  these should not move.  only the interior nodes move.
         for index in list(range(len(self.selection)))[1:-1]:
             if x_axis:
-                nodes_sorted_x[index][0].pos_x.set_value(dest_x[index])
+                destinations[nodes_sorted_x[index]][0] = dest_x[index]
             if y_axis:
-                nodes_sorted_y[index][0].pos_y.set_value(dest_y[index])
+                destinations[nodes_sorted_y[index]][1] = dest_y[index]
+
+        self.move_nodes([tuple(pos) for pos in destinations])
+
+    def move_nodes(self, destinations):
+        """Move nodes to integer x, y destinations, in the same order as selection.
+
+        Only the axis values that differ from the current positions are written to
+        Flame.  Returns the number of nodes moved.
+        """
+        moved = 0
+        for index, (node, current_pos, dest_pos) in enumerate(
+                zip(self.selection, self.current_positions, destinations)):
+            if dest_pos == current_pos:
+                continue
+            if dest_pos[0] != current_pos[0]:
+                node.pos_x.set_value(dest_pos[0])
+            if dest_pos[1] != current_pos[1]:
+                node.pos_y.set_value(dest_pos[1])
+            self.current_positions[index] = dest_pos
+            moved += 1
+        return moved
 
     def return_to_starting_positions(self):
         """Move the nodes back to their starting positions."""
-        for node, start_pos in zip(self.selection, self.starting_positions):
-            node.pos_x.set_value(start_pos[0])
-            node.pos_y.set_value(start_pos[1])
+        self.move_nodes(self.starting_positions)
+
+    def get_connections(self):
+        """Get the connections between the selected Batch nodes.
+
+        Reads the input sockets of each node once.  Returns a list of tuples of
+        (upstream index, downstream index) into self.selection.
+        """
+        indexes = {node.name.get_value(): index for index, node in enumerate(self.selection)}
+        connections = []
+        for index, node in enumerate(self.selection):
+            try:
+                inputs = node.sockets.get('input', {})
+            except AttributeError:
+                continue
+            for names in inputs.values():
+                if isinstance(names, str):
+                    names = [names]
+                for name in names:
+                    if name in indexes:
+                        connections.append((indexes[name], index))
+        return connections
+
+    def layout(self):
+        """Arrange the nodes in columns following their connections.
+
+        Returns the number of nodes moved.
+        """
+        destinations = layered_layout(self.starting_positions, self.get_connections())
+        return self.move_nodes(destinations)
 
     def scale(self, scale_x, scale_y):
         """Scale nodes.
@@ -802,15 +964,17 @@ class TidyNodes:
         Scale the distance from the selected nodes based on the center point of the
         selection.
         """
-        for node, start_pos in zip(self.selection, self.starting_positions):
+        destinations = []
+        for start_pos in self.starting_positions:
             destination_x = int(round(
                     (start_pos[0] - self.center[0]) * scale_x + self.center[0]))
             destination_y = int(round(
                     (start_pos[1] - self.center[1]) * scale_y + self.center[1]))
 
-            # the 2 below are not added to the undo stack
-            node.pos_x.set_value(destination_x)
-            node.pos_y.set_value(destination_y)
+            destinations.append((destination_x, destination_y))
+
+        # not added to the undo stack
+        self.move_nodes(destinations)
 
     def scale_window(self):
         """Window for scaling interactively."""
@@ -976,6 +1140,36 @@ def tidy_vertical(selection):
     nodes.message('Done!')
 
 
+def layout_graph(selection):
+    """Arrange the selected Batch nodes in columns following their connections."""
+    nodes = TidyNodes(selection)
+    nodes.message(f'Laying out {len(selection)} nodes...')
+    moved = nodes.layout()
+    last_layout[:] = [(node, start_pos) for node, start_pos, current_pos in zip(
+            nodes.selection, nodes.starting_positions, nodes.current_positions)
+                      if start_pos != current_pos]
+    nodes.message(f'Moved {moved} of {len(selection)} nodes.')
+    nodes.message('Done!')
+
+
+def undo_layout(selection):
+    """Move the nodes of the last Layout Graph back to their starting positions."""
+    TidyNodes.message(f'Returning {len(last_layout)} nodes to their starting positions...')
+    for node, start_pos in last_layout:
+        try:
+            node.pos_x.set_value(start_pos[0])
+            node.pos_y.set_value(start_pos[1])
+        except Exception:  # node deleted since the layout
+            pass
+    last_layout.clear()
+    TidyNodes.message('Done!')
+
+
+def scope_undo_layout(selection):
+    """Test if there is a Layout Graph to undo.  Returns a bool."""
+    return bool(last_layout)
+
+
 def scope_nodes(selection):
     """Test for correct node object types, at least 2 or more.  Returns a bool."""
     valid_objects = (
@@ -1062,5 +1256,13 @@ def get_batch_custom_ui_actions():
                          {'name': 'Tidy Vertically',
                           'isVisible': scope_more_nodes,
                           'execute': tidy_vertical,
-                          'minimemVersion': '2025.0.0.0'}]
+                          'minimemVersion': '2025.0.0.0'},
+                         {'name': 'Layout Graph',
+                          'isVisible': scope_nodes,
+                          'execute': layout_graph,
+                          'minimumVersion': '2025.0.0.0'},
+                         {'name': 'Undo Layout',
+                          'isVisible': scope_undo_layout,
+                          'execute': undo_layout,
+                          'minimumVersion': '2025.0.0.0'}]
             }]
@@ -19,11 +19,11 @@
 
 """
 Script Name: Uber Save
-Script Version: 5.1.0
+Script Version: 5.2.0
 Flame Version: 2025
 Written by: Michael Vaglienty
 Creation Date: 07.28.19
-Update Date: 08.18.26
+Update Date: 10.19.26
 
 License: GNU General Public License v3.0 (GPL-3.0) - see LICENSE file for details
 
@@ -41,6 +41,11 @@ Usage:
 
     If multiple paths have been created, the one selected in the dropdown menu will be used to save batch groups.
 
+    Save Changed Batch Groups only saves batch groups that changed since they were last saved by Uber Save. A batch group is
+    skipped when its current iteration, nodes and node connections are the same as when it was last saved, it resolves to the
+    same save path and the saved setup still exists. Changes inside nodes that are not exposed to Flame's python API are not
+    detected, use Save All Batch Groups to save those.
+
     The path can be tokenized using the following tokens:
         <ProjectName> - Adds name of current Flame project to path
         <ProjectNickName> - Adds Flame project nicknick to path
@@ -67,6 +72,7 @@ Menus:
     Right-click selected batchgroups in desktop -> Uber Save... -> Iterate and Save Selected Batchgroups
 
     Right-click on desktop in media panel -> Uber Save... -> Save All Batchgroups
+    Right-click on desktop in media panel -> Uber Save... -> Save Changed Batchgroups
 
     Right-click in batch -> Uber Save... -> Save Current Batchgroup
     Right-click in batch -> Uber Save... -> Iterate and Save Current Batchgroup
@@ -77,6 +83,15 @@ To install:
 
 Updates:
 
+    v5.2.0 10.19.26
+        - Added Save Changed Batch Groups. Batch groups that have not changed since they were last saved are skipped.
+        - Resolved save paths are cached for the Flame session, unless the path uses time, user or shot name tokens.
+        - Saved, skipped and failed batch groups are listed with save times after saving.
+
+    v5.1.1 10.19.26
+        - Batch save paths for all batch groups are resolved in one pass. Each save path folder is only created once.
+        - Updated to PyFlameLib v5.5.2.
+
     v5.1.0 08.18.26
         - Simplified/improved the process of creating and saving paths further.
         - Updated to PyFlameLib v5.6.0.
@@ -170,6 +185,10 @@ Updates:
 
 import os
 import re
+import json
+import time
+import hashlib
+import datetime
 
 import flame
 from lib.pyflame_lib_uber_save import *
@@ -179,8 +198,21 @@ from lib.pyflame_lib_uber_save import *
 # ==============================================================================
 
 SCRIPT_NAME = 'Uber Save'
-SCRIPT_VERSION = 'v5.1.0'
+SCRIPT_VERSION = 'v5.2.0'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
+SAVE_STATE_PATH = os.path.join(SCRIPT_PATH, 'config', 'save_state.json')
+
+# Resolved batch save paths for the Flame session, by tokenized path, project name and nickname, batch group name,
+# tags and date.
+resolved_path_cache = {}
+
+# Tokens resolved from values that are not part of the resolved path cache key: time of day, user and
+# shot name (which can come from the render/write nodes). Paths with these tokens are not cached.
+UNCACHED_PATH_TOKENS = (
+    '<Hour>', '<Minute>', '<AMPM>', '<ampm>',
+    '<UserName>', '<UserNickName>',
+    '<ShotName>', '<SeqName>', '<SEQNAME>',
+    )
 
 # ==============================================================================
 # [Main Script]
@@ -208,6 +240,81 @@ def load_config() -> PyFlameConfig:
 
     return settings
 
+def load_save_state() -> dict:
+    """
+    Load Save State
+    ===============
+
+    Load the save path, setup path and fingerprint of each batch group last saved by Uber Save.
+
+    Returns
+    -------
+        save_state (dict):
+            Save state by project name, then batch group name. Empty if the file does not exist or can't be read.
+    """
+
+    try:
+        with open(SAVE_STATE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_save_state(save_state: dict) -> None:
+    """
+    Save Save State
+    ===============
+
+    Write the save state to a temp file first so an interrupted save doesn't leave a broken file behind.
+
+    Args
+    ----
+        save_state (dict):
+            Save state by project name, then batch group name.
+    """
+
+    os.makedirs(os.path.dirname(SAVE_STATE_PATH), exist_ok=True)
+    temp_path = SAVE_STATE_PATH + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(save_state, f, indent=4)
+    os.replace(temp_path, SAVE_STATE_PATH)
+
+def batch_group_fingerprint(batch_group) -> str:
+    """
+    Batch Group Fingerprint
+    =======================
+
+    Hash of the current iteration name and the attributes and socket connections of every node in a batch group.
+    Batch group must be open.
+
+    Args
+    ----
+        batch_group (flame.PyBatch):
+            Batch group to fingerprint.
+
+    Returns
+    -------
+        fingerprint (str):
+            SHA1 hex digest.
+    """
+
+    fingerprint = hashlib.sha1()
+    fingerprint.update(str(batch_group.current_iteration.name).encode())
+    fingerprint.update(str(batch_group.duration).encode())
+
+    for node in batch_group.nodes:
+        for attribute in node.attributes:
+            try:
+                fingerprint.update(f'{attribute}={getattr(node, attribute)}\n'.encode())
+            except Exception:
+                pass
+        try:
+            fingerprint.update(str(node.sockets).encode())
+        except Exception:
+            pass
+        fingerprint.update(b'\0')
+
+    return fingerprint.hexdigest()
+
 class UberSaveSetup:
 
     def __init__(self, selection) -> None:
@@ -653,43 +760,64 @@ class UberSave:
 
     # ==============================================================================
 
-    def resolve_path(self, batch_group) -> str:
+    def resolve_paths(self, batch_groups) -> list[str]:
         """
-        Resolve Path
-        ============
+        Resolve Paths
+        =============
 
-        Resolve path for batch setups folder.
+        Resolve batch setups folder paths for a list of batch groups.
         Any tokens in the path will be resolved.
 
-        Resolves different paths for Flame and Flare.
+        The save path is only split into tokens once and project, user, and date
+        values are only looked up once for all batch groups. Resolved paths are cached
+        for the Flame session, so only batch groups that are new, renamed or retagged
+        since the last save are resolved again. Paths using time, user or shot name
+        tokens are always resolved, see UNCACHED_PATH_TOKENS.
 
         Args
         ----
-            batch_group (flame.PyBatch): Batch group to use to resolve path.
+            batch_groups (list[flame.PyBatch]): Batch groups to use to resolve paths.
 
         Returns
         -------
-            resolved_save_path (str): Resolved path for batch setups.
-
-        Raises
-        ------
-            OSError:
-                If the resolved path could not be created.
+            resolved_save_paths (list[str]): Resolved paths for batch setups, in the same order as batch_groups.
         """
 
-        print('Resolving Batch Save Path...\n')
+        if any(token in self.batch_path for token in UNCACHED_PATH_TOKENS):
+            print('Resolving Batch Save Paths...\n')
 
-        resolved_save_path = pyflame.resolve_tokens(
-            tokenized_string=self.batch_path,
-            flame_pyobject=batch_group,)
+            return pyflame.resolve_tokens_bulk(
+                tokenized_string=self.batch_path,
+                flame_pyobjects=list(batch_groups),
+                )
 
-        os.makedirs(resolved_save_path, exist_ok=True)
+        today = datetime.date.today().isoformat()
 
-        return resolved_save_path
+        cache_keys = []
+        for batch_group in batch_groups:
+            try:
+                tags = str(batch_group.tags)
+            except Exception:
+                tags = ''
+            cache_keys.append((self.batch_path, self.flame_prj_name, self.flame_prj_nickname, str(batch_group.name)[1:-1], tags, today))
+
+        unresolved = [(cache_key, batch_group) for cache_key, batch_group in zip(cache_keys, batch_groups) if cache_key not in resolved_path_cache]
+
+        if unresolved:
+            print(f'Resolving Batch Save Paths: {len(unresolved)} of {len(cache_keys)}...\n')
+
+            resolved_paths = pyflame.resolve_tokens_bulk(
+                tokenized_string=self.batch_path,
+                flame_pyobjects=[batch_group for _, batch_group in unresolved],
+                )
+            for (cache_key, _), resolved_path in zip(unresolved, resolved_paths):
+                resolved_path_cache[cache_key] = resolved_path
+
+        return [resolved_path_cache[cache_key] for cache_key in cache_keys]
 
     # ==============================================================================
 
-    def save_batchgroup(self, save_path: str, batch_group, iterate: bool) -> None:
+    def save_batchgroup(self, save_path: str, batch_group, iterate: bool) -> str:
         """
         Save Batch Group
         ================
@@ -709,6 +837,11 @@ class UberSave:
             iterate (bool):
                 Iterate up before saving. Forced True on a batch group's first save.
 
+        Returns
+        -------
+            setup_path (str):
+                Path of the saved batch setup file.
+
         Raises
         ------
             Exception:
@@ -771,9 +904,11 @@ class UberSave:
         pyflame.print(f'Batch Saved: {selected_batch_name}', new_line=False)
         print('-' * 80, '\n')
 
+        return shot_save_path + '.batch'
+
     # ==============================================================================
 
-    def save_batch_groups(self, batch_groups, iterate: bool, complete_message: str) -> None:
+    def save_batch_groups(self, batch_groups, iterate: bool, complete_message: str, incremental: bool=False) -> None:
         """
         Save Batch Groups
         =================
@@ -782,6 +917,10 @@ class UberSave:
         batch groups have been processed so a bad path does not open one message
         window per batch group.
 
+        The save path and fingerprint of each saved batch group are stored in the save
+        state file. In incremental mode, batch groups that have not changed since they
+        were last saved are skipped.
+
         Args
         ----
             batch_groups (list[flame.PyBatch]):
@@ -792,36 +931,116 @@ class UberSave:
 
             complete_message (str):
                 Message printed when every batch group saved without error.
+
+            incremental (bool, optional):
+                Skip batch groups that have not changed since they were last saved.
+                (Default: `False`)
         """
 
+        batch_groups = list(batch_groups)
         errors = []
+        results = []
+        created_paths = set()
 
-        for batch_group in batch_groups:
+        try:
+            resolved_paths = self.resolve_paths(batch_groups)
+        except Exception as e:
+            pyflame.print(f'Unable to resolve batch save path: {e}', print_type=PrintType.ERROR)
+            PyFlameMessageWindow(
+                message=f'Unable to resolve batch save path. Check path in setup.\n\n{e}',
+                message_type=MessageType.ERROR,
+                parent=None,
+                )
+            return
+
+        save_state = load_save_state()
+        project_save_state = save_state.setdefault(self.flame_prj_name, {})
+
+        for batch_group, resolved_path in zip(batch_groups, resolved_paths):
             batch_group_name = str(batch_group.name)[1:-1]
+            start_time = time.perf_counter()
 
             try:
-                resolved_path = self.resolve_path(
-                    batch_group=batch_group,
-                    )
-
-                self.save_batchgroup(
+                if incremental and not iterate:
+                    batch_group.open()
+                    last_save = project_save_state.get(batch_group_name, {})
+                    if (
+                        last_save.get('save_path') == resolved_path
+                        and last_save.get('fingerprint') == batch_group_fingerprint(batch_group)
+                        and os.path.isfile(last_save.get('setup_path', ''))
+                        ):
+                        pyflame.print(f'Batch Unchanged, Skipping: {batch_group_name}')
+                        results.append((batch_group_name, 'Skipped', time.perf_counter() - start_time))
+                        continue
+
+                if resolved_path not in created_paths:
+                    os.makedirs(resolved_path, exist_ok=True)
+                    created_paths.add(resolved_path)
+
+                setup_path = self.save_batchgroup(
                     save_path=resolved_path,
                     batch_group=batch_group,
                     iterate=iterate,
                     )
+
+                project_save_state[batch_group_name] = {
+                    'save_path': resolved_path,
+                    'setup_path': setup_path,
+                    'fingerprint': batch_group_fingerprint(batch_group),
+                    }
+                results.append((batch_group_name, 'Saved', time.perf_counter() - start_time))
             except Exception as e:
                 pyflame.print(f'Batch Not Saved: {batch_group_name} - {e}', print_type=PrintType.ERROR)
                 errors.append(f'{batch_group_name}: {e}')
+                results.append((batch_group_name, 'Failed', time.perf_counter() - start_time))
+
+        try:
+            save_save_state(save_state)
+        except OSError as e:
+            pyflame.print(f'Unable to write save state: {e}', print_type=PrintType.ERROR)
+
+        summary = self.print_save_summary(results)
 
         if errors:
             PyFlameMessageWindow(
-                message='Batch groups not saved. Check path in setup.\n\n' + '\n\n'.join(errors),
+                message=f'Batch groups not saved. Check path in setup.\n\n{summary}\n\n' + '\n\n'.join(errors),
                 message_type=MessageType.ERROR,
                 parent=None,
                 )
             return
 
-        pyflame.print(complete_message, text_color=TextColor.GREEN)
+        pyflame.print(f'{complete_message}\n\n{summary}', text_color=TextColor.GREEN)
+
+    def print_save_summary(self, results: list) -> str:
+        """
+        Print Save Summary
+        ==================
+
+        Print the result and save time of each batch group to the terminal.
+
+        Args
+        ----
+            results (list):
+                List of (batch group name, 'Saved'/'Skipped'/'Failed', seconds).
+
+        Returns
+        -------
+            summary (str):
+                Number of saved, skipped and failed batch groups and total time.
+        """
+
+        print('Save Summary')
+        print('-' * 80)
+        for batch_group_name, result, seconds in results:
+            print(f'{batch_group_name:<55} {result:<8} {seconds:8.2f} sec')
+        print('-' * 80)
+
+        counts = {result: sum(1 for _, r, _ in results if r == result) for result in ('Saved', 'Skipped', 'Failed')}
+        total_time = sum(seconds for _, _, seconds in results)
+        summary = f'Saved: {counts["Saved"]}  Skipped: {counts["Skipped"]}  Failed: {counts["Failed"]}  Time: {total_time:.2f} sec'
+        print(summary, '\n')
+
+        return summary
 
     # ==============================================================================
 
@@ -867,6 +1086,21 @@ class UberSave:
             complete_message='Saving all batch groups complete',
             )
 
+    def batch_group_save_changed(self) -> None:
+        """
+        Batch Group Save Changed
+        ========================
+
+        Save batchgroups in desktop that changed since they were last saved.
+        """
+
+        self.save_batch_groups(
+            batch_groups=flame.project.current_project.current_workspace.desktop.batch_groups,
+            iterate=False,
+            complete_message='Saving changed batch groups complete',
+            incremental=True,
+            )
+
     def batch_group_save_selected(self) -> None:
         """
         Batch Group Save Selected
@@ -924,6 +1158,15 @@ def uber_batch_group_save_all(selection) -> None:
     if uber_save.valid:
         uber_save.batch_group_save_all()
 
+def uber_batch_group_save_changed(selection) -> None:
+    """
+    Save batchgroups in desktop that changed since they were last saved.
+    """
+
+    uber_save = UberSave(selection)
+    if uber_save.valid:
+        uber_save.batch_group_save_changed()
+
 def uber_batch_group_save_selected(selection) -> None:
     """
     Save selected batchgroups in desktop.
@@ -999,6 +1242,12 @@ def get_media_panel_custom_ui_actions():
                     'execute': uber_batch_group_save_all,
                     'minimumVersion': '2025'
                 },
+                {
+                    'name': 'Save Changed Batch Groups',
+                    'isVisible': scope_desktop,
+                    'execute': uber_batch_group_save_changed,
+                    'minimumVersion': '2025'
+                },
                 {
                     'name': 'Save Selected Batch Groups',
                     'isVisible': scope_batch,
@@ -20,12 +20,12 @@
 
 """
 Script Name: Uber Slate Maker
-Script Version: v2.6.0
+Script Version: v2.6.1
 Flame Version: 2027
 Written by: Michael Vaglienty
 Extended by: Bryan Bayley (v2.0.0 and later)
 Creation Date: 12.29.18
-Update Date: 08.06.26
+Update Date: 10.19.26
 
 Derived from: Slate Maker v1.0.0 / Uber Slate Maker v1.3.1
 
@@ -120,6 +120,12 @@ Usage:
 
 Updates:
 
+    v2.6.1 10.19.26
+        - Updated to PyFlameLib v5.5.2.
+        - CSV files are parsed once and shared by the pre-flight
+          check, slate creation and the CSV editor. Large CSV files
+          open in the editor without locking the UI.
+
     v2.6.0 08.06.26
         - Facility-agnostic update fields: the Update <Field> menu
           now learns its field list from the slates you create -
@@ -235,7 +241,6 @@ To install:
 # [Import Modules]
 #-------------------------------------
 
-import csv
 import datetime
 import json
 import os
@@ -251,7 +256,7 @@ from lib.pyflame_lib_uber_slate_maker import *
 #-------------------------------------
 
 SCRIPT_NAME = 'Uber Slate Maker'
-SCRIPT_VERSION = 'v2.6.0'
+SCRIPT_VERSION = 'v2.6.1'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
 # Shared config schema - all modes load the same config/config.json.
@@ -1292,17 +1297,16 @@ class SlateMaker():
         errors = []
         warnings = []
 
-        with open(csv_file_path, mode='r', newline='') as f:
-            reader = csv.reader(f)
-            try:
-                headers = [h.strip() for h in next(reader)]
-            except StopIteration:
-                PyFlameMessageWindow(
-                    message='CSV pre-flight: file is empty.',
-                    type=MessageType.ERROR,
-                    )
-                return False
-            rows = list(reader)
+        # Parsed once and cached, create_slate_dicts reuses the same data
+        csv_data = PyFlameCSVData.load(csv_file_path)
+        if not csv_data.column_count:
+            PyFlameMessageWindow(
+                message='CSV pre-flight: file is empty.',
+                type=MessageType.ERROR,
+                )
+            return False
+        headers = [h.strip() for h in csv_data.headers]
+        rows = list(csv_data.rows())
 
         # No data rows
         if not rows:
@@ -1569,10 +1573,10 @@ class SlateMaker():
         slate_dict = {}
         slate_names = []
 
-        with open(csv_file_path, mode="r", newline="") as file:
-            reader = csv.reader(file)
-            tokens = next(reader)
-            for index, row in enumerate(reader, start=1):
+        csv_data = PyFlameCSVData.load(csv_file_path)
+        tokens = csv_data.headers
+        if tokens:
+            for index, row in enumerate(csv_data.rows(), start=1):
                 slate_key = f"Slate {index}"
                 self.row_dict = dict(zip(tokens, row))
 
@@ -1,10 +1,10 @@
 """
 Script Name: BB Archiver UI
-Script Version: 1.8.0
+Script Version: 1.9.0
 Flame Version: 2023.2
 Written by: John Geehreng
 Creation Date: 11.17.22
-Update Date: 02.05.24
+Update Date: 10.19.26
 
 Script Type: Main Menu
 
@@ -12,11 +12,15 @@ Description:
 
     This is a simple UI for Background Archiving using Backburner Manager. The script only works with the local flame, it does not support remote project archiving.
 
+    Size estimates run in the background, so several projects or archive option sets can be estimated at the same time.
+    Estimates are saved in the config folder per project and archive options and reused for 24 hours.
+
 To install:
 
     Copy script into /opt/Autodesk/shared/python/bb_archiver_ui
 
 Updates:
+10.19.26 - v1.9 - Size estimates run in the background and are cached per project and archive options. Project list is cached.
 02.05.24 - v1.8 - Prep for Distribution
 10.14.23 - v1.7 - Turned off emailing
 05.22.23 - v1.4 - Fixed typo
@@ -38,12 +42,293 @@ import xml.etree.ElementTree as ET
 import os
 import flame
 import re
+import json
+import time
+import queue
+import threading
 import subprocess
 import platform
 
 SCRIPT_NAME = 'BB Archiver UI'
 SCRIPT_PATH = '/opt/Autodesk/shared/python/bb_archiver_ui'
-SCRIPT_VERSION = '1.8.0'
+SCRIPT_VERSION = '1.9.0'
+
+FLAME_ARCHIVE_LIST_PATH = '/opt/Autodesk/io/bin/flame_archive'
+FLAME_PROJECT_PATH = '/opt/Autodesk/project'
+PROJECT_LIST_CACHE_TIME = 3600 # Seconds the project list is reused for, unless a project is added or removed
+SIZE_ESTIMATE_CACHE_PATH = os.path.join(SCRIPT_PATH, 'config', 'size_estimates.json')
+SIZE_ESTIMATE_CACHE_TIME = 24 * 3600 # Seconds a size estimate is reused for
+SIZE_ESTIMATE_MAX_JOBS = 3 # Number of size estimates run at the same time
+
+# Archive options in the order they are shown, with the names used in the config and the flame_archive --omit names
+ARCHIVE_OPTIONS = [
+    ('source_media', 'Source Media Cache', 'sources'),
+    ('cache_uncached', 'Cache Uncached Media', None),
+    ('maps', 'Maps and ML Cache', 'maps'),
+    ('renders', 'Timeline Renders', 'renders'),
+    ('unused', 'Unused Versions', 'unused'),
+    ('otoc', 'TOC', None),
+    ]
+
+#-------------------------------------#
+# flame_archive
+
+def flame_archive_path():
+
+    return '/opt/Autodesk/io/' + str(flame.get_version()) + '/bin/flame_archive'
+
+def flame_archive_args(mode, project_name, archive_options, archive_file=None):
+    """Build flame_archive arguments for a project.
+
+    Args:
+        mode (str): '-e' to estimate the archive size, '-g' to archive.
+        project_name (str): Flame project to archive.
+        archive_options (dict): True/False for each ARCHIVE_OPTIONS name.
+        archive_file (str): Archive to write to when archiving.
+
+    Returns:
+        list: flame_archive command
+    """
+
+    args = [flame_archive_path(), '-a', mode]
+
+    omit = ['sources', 'renders', 'maps', 'unused']
+    for name, _, omit_name in ARCHIVE_OPTIONS:
+        if omit_name and archive_options.get(name):
+            omit.remove(omit_name)
+    if omit:
+        args += ['--omit', ','.join(omit)]
+
+    if not archive_options.get('cache_uncached'):
+        args.append('-k')
+    if archive_options.get('otoc'):
+        args.append('-T')
+
+    args += ['-P', project_name]
+    if archive_file:
+        args += ['-F', archive_file]
+
+    return args
+
+def archive_options_text(archive_options):
+
+    included = [label for name, label, _ in ARCHIVE_OPTIONS if archive_options.get(name)]
+    return ', '.join(included) if included else 'No Options'
+
+def parse_size_estimate(lines):
+    """Get the size estimate from flame_archive -e output. Returns None if no size was found."""
+
+    size_estimate = None
+    for line in lines:
+        line = line.strip()
+        if re.search(r'(?i)stopping managed threads\.', line):
+            break
+        if 'B' in line:
+            size_estimate = line
+
+    return size_estimate
+
+_project_list_cache = {}
+
+def get_local_flame_projects(refresh=False):
+    """Get all flame projets from /opt/Autodesk/io/bin/flame_archive -l
+
+    The list is cached for PROJECT_LIST_CACHE_TIME, or until the project folder changes.
+
+    Returns:
+        list: This is a list of the flame projects that exist on the workstation
+    """
+
+    try:
+        project_folder_mtime = os.path.getmtime(FLAME_PROJECT_PATH)
+    except OSError:
+        project_folder_mtime = None
+
+    if (not refresh and _project_list_cache
+            and _project_list_cache['project_folder_mtime'] == project_folder_mtime
+            and time.time() - _project_list_cache['time'] < PROJECT_LIST_CACHE_TIME):
+        return list(_project_list_cache['projects'])
+
+    project_list = []
+    proc = subprocess.Popen([FLAME_ARCHIVE_LIST_PATH, '-l'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    output = proc.communicate()[0]
+
+    if isinstance(output, bytes):
+        output = output.decode('utf-8')
+
+    proj_trip = False
+    for proj in output.split('\n'):
+        proj = re.sub(r'^\s+', '', proj)
+
+        if re.search(r'(?i)stopping managed threads\.', proj):
+            break
+
+        if re.search(r'(?i)^projects:', proj):
+            proj_trip = True
+            continue
+
+        if not proj_trip or proj == '.DS_Store':
+            continue
+
+        project_list.append(proj)
+
+    _project_list_cache.update(time=time.time(), project_folder_mtime=project_folder_mtime, projects=project_list)
+
+    return list(project_list)
+
+class SizeEstimator(object):
+    """Run flame_archive size estimates in the background.
+
+    Up to SIZE_ESTIMATE_MAX_JOBS estimates run at the same time, each in a thread that reads the
+    flame_archive output line by line. Output and results are passed back through a queue that a
+    QTimer empties on the main thread, so only the main thread updates the UI, calls Flame and
+    writes the cache.
+
+    Estimates are keyed by project and archive options and saved to SIZE_ESTIMATE_CACHE_PATH with
+    the time they finished.
+    """
+
+    def __init__(self, cache_path=SIZE_ESTIMATE_CACHE_PATH, max_jobs=SIZE_ESTIMATE_MAX_JOBS):
+
+        self.cache_path = cache_path
+        self.estimates = {}
+        self.on_change = None
+
+        self._slots = threading.Semaphore(max_jobs)
+        self._queue = queue.Queue()
+        self._timer = QtCore.QTimer()
+        self._timer.setInterval(200)
+        self._timer.timeout.connect(self.poll)
+
+        try:
+            with open(cache_path) as cache_file:
+                self.estimates = json.load(cache_file)
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def estimate_key(project_name, archive_options):
+
+        return project_name + '|' + ','.join(name for name, _, _ in ARCHIVE_OPTIONS if archive_options.get(name))
+
+    def cached(self, project_name, archive_options):
+        """Get a finished estimate that is less than SIZE_ESTIMATE_CACHE_TIME old, or None."""
+
+        estimate = self.estimates.get(self.estimate_key(project_name, archive_options))
+        if estimate and estimate['status'] == 'done' and time.time() - estimate['time'] < SIZE_ESTIMATE_CACHE_TIME:
+            return estimate
+        return None
+
+    def estimate(self, project_name, archive_options):
+        """Start a size estimate. Returns False if the same estimate is already running."""
+
+        key = self.estimate_key(project_name, archive_options)
+        if key in self.estimates and self.estimates[key]['status'] in ('queued', 'running'):
+            return False
+
+        command = flame_archive_args('-e', project_name, archive_options)
+        print ('size_estimate_command: ', ' '.join(command))
+
+        self.estimates[key] = {
+            'project': project_name,
+            'options': archive_options_text(archive_options),
+            'status': 'queued',
+            'size': None,
+            'output': '',
+            'time': time.time(),
+            }
+
+        threading.Thread(target=self._run, args=(key, command), daemon=True).start()
+        self._timer.start()
+        self._changed()
+
+        return True
+
+    def poll(self):
+        """Apply output and results from the estimate threads. Runs on the main thread."""
+
+        finished = False
+        while True:
+            try:
+                key, status, value = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            estimate = self.estimates[key]
+            estimate['status'] = status
+            if status == 'running':
+                estimate['output'] = value
+                continue
+
+            estimate['time'] = time.time()
+            estimate['output'] = ''
+            finished = True
+            if status == 'done':
+                estimate['size'] = value
+                print ('Size Estimate is: ', value)
+                flame.messages.show_in_console('Size Estimate for ' + estimate['project'] + ' (' + estimate['options'] + ') is ' + value + '.', 'info', 15)
+            else:
+                print ('Size Estimate failed: ', value)
+                flame.messages.show_in_console('Size Estimate for ' + estimate['project'] + ' failed: ' + value, 'error', 15)
+
+        if finished:
+            self._save()
+        if not any(estimate['status'] in ('queued', 'running') for estimate in self.estimates.values()):
+            self._timer.stop()
+
+        self._changed()
+
+    def _run(self, key, command):
+
+        with self._slots:
+            self._queue.put((key, 'running', ''))
+            lines = []
+            try:
+                proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True, bufsize=1)
+                for line in proc.stdout:
+                    line = line.strip()
+                    if line:
+                        lines.append(line)
+                        self._queue.put((key, 'running', line))
+                proc.wait()
+            except OSError as e:
+                self._queue.put((key, 'failed', str(e)))
+                return
+
+            size_estimate = parse_size_estimate(lines)
+            if size_estimate:
+                self._queue.put((key, 'done', size_estimate))
+            else:
+                self._queue.put((key, 'failed', 'flame_archive returned ' + str(proc.returncode) + ' without a size estimate.'))
+
+    def _changed(self):
+
+        if self.on_change:
+            try:
+                self.on_change()
+            except RuntimeError:
+                # Window was closed
+                self.on_change = None
+
+    def _save(self):
+
+        done = {key: estimate for key, estimate in self.estimates.items() if estimate['status'] == 'done'}
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path + '.tmp', 'w') as cache_file:
+                json.dump(done, cache_file, indent=4, sort_keys=True)
+            os.replace(self.cache_path + '.tmp', self.cache_path)
+        except OSError as e:
+            print ('Unable to save size estimates: ', e)
+
+_size_estimator = None
+
+def get_size_estimator():
+
+    global _size_estimator
+    if _size_estimator is None:
+        _size_estimator = SizeEstimator()
+    return _size_estimator
 
 #-------------------------------------#
 # Main Script
@@ -270,45 +555,8 @@ class bb_archiver_ui(object):
         print ('Job Folders: ',self.job_folder_path)
         print ('Archive Path: ',self.archive_path)
 
-        def get_local_flame_projects():
-            """Get all flame projets from /opt/Autodesk/io/bin/flame_archive -l
-
-            Returns:
-                list: This is a list of the flame projects that exist on the workstation
-            """
-            project_list = []
-            proc = subprocess.Popen(['/opt/Autodesk/io/bin/flame_archive', '-l'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-            output = proc.communicate()[0]
-
-            if isinstance(output, bytes):
-                output = output.decode('utf-8')
-
-            proj_trip = False
-            for proj in output.split('\n'):
-                proj = re.sub(r'^\s+', '', proj)
-
-                if re.search(r'(?i)stopping managed threads\.', proj):
-                    break
-
-                if re.search(r'(?i)^projects:', proj):
-                    proj_trip = True
-                    continue
-
-                if not proj_trip:
-                    continue
-
-                project_list.append(proj)
-
-            return project_list
-
         project_list = get_local_flame_projects()
 
-        try:
-            project_list.remove(".DS_Store")
-        except:
-            pass
-            print ("project_list: ", project_list)
-
         def format_flame_archive():
 
             # Get Flame Version
@@ -345,12 +593,18 @@ class bb_archiver_ui(object):
                     buttons = ["Ok"])
                 self.window.show()
 
-        def get_size_estimate():
-            # Change cursor to busy
-            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.BusyCursor)
+        def get_archive_options():
 
-            # Get Flame Version and other variables
-            flame_version = flame.get_version()
+            return {
+                'source_media': self.source_media_cache_pb.isChecked(),
+                'cache_uncached': self.cache_uncached_media_pb.isChecked(),
+                'maps': self.maps_and_ml_cache_pb.isChecked(),
+                'renders': self.timeline_fx_renders_pb.isChecked(),
+                'unused': self.unused_versions_pb.isChecked(),
+                'otoc': self.otoc_pb.isChecked(),
+                }
+
+        def get_size_estimate():
 
             project_name = self.project_menu_push_button.text()
             current_project_name = flame.project.current_project.name
@@ -358,75 +612,46 @@ class bb_archiver_ui(object):
 
             if project_name == current_project_name or project_name == current_project_nickname:
                 self.window.hide()
-                warning_dialogue = flame.messages.show_in_dialog(
+                flame.messages.show_in_dialog(
                     title = "Warning",
                     message = "Cannot get size estimate for current project.",
                     type = "warning",
                     buttons = ["Ok"],
                     cancel_button = "Cancel")
-                if warning_dialogue == "Ok":
-                    self.window.show()
-                    return
-                else:
-                    self.window.show()
-                    return
+                self.window.show()
+                return
 
-            flame.messages.show_in_console('Getting Size Estimate for ' + project_name + '...', 'info',20)
-
-            size_estimate_command = "/opt/Autodesk/io/" + str(flame_version) + "/bin/flame_archive -a -e --omit sources,renders,maps,unused -k -P " + project_name
-
-            # Change the commands depending on what buttons were pressed:
-            if self.source_media_cache_pb.isChecked() and self.maps_and_ml_cache_pb.isChecked() and self.timeline_fx_renders_pb.isChecked() and self.unused_versions_pb.isChecked() and self.cache_uncached_media_pb.isChecked():
-                size_estimate_command = size_estimate_command.replace(" --omit sources,renders,maps,unused -k -P"," -P")
-            if self.source_media_cache_pb.isChecked():
-                size_estimate_command = size_estimate_command.replace("sources,","")
-                self.source_media=True
-            if self.cache_uncached_media_pb.isChecked():
-                size_estimate_command = size_estimate_command.replace(" -k -P "," -P ")
-            if self.maps_and_ml_cache_pb.isChecked():
-                size_estimate_command = size_estimate_command.replace("maps,","")
-            if self.timeline_fx_renders_pb.isChecked():
-                size_estimate_command = size_estimate_command.replace("renders,","")
-            if self.unused_versions_pb.isChecked():
-                size_estimate_command = size_estimate_command.replace(",unused","")
-            if self.otoc_pb.isChecked():
-                size_estimate_command = size_estimate_command.replace(" -P "," -T -P ")
-
-            print ('size_estimate_command: ', size_estimate_command)
-            command = size_estimate_command.split()
-            proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-            output = proc.communicate()[0]
-
-            if isinstance(output, bytes):
-                output = output.decode('utf-8')
-
-            proj_trip = False
-            for proj in output.split('\n'):
-                proj = re.sub(r'^\s+', '', proj)
-
-                if re.search(r'(?i)stopping managed threads\.', proj):
-                    break
+            archive_options = get_archive_options()
+            size_estimator = get_size_estimator()
+
+            cached_estimate = size_estimator.cached(project_name, archive_options)
+            if cached_estimate:
+                flame.messages.show_in_console('Size Estimate for ' + project_name + ' (' + cached_estimate['options'] + ') is ' + cached_estimate['size'] + '.', 'info',15)
+                update_size_estimates()
+                return
 
-                if re.search('B', proj):
-                    proj_trip = True
-                    print ('Size Estimate is: ', proj)
-                    flame.messages.show_in_console('Size Estimate for ' + project_name + ' is ' + proj + '.', 'info',15)
-                    message = 'Size Estimate for ' + project_name + ' is ' + proj + '.'
-                    continue
+            if size_estimator.estimate(project_name, archive_options):
+                flame.messages.show_in_console('Getting Size Estimate for ' + project_name + '...', 'info',20)
 
-                if not proj_trip:
-                    continue
+        def update_size_estimates():
 
-            # Restore cursor
-            QtWidgets.QApplication.restoreOverrideCursor()
-            self.window.hide()
-            flame.messages.show_in_dialog(
-               title = "Size Estimate",
-               message = message,
-               type = "info",
-               buttons = ["Ok"],
-               cancel_button = "Cancel")
-            self.window.show()
+            # List running estimates first, then finished estimates, newest first
+            size_estimator = get_size_estimator()
+            estimates = sorted(size_estimator.estimates.values(), key=lambda estimate: (estimate['status'] == 'done', -estimate['time']))
+
+            lines = []
+            for estimate in estimates:
+                name = estimate['project'] + ' (' + estimate['options'] + ')'
+                if estimate['status'] == 'done':
+                    lines.append(name + ': ' + estimate['size'] + '  [' + time.strftime('%m.%d.%y %H:%M', time.localtime(estimate['time'])) + ']')
+                elif estimate['status'] == 'failed':
+                    lines.append(name + ': Failed')
+                elif estimate['status'] == 'running':
+                    lines.append(name + ': Estimating... ' + estimate['output'])
+                else:
+                    lines.append(name + ': Waiting...')
+
+            self.size_estimates_text_edit.setText('\n'.join(lines))
 
         def send_archive_job_to_bbm():
 
@@ -493,9 +718,7 @@ class bb_archiver_ui(object):
                 server = platform.node().split('.')[0]
             machine_name = platform.node().split('.')[0]
 
-            # Get Flame Version and other variables
-            flame_version = flame.get_version()
-
+            # Get project and archive path variables
             project_name = self.project_menu_push_button.text()
             machine_name = platform.node().split('.')[0]
             current_project_name = flame.project.current_project.name
@@ -525,8 +748,8 @@ class bb_archiver_ui(object):
                     self.window.show()
                     return
 
-            archive_command = "/opt/Autodesk/io/" + str(flame_version) + "/bin/flame_archive -a -g --omit sources,renders,maps,unused -k -P " + project_name + " -F " + resolved_path + "/" + project_name + "_Archive"
             archive_file = resolved_path + "/" + project_name + "_Archive"
+            archive_command = ' '.join(flame_archive_args('-g', project_name, get_archive_options(), archive_file))
 
             if os.path.isfile(archive_file):
                 pass
@@ -538,23 +761,6 @@ class bb_archiver_ui(object):
             else:
                 return
 
-            # Change the commands depending on what buttons were pressed:
-            if self.source_media_cache_pb.isChecked() and self.maps_and_ml_cache_pb.isChecked() and self.timeline_fx_renders_pb.isChecked() and self.unused_versions_pb.isChecked() and self.cache_uncached_media_pb.isChecked():
-                archive_command = archive_command.replace(" --omit sources,renders,maps,unused -k -P"," -P")
-            if self.source_media_cache_pb.isChecked():
-                archive_command = archive_command.replace("sources,","")
-                self.source_media=True
-            if self.cache_uncached_media_pb.isChecked():
-                archive_command = archive_command.replace(" -k -P "," -P ")
-            if self.maps_and_ml_cache_pb.isChecked():
-                archive_command = archive_command.replace("maps,","")
-            if self.timeline_fx_renders_pb.isChecked():
-                archive_command = archive_command.replace("renders,","")
-            if self.unused_versions_pb.isChecked():
-                archive_command = archive_command.replace(",unused","")
-            if self.otoc_pb.isChecked():
-                archive_command = archive_command.replace(" -P "," -T -P ")
-
             qt_app_instance = QtWidgets.QApplication.instance()
             qt_app_instance.clipboard().setText(archive_command)
             print ('archive_command: ' , archive_command)
@@ -598,6 +804,7 @@ class bb_archiver_ui(object):
         def close_window():
                 print('\n')
                 print('>' * 10, f'{SCRIPT_NAME} {SCRIPT_VERSION}', '<' * 10, '\n')
+                get_size_estimator().on_change = None
                 self.window.close()
 
         def cache_toggle():
@@ -612,7 +819,7 @@ class bb_archiver_ui(object):
 
         self.window = self.prefs_window = PyFlameWindow(
             width=620,
-            height=320,
+            height=470,
             title=f'{SCRIPT_NAME} <small>{SCRIPT_VERSION}'
             )
 
@@ -635,6 +842,10 @@ class bb_archiver_ui(object):
         self.project_label = PyFlameLabel(text='Flame Project', style=Style.UNDERLINE)
         self.segment_size_label = PyFlameLabel(text='Segment Size', style=Style.UNDERLINE)
         self.archive_options_label = PyFlameLabel(text='Archive Options', style=Style.UNDERLINE)
+        self.size_estimates_label = PyFlameLabel(text='Size Estimates', style=Style.UNDERLINE)
+
+        # Text Edits
+        self.size_estimates_text_edit = PyFlameTextEdit(text='', height=120, read_only=True)
 
         BUTTON_WIDTH = 205
 
@@ -697,9 +908,17 @@ class bb_archiver_ui(object):
         grid_layout.addWidget(self.otoc_pb, 4, 2)
 
         grid_layout.addWidget(self.size_estimate_btn, 5, 2)
-        grid_layout.addWidget(self.setup_btn, 6, 0)
-        grid_layout.addWidget(self.bg_archive_btn, 6, 1)
-        grid_layout.addWidget(self.cancel_btn, 6, 2)
+
+        grid_layout.addWidget(self.size_estimates_label, 6, 0)
+        grid_layout.addWidget(self.size_estimates_text_edit, 7, 0, 1, 3)
+
+        grid_layout.addWidget(self.setup_btn, 8, 0)
+        grid_layout.addWidget(self.bg_archive_btn, 8, 1)
+        grid_layout.addWidget(self.cancel_btn, 8, 2)
+
+        # Show estimates as they run, including estimates started before the window was opened
+        get_size_estimator().on_change = update_size_estimates
+        update_size_estimates()
 
         # Add layout to window
         self.window.add_layout(grid_layout)
@@ -1,10 +1,10 @@
 """
 Script Name: ultragrid
-Script Version: 0.0.2
+Script Version: 0.1.0
 Flame Version: 2023.2
 Written by: John Geehreng
 Creation Date: 05.30.24
-Update Date: 06.10.24
+Update Date: 10.19.26
 
 Script Type: Main Menu
 
@@ -12,9 +12,15 @@ Description:
 
     A simple script for starting and stopping UltraGrid quickly.
 
+    UltraGrid is started, stopped and checked on the sender and receiver at the same time in the background. The UltraGrid
+    Status window shows whether UltraGrid is running on each host and the SSH round trip time. SSH connections are kept
+    open for 10 minutes after the last command so later commands don't have to connect again.
+
+    UltraGrid output is written to /tmp/ultragrid.log on each host.
+
 Menus:
 
-    Flame Main Menu -> UltraGrid -> UltraGrid Setup, UltraGrid Start, UltraGrid Stop
+    Flame Main Menu -> UltraGrid -> UltraGrid Setup, UltraGrid Start, UltraGrid Stop, UltraGrid Status
 
 To install:
 
@@ -22,6 +28,12 @@ To install:
 
 Updates:
 
+    v0.1.0 10.19.26
+        Start/Stop run on the sender and receiver at the same time in the background instead of in terminal windows.
+        Added UltraGrid Status window showing state and SSH latency of each host.
+        SSH connections are reused between commands.
+        Stop now stops all UltraGrid processes on a host.
+
     v0.0.2 06.10.24
         Minor code cleanup and added some error windows and console messages.
 
@@ -34,18 +46,25 @@ Updates:
 # Imports
 
 import os
-import subprocess
 import flame
 
 from pyflame_lib_ultragrid import *
+from ultragrid_session import UltraGridHost, UltraGridSession, BUSY, RUNNING, STOPPED, ERROR
 
 #-------------------------------------#
 # Setup Window Script
 
 SCRIPT_NAME = 'UltraGrid'
-SCRIPT_VERSION = 'v0.0.2'
+SCRIPT_VERSION = 'v0.1.0'
 SCRIPT_PATH = '/opt/Autodesk/shared/python/ultragrid'
 
+STATUS_INTERVAL = 10 # Seconds between status checks while the UltraGrid Status window is open
+
+# UltraGrid session shared by Start, Stop and Status
+ultragrid_session = None
+ultragrid_session_settings = None
+ultragrid_status_window = None
+
 class UltraGrid():
 
     def __init__(self, selection) -> None:
@@ -263,20 +282,16 @@ class UltraGridStart():
         return settings
 
     def start_ultra_grid(self):
-        self.load_config()
         print("Start UG...")
 
-        # Execute the send command on a remote machine via SSH using SSH keys.
-        ssh_command = f"{self.settings.sender_ssh_setting} {self.settings.send_cmd_setting}"
-        print (f'Sender Command: {ssh_command}')
-        subprocess.run(['gnome-terminal', '--', 'bash', '-c', ssh_command])
+        session = get_session(self.settings)
+        if not session:
+            return
 
-        # Execute the recieve command on a remote machine via SSH using SSH keys.
-        ssh_command = f"{self.settings.receiver_ssh_setting} {self.settings.receive_cmd_setting}"
-        print (f'Receiver Command: {ssh_command}')
-        subprocess.run(['gnome-terminal', '--', 'bash', '-c', ssh_command])
+        session.start()
+        show_status_window(session)
 
-        flame.messages.show_in_console('UltraGrid Start commands sent. Check new terminal windows if you have any issues.', 'info',10)
+        flame.messages.show_in_console('UltraGrid starting. Check UltraGrid Status window if you have any issues.', 'info', 10)
 
 #-------------------------------------#
 # UG Stop
@@ -321,54 +336,267 @@ class UltraGridStop():
     def stop_ultra_grid(self):
         print("Stop UG...")
 
-        def ssh_command(host, username, command):
-            """Execute a command on a remote machine via SSH using SSH keys."""
-            ssh_command = f"ssh {username}@{host} '{command}'"
-            print (f'ssh comand: {ssh_command}')
-            result = subprocess.run(ssh_command, shell=True, capture_output=True, text=True)
-
-            if result.returncode != 0:
-                print(f"Error: {result.stderr}")
-                flame.messages.show_in_dialog(
-                    title = f"Cannot Stop UltraGrid on {host}",
-                    message = "Please check commands and ssh keys.",
-                    type = "error",
-                    buttons = ["Ok"])
-            return result.stdout.strip()
-
-        def stop_ultragrid_remote(host, username):
-            # Command to find and kill the UltraGrid process
-            find_pid_command = "pgrep uv-real"
-            kill_command_template = "kill {}"
-
-            # Find the PID of the UltraGrid process
-            pid = ssh_command(host, username, find_pid_command)
-
-            if pid:
-                # Construct the kill command with the found PID
-                kill_command = kill_command_template.format(pid)
-                ssh_command(host, username, kill_command)
-                print(f"UltraGrid process with PID {pid} on {host} has been terminated.")
-            else:
-                print("UltraGrid process not found on remote machine.")
-
-        # Get the sender host and username from settings for the sender
-        ssh_info = self.settings.sender_ssh_setting
-        ssh_info = ssh_info.replace('ssh ', '')
-        username, host = ssh_info.split('@')
-
-        # Stop the UltraGrid process on the remote machine
-        stop_ultragrid_remote(host, username)
-
-        # Get the sender host and username from settings for the receiver
-        ssh_info = self.settings.receiver_ssh_setting
-        ssh_info = ssh_info.replace('ssh ', '')
-        username, host = ssh_info.split('@')
-
-        # Stop the UltraGrid process on the remote machine
-        stop_ultragrid_remote(host, username)
-
-        flame.messages.show_in_console('UltraGrid Stop commands sent. Check terminal windows if you have any issues.', 'info',10)
+        session = get_session(self.settings)
+        if not session:
+            return
+
+        session.stop()
+        show_status_window(session)
+
+        flame.messages.show_in_console('UltraGrid stopping. Check UltraGrid Status window if you have any issues.', 'info', 10)
+
+#-------------------------------------#
+# UG Status
+
+class UltraGridStatus():
+
+    def __init__(self, selection) -> None:
+
+        print('\n')
+        print('>' * 10, f'{SCRIPT_NAME} Status {SCRIPT_VERSION}', '<' * 10, '\n')
+
+        # Create/Load config file settings.
+        self.settings = self.load_config()
+
+        # Check UltraGrid Status
+        self.status_ultra_grid()
+
+    def load_config(self) -> PyFlameConfig:
+        """
+        Create/Load config values from config file.
+        If config file does not exist, create it using config_values as default values otherwise load config values from file.
+        Default values should be set in the config_values dictionary.
+
+        Returns:
+            PyFlameConfig: PyFlameConfig object with config values.
+        """
+
+        settings = PyFlameConfig(
+            script_name=SCRIPT_NAME,
+            script_path=SCRIPT_PATH,
+            config_values={
+                'sender_ssh_setting': 'ssh user@XXX.XXX.XX.XXX',
+                'send_cmd_setting': '/Applications/uv-qt.app/Contents/MacOS/uv  -t ndi:url=XXX.XXX.XX.XXX:XXXX -c libavcodec:codec=H.264:bitrate=40000000 --audio-filter controlport_stats -s AESEBU --audio-capture-format channels=2 --audio-codec Opus -f rs:200:220 -P 5004 --control-port 8888 XXX.XXX.XXX.XX --param errors-fatal',
+                'receiver_ssh_setting': 'ssh user@XXX.XXX.XX.XXX',
+                'receive_cmd_setting': '/Applications/uv-qt.app/Contents/MacOS/uv -d vulkan_sdl2:fs -N -r coreaudio',
+                },
+            )
+
+        return settings
+
+    def status_ultra_grid(self):
+        print("UG Status...")
+
+        session = get_session(self.settings)
+        if not session:
+            return
+
+        session.status()
+        show_status_window(session)
+
+class UltraGridStatusWindow():
+    """
+    Window showing the state, SSH latency and last message of each UltraGrid host.
+
+    Host state is read from the session every 250 ms, so the window updates as soon as a host
+    finishes an action. While the window is open, status is checked every STATUS_INTERVAL seconds.
+
+    Args:
+        session (UltraGridSession): Session to show.
+    """
+
+    def __init__(self, session) -> None:
+
+        self.session = session
+        self.state_colors = {
+            RUNNING: '#4f9e4f',
+            STOPPED: '#9a9a9a',
+            BUSY: '#d6a530',
+            ERROR: '#d05050',
+            }
+
+        self.main_window()
+
+    def main_window(self) -> None:
+        """
+        Create status window.
+        """
+
+        def close_window() -> None:
+
+            global ultragrid_status_window
+
+            self.refresh_timer.stop()
+            self.status_timer.stop()
+            ultragrid_status_window = None
+            self.window.close()
+
+        #------------------------------------#
+        # Window Elements
+
+        # Window
+        self.window = PyFlameWindow(
+            width=900,
+            height=200,
+            title=f'{SCRIPT_NAME} Status <small>{SCRIPT_VERSION}',
+            return_pressed=close_window,
+            )
+
+        # Labels
+        self.header_labels = [
+            PyFlameLabel(text=text, style=Style.UNDERLINE)
+            for text in ('Host', 'Destination', 'State', 'Latency', 'Message')
+            ]
+        self.host_labels = []
+        for host in self.session.snapshot():
+            self.host_labels.append({
+                'name': PyFlameLabel(text=host['name']),
+                'destination': PyFlameLabel(text=host['destination']),
+                'state': PyFlameLabel(text=''),
+                'latency': PyFlameLabel(text=''),
+                'message': PyFlameLabel(text='', max_width=True),
+                })
+
+        # Buttons
+        self.start_button = PyFlameButton(
+            text='Start',
+            connect=self.session.start,
+            )
+        self.stop_button = PyFlameButton(
+            text='Stop',
+            connect=self.session.stop,
+            )
+        self.status_button = PyFlameButton(
+            text='Refresh',
+            connect=self.session.status,
+            )
+        self.close_button = PyFlameButton(
+            text='Close',
+            connect=close_window,
+            color=Color.BLUE,
+            )
+
+        #------------------------------------#
+        # Window Layout
+
+        grid_layout = PyFlameGridLayout()
+
+        for column, label in enumerate(self.header_labels):
+            grid_layout.addWidget(label, 0, column)
+
+        for row, labels in enumerate(self.host_labels, 1):
+            for column, key in enumerate(('name', 'destination', 'state', 'latency', 'message')):
+                grid_layout.addWidget(labels[key], row, column)
+
+        button_row = len(self.host_labels) + 2
+        grid_layout.addWidget(self.start_button, button_row, 0)
+        grid_layout.addWidget(self.stop_button, button_row, 1)
+        grid_layout.addWidget(self.status_button, button_row, 2)
+        grid_layout.addWidget(self.close_button, button_row, 4, QtCore.Qt.AlignRight)
+
+        # Add layout to window
+        self.window.add_layout(grid_layout)
+
+        # Timers
+        self.refresh_timer = QtCore.QTimer(self.window)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(250)
+
+        self.status_timer = QtCore.QTimer(self.window)
+        self.status_timer.timeout.connect(self.check_status)
+        self.status_timer.start(STATUS_INTERVAL * 1000)
+
+        self.refresh()
+
+        self.window.show()
+
+    def refresh(self) -> None:
+        """
+        Update host labels from session.
+        """
+
+        busy = False
+
+        for labels, host in zip(self.host_labels, self.session.snapshot()):
+            state = f'{host["action"]}...' if host['state'] == BUSY else host['state']
+            busy = busy or host['state'] == BUSY
+            labels['state'].setText(f'<font color="{self.state_colors.get(host["state"], "#9a9a9a")}">{state}</font>')
+            labels['latency'].setText('' if host['latency'] is None else f'{host["latency"] * 1000:.0f} ms')
+            labels['message'].setText(host['message'].splitlines()[0] if host['message'] else '')
+            labels['message'].setToolTip(host['message'])
+
+        for button in (self.start_button, self.stop_button, self.status_button):
+            button.setEnabled(not busy)
+
+    def check_status(self) -> None:
+        """
+        Check status of hosts that are not busy.
+        """
+
+        if not self.session.busy():
+            self.session.status()
+
+def show_status_window(session) -> None:
+    """
+    Show the UltraGrid Status window for session. If it is already open, bring it to the front
+    instead of opening another one.
+
+    Args:
+        session (UltraGridSession): Session to show.
+    """
+
+    global ultragrid_status_window
+
+    if ultragrid_status_window is not None and ultragrid_status_window.session is session:
+        ultragrid_status_window.window.show()
+        ultragrid_status_window.window.raise_()
+        return
+
+    if ultragrid_status_window is not None:
+        ultragrid_status_window.window.close()
+
+    ultragrid_status_window = UltraGridStatusWindow(session)
+
+def get_session(settings) -> UltraGridSession:
+    """
+    Get the UltraGrid session for the sender and receiver in settings. The session is reused while
+    the sender and receiver settings stay the same.
+
+    Args:
+        settings (PyFlameConfig): Settings with sender/receiver SSH settings and commands.
+
+    Returns:
+        UltraGridSession: Session, or None if an SSH setting is not valid.
+    """
+
+    global ultragrid_session, ultragrid_session_settings
+
+    session_settings = (
+        settings.sender_ssh_setting,
+        settings.send_cmd_setting,
+        settings.receiver_ssh_setting,
+        settings.receive_cmd_setting,
+        )
+
+    if ultragrid_session is not None and (session_settings == ultragrid_session_settings or ultragrid_session.busy()):
+        return ultragrid_session
+
+    try:
+        ultragrid_session = UltraGridSession([
+            UltraGridHost('Sender', settings.sender_ssh_setting, settings.send_cmd_setting),
+            UltraGridHost('Receiver', settings.receiver_ssh_setting, settings.receive_cmd_setting),
+            ])
+    except ValueError as e:
+        PyFlameMessageWindow(
+            message=f'SSH setting is not valid. Check UltraGrid Setup.<br><br>{e}',
+            script_name=SCRIPT_NAME,
+            type=MessageType.ERROR,
+            )
+        return None
+
+    ultragrid_session_settings = session_settings
+
+    return ultragrid_session
 
 #-------------------------------------#
 # Flame Menu
@@ -394,6 +622,11 @@ def get_main_menu_custom_ui_actions():
                     'name': 'UltraGrid Stop',
                     'execute': UltraGridStop,
                     'minimumVersion': '2023.2'
+               },
+               {
+                    'name': 'UltraGrid Status',
+                    'execute': UltraGridStatus,
+                    'minimumVersion': '2023.2'
                }
            ]
         }
@@ -0,0 +1,314 @@
+"""
+UltraGrid Session
+
+Runs UltraGrid start, stop and status commands on the sender and receiver hosts over SSH.
+Commands for all hosts run at the same time on worker threads so Flame never waits on an
+SSH round trip. Host state and latency are kept on each UltraGridHost for the UltraGrid
+window to show.
+
+SSH connections are reused with OpenSSH connection sharing. The first command to a host
+opens a master connection that stays open for CONTROL_PERSIST after the last command. Later
+commands go over the master connection and skip connecting and authenticating again.
+
+This file must not import flame or Qt so it can be tested on its own. Set ULTRAGRID_SSH to
+use a different ssh command, for example a stand-in script that runs the remote command
+locally. The stand-in is called as:
+
+    <ssh> -o <option> ... -O check <ssh args>               Exit 0 if a master connection is open
+    <ssh> -o <option> ... -M -N -f <ssh args>               Open a master connection
+    <ssh> -o <option> ... -O exit <ssh args>                Close the master connection
+    <ssh> -o <option> ... <ssh args> <remote command>       Run remote command with sh
+"""
+
+#-------------------------------------#
+# Imports
+
+import os
+import shlex
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+#-------------------------------------#
+# Constants
+
+SSH_COMMAND = os.environ.get('ULTRAGRID_SSH', 'ssh')
+CONTROL_DIR = os.path.expanduser('~/.ssh/ultragrid') # Master connection sockets
+CONTROL_PERSIST = '10m' # Time master connections stay open after the last command
+CONNECT_TIMEOUT = 5 # Seconds
+COMMAND_TIMEOUT = 20 # Seconds
+START_CHECK_DELAY = 2 # Seconds to wait after starting UltraGrid before checking it is still running
+
+UV_PROCESS = 'uv-real' # UltraGrid process name on remote hosts
+REMOTE_LOG = '/tmp/ultragrid.log' # UltraGrid output on remote hosts
+
+# Host states
+UNKNOWN = 'Unknown'
+BUSY = 'Busy'
+RUNNING = 'Running'
+STOPPED = 'Stopped'
+ERROR = 'Error'
+
+#-------------------------------------#
+
+class UltraGridError(Exception):
+    """SSH or remote command failed."""
+
+class UltraGridHost():
+    """
+    Host UltraGrid is started and stopped on.
+
+    Args:
+        name (str): Name shown in the UltraGrid window. Sender or Receiver.
+        ssh_setting (str): SSH setting from the config, ie: ssh user@host or ssh -p 2222 user@host.
+        command (str): UltraGrid command to run on the host.
+
+    Attributes set by UltraGridSession:
+        state (str): UNKNOWN, BUSY, RUNNING, STOPPED or ERROR.
+        action (str): Action in progress while BUSY: Starting, Stopping or Checking.
+        latency (float): Seconds taken by the last remote command. None until a command has run.
+        message (str): Result of the last action.
+        updated (float): Time of the last update.
+    """
+
+    def __init__(self, name: str, ssh_setting: str, command: str) -> None:
+
+        self.name = name
+        self.ssh_args = parse_ssh_setting(ssh_setting)
+        self.destination = self.ssh_args[-1]
+        self.command = command
+
+        self.state = UNKNOWN
+        self.action = ''
+        self.latency = None
+        self.message = ''
+        self.updated = 0.0
+
+def parse_ssh_setting(ssh_setting: str) -> list:
+    """
+    Split an SSH setting into ssh arguments. A leading ssh is dropped.
+
+    Args:
+        ssh_setting (str): SSH setting, ie: ssh user@host
+
+    Returns:
+        list: ssh arguments, the last one is the destination, ie: ['user@host']
+
+    Raises:
+        ValueError: If the setting has no destination.
+    """
+
+    ssh_args = shlex.split(ssh_setting)
+    if ssh_args and os.path.basename(ssh_args[0]) == 'ssh':
+        ssh_args = ssh_args[1:]
+    if not ssh_args:
+        raise ValueError(f'No SSH destination in: {ssh_setting}')
+    return ssh_args
+
+class UltraGridSession():
+    """
+    Run start, stop and status on UltraGrid hosts, all hosts at the same time.
+
+    Start, stop and status return straight away. Each host is handled on a worker thread that
+    updates the host's state, latency and message when done. Use snapshot() to read host
+    state from another thread. An action is not started on a host that is still busy.
+
+    Args:
+        hosts (list): UltraGridHost objects.
+
+    Example:
+        session = UltraGridSession([
+            UltraGridHost('Sender', 'ssh user@sender', send_cmd),
+            UltraGridHost('Receiver', 'ssh user@receiver', receive_cmd),
+            ])
+        session.start()
+        ...
+        for host in session.snapshot():
+            print(host['name'], host['state'], host['latency'])
+    """
+
+    def __init__(self, hosts: list) -> None:
+
+        self.hosts = list(hosts)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(len(self.hosts), 1), thread_name_prefix='ultragrid')
+
+    #-------------------------------------#
+    # Actions
+
+    def start(self) -> list:
+        """Start UltraGrid on all hosts. Returns a future per host that was not busy."""
+
+        return self._submit('Starting', self._start)
+
+    def stop(self) -> list:
+        """Stop UltraGrid on all hosts. Returns a future per host that was not busy."""
+
+        return self._submit('Stopping', self._stop)
+
+    def status(self) -> list:
+        """Check if UltraGrid is running on all hosts. Returns a future per host that was not busy."""
+
+        return self._submit('Checking', self._status)
+
+    def busy(self) -> bool:
+        """True while an action is running on any host."""
+
+        with self._lock:
+            return any(host.state == BUSY for host in self.hosts)
+
+    def snapshot(self) -> list:
+        """Copy of the state of each host as a dict, safe to read while actions are running."""
+
+        with self._lock:
+            return [
+                {
+                    'name': host.name,
+                    'destination': host.destination,
+                    'state': host.state,
+                    'action': host.action,
+                    'latency': host.latency,
+                    'message': host.message,
+                    'updated': host.updated,
+                    }
+                for host in self.hosts
+                ]
+
+    def close(self) -> None:
+        """Wait for running actions, then close the master connections."""
+
+        self._executor.shutdown(wait=True)
+        for host in self.hosts:
+            try:
+                subprocess.run(
+                    self._ssh_base() + ['-O', 'exit'] + host.ssh_args,
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=CONNECT_TIMEOUT,
+                    )
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+
+    #-------------------------------------#
+    # Internal
+
+    def _submit(self, action: str, function) -> list:
+
+        futures = []
+        with self._lock:
+            hosts = [host for host in self.hosts if host.state != BUSY]
+            for host in hosts:
+                host.state = BUSY
+                host.action = action
+        for host in hosts:
+            futures.append(self._executor.submit(self._run_action, host, function))
+        return futures
+
+    def _run_action(self, host: UltraGridHost, function) -> str:
+
+        try:
+            state, message = function(host)
+        except Exception as e:
+            state, message = ERROR, str(e)
+        self._update(host, state=state, message=message)
+        return state
+
+    def _update(self, host: UltraGridHost, **values) -> None:
+
+        with self._lock:
+            for attribute, value in values.items():
+                setattr(host, attribute, value)
+            if host.state != BUSY:
+                host.action = ''
+            host.updated = time.time()
+
+    def _ssh_base(self) -> list:
+
+        return [
+            SSH_COMMAND,
+            '-o', f'ControlPath={CONTROL_DIR}/%C',
+            '-o', 'BatchMode=yes',
+            '-o', f'ConnectTimeout={CONNECT_TIMEOUT}',
+            ]
+
+    def _connect(self, host: UltraGridHost) -> None:
+        """
+        Open a master connection to the host if one is not open.
+
+        The master is opened with -f so it goes to the background once connected. Its output
+        goes to a temp file, not a pipe, so the background master can't hold a pipe open.
+        """
+
+        os.makedirs(CONTROL_DIR, mode=0o700, exist_ok=True)
+
+        check = subprocess.run(
+            self._ssh_base() + ['-O', 'check'] + host.ssh_args,
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=CONNECT_TIMEOUT,
+            )
+        if check.returncode == 0:
+            return
+
+        with tempfile.TemporaryFile() as error_file:
+            result = subprocess.run(
+                self._ssh_base() + ['-o', f'ControlPersist={CONTROL_PERSIST}', '-M', '-N', '-f'] + host.ssh_args,
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=error_file, timeout=COMMAND_TIMEOUT,
+                )
+            if result.returncode != 0:
+                error_file.seek(0)
+                error = error_file.read().decode(errors='replace').strip()
+                raise UltraGridError(error or f'Could not connect to {host.destination}')
+
+    def _run(self, host: UltraGridHost, remote_command: str) -> str:
+        """Run a command on the host over its master connection. Returns stdout."""
+
+        self._connect(host)
+
+        start_time = time.perf_counter()
+        try:
+            result = subprocess.run(
+                self._ssh_base() + ['-o', 'ControlMaster=no'] + host.ssh_args + [remote_command],
+                stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=COMMAND_TIMEOUT,
+                )
+        except subprocess.TimeoutExpired:
+            raise UltraGridError(f'No reply from {host.destination} after {COMMAND_TIMEOUT} seconds')
+        self._update(host, latency=time.perf_counter() - start_time)
+
+        if result.returncode != 0:
+            raise UltraGridError(result.stderr.strip() or f'Command failed on {host.destination}')
+        return result.stdout.strip()
+
+    def _pids(self, host: UltraGridHost) -> str:
+
+        return ' '.join(self._run(host, f'pgrep {UV_PROCESS} || true').split())
+
+    def _status(self, host: UltraGridHost) -> tuple:
+
+        pids = self._pids(host)
+        if pids:
+            return RUNNING, f'PID {pids}'
+        return STOPPED, 'UltraGrid not running'
+
+    def _start(self, host: UltraGridHost) -> tuple:
+
+        pids = self._pids(host)
+        if pids:
+            return RUNNING, f'Already running, PID {pids}'
+
+        self._run(host, f'nohup {host.command} > {REMOTE_LOG} 2>&1 < /dev/null & echo $!')
+
+        # UltraGrid exits straight away on bad settings, check it is still running
+        time.sleep(START_CHECK_DELAY)
+        pids = self._pids(host)
+        if pids:
+            return RUNNING, f'Started, PID {pids}'
+
+        log = self._run(host, f'tail -n 5 {REMOTE_LOG} 2>/dev/null || true')
+        return ERROR, f'UltraGrid exited after starting. {REMOTE_LOG}:\n{log}' if log else 'UltraGrid exited after starting.'
+
+    def _stop(self, host: UltraGridHost) -> tuple:
+
+        pids = self._run(host, f'pids=$(pgrep {UV_PROCESS}); if [ -n "$pids" ]; then kill $pids; echo $pids; fi')
+        pids = ' '.join(pids.split())
+        if pids:
+            return STOPPED, f'Stopped, PID {pids}'
+        return STOPPED, 'UltraGrid was not running'